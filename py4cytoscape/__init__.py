@@ -48,9 +48,18 @@ from .py4cytoscape_logger import set_summary_logger
 from .sandbox import *
 from .py4cytoscape_sandbox import *
 from .py4cytoscape_tuning import set_catchup_filter_secs, set_catchup_network_secs, set_model_propagation_secs
+from .py4cytoscape_tuning import set_http_pool_size, set_http_keep_alive, set_http_max_retries, set_http_retry_backoff_secs, set_http_timeout_secs
+from .py4cytoscape_tuning import set_bypass_batch_size, set_readiness_poll_secs, set_metadata_cache_file, set_table_load_chunking
+from .py4cytoscape_tuning import get_readiness_wait_stats, reset_readiness_wait_stats, get_stability_wait_stats, reset_stability_wait_stats
+from .py4cytoscape_http import reset_http_sessions
+from .py4cytoscape_client import CytoscapeClient, get_client, invalidate_caches
+from .py4cytoscape_metadata import warm_metadata_cache
 from ._version import __version__
 from .notebook import *
 from .annotations import *
+from .aio import AsyncCyClient
+from .pool import CytoscapePool
+from .fake_cytoscape import FakeCytoscape
 
 # Note that we have tried to enforce documentation standards for modules and private functions per:
 # https://www.python.org/dev/peps/pep-0257/ and https://www.python.org/dev/peps/pep-0008/#comments
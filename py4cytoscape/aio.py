@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""Asyncio interface for issuing CyREST and Commands API calls without blocking the caller.
+
+An ``AsyncCyClient`` mirrors the CyREST (``cyrest_get``, ``cyrest_post``, ``cyrest_put``, ``cyrest_delete``) and
+Commands (``commands_get``, ``commands_post``) functions in the ``commands`` module as coroutines, so that independent
+reads (e.g., table columns, view properties and style values) can be awaited together, and so that a single event
+loop can drive several Cytoscape instances at once.
+
+Each call is executed by the same code as its blocking counterpart, so error translation (``CyError`` and
+``requests.exceptions.RequestException``) and sandbox initialization are identical. Calls are carried out on a
+bounded set of worker threads that share the pooled connections to Cytoscape, so no more than ``max_concurrency``
+requests are outstanding against a Cytoscape at any time.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Internal module imports
+from . import commands
+from . import py4cytoscape_tuning as tuning
+
+# Internal module convenience imports
+from .py4cytoscape_utils import DEFAULT_BASE_URL
+from .py4cytoscape_sandbox import get_sandbox_reinitialize
+
+
+class AsyncCyClient:
+    """Issue CyREST and Commands API calls to one Cytoscape as coroutines.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        max_concurrency (int): maximum number of calls outstanding against Cytoscape at one time. Default is
+            the HTTP connection pool size (see ``set_http_pool_size()``).
+
+    Returns:
+        AsyncCyClient: client bound to ``base_url``
+
+    Raises:
+        none
+
+    Examples:
+        >>> async def fetch(client):
+        ...     return await asyncio.gather(client.cyrest_get('networks'), client.cyrest_get('styles'))
+        >>> async with AsyncCyClient() as client:
+        ...     networks, styles = await fetch(client)
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, max_concurrency=None):
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency or tuning.HTTP_POOL_SIZE
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='py4cytoscape-aio')
+        self._semaphore = None  # Created lazily so it's bound to the running event loop
+        self._init_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the worker threads. Calls already in progress are allowed to finish."""
+        self._executor.shutdown(wait=False)
+
+    async def cyrest_delete(self, operation=None, parameters=None, require_json=True):
+        """Same as ``commands.cyrest_delete()``, but awaitable."""
+        return await self.call(commands.cyrest_delete, operation, parameters, require_json=require_json)
+
+    async def cyrest_get(self, operation=None, parameters=None, require_json=True):
+        """Same as ``commands.cyrest_get()``, but awaitable."""
+        return await self.call(commands.cyrest_get, operation, parameters, require_json=require_json)
+
+    async def cyrest_post(self, operation=None, parameters=None, body=None, require_json=True):
+        """Same as ``commands.cyrest_post()``, but awaitable."""
+        return await self.call(commands.cyrest_post, operation, parameters, body, require_json=require_json)
+
+    async def cyrest_put(self, operation=None, parameters=None, body=None, require_json=True):
+        """Same as ``commands.cyrest_put()``, but awaitable."""
+        return await self.call(commands.cyrest_put, operation, parameters, body, require_json=require_json)
+
+    async def commands_get(self, cmd_string):
+        """Same as ``commands.commands_get()``, but awaitable."""
+        return await self.call(commands.commands_get, cmd_string)
+
+    async def commands_post(self, cmd):
+        """Same as ``commands.commands_post()``, but awaitable."""
+        return await self.call(commands.commands_post, cmd)
+
+    async def call(self, func, *args, **kwargs):
+        """Run any py4cytoscape function against this client's Cytoscape without blocking the event loop.
+
+        Args:
+            func (function): a py4cytoscape function that accepts a ``base_url`` parameter
+            *args: positional arguments for ``func``
+            **kwargs: named arguments for ``func`` ... ``base_url`` is supplied by the client
+
+        Returns:
+            whatever ``func`` returns
+
+        Raises:
+            whatever ``func`` raises
+
+        Examples:
+            >>> await client.call(get_table_columns, 'node', ['name', 'degree.layout'])
+            >>> await client.call(get_node_property, visual_property='NODE_SIZE')
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._init_lock = asyncio.Lock()
+
+        await self._initialize_sandbox()
+        async with self._semaphore:
+            return await self._run(functools.partial(func, *args, base_url=self.base_url, **kwargs))
+
+    async def _initialize_sandbox(self):
+        # The first call to Cytoscape (or the first after a sandbox change) sets up the sandbox. Do that exactly once
+        # before fanning out so that concurrent calls don't race to initialize it.
+        if get_sandbox_reinitialize(base_url=self.base_url):
+            async with self._init_lock:
+                if get_sandbox_reinitialize(base_url=self.base_url):
+                    await self._run(functools.partial(commands.do_initialize_sandbox, base_url=self.base_url))
+
+    async def _run(self, func):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
@@ -250,7 +250,7 @@ def add_annotation_image(url=None, x_pos=None, y_pos=None, angle=None, opacity=N
     cmd_string += f' type="org.cytoscape.view.presentation.annotations.ImageAnnotation"'
 
     # Image to add
-    cmd_string += _get_url_cmd_string(url)
+    cmd_string += _get_url_cmd_string(url, base_url=base_url)
 
     # x and y position
     cmd_string += _get_x_y_pos_cmd_string(x_pos, y_pos, net_suid, base_url)
@@ -802,7 +802,7 @@ def update_annotation_image(url=None, annotation_name=None, x_pos=None, y_pos=No
     cmd_string += f' type="org.cytoscape.view.presentation.annotations.ImageAnnotation"'
 
     # Image to add
-    cmd_string += _get_url_cmd_string(url, optional=True)
+    cmd_string += _get_url_cmd_string(url, optional=True, base_url=base_url)
 
     cmd_string += _get_annotation_name_cmd_string(annotation_name)
 
@@ -1032,7 +1032,7 @@ def _get_brightness_contrast_cmd_string(brightness, contrast):
 
     return brightness_cmd + contrast_cmd
 
-def _get_url_cmd_string(url, optional=False):
+def _get_url_cmd_string(url, optional=False, base_url=DEFAULT_BASE_URL):
     if url is None:
         if optional:
             return ''
@@ -1040,7 +1040,7 @@ def _get_url_cmd_string(url, optional=False):
             raise CyError(f'URL or path to image file must be provided.')
 
     if re.search('^http[s]*://', url) == None:
-        url = sandbox.get_abs_sandbox_path(url)
+        url = sandbox.get_abs_sandbox_path(url, base_url=base_url)
     return f' url="{url}"'
 
 
@@ -29,6 +29,7 @@ from . import commands
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_metadata import forget_metadata
 
 
 @cy_log
@@ -55,6 +56,7 @@ def disable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps disable app="{app}"', base_url=base_url)
+    forget_metadata(base_url=base_url)  # The app may have added or removed layouts
     return narrate(res)
 
 
@@ -82,6 +84,7 @@ def enable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps enable app="{app}"', base_url=base_url)
+    forget_metadata(base_url=base_url)  # The app may have added or removed layouts
     return narrate(res)
 
 
@@ -133,6 +136,7 @@ def install_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps install app="{app}"', base_url=base_url)
+    forget_metadata(base_url=base_url)  # The app may have added or removed layouts
     return narrate(res)
 
 
@@ -333,6 +337,7 @@ def uninstall_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps uninstall app="{app}"', base_url=base_url)
+    forget_metadata(base_url=base_url)  # The app may have added or removed layouts
     return narrate(res)
 
 
@@ -358,4 +363,5 @@ def update_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps update app="{app}"', base_url=base_url)
+    forget_metadata(base_url=base_url)  # The app may have added or removed layouts
     return narrate(res)
@@ -35,13 +35,14 @@ import json
 import webbrowser
 import sys
 import os
-import backoff
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, log_http_result, log_http_request, show_error
 from .py4cytoscape_notebook import execution_environment, do_request_jupyter_bridge, check_execution_environment, get_notebook_is_running, ExecutionEnvironment
 from .py4cytoscape_sandbox import *
+from .py4cytoscape_http import pooled_request
+from .py4cytoscape_client import get_client
 from .exceptions import CyError
 
 def __init__(self):
@@ -166,7 +167,7 @@ def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BAS
     Args:
         operation (str): A string to be converted to the REST query namespace
         parameters (dict): A named list of values to be converted to REST query parameters
-        body (dict): A named list of values to be converted to JSON
+        body (dict or bytes): A named list of values to be converted to JSON, or JSON already encoded as bytes
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
@@ -187,7 +188,8 @@ def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BAS
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('POST', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url)
+        r = _do_request('POST', url, params=parameters, headers = {'Content-Type': 'application/json'}, base_url=base_url,
+                        **_body_kwargs(body))
         r.raise_for_status()
         try:
             return r.json()
@@ -207,7 +209,7 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
     Args:
         operation (str): A string to be converted to the REST query namespace
         parameters (dict): A named list of values to be converted to REST query parameters
-        body (dict): A named list of values to be converted to JSON
+        body (dict or bytes): A named list of values to be converted to JSON, or JSON already encoded as bytes
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
@@ -226,7 +228,8 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('PUT', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url)
+        r = _do_request('PUT', url, params=parameters, headers = {'Content-Type': 'application/json'}, base_url=base_url,
+                        **_body_kwargs(body))
         r.raise_for_status()
         try:
             return r.json()
@@ -383,18 +386,7 @@ def commands_post(cmd, base_url=DEFAULT_BASE_URL):
          {'appName': 'AgilentLiteratureSearch', 'description': 'Mines scientific literature to ... ', 'details': ''} ...]
     """
 
-    try:
-        post_url = _command_2_post_query_url(cmd, base_url=base_url)
-        post_body = _command_2_post_query_body(cmd)
-        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-        r = _do_request('POST', post_url, json=post_body, headers=headers, base_url=base_url)
-        r.raise_for_status()
-        res = json.loads(r.text)
-        if len(res['errors']):
-            raise CyError(str(res['errors'][0]))
-        return res['data']
-    except requests.exceptions.RequestException as e:
-        _handle_error(e)
+    return _commands_post_args(cmd, _command_2_post_query_body(cmd), base_url=base_url)
 
 
 @cy_log
@@ -551,7 +543,7 @@ def command_run_file(file, args=None, base_url=DEFAULT_BASE_URL):
         {}
     """
     args_str = f' args="{args}"' if args else ''
-    file = get_abs_sandbox_path(file)
+    file = get_abs_sandbox_path(file, base_url=base_url)
 
     return commands_post(f'command run{args_str} file="{file}"', base_url=base_url)
 
@@ -614,6 +606,24 @@ def _command_2_get_query(cmd_string, base_url=DEFAULT_BASE_URL):
     return url, arg_dict
 
 
+def _commands_post_args(cmd, args, base_url=DEFAULT_BASE_URL):
+    """ POST a command (without inline parameters) with its parameters as a JSON body (dict or already encoded bytes)
+
+    Large parameters (e.g., a file encoded as base64) aren't copied while being parsed out of a command string.
+    """
+    try:
+        post_url = _command_2_post_query_url(cmd, base_url=base_url)
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        r = _do_request('POST', post_url, **_body_kwargs(args), headers=headers, base_url=base_url)
+        r.raise_for_status()
+        res = json.loads(r.text)
+        if len(res['errors']):
+            raise CyError(str(res['errors'][0]))
+        return res['data']
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+
 def _command_2_post_query_url(cmd, base_url=DEFAULT_BASE_URL):
     """ Construct complete command URL from base URL and Cytoscape command """
 
@@ -682,11 +692,15 @@ def _handle_error(e, force_cy_error=False):
                 show_error(f'In {caller}: {e}\n{content}')
         raise e
 
-@backoff.on_exception(backoff.expo, requests.exceptions.ConnectionError, max_tries=3)
+def _body_kwargs(body):
+    # Send a body that's already JSON-encoded as is (e.g., one encoded column-wise from a large DataFrame, or a file
+    # encoded as it's read)
+    return {'data': body} if isinstance(body, bytes) or hasattr(body, 'read') else {'json': body}
+
 def _do_request_local(method, url, **kwargs):
-    # Call CyREST via a local URL
+    # Call CyREST via a local URL, using a pooled connection (which also retries failed connections)
     log_http_request(method, url, **kwargs)
-    r = requests.request(method, url, **kwargs)
+    r = pooled_request(method, url, **kwargs)
     log_http_result(r)
     return r
 
@@ -694,26 +708,33 @@ def _do_request(method, url, base_url=DEFAULT_BASE_URL, raw_request=False, **kwa
     # Determine whether actual call is local or remote
     requester, default_sandbox = _get_requester(base_url)
 
-    if not raw_request:
-        do_initialize_sandbox(requester, base_url=base_url) # make sure there's a sandbox before executing a command
-
-    return requester(method, url, **kwargs)
+    try:
+        if not raw_request:
+            do_initialize_sandbox(requester, base_url=base_url) # make sure there's a sandbox before executing a command
+
+        return requester(method, url, **kwargs)
+    except requests.exceptions.ConnectionError:
+        # Cytoscape may have restarted (e.g., as another version or with other apps), so forget everything cached
+        # about it ... versions, metadata and sandbox are fetched again once it can be reached
+        get_client(base_url).reset()
+        raise
 
 def do_initialize_sandbox(requester=None, base_url=DEFAULT_BASE_URL):
     # If re-initialize has been requested, reset sandbox to environment's default (i.e., None or default_sandbox)
-    if get_sandbox_reinitialize():
-        if requester:
-            default_sandbox = get_default_sandbox()
-        else:
-            requester, default_sandbox = _get_requester(base_url)
-        return do_set_sandbox(default_sandbox, requester, base_url=base_url)
-    else:
-        return get_current_sandbox()
+    if get_sandbox_reinitialize(base_url=base_url):
+        with get_client(base_url).lock: # Make sure concurrent callers don't all initialize the sandbox
+            if get_sandbox_reinitialize(base_url=base_url):
+                if requester:
+                    default_sandbox = get_default_sandbox(base_url=base_url)
+                else:
+                    requester, default_sandbox = _get_requester(base_url)
+                return do_set_sandbox(default_sandbox, requester, base_url=base_url)
+    return get_current_sandbox(base_url=base_url)
 
 def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
     # Set the sandbox to whatever is passed in. Note that sandbox_to_set is a dictionary not a string.
     if requester:
-        default_sandbox = get_default_sandbox()
+        default_sandbox = get_default_sandbox(base_url=base_url)
     else:
         requester, default_sandbox = _get_requester(base_url)
     if not sandbox_to_set['sandboxName']:
@@ -729,7 +750,9 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
                           json=sandbox_to_set,
                           headers={'Content-Type': 'application/json', 'Accept': 'application/json'})
             r.raise_for_status()
-            new_sandbox = set_current_sandbox(sandbox_name, r.json()['data']['sandboxPath'])
+            new_sandbox = set_current_sandbox(sandbox_name, r.json()['data']['sandboxPath'], base_url=base_url)
+        except requests.exceptions.ConnectionError:
+            raise  # There's no response to explain
         except Exception as e:
             message = r.text
             caller = sys._getframe(1).f_code.co_name
@@ -750,7 +773,7 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
         # If we are running on the Cytoscape workstation, we want to find out whether a sandbox is defined, and if so,
         # what it is. If no sandbox is defined, the entire workstation file system is the sandbox. If a sandbox is
         # defined, the caller will consider the file name to be relative to it.
-        default_sandbox_path = get_default_sandbox_path()
+        default_sandbox_path = get_default_sandbox_path(base_url=base_url)
         if default_sandbox_path is None:
             if _find_execution_environment(base_url) in {ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE, ExecutionEnvironment.REMOTE_DIRECT_URL}:
                 try:
@@ -758,7 +781,7 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
                                   json={'sandboxName': None, 'fileName': '.'},
                                   headers={'Content-Type': 'application/json', 'Accept': 'application/json'})
                     r.raise_for_status()
-                    default_sandbox_path = set_default_sandbox_path(json.loads(r.text)['data']['filePath'])
+                    default_sandbox_path = set_default_sandbox_path(json.loads(r.text)['data']['filePath'], base_url=base_url)
                 except Exception as e:
                     # This is a nasty case ... it's hard for getFileInfo to fail unless FileTransfer isn't installed.
                     # We'll assume that's so, and assume that means we're running on the Cytoscape workstation. So,
@@ -769,22 +792,22 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
             else:
                 default_sandbox_path = os.getcwd() # Running on the Cytoscape workstation
 
-        new_sandbox = set_current_sandbox(None, default_sandbox_path)
+        new_sandbox = set_current_sandbox(None, default_sandbox_path, base_url=base_url)
 
-    set_sandbox_reinitialize(False) # No need to initialize again immediately before the next command is issued
+    set_sandbox_reinitialize(False, base_url=base_url) # No need to initialize again immediately before the next command is issued
     return new_sandbox
 
 def _get_requester(base_url):
     # Figure out whether CyREST available only via Jupyter-Bridge and what the default sandbox should be
     environment = _find_execution_environment(base_url)
     if environment == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE:
-        default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
+        default_sandbox = set_default_sandbox(base_url=base_url, **sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
         return do_request_jupyter_bridge, default_sandbox
     elif environment == ExecutionEnvironment.REMOTE_DIRECT_URL:
-        default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
+        default_sandbox = set_default_sandbox(base_url=base_url, **sandbox_initializer(sandboxName=PREDEFINED_SANDBOX_NAME))
         return _do_request_local, default_sandbox
     else: # for execution on shared Cytoscape workstation
-        default_sandbox = set_default_sandbox(**sandbox_initializer(sandboxName=None))
+        default_sandbox = set_default_sandbox(base_url=base_url, **sandbox_initializer(sandboxName=None))
         return _do_request_local, default_sandbox
 
 def _do_browser_open(url, base_url, **kwargs):
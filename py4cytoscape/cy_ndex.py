@@ -32,6 +32,7 @@ from . import networks
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_client import get_client, NETWORK_SUID_CACHE
 
 @cy_log
 def import_network_from_ndex(ndex_id, username=None, password=None, access_key=None, ndex_url="http://ndexbio.org", ndex_version="v2", base_url=DEFAULT_BASE_URL):
@@ -73,6 +74,7 @@ def import_network_from_ndex(ndex_id, username=None, password=None, access_key=N
     if access_key is not None: ndex_body.update({'accessKey': access_key})
 
     res = commands.cyrest_post('networks', body=ndex_body, base_url=_cy_ndex_base_url(base_url))
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
     return res['data']['suid']
 
 @cy_log
@@ -0,0 +1,1332 @@
+# -*- coding: utf-8 -*-
+
+"""An in-process stand-in for Cytoscape, for running py4cytoscape without a Cytoscape desktop.
+
+A ``FakeCytoscape`` serves the CyREST and Commands API calls that py4cytoscape makes (networks, tables, views,
+styles, commands and filetransfer) from an in-memory model of networks and styles, over a real HTTP connection on the
+loopback interface. Because py4cytoscape reaches it the same way it reaches Cytoscape, tests and benchmarks exercise
+the library's full call path (logging, HTTP session pooling, sandbox initialization and error handling) without a
+network or a Cytoscape installation. An artificial per-call latency can be set to model a remote or busy Cytoscape.
+
+The model is deliberately simple: layouts place nodes on a grid, only passthrough and discrete style mappings are
+evaluated, and calls that py4cytoscape makes but the model doesn't implement (e.g., apps, filters, image export)
+return an HTTP 404 or Commands API error, just as Cytoscape does for an unknown endpoint or command.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import base64
+import collections
+import copy
+import csv
+import datetime
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Internal module convenience imports
+from .py4cytoscape_client import get_client
+
+
+class FakeCytoscape:
+    """Serve CyREST and Commands API calls from an in-memory model of Cytoscape.
+
+    Args:
+        latency_secs (float): time to wait before answering each call, to model network and Cytoscape delays
+        host (str): address to listen on. Default is the loopback interface.
+        port (int): port to listen on. Default is any free port.
+        cytoscape_version (str): Cytoscape version to report (e.g., to test version checks)
+
+    Returns:
+        FakeCytoscape: stand-in whose ``base_url`` can be passed to any py4cytoscape function
+
+    Raises:
+        OSError: if the port can't be opened
+
+    Examples:
+        >>> with FakeCytoscape(latency_secs=0.002) as cy:
+        ...     cy.add_network(['A', 'B', 'C'], [('A', 'B', 'pp'), ('B', 'C', 'pp')], title='test')
+        ...     get_table_columns(columns='name', base_url=cy.base_url)
+        ...     cy.call_count
+        52
+             name
+        53      A
+        54      B
+        55      C
+        7
+    """
+
+    def __init__(self, latency_secs=0.0, host='127.0.0.1', port=0, cytoscape_version='3.10.0'):
+        self.latency_secs = latency_secs
+        self.cytoscape_version = cytoscape_version
+        self.installed_apps = [{'appName': 'JSON Support', 'version': cytoscape_version, 'description': 'null',
+                                'status': 'Installed'}]  # As reported by 'apps list installed' ... None if it fails
+        self.calls = collections.Counter()  # {'<method> <endpoint>': number of calls}, with SUIDs shown as {suid}
+        self._lock = threading.RLock()
+        self._sandbox_root = tempfile.mkdtemp(prefix='fake_cytoscape_')
+        self._model = _Model()
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = None
+        self.base_url = f'http://{host}:{self._server.server_address[1]}/v1'
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start answering calls on a background thread.
+
+        Returns:
+            FakeCytoscape: this stand-in
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='fake-cytoscape', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop answering calls, and discard the sandbox directory."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        shutil.rmtree(self._sandbox_root, ignore_errors=True)
+        get_client(self.base_url).reset()
+
+    @property
+    def call_count(self):
+        """int: number of calls answered so far"""
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        """Zero the call counters."""
+        with self._lock:
+            self.calls.clear()
+
+    def reset(self):
+        """Discard all networks and styles, as ``close_session()`` would."""
+        with self._lock:
+            self._model = _Model()
+
+    def add_network(self, nodes, edges=None, title='network', node_columns=None, edge_columns=None):
+        """Create a network (with a view) directly in the model, bypassing the HTTP interface.
+
+        This is much faster than building a network with py4cytoscape calls, and so is useful for setting up large
+        test and benchmark networks.
+
+        Args:
+            nodes (list): node names
+            edges (list): (source name, target name, interaction) for each edge
+            title (str): network name
+            node_columns (dict): {column name: list of values, one per node}
+            edge_columns (dict): {column name: list of values, one per edge}
+
+        Returns:
+            int: SUID of the new network
+        """
+        with self._lock:
+            net = self._model.new_network(title)
+            node_suids = {}
+            for name in nodes:
+                node_suids[name] = net.add_node(self._model.next_suid(), name)
+            for source, target, interaction in edges or []:
+                net.add_edge(self._model.next_suid(), node_suids[source], node_suids[target], interaction)
+            for table, columns in (('defaultnode', node_columns), ('defaultedge', edge_columns)):
+                rows = list(net.tables[table].rows.values())
+                for col, values in (columns or {}).items():
+                    values = list(values)
+                    if col not in net.tables[table].columns:
+                        net.tables[table].columns[col] = _infer_type(values[0]) if values else 'String'
+                    net.tables[table].set_values(col, zip(rows, values))
+            net.add_view(self._model.next_suid())
+            self._model.current = net
+            return net.suid
+
+    # --------------------------------------------------------------------------------------------------------------
+    # Request dispatch
+
+    def _handle(self, method, path, params, body):
+        # Answer one call, returning (HTTP status, JSON-able reply or None for an empty reply)
+        if self.latency_secs: time.sleep(self.latency_secs)
+
+        path = path[len('/v1'):] if path.startswith('/v1') else path
+        path = path.strip('/')
+        with self._lock:
+            self.calls[f'{method} {re.sub(r"(?<=/)[0-9]+(?=/|$)", "{suid}", "/" + path)[1:]}'] += 1
+            try:
+                if path.startswith('commands/'):
+                    data = self._command(path[len('commands/'):], params, body)
+                    if method == 'GET':  # Commands API GET replies are text, one line per item
+                        return 200, _Text(_command_text(data))
+                    return 200, {'data': data, 'errors': []}
+                for route_method, pattern, handler in _ROUTES:
+                    if route_method == method:
+                        match = pattern.fullmatch(path)
+                        if match:
+                            return 200, handler(self, params, body, *match.groups())
+                raise _CyRestError(404, f'No {method} endpoint for "{path}" in FakeCytoscape')
+            except _CyRestError as e:
+                return e.status, {'data': {}, 'errors': [{'status': e.status, 'type': 'urn:cytoscape:ci:fake-cytoscape',
+                                                          'message': e.message, 'link': ''}]}
+
+    def _command(self, command, params, body):
+        args = dict(params)
+        if isinstance(body, dict): args.update(body)
+        namespace, _, verb = urllib.parse.unquote(command).partition('/')
+        handler = _COMMANDS.get((namespace, verb)) or _COMMANDS.get((namespace, '*'))
+        if handler is None:
+            raise _CyRestError(404, f'Failed to find command namespace: {namespace} {verb}'.rstrip())
+        return handler(self, verb, {k: str(v) if v is not None else None for k, v in args.items()})
+
+    # --------------------------------------------------------------------------------------------------------------
+    # CyREST endpoints
+
+    def _get_root(self, params, body):
+        return {'apiVersion': 'v1', 'cytoscapeVersion': self.cytoscape_version, 'numberOfCores': os.cpu_count(),
+                'memoryStatus': {'usedMemory': 100, 'freeMemory': 900, 'totalMemory': 1000, 'maxMemory': 4000},
+                'availableApiVersions': ['v1']}
+
+    def _get_version(self, params, body):
+        return {'apiVersion': 'v1', 'cytoscapeVersion': self.cytoscape_version}
+
+    def _get_gc(self, params, body):
+        return None
+
+    def _get_networks(self, params, body):
+        return [net.suid for net in self._model.networks.values()]
+
+    def _get_network_count(self, params, body):
+        return {'count': len(self._model.networks)}
+
+    def _get_network_names(self, params, body):
+        names = [{'SUID': net.suid, 'name': net.name} for net in self._model.networks.values()]
+        if params.get('column', '').lower() == 'suid':
+            names = [x for x in names if str(x['SUID']) == str(params.get('query'))]
+        return names
+
+    def _post_network(self, params, body):
+        net = self._model.import_cyjs(body or {}, params.get('title'))
+        return {'networkSUID': net.suid}
+
+    def _delete_networks(self, params, body):
+        self._model.networks.clear()
+        self._model.current = None
+        return None
+
+    def _get_network(self, params, body, net_suid):
+        return self._network(net_suid).to_cyjs(self._model)
+
+    def _delete_network(self, params, body, net_suid):
+        self._model.delete_network(self._network(net_suid))
+        return None
+
+    def _get_elements(self, params, body, net_suid, kind):
+        net = self._network(net_suid)
+        table = net.tables[_TABLE_OF[kind]]
+        if 'column' in params and 'query' in params:
+            return table.find(params['column'], params['query'])
+        return list(table.rows)
+
+    def _get_element_count(self, params, body, net_suid, kind):
+        return {'count': len(self._network(net_suid).tables[_TABLE_OF[kind]].rows)}
+
+    def _post_nodes(self, params, body, net_suid):
+        net = self._network(net_suid)
+        return [{'name': name, 'SUID': net.add_node(self._model.next_suid(), name)} for name in body]
+
+    def _post_edges(self, params, body, net_suid):
+        net = self._network(net_suid)
+        added = []
+        for edge in body:
+            for end in ('source', 'target'):
+                if edge[end] not in net.tables['defaultnode'].rows:
+                    raise _CyRestError(404, f'Node {edge[end]} not found in network {net.suid}')
+            suid = net.add_edge(self._model.next_suid(), edge['source'], edge['target'],
+                                edge.get('interaction', 'interacts with'), edge.get('directed', True))
+            added.append({'SUID': suid, 'source': edge['source'], 'target': edge['target']})
+        return added
+
+    def _get_edge(self, params, body, net_suid, edge_suid):
+        net = self._network(net_suid)
+        edge = net.edges.get(int(edge_suid))
+        if edge is None:
+            raise _CyRestError(404, f'Edge {edge_suid} not found in network {net.suid}')
+        return {'SUID': int(edge_suid), 'source': edge[0], 'target': edge[1]}
+
+    def _get_neighbors(self, params, body, net_suid, node_suid):
+        net = self._network(net_suid)
+        node_suid = int(node_suid)
+        if node_suid not in net.tables['defaultnode'].rows:
+            raise _CyRestError(404, f'Node {node_suid} not found in network {net.suid}')
+        return net.neighbors(node_suid)
+
+    def _get_columns(self, params, body, net_suid, tbl):
+        return self._table(net_suid, tbl).describe_columns()
+
+    def _post_column(self, params, body, net_suid, tbl):
+        # Create one column, or a list of them
+        table = self._table(net_suid, tbl)
+        for column in body if isinstance(body, list) else [body]:
+            table.add_column(column['name'], column.get('type', 'String'))
+        return None
+
+    def _put_columns(self, params, body, net_suid, tbl):
+        # Rename a column
+        table = self._table(net_suid, tbl)
+        table.rename_column(body['oldName'], body['newName'])
+        return None
+
+    def _get_column(self, params, body, net_suid, tbl, col):
+        table = self._table(net_suid, tbl)
+        table.check_column(col)
+        return {'name': col, 'values': [row.get(col) for row in table.rows.values()]}
+
+    def _put_column(self, params, body, net_suid, tbl, col):
+        table = self._table(net_suid, tbl)
+        table.check_column(col)
+        if 'default' in params:
+            value = _parse_value(params['default'], table.columns[col])
+            table.set_values(col, ((row, value) for row in table.rows.values()))
+        else:
+            table.set_values(col, ((table.row(x['SUID']), x['value']) for x in body or []))
+        return None
+
+    def _delete_column(self, params, body, net_suid, tbl, col):
+        self._table(net_suid, tbl).delete_column(col)
+        return None
+
+    def _get_rows(self, params, body, net_suid, tbl):
+        return [{col: val for col, val in row.items() if val is not None}
+                for row in self._table(net_suid, tbl).rows.values()]
+
+    def _get_cell(self, params, body, net_suid, tbl, row_key, col):
+        table = self._table(net_suid, tbl)
+        table.check_column(col)
+        return table.row(row_key).get(col)
+
+    def _put_table(self, params, body, net_suid, tbl):
+        # Merge rows into the table, matching each data row's dataKey value to the table's key column. Like CyREST,
+        # the dataKey column itself is loaded too.
+        table = self._table(net_suid, tbl)
+        key, data_key = body.get('key', 'SUID'), body.get('dataKey', 'SUID')
+        table.check_column(key)
+        rows_by_key = collections.defaultdict(list)
+        for row in table.rows.values():
+            rows_by_key[row.get(key)].append(row)
+        for data in body.get('data', []):
+            for col, value in data.items():
+                if col == 'SUID': continue
+                if col not in table.columns: table.add_column(col, _infer_type(value))
+                table.set_values(col, ((row, value) for row in rows_by_key.get(data.get(data_key), [])))
+        return None
+
+    def _get_views(self, params, body, net_suid):
+        return list(self._network(net_suid).views)
+
+    def _post_view(self, params, body, net_suid):
+        net = self._network(net_suid)
+        return {'networkViewSUID': net.views[0] if net.views else net.add_view(self._model.next_suid())}
+
+    def _delete_views(self, params, body, net_suid):
+        self._network(net_suid).views.clear()
+        return None
+
+    def _get_first_view(self, params, body, net_suid):
+        net = self._network(net_suid)
+        if not net.views:
+            raise _CyRestError(404, f'No view for network {net.suid}')
+        return net.to_cyjs(self._model, with_positions=True)
+
+    def _get_current_view(self, params, body):
+        net = self._model.current
+        return {'data': {'networkViewSUID': net.views[0] if net and net.views else None}, 'errors': []}
+
+    def _put_current_view(self, params, body):
+        self._model.current = self._network_of_view(body['networkViewSUID'])
+        return None
+
+    def _get_view_elements(self, params, body, net_suid, view_suid, kind):
+        net = self._view(net_suid, view_suid)
+        kind = kind[:-1]
+        vps = [params['visualProperty']] if 'visualProperty' in params else _VISUAL_PROPERTIES[kind]
+        for vp in vps: _check_visual_property(kind, vp)
+        return [{'SUID': suid, 'view': [{'visualProperty': vp, 'value': self._model.view_value(net, kind, suid, vp)}
+                                        for vp in vps]}
+                for suid in net.tables[_TABLE_OF[kind]].rows]
+
+    def _put_view_elements(self, params, body, net_suid, view_suid, kind):
+        net = self._view(net_suid, view_suid)
+        kind = kind[:-1]
+        rows = net.tables[_TABLE_OF[kind]].rows
+        bypass = str(params.get('bypass', 'false')).lower() == 'true'
+        for element in body:
+            suid = int(element['SUID'])
+            if suid not in rows:
+                raise _CyRestError(404, f'{kind.capitalize()} {suid} not found in network {net.suid}')
+            for vp in element['view']:
+                _check_visual_property(kind, vp['visualProperty'])
+                net.set_view_value(kind, suid, vp['visualProperty'], vp['value'], bypass)
+        return None
+
+    def _get_view_element(self, params, body, net_suid, view_suid, kind, suid, vp):
+        net = self._view(net_suid, view_suid)
+        kind = kind[:-1]
+        if int(suid) not in net.tables[_TABLE_OF[kind]].rows:
+            raise _CyRestError(404, f'{kind.capitalize()} {suid} not found in network {net.suid}')
+        _check_visual_property(kind, vp)
+        return {'visualProperty': vp, 'value': self._model.view_value(net, kind, int(suid), vp)}
+
+    def _delete_bypass(self, params, body, net_suid, view_suid, kind, suid, vp):
+        net = self._view(net_suid, view_suid)
+        kind = kind[:-1]
+        if int(suid) not in net.tables[_TABLE_OF[kind]].rows:
+            raise _CyRestError(404, f'{kind.capitalize()} {suid} not found in network {net.suid}')
+        _check_visual_property(kind, vp)
+        net.bypasses[kind].get(int(suid), {}).pop(vp, None)
+        return {'data': {}, 'errors': []}
+
+    def _get_network_view_values(self, params, body, net_suid, view_suid):
+        net = self._view(net_suid, view_suid)
+        return [{'visualProperty': vp, 'value': self._model.view_value(net, 'network', net.suid, vp)}
+                for vp in _VISUAL_PROPERTIES['network']]
+
+    def _put_network_view_values(self, params, body, net_suid, view_suid):
+        net = self._view(net_suid, view_suid)
+        bypass = str(params.get('bypass', 'false')).lower() == 'true'
+        for vp in body:
+            _check_visual_property('network', vp['visualProperty'])
+            net.set_view_value('network', net.suid, vp['visualProperty'], vp['value'], bypass)
+        return None
+
+    def _get_network_view_value(self, params, body, net_suid, view_suid, vp):
+        net = self._view(net_suid, view_suid)
+        _check_visual_property('network', vp)
+        return {'visualProperty': vp, 'value': self._model.view_value(net, 'network', net.suid, vp)}
+
+    def _delete_network_bypass(self, params, body, net_suid, view_suid, vp):
+        net = self._view(net_suid, view_suid)
+        _check_visual_property('network', vp)
+        net.bypasses['network'].get(net.suid, {}).pop(vp, None)
+        return {'data': {}, 'errors': []}
+
+    def _get_current_style(self, params, body, net_suid, view_suid):
+        return {'title': self._view(net_suid, view_suid).style}
+
+    def _get_styles(self, params, body):
+        return list(self._model.styles)
+
+    def _post_style(self, params, body):
+        title = body['title']
+        self._model.styles[title] = _Style(title, {x['visualProperty']: x['value'] for x in body.get('defaults', [])},
+                                           body.get('mappings', []))
+        return {'title': title}
+
+    def _delete_styles(self, params, body):
+        self._model.styles = {'default': self._model.styles['default']}
+        return None
+
+    def _get_style(self, params, body, name):
+        return self._style(name).to_json()
+
+    def _delete_style(self, params, body, name):
+        if name == 'default':
+            raise _CyRestError(500, 'Cannot delete the default style')
+        del self._model.styles[self._style(name).title]
+        return None
+
+    def _get_style_defaults(self, params, body, name):
+        return {'defaults': self._style(name).to_json()['defaults']}
+
+    def _put_style_defaults(self, params, body, name):
+        style = self._style(name)
+        for x in body:
+            style.defaults[x['visualProperty']] = x['value']
+        return None
+
+    def _get_style_default(self, params, body, name, vp):
+        style = self._style(name)
+        if vp not in _DEFAULTS:
+            raise _CyRestError(404, f'Visual property "{vp}" does not exist')
+        return {'visualProperty': vp, 'value': style.defaults.get(vp, _DEFAULTS[vp])}
+
+    def _get_mappings(self, params, body, name):
+        return list(self._style(name).mappings.values())
+
+    def _post_mappings(self, params, body, name):
+        style = self._style(name)
+        for mapping in body:
+            style.mappings[mapping['visualProperty']] = mapping
+        return None
+
+    def _get_mapping(self, params, body, name, vp):
+        mapping = self._style(name).mappings.get(vp)
+        if mapping is None:
+            raise _CyRestError(404, f'Mapping for "{vp}" does not exist')
+        return mapping
+
+    def _put_mapping(self, params, body, name, vp):
+        return self._post_mappings(params, body, name)
+
+    def _delete_mapping(self, params, body, name, vp):
+        if self._style(name).mappings.pop(vp, None) is None:
+            raise _CyRestError(404, f'Mapping for "{vp}" does not exist')
+        return None
+
+    def _get_dependencies(self, params, body, name):
+        return [{'visualPropertyDependency': dep, 'enabled': enabled}
+                for dep, enabled in self._style(name).dependencies.items()]
+
+    def _put_dependencies(self, params, body, name):
+        style = self._style(name)
+        for x in body:
+            style.dependencies[x['visualPropertyDependency']] = x['enabled']
+        return None
+
+    def _get_vp_values(self, params, body, vp):
+        if vp not in _VP_VALUES:
+            raise _CyRestError(404, f'Visual property "{vp}" has no discrete values')
+        return {'visualProperty': vp, 'values': list(_VP_VALUES[vp])}
+
+    def _apply_style(self, params, body, name, net_suid):
+        self._network(net_suid).style = self._style(name).title
+        return {'message': 'Visual Style applied.'}
+
+    def _get_layouts(self, params, body):
+        return list(_LAYOUTS)
+
+    def _get_layout(self, params, body, name):
+        if name not in _LAYOUTS:
+            raise _CyRestError(404, f'No such layout algorithm: {name}')
+        return {'name': name, 'longName': name, 'parameters': [], 'compatibleColumnDataTypes': []}
+
+    def _get_layout_parameters(self, params, body, name):
+        self._get_layout(params, body, name)
+        return []
+
+    def _get_session_name(self, params, body):
+        return {'name': ''}
+
+    def _delete_session(self, params, body):
+        self._model = _Model()
+        return {'message': 'New session created.'}
+
+    # --------------------------------------------------------------------------------------------------------------
+    # Commands
+
+    def _cmd_network(self, verb, args):
+        if verb == 'get attribute':
+            net = self._network_arg(args.get('network'))
+            table = net.tables['default' + args.get('table', 'network')]
+            columns = [x.strip() for x in (args.get('columnList') or 'SUID').split(',')]
+            for col in columns: table.check_column(col)
+            return [{col: row.get(col) for col in columns} for row in table.rows.values()]
+        elif verb == 'set current':
+            self._model.current = self._network_arg(args.get('network'))
+            return {}
+        elif verb == 'list':
+            return {'networks': [net.suid for net in self._model.networks.values()]}
+        elif verb == 'rename':
+            net = self._network_arg(args.get('sourceNetwork'))
+            net.rename(args['name'])
+            return {'network': net.suid, 'title': args['name']}
+        elif verb == 'clone':
+            net = self._network_arg(args.get('network'))
+            clone = self._model.clone_network(net)
+            return {'network': clone.suid, 'view': clone.views[0] if clone.views else None}
+        elif verb == 'select':
+            return self._select(self._network_arg(args.get('network') or args.get('SUID')), args)
+        elif verb == 'delete':
+            net = self._network_arg(args.get('network'))
+            return net.delete_elements(self._element_list(net, 'node', args.get('nodeList')),
+                                       self._element_list(net, 'edge', args.get('edgeList')))
+        elif verb == 'import file':
+            return self._import_network_file(args)
+        raise _CyRestError(404, f'Failed to find command: network {verb}')
+
+    def _import_network_file(self, args):
+        # Read a delimited file with a source, target and (optionally) interaction column, and attribute columns typed
+        # by dataTypeList (or String). Empty values are left missing.
+        path = args.get('file') or ''
+        if not os.path.isfile(path):
+            raise _CyRestError(500, f'File "{path}" does not exist')
+        delimiters = [{'\\,': ',', '\\t': '\t'}.get(x, x) for x in re.split(r'(?<!\\),', args.get('delimiters') or '\\,')]
+        with open(path, newline='', encoding='utf-8') as f:
+            first_line = f.readline()
+            delimiter = next((x for x in delimiters if x and x in first_line), delimiters[0])
+            f.seek(0)
+            rows = [row for row in csv.reader(f, delimiter=delimiter) if row]
+        if str(args.get('firstRowAsColumnNames')).lower() == 'true':
+            names, rows = rows[0], rows[1:]
+        else:
+            names = [f'Column {i + 1}' for i in range(len(rows[0]) if rows else 0)]
+        rows = rows[int(args.get('startLoadRow') or 1) - 1:]
+        column_types = [x.strip().lower() for x in (args.get('columnTypeList') or 's,i,t').split(',')]
+        data_types = [_IMPORT_DATA_TYPES[x.strip().lower()] for x in (args.get('dataTypeList') or '').split(',') if x]
+        data_types += ['String'] * (len(names) - len(data_types))
+        roles = {_IMPORT_COLUMN_ROLES.get(col_type, col_type): i for i, col_type in enumerate(column_types)}
+        if 's' not in roles or 't' not in roles:
+            raise _CyRestError(500, 'Source and target columns must be given')
+
+        net = self._model.new_network(os.path.basename(path))
+        node_table, edge_table = net.tables['defaultnode'], net.tables['defaultedge']
+        attr_cols = [(i, _IMPORT_COLUMN_ROLES.get(col_type, col_type)) for i, col_type in enumerate(column_types)
+                     if _IMPORT_COLUMN_ROLES.get(col_type, col_type) in ('sa', 'ta', 'ea')]
+        for i, role in attr_cols:
+            (edge_table if role == 'ea' else node_table).columns.setdefault(names[i], data_types[i])
+        node_suids = {}
+        for row in rows:
+            ends = []
+            for end in ('s', 't'):
+                name = row[roles[end]]
+                if name not in node_suids: node_suids[name] = net.add_node(self._model.next_suid(), name)
+                ends.append(node_suids[name])
+            interaction = row[roles['i']] if 'i' in roles else 'interacts with'
+            edge_suid = net.add_edge(self._model.next_suid(), ends[0], ends[1], interaction)
+            for i, role in attr_cols:
+                if i >= len(row) or row[i] == '': continue
+                table, suid = (edge_table, edge_suid) if role == 'ea' else (node_table, ends[role == 'ta'])
+                table.set_values(names[i], [(table.rows[suid], row[i])])
+        view_suid = net.add_view(self._model.next_suid())
+        self._model.current = net
+        return {'networks': [net.suid], 'views': [view_suid]}
+
+    def _cmd_view(self, verb, args):
+        if verb == 'create':
+            net = self._network_arg(args.get('network'))
+            view_suid = net.views[0] if net.views else net.add_view(self._model.next_suid())
+            return [{'network': net.suid, 'view': view_suid}]
+        elif verb == 'set current':
+            self._model.current = self._network_of_view(_suid_arg(args.get('view')))
+            return {}
+        elif verb in ('fit content', 'fit selected', 'update'):
+            return {}
+        raise _CyRestError(404, f'Failed to find command: view {verb}')
+
+    def _cmd_vizmap(self, verb, args):
+        if verb == 'apply':
+            names = [x.strip() for x in (args.get('styles') or 'default').split(',')]
+            for name in names:
+                style = self._style(name)
+                if self._model.current: self._model.current.style = style.title
+            return names
+        raise _CyRestError(404, f'Failed to find command: vizmap {verb}')
+
+    def _cmd_layout(self, verb, args):
+        name = 'grid' if verb == 'apply preferred' else verb
+        if name not in _LAYOUTS:
+            raise _CyRestError(404, f'Failed to find command: layout {verb}')
+        net = self._network_arg(args.get('network') or args.get('networkSelected'))
+        net.grid_layout()
+        return {}
+
+    def _cmd_session(self, verb, args):
+        if verb == 'new':
+            self._model = _Model()
+            return {}
+        raise _CyRestError(404, f'Failed to find command: session {verb}')
+
+    def _cmd_command(self, verb, args):
+        if verb == 'echo':
+            return [args.get('message', '')]
+        elif verb == 'sleep':
+            time.sleep(float(args.get('duration') or 0))
+            return {}
+        raise _CyRestError(404, f'Failed to find command: command {verb}')
+
+    def _cmd_apps(self, verb, args):
+        if verb == 'list installed' and self.installed_apps is not None:
+            return [app for app in self.installed_apps if app['status'] == 'Installed']
+        raise _CyRestError(404, f'Failed to find command: apps {verb}')
+
+    def _cmd_filetransfer(self, verb, args):
+        if verb == 'setSandbox':
+            path = self._sandbox_path(args.get('sandboxName'))
+            if str(args.get('reinitialize')).lower() == 'true': shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(path, exist_ok=True)
+            return {'sandboxPath': path}
+        elif verb == 'removeSandbox':
+            path = self._sandbox_path(args.get('sandboxName'))
+            existed = os.path.isdir(path)
+            shutil.rmtree(path, ignore_errors=True)
+            return {'sandboxPath': path, 'existed': existed}
+
+        path = self._sandbox_file(args.get('sandboxName'), args.get('fileName'))
+        if verb == 'getFileInfo':
+            exists = os.path.exists(path)
+            return {'filePath': path, 'isFile': os.path.isfile(path),
+                    'modifiedTime': _file_time(path) if exists else ''}
+        elif verb == 'toSandbox':
+            if os.path.exists(path) and str(args.get('overwrite')).lower() == 'false':
+                raise _CyRestError(500, f'File "{path}" already exists')
+            content = base64.b64decode(args.get('fileBase64') or '')
+            if args.get('fileByteCount') and int(args['fileByteCount']) != len(content):
+                raise _CyRestError(500, f'Expected {args["fileByteCount"]} bytes, but received {len(content)}')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f: f.write(content)
+            return {'filePath': path}
+        elif verb == 'fromSandbox':
+            if not os.path.isfile(path):
+                raise _CyRestError(500, f'File "{path}" does not exist')
+            with open(path, 'rb') as f: content = f.read()
+            return {'filePath': path, 'modifiedTime': _file_time(path), 'isFile': True,
+                    'fileByteCount': len(content), 'fileBase64': base64.b64encode(content).decode('utf-8')}
+        elif verb == 'urlToSandbox':
+            if os.path.exists(path) and str(args.get('overwrite')).lower() == 'false':
+                raise _CyRestError(500, f'File "{path}" already exists')
+            try:
+                with urllib.request.urlopen(args['sourceURL']) as r: content = r.read()
+            except Exception as e:
+                raise _CyRestError(500, f'Could not fetch "{args.get("sourceURL")}": {e}')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f: f.write(content)
+            return {'filePath': path, 'fileByteCount': len(content)}
+        elif verb == 'removeFile':
+            if not os.path.isfile(path):
+                raise _CyRestError(500, f'File "{path}" does not exist')
+            os.remove(path)
+            return {'filePath': path}
+        raise _CyRestError(404, f'Failed to find command: filetransfer {verb}')
+
+    def _select(self, net, args):
+        nodes = net.tables['defaultnode']
+        edges = net.tables['defaultedge']
+        selected_nodes = self._element_list(net, 'node', args.get('nodeList'))
+        selected_edges = self._element_list(net, 'edge', args.get('edgeList'))
+        invert = args.get('invert')
+        if invert in ('nodes', 'both'):
+            selected_nodes = [suid for suid, row in nodes.rows.items() if not row.get('selected')]
+            nodes.set_values('selected', ((row, False) for row in nodes.rows.values()))
+        if invert in ('edges', 'both'):
+            selected_edges = [suid for suid, row in edges.rows.items() if not row.get('selected')]
+            edges.set_values('selected', ((row, False) for row in edges.rows.values()))
+        if args.get('firstNeighbors'):
+            sources = set(selected_nodes or nodes.find('selected', 'true'))
+            selected_nodes = [end for source, target, directed in net.edges.values() if {source, target} & sources
+                              for end in (source, target) if end not in sources]
+        if str(args.get('adjacentEdges')).lower() == 'true':
+            ends = set(selected_nodes or nodes.find('selected', 'true'))
+            selected_edges = [suid for suid, (source, target, directed) in net.edges.items()
+                              if source in ends or target in ends]
+        if str(args.get('extendEdges')).lower() == 'true':
+            ends = {end for suid in (selected_edges or edges.find('selected', 'true')) for end in net.edges[suid][:2]}
+            selected_nodes = list(ends)
+        nodes.set_values('selected', ((nodes.rows[suid], True) for suid in selected_nodes))
+        edges.set_values('selected', ((edges.rows[suid], True) for suid in selected_edges))
+        return {'nodes': list(dict.fromkeys(selected_nodes)), 'edges': list(dict.fromkeys(selected_edges))}
+
+    def _element_list(self, net, kind, element_list):
+        # Resolve a Commands API nodeList or edgeList (i.e., 'all', 'selected', or 'column:value,column:value,...')
+        table = net.tables[_TABLE_OF[kind]]
+        if element_list is None or element_list.strip() == '':
+            return []
+        element_list = element_list.strip()
+        if element_list.lower() == 'all':
+            return list(table.rows)
+        if element_list.lower() == 'selected':
+            return table.find('selected', 'true')
+        suids = []
+        for item in re.split(r'(?<!\\),', element_list):
+            col, sep, value = item.strip().partition(':')
+            if not sep: col, value = 'name', col
+            col = 'SUID' if col.upper() == 'SUID' else col
+            table.check_column(col)
+            suids += table.find(col, value.replace('\\,', ',').strip())
+        return list(dict.fromkeys(suids))
+
+    # --------------------------------------------------------------------------------------------------------------
+    # Lookups
+
+    def _network(self, net_suid):
+        net = self._model.networks.get(int(net_suid))
+        if net is None:
+            raise _CyRestError(404, f'Network with SUID {net_suid} does not exist')
+        return net
+
+    def _network_arg(self, network):
+        # Resolve a Commands API network argument (i.e., 'current', 'SUID:<suid>' or a network name)
+        if network is None or network.strip() in ('', 'current'):
+            if self._model.current is None:
+                raise _CyRestError(500, 'No current network')
+            return self._model.current
+        suid = _suid_arg(network)
+        if suid is not None:
+            return self._network(suid)
+        if network.strip().isdigit() and int(network) in self._model.networks:
+            return self._model.networks[int(network)]
+        for net in self._model.networks.values():
+            if net.name == network.strip():
+                return net
+        raise _CyRestError(500, f'Network "{network}" does not exist')
+
+    def _network_of_view(self, view_suid):
+        for net in self._model.networks.values():
+            if int(view_suid) in net.views:
+                return net
+        raise _CyRestError(404, f'Network view with SUID {view_suid} does not exist')
+
+    def _view(self, net_suid, view_suid):
+        net = self._network(net_suid)
+        if int(view_suid) not in net.views:
+            raise _CyRestError(404, f'Network view with SUID {view_suid} does not exist')
+        return net
+
+    def _table(self, net_suid, tbl):
+        net = self._network(net_suid)
+        if tbl not in net.tables:
+            raise _CyRestError(404, f'Table "{tbl}" does not exist in network {net.suid}')
+        return net.tables[tbl]
+
+    def _style(self, name):
+        if name not in self._model.styles:
+            raise _CyRestError(404, f'Visual Style "{name}" does not exist')
+        return self._model.styles[name]
+
+    def _sandbox_path(self, sandbox_name):
+        if sandbox_name is None or '..' in sandbox_name or os.path.isabs(sandbox_name):
+            raise _CyRestError(500, f'Invalid sandbox name "{sandbox_name}"')
+        return os.path.join(self._sandbox_root, sandbox_name)
+
+    def _sandbox_file(self, sandbox_name, file_name):
+        if file_name is None:
+            raise _CyRestError(500, 'fileName is required')
+        if not sandbox_name:
+            return os.path.abspath(file_name)  # Whole file system, as for a Cytoscape on the same workstation
+        path = os.path.abspath(os.path.join(self._sandbox_path(sandbox_name), file_name))
+        if not path.startswith(self._sandbox_path(sandbox_name)):
+            raise _CyRestError(500, f'File "{file_name}" is outside of the sandbox')
+        return path
+
+
+# ==============================================================================
+# In-memory model of Cytoscape
+
+_TABLE_OF = {'node': 'defaultnode', 'edge': 'defaultedge', 'network': 'defaultnetwork',
+             'nodes': 'defaultnode', 'edges': 'defaultedge'}
+
+_LAYOUTS = ['grid', 'circular', 'force-directed', 'hierarchical', 'degree-circle', 'attribute-circle',
+            'attributes-layout', 'isom', 'kamada-kawai', 'fruchterman-rheingold', 'stacked-node-layout', 'cose']
+
+_NODE_SHAPES = ['DIAMOND', 'ELLIPSE', 'HEXAGON', 'OCTAGON', 'PARALLELOGRAM', 'RECTANGLE', 'ROUND_RECTANGLE',
+                'TRIANGLE', 'VEE']
+_LINE_STYLES = ['BACKWARD_SLASH', 'CONTIGUOUS_ARROW', 'DASH_DOT', 'DOT', 'EQUAL_DASH', 'FORWARD_SLASH', 'LONG_DASH',
+                'MARQUEE_DASH', 'MARQUEE_DASH_DOT', 'MARQUEE_EQUAL', 'PARALLEL_LINES', 'SEPARATE_ARROW', 'SINEWAVE',
+                'SOLID', 'VERTICAL_SLASH', 'ZIGZAG']
+_ARROW_SHAPES = ['ARROW', 'ARROW_SHORT', 'CIRCLE', 'CROSS_DELTA', 'CROSS_OPEN_DELTA', 'DELTA', 'DELTA_SHORT_1',
+                 'DELTA_SHORT_2', 'DIAMOND', 'DIAMOND_SHORT_1', 'DIAMOND_SHORT_2', 'HALF_BOTTOM', 'HALF_TOP', 'NONE',
+                 'OPEN_CIRCLE', 'OPEN_DELTA', 'OPEN_DIAMOND', 'OPEN_HALF_CIRCLE', 'OPEN_SQUARE', 'SQUARE', 'T']
+_VP_VALUES = {'NODE_SHAPE': _NODE_SHAPES, 'EDGE_LINE_TYPE': _LINE_STYLES,
+              'EDGE_SOURCE_ARROW_SHAPE': _ARROW_SHAPES, 'EDGE_TARGET_ARROW_SHAPE': _ARROW_SHAPES}
+
+# Visual properties and their values in the default style
+_DEFAULTS = {
+    'NODE_BORDER_PAINT': '#CCCCCC', 'NODE_BORDER_TRANSPARENCY': 255, 'NODE_BORDER_WIDTH': 0.0,
+    'NODE_FILL_COLOR': '#89D0F5', 'NODE_HEIGHT': 35.0, 'NODE_LABEL': '', 'NODE_LABEL_COLOR': '#000000',
+    'NODE_LABEL_FONT_FACE': 'SansSerif.plain,plain,12', 'NODE_LABEL_FONT_SIZE': 12, 'NODE_LABEL_TRANSPARENCY': 255,
+    'NODE_LABEL_WIDTH': 200.0, 'NODE_PAINT': '#1E90FF', 'NODE_SELECTED': False, 'NODE_SELECTED_PAINT': '#FFFF00',
+    'NODE_SHAPE': 'ROUND_RECTANGLE', 'NODE_SIZE': 35.0, 'NODE_TOOLTIP': '', 'NODE_TRANSPARENCY': 255,
+    'NODE_VISIBLE': True, 'NODE_WIDTH': 75.0, 'NODE_X_LOCATION': 0.0, 'NODE_Y_LOCATION': 0.0,
+    'NODE_Z_LOCATION': 0.0,
+    'EDGE_LABEL': '', 'EDGE_LABEL_COLOR': '#000000', 'EDGE_LABEL_FONT_FACE': 'Dialog.plain,plain,10',
+    'EDGE_LABEL_FONT_SIZE': 10, 'EDGE_LABEL_TRANSPARENCY': 255, 'EDGE_LINE_TYPE': 'SOLID', 'EDGE_PAINT': '#323232',
+    'EDGE_SELECTED': False, 'EDGE_SELECTED_PAINT': '#FF0000', 'EDGE_SOURCE_ARROW_SHAPE': 'NONE',
+    'EDGE_SOURCE_ARROW_UNSELECTED_PAINT': '#000000', 'EDGE_STROKE_SELECTED_PAINT': '#FF0000',
+    'EDGE_STROKE_UNSELECTED_PAINT': '#848484', 'EDGE_TARGET_ARROW_SHAPE': 'NONE',
+    'EDGE_TARGET_ARROW_UNSELECTED_PAINT': '#000000', 'EDGE_TOOLTIP': '', 'EDGE_TRANSPARENCY': 255,
+    'EDGE_UNSELECTED_PAINT': '#404040', 'EDGE_VISIBLE': True, 'EDGE_WIDTH': 2.0,
+    'NETWORK_BACKGROUND_PAINT': '#FFFFFF', 'NETWORK_CENTER_X_LOCATION': 0.0, 'NETWORK_CENTER_Y_LOCATION': 0.0,
+    'NETWORK_CENTER_Z_LOCATION': 0.0, 'NETWORK_DEPTH': 0.0, 'NETWORK_HEIGHT': 600.0, 'NETWORK_SCALE_FACTOR': 1.0,
+    'NETWORK_TITLE': '', 'NETWORK_WIDTH': 800.0,
+}
+_VISUAL_PROPERTIES = {kind: [vp for vp in _DEFAULTS if vp.startswith(kind.upper() + '_')]
+                      for kind in ('node', 'edge', 'network')}
+
+
+class _Text(str):
+    # A reply to send as plain text instead of JSON
+    pass
+
+
+class _CyRestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _Table:
+    # One node, edge or network table ... rows are {SUID: {column: value}}, in insertion order
+
+    def __init__(self, columns):
+        self.columns = dict(columns)  # {name: CyREST type}
+        self.rows = {}
+
+    def row(self, suid):
+        try:
+            return self.rows[int(suid)]
+        except (KeyError, ValueError):
+            raise _CyRestError(404, f'Row {suid} does not exist')
+
+    def check_column(self, col):
+        if col not in self.columns:
+            raise _CyRestError(404, f'Column "{col}" does not exist')
+
+    def describe_columns(self):
+        return [{'name': col, 'type': col_type, 'immutable': col in ('SUID', 'selected'), 'primaryKey': col == 'SUID'}
+                for col, col_type in self.columns.items()]
+
+    def add_column(self, col, col_type):
+        if col in self.columns:
+            raise _CyRestError(500, f'Column "{col}" already exists')
+        self.columns[col] = col_type
+
+    def rename_column(self, old_name, new_name):
+        self.check_column(old_name)
+        if new_name in self.columns:
+            raise _CyRestError(500, f'Column "{new_name}" already exists')
+        self.columns = {new_name if col == old_name else col: col_type for col, col_type in self.columns.items()}
+        for row in self.rows.values():
+            if old_name in row: row[new_name] = row.pop(old_name)
+
+    def delete_column(self, col):
+        self.check_column(col)
+        if col in ('SUID', 'shared name', 'name', 'selected'):
+            raise _CyRestError(500, f'Column "{col}" cannot be deleted')
+        del self.columns[col]
+        for row in self.rows.values():
+            row.pop(col, None)
+
+    def set_values(self, col, row_values):
+        if col not in self.columns: self.columns[col] = 'String'
+        col_type = self.columns[col]
+        for row, value in row_values:
+            row[col] = _coerce_value(value, col_type)
+
+    def find(self, col, value):
+        self.check_column(col)
+        col_type = self.columns[col]
+        try:
+            value = _parse_value(value, col_type)
+        except ValueError:
+            return []
+        return [suid for suid, row in self.rows.items() if row.get(col) == value]
+
+
+class _Network:
+    def __init__(self, suid, name):
+        self.suid = suid
+        self.name = name
+        self.views = []
+        self.style = 'default'
+        self.edges = {}  # {edge SUID: (source SUID, target SUID, directed)}
+        self._neighbors = None  # {node SUID: [neighbor SUIDs]}, built from edges when first needed
+        self.view_values = {'node': {}, 'edge': {}, 'network': {}}  # {kind: {SUID: {visual property: value}}}
+        self.bypasses = {'node': {}, 'edge': {}, 'network': {}}
+        self.tables = {
+            'defaultnode': _Table({'SUID': 'Long', 'shared name': 'String', 'name': 'String', 'selected': 'Boolean'}),
+            'defaultedge': _Table({'SUID': 'Long', 'shared name': 'String', 'shared interaction': 'String',
+                                   'name': 'String', 'selected': 'Boolean', 'interaction': 'String'}),
+            'defaultnetwork': _Table({'SUID': 'Long', 'shared name': 'String', 'name': 'String',
+                                      'selected': 'Boolean'}),
+        }
+        self.tables['defaultnetwork'].rows[suid] = {'SUID': suid, 'shared name': name, 'name': name, 'selected': True}
+
+    def rename(self, name):
+        self.name = name
+        self.tables['defaultnetwork'].rows[self.suid].update({'shared name': name, 'name': name})
+
+    def add_node(self, suid, name):
+        self.tables['defaultnode'].rows[suid] = {'SUID': suid, 'shared name': name, 'name': name, 'selected': False}
+        return suid
+
+    def add_edge(self, suid, source, target, interaction='interacts with', directed=True, name=None):
+        nodes = self.tables['defaultnode'].rows
+        if name is None:
+            name = f'{nodes[source]["name"]} ({interaction}) {nodes[target]["name"]}'
+        self.edges[suid] = (source, target, directed)
+        self._neighbors = None
+        self.tables['defaultedge'].rows[suid] = {'SUID': suid, 'shared name': name, 'shared interaction': interaction,
+                                                 'name': name, 'selected': False, 'interaction': interaction}
+        return suid
+
+    def add_view(self, suid):
+        self.views.append(suid)
+        return suid
+
+    def neighbors(self, node_suid):
+        # Index the edges by node, so each lookup is as cheap as Cytoscape's own (e.g., for a neighbor query per node)
+        if self._neighbors is None:
+            self._neighbors = {}
+            for source, target, directed in self.edges.values():
+                self._neighbors.setdefault(source, {})[target] = None
+                if target != source: self._neighbors.setdefault(target, {})[source] = None
+        return list(self._neighbors.get(node_suid, {}))
+
+    def delete_elements(self, node_suids, edge_suids):
+        node_suids = set(node_suids)
+        edge_suids = set(edge_suids) | {suid for suid, (source, target, directed) in self.edges.items()
+                                        if source in node_suids or target in node_suids}
+        for suid in edge_suids:
+            self.edges.pop(suid, None)
+            self.tables['defaultedge'].rows.pop(suid, None)
+        self._neighbors = None
+        for suid in node_suids:
+            self.tables['defaultnode'].rows.pop(suid, None)
+        return {'nodes': sorted(node_suids), 'edges': sorted(edge_suids)}
+
+    def set_view_value(self, kind, suid, vp, value, bypass):
+        (self.bypasses if bypass else self.view_values)[kind].setdefault(suid, {})[vp] = value
+
+    def grid_layout(self):
+        nodes = list(self.tables['defaultnode'].rows)
+        columns = max(1, math.ceil(math.sqrt(len(nodes))))
+        for i, suid in enumerate(nodes):
+            values = self.view_values['node'].setdefault(suid, {})
+            values['NODE_X_LOCATION'] = float((i % columns) * 80)
+            values['NODE_Y_LOCATION'] = float((i // columns) * 80)
+
+    def to_cyjs(self, model, with_positions=False):
+        node_table, edge_table = self.tables['defaultnode'], self.tables['defaultedge']
+        nodes = []
+        for suid, row in node_table.rows.items():
+            node = {'data': dict({'id': str(suid)}, **row)}
+            if with_positions:
+                node['position'] = {'x': model.view_value(self, 'node', suid, 'NODE_X_LOCATION'),
+                                    'y': model.view_value(self, 'node', suid, 'NODE_Y_LOCATION')}
+            nodes.append(node)
+        edges = [{'data': dict({'id': str(suid), 'source': str(self.edges[suid][0]),
+                                'target': str(self.edges[suid][1])}, **row)}
+                 for suid, row in edge_table.rows.items()]
+        return {'format_version': '1.0', 'generated_by': 'fake_cytoscape', 'target_cytoscapejs_version': '~2.1',
+                'data': dict(self.tables['defaultnetwork'].rows[self.suid]),
+                'elements': {'nodes': nodes, 'edges': edges}}
+
+
+class _Style:
+    def __init__(self, title, defaults=None, mappings=None):
+        self.title = title
+        self.defaults = dict(defaults or {})
+        self.mappings = {mapping['visualProperty']: mapping for mapping in mappings or []}
+        self.dependencies = {'arrowColorMatchesEdge': False, 'nodeCustomGraphicsSizeSync': True,
+                             'nodeSizeLocked': True}
+
+    def to_json(self):
+        defaults = dict(_DEFAULTS, **self.defaults)
+        return {'title': self.title, 'defaults': [{'visualProperty': vp, 'value': val} for vp, val in defaults.items()],
+                'mappings': list(self.mappings.values())}
+
+    def value(self, vp, row):
+        mapping = self.mappings.get(vp)
+        if mapping and row is not None and mapping.get('mappingColumn') in row:
+            col_value = row[mapping['mappingColumn']]
+            if mapping.get('mappingType') == 'passthrough':
+                return col_value
+            if mapping.get('mappingType') == 'discrete':
+                for entry in mapping.get('map', []):
+                    if str(entry['key']) == str(col_value):
+                        return entry['value']
+        return self.defaults.get(vp, _DEFAULTS[vp])
+
+
+class _Model:
+    def __init__(self):
+        self.networks = {}  # {SUID: _Network}
+        self.current = None
+        self.styles = {'default': _Style('default', mappings=[
+            {'mappingType': 'passthrough', 'mappingColumn': 'name', 'mappingColumnType': 'String',
+             'visualProperty': 'NODE_LABEL'}])}
+        self._suid = 51
+
+    def next_suid(self):
+        self._suid += 1
+        return self._suid
+
+    def new_network(self, title):
+        net = _Network(self.next_suid(), title)
+        self.networks[net.suid] = net
+        return net
+
+    def delete_network(self, net):
+        del self.networks[net.suid]
+        if self.current is net:
+            self.current = next(iter(self.networks.values()), None)
+
+    def clone_network(self, net):
+        clone = copy.deepcopy(net)
+        suid_map = {net.suid: self.next_suid()}
+        for table in ('defaultnode', 'defaultedge'):
+            for suid in net.tables[table].rows:
+                suid_map[suid] = self.next_suid()
+        clone.suid = suid_map[net.suid]
+        clone.views = [self.next_suid() for view in net.views]
+        clone.edges = {suid_map[suid]: (suid_map[source], suid_map[target], directed)
+                       for suid, (source, target, directed) in net.edges.items()}
+        clone._neighbors = None
+        for table in clone.tables.values():
+            table.rows = {suid_map[suid]: dict(row, SUID=suid_map[suid]) for suid, row in table.rows.items()}
+        for values in (clone.view_values, clone.bypasses):
+            for kind in values:
+                values[kind] = {suid_map[suid]: vps for suid, vps in values[kind].items()}
+        clone.rename(net.name + '_1')
+        self.networks[clone.suid] = clone
+        self.current = clone
+        return clone
+
+    def import_cyjs(self, cyjs, title):
+        # Create a network from Cytoscape.js JSON ... node and edge data become table columns
+        data = cyjs.get('data', {})
+        if isinstance(data, list): data = data[0] if data else {}
+        net = self.new_network(title or data.get('name') or 'From cytoscapejs')
+        elements = cyjs.get('elements', {})
+        node_ids = {}
+        for node in elements.get('nodes', []):
+            node_data = node.get('data', {})
+            node_id = str(node_data.get('id', ''))
+            suid = net.add_node(self.next_suid(), node_data.get('name', node_id))
+            node_ids[node_id] = suid
+            self._import_attrs(net.tables['defaultnode'], suid, node_data, {'SUID', 'name', 'selected'})
+            if 'position' in node:
+                net.set_view_value('node', suid, 'NODE_X_LOCATION', float(node['position'].get('x', 0)), False)
+                net.set_view_value('node', suid, 'NODE_Y_LOCATION', float(node['position'].get('y', 0)), False)
+        for edge in elements.get('edges', []):
+            edge_data = edge.get('data', {})
+            source, target = node_ids.get(str(edge_data.get('source'))), node_ids.get(str(edge_data.get('target')))
+            if source is None or target is None:
+                raise _CyRestError(500, f'Edge refers to a node that does not exist: {edge_data}')
+            suid = net.add_edge(self.next_suid(), source, target, edge_data.get('interaction', 'interacts with'),
+                                name=edge_data.get('name'))
+            self._import_attrs(net.tables['defaultedge'], suid, edge_data,
+                               {'SUID', 'name', 'selected', 'source', 'target', 'interaction'})
+        net.add_view(self.next_suid())
+        self.current = net
+        return net
+
+    def view_value(self, net, kind, suid, vp):
+        for values in (net.bypasses, net.view_values):
+            if vp in values[kind].get(suid, {}):
+                return values[kind][suid][vp]
+        row = net.tables[_TABLE_OF[kind]].rows.get(suid)
+        return self.styles.get(net.style, self.styles['default']).value(vp, row)
+
+    @staticmethod
+    def _import_attrs(table, suid, data, skip):
+        for col, value in data.items():
+            if col in skip: continue
+            if col not in table.columns: table.columns[col] = _infer_type(value)
+            table.set_values(col, [(table.rows[suid], value)])
+
+
+# ==============================================================================
+# Helpers
+
+_IMPORT_COLUMN_ROLES = {'source': 's', 'target': 't', 'interaction': 'i', 'source attribute': 'sa',
+                        'target attribute': 'ta', 'edge attribute': 'ea', 'skip': 'x'}
+_IMPORT_DATA_TYPES = {'s': 'String', 'string': 'String', 'i': 'Integer', 'int': 'Integer', 'l': 'Long',
+                      'long': 'Long', 'd': 'Double', 'double': 'Double', 'b': 'Boolean', 'boolean': 'Boolean'}
+
+
+def _infer_type(value):
+    if isinstance(value, bool): return 'Boolean'
+    if isinstance(value, int): return 'Long'
+    if isinstance(value, float): return 'Double'
+    if isinstance(value, list): return 'List'
+    return 'String'
+
+
+def _coerce_value(value, col_type):
+    # Store a value the way Cytoscape would for a column of col_type
+    if value is None or col_type == 'List':
+        return value
+    try:
+        if col_type in ('Long', 'Integer'):
+            return None if isinstance(value, float) and math.isnan(value) else int(value)
+        if col_type == 'Double':
+            return float(value)
+        if col_type == 'Boolean':
+            return value if isinstance(value, bool) else str(value).lower() == 'true'
+    except (TypeError, ValueError):
+        raise _CyRestError(500, f'Value "{value}" is not valid for a {col_type} column')
+    return str(value)
+
+
+def _parse_value(text, col_type):
+    # Interpret a query or default value passed as text
+    if col_type in ('Long', 'Integer'): return int(text)
+    if col_type == 'Double': return float(text)
+    if col_type == 'Boolean': return str(text).lower() == 'true'
+    return text
+
+
+def _check_visual_property(kind, vp):
+    if vp not in _VISUAL_PROPERTIES[kind]:
+        raise _CyRestError(404, f'Visual property "{vp}" does not exist for {kind}s')
+
+
+def _command_text(data):
+    if isinstance(data, dict):
+        lines = [f'{key}: {value}' for key, value in data.items()]
+    elif isinstance(data, list):
+        lines = [str(item) for item in data]
+    else:
+        lines = [str(data)]
+    return '\n'.join(lines + ['Finished', ''])
+
+
+def _suid_arg(value):
+    match = re.fullmatch(r'\s*SUID:\s*"?([0-9]+)"?\s*', value or '')
+    return int(match.group(1)) if match else None
+
+
+def _file_time(path):
+    return datetime.datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d %H:%M:%S.%f')[:-2]
+
+
+def _route(method, pattern, handler):
+    return method, re.compile(pattern.replace('{suid}', '([0-9]+)').replace('{name}', '([^/]+)')), handler
+
+
+_ROUTES = [
+    _route('GET', r'', FakeCytoscape._get_root),
+    _route('GET', r'version', FakeCytoscape._get_version),
+    _route('GET', r'gc', FakeCytoscape._get_gc),
+    _route('GET', r'networks', FakeCytoscape._get_networks),
+    _route('POST', r'networks', FakeCytoscape._post_network),
+    _route('DELETE', r'networks', FakeCytoscape._delete_networks),
+    _route('GET', r'networks/count', FakeCytoscape._get_network_count),
+    _route('GET', r'networks\.names', FakeCytoscape._get_network_names),
+    _route('GET', r'networks/views/currentNetworkView', FakeCytoscape._get_current_view),
+    _route('PUT', r'networks/views/currentNetworkView', FakeCytoscape._put_current_view),
+    _route('GET', r'networks/{suid}', FakeCytoscape._get_network),
+    _route('DELETE', r'networks/{suid}', FakeCytoscape._delete_network),
+    _route('GET', r'networks/{suid}/(nodes|edges)', FakeCytoscape._get_elements),
+    _route('GET', r'networks/{suid}/(nodes|edges)/count', FakeCytoscape._get_element_count),
+    _route('POST', r'networks/{suid}/nodes', FakeCytoscape._post_nodes),
+    _route('POST', r'networks/{suid}/edges', FakeCytoscape._post_edges),
+    _route('GET', r'networks/{suid}/edges/{suid}', FakeCytoscape._get_edge),
+    _route('GET', r'networks/{suid}/nodes/{suid}/neighbors', FakeCytoscape._get_neighbors),
+    _route('PUT', r'networks/{suid}/tables/{name}', FakeCytoscape._put_table),
+    _route('GET', r'networks/{suid}/tables/{name}/columns', FakeCytoscape._get_columns),
+    _route('POST', r'networks/{suid}/tables/{name}/columns', FakeCytoscape._post_column),
+    _route('PUT', r'networks/{suid}/tables/{name}/columns', FakeCytoscape._put_columns),
+    _route('GET', r'networks/{suid}/tables/{name}/columns/{name}', FakeCytoscape._get_column),
+    _route('PUT', r'networks/{suid}/tables/{name}/columns/{name}', FakeCytoscape._put_column),
+    _route('DELETE', r'networks/{suid}/tables/{name}/columns/{name}', FakeCytoscape._delete_column),
+    _route('GET', r'networks/{suid}/tables/{name}/rows', FakeCytoscape._get_rows),
+    _route('GET', r'networks/{suid}/tables/{name}/rows/{name}/{name}', FakeCytoscape._get_cell),
+    _route('GET', r'networks/{suid}/views', FakeCytoscape._get_views),
+    _route('POST', r'networks/{suid}/views', FakeCytoscape._post_view),
+    _route('DELETE', r'networks/{suid}/views', FakeCytoscape._delete_views),
+    _route('GET', r'networks/{suid}/views/first', FakeCytoscape._get_first_view),
+    _route('GET', r'networks/{suid}/views/{suid}/currentStyle', FakeCytoscape._get_current_style),
+    _route('GET', r'networks/{suid}/views/{suid}/network', FakeCytoscape._get_network_view_values),
+    _route('PUT', r'networks/{suid}/views/{suid}/network', FakeCytoscape._put_network_view_values),
+    _route('GET', r'networks/{suid}/views/{suid}/network/{name}', FakeCytoscape._get_network_view_value),
+    _route('DELETE', r'networks/{suid}/views/{suid}/network/{name}/bypass', FakeCytoscape._delete_network_bypass),
+    _route('GET', r'networks/{suid}/views/{suid}/(nodes|edges)', FakeCytoscape._get_view_elements),
+    _route('PUT', r'networks/{suid}/views/{suid}/(nodes|edges)', FakeCytoscape._put_view_elements),
+    _route('GET', r'networks/{suid}/views/{suid}/(nodes|edges)/{suid}/{name}', FakeCytoscape._get_view_element),
+    _route('DELETE', r'networks/{suid}/views/{suid}/(nodes|edges)/{suid}/{name}/bypass',
+           FakeCytoscape._delete_bypass),
+    _route('GET', r'styles', FakeCytoscape._get_styles),
+    _route('POST', r'styles', FakeCytoscape._post_style),
+    _route('DELETE', r'styles', FakeCytoscape._delete_styles),
+    _route('GET', r'styles/visualproperties/{name}/values', FakeCytoscape._get_vp_values),
+    _route('GET', r'styles/{name}', FakeCytoscape._get_style),
+    _route('DELETE', r'styles/{name}', FakeCytoscape._delete_style),
+    _route('GET', r'styles/{name}/defaults', FakeCytoscape._get_style_defaults),
+    _route('PUT', r'styles/{name}/defaults', FakeCytoscape._put_style_defaults),
+    _route('GET', r'styles/{name}/defaults/{name}', FakeCytoscape._get_style_default),
+    _route('GET', r'styles/{name}/mappings', FakeCytoscape._get_mappings),
+    _route('POST', r'styles/{name}/mappings', FakeCytoscape._post_mappings),
+    _route('GET', r'styles/{name}/mappings/{name}', FakeCytoscape._get_mapping),
+    _route('PUT', r'styles/{name}/mappings/{name}', FakeCytoscape._put_mapping),
+    _route('DELETE', r'styles/{name}/mappings/{name}', FakeCytoscape._delete_mapping),
+    _route('GET', r'styles/{name}/dependencies', FakeCytoscape._get_dependencies),
+    _route('PUT', r'styles/{name}/dependencies', FakeCytoscape._put_dependencies),
+    _route('GET', r'apply/styles', FakeCytoscape._get_styles),
+    _route('GET', r'apply/styles/{name}/{suid}', FakeCytoscape._apply_style),
+    _route('GET', r'apply/layouts', FakeCytoscape._get_layouts),
+    _route('GET', r'apply/layouts/{name}', FakeCytoscape._get_layout),
+    _route('GET', r'apply/layouts/{name}/parameters', FakeCytoscape._get_layout_parameters),
+    _route('GET', r'session/name', FakeCytoscape._get_session_name),
+    _route('DELETE', r'session', FakeCytoscape._delete_session),
+]
+
+_COMMANDS = {
+    ('network', 'get attribute'): FakeCytoscape._cmd_network,
+    ('network', 'import file'): FakeCytoscape._cmd_network,
+    ('network', 'set current'): FakeCytoscape._cmd_network,
+    ('network', 'list'): FakeCytoscape._cmd_network,
+    ('network', 'rename'): FakeCytoscape._cmd_network,
+    ('network', 'clone'): FakeCytoscape._cmd_network,
+    ('network', 'select'): FakeCytoscape._cmd_network,
+    ('network', 'delete'): FakeCytoscape._cmd_network,
+    ('view', '*'): FakeCytoscape._cmd_view,
+    ('vizmap', 'apply'): FakeCytoscape._cmd_vizmap,
+    ('layout', '*'): FakeCytoscape._cmd_layout,
+    ('session', 'new'): FakeCytoscape._cmd_session,
+    ('command', 'echo'): FakeCytoscape._cmd_command,
+    ('command', 'sleep'): FakeCytoscape._cmd_command,
+    ('apps', 'list installed'): FakeCytoscape._cmd_apps,
+    ('filetransfer', '*'): FakeCytoscape._cmd_filetransfer,
+}
+
+
+def _handler_for(fake):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep connections alive, as Cytoscape does
+        disable_nagle_algorithm = True
+
+        def _reply(self):
+            length = int(self.headers.get('Content-Length', 0))
+            raw_body = self.rfile.read(length) if length else b''
+            try:
+                body = json.loads(raw_body) if raw_body else None
+            except ValueError:
+                body = raw_body.decode('utf-8')
+            url = urllib.parse.urlsplit(self.path)
+            params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query, keep_blank_values=True).items()}
+            status, reply = fake._handle(self.command, urllib.parse.unquote(url.path), params, body)
+
+            if isinstance(reply, _Text):
+                content, content_type = reply.encode('utf-8'), 'text/plain'
+            else:
+                content, content_type = b'' if reply is None else json.dumps(reply).encode('utf-8'), 'application/json'
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+        def log_message(self, format, *args):
+            pass
+
+    return _Handler
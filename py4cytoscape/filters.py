@@ -22,10 +22,8 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # Internal module convenience imports
-import time
 import json
 import warnings
-import numpy as np
 
 # Internal module imports
 from . import commands
@@ -39,7 +37,8 @@ from . import sandbox
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, show_error
-from .py4cytoscape_tuning import CATCHUP_FILTER_SECS
+from .py4cytoscape_client import get_client
+from .py4cytoscape_tuning import wait_until_ready, settled
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
 @cy_log
@@ -145,7 +144,7 @@ def create_column_filter(filter_name, column, criterion, predicate, caseSensitiv
     if column not in tables.get_table_column_names(type[:4], base_url=base_url):
         raise CyError('Column "%s" does not exist in the "%s" table' % (column, type[:4]))
 
-    if predicate == "REGEX" and check_supported_versions(cytoscape='3.9'):
+    if predicate == "REGEX" and not has_capability('supports_regex_filter', base_url=base_url):
         show_error('Warning -- Cytoscape version pre-3.9 in use ... REGEX filter may hang forever')
     elif predicate in ['BETWEEN', 'IS_NOT_BETWEEN']:
         if not isinstance(criterion, list) or len(criterion) != 2:
@@ -159,6 +158,7 @@ def create_column_filter(filter_name, column, criterion, predicate, caseSensitiv
         # crit_max will be the type of the Pandas column, which could be np.int64, npfloat64 or string.
         # The numeric formats can't be directly serialized into JSON, so they have to be converted to
         # Python types that can be serialized.
+        import numpy as np  # Already loaded by pandas, but not imported by py4cytoscape until needed
         if isinstance(crit_max, np.int64):  crit_max=int(crit_max)
         elif isinstance(crit_max, np.float64):  crit_max=float(crit_max)
         criterion = [criterion, crit_max]
@@ -388,15 +388,17 @@ def import_filters(filename, base_url=DEFAULT_BASE_URL):
         []
     """
 
-    res = commands.commands_get(f'filter import file="{get_abs_sandbox_path(filename)}"', base_url=base_url)
-    time.sleep(
-        CATCHUP_FILTER_SECS)  # give the filters time to finish executing ... this race condition is a Cytoscape bug
+    res = commands.commands_get(f'filter import file="{get_abs_sandbox_path(filename, base_url=base_url)}"', base_url=base_url)
+    # give the filters time to finish executing ... this race condition is a Cytoscape bug
+    tuning = get_client(base_url).tuning
+    wait_until_ready(settled(lambda: network_selection.get_selected_node_count(base_url=base_url)),
+                     tuning.CATCHUP_FILTER_SECS, tuning=tuning)
     return res
 
 
 def _create_filter_and_finish(cmd, cmd_body, hide, apply, network, base_url):
     AUTO_APPLY_THRESHOLD = 100000
-    if check_supported_versions(cytoscape='3.9') is None:
+    if has_capability('supports_filter_apply_flag', base_url=base_url):
         cmd_body['apply'] = apply
         res = commands.cyrest_post(cmd, body=cmd_body, base_url=base_url)
     else:
@@ -418,10 +420,13 @@ def _create_filter_and_finish(cmd, cmd_body, hide, apply, network, base_url):
 
 
 def _check_selected(hide, network, base_url):
-    if check_supported_versions(cytoscape='3.9'):
+    if not has_capability('supports_filter_apply_flag', base_url=base_url):
     # This delay became unnecessary in Cytoscape 3.9
         show_error('Warning -- Cytoscape version pre-3.9 in use ... settling delay inserted after filter execution')
-        time.sleep(CATCHUP_FILTER_SECS)  # Yikes! Have to wait a second for selection to settle!
+        # Yikes! Have to wait a second for selection to settle!
+        tuning = get_client(base_url).tuning
+        wait_until_ready(settled(lambda: network_selection.get_selected_node_count(network=network, base_url=base_url)),
+                         tuning.CATCHUP_FILTER_SECS, tuning=tuning)
 
     sel_nodes = network_selection.get_selected_nodes(network=network, base_url=base_url)
     sel_edges = network_selection.get_selected_edges(network=network, base_url=base_url)
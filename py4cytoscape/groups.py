@@ -30,6 +30,7 @@ from . import networks
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_client import get_client, NAME_INDEX_CACHE
 
 
 @cy_log
@@ -92,6 +93,7 @@ def add_to_group(group_name, nodes=None, nodes_by_col='SUID', edges=None, edges_
     res = commands.commands_post(
         f'group add groupName="{group_name}" nodeList="{node_list}" edgeList="{edge_list}" network="SUID:{net_suid}"',
         base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -132,6 +134,7 @@ def collapse_group(groups=None, network=None, base_url=DEFAULT_BASE_URL):
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'group collapse groupList="{group_list}" network="SUID:{net_suid}"',
                                  base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -185,6 +188,7 @@ def create_group(group_name, nodes=None, nodes_by_col='SUID', network=None, base
     res = commands.commands_post(
         f'group create groupName="{group_name}" nodeList="{node_list}" network="SUID:{net_suid}"',
         base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -218,6 +222,7 @@ def create_group_by_column(group_name, column=None, value=None, network=None, ba
     res = commands.commands_post(
         f'group create groupName="{group_name}" nodeList="{column}":"{value}" network="SUID:{net_suid}"',
         base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -258,6 +263,7 @@ def expand_group(groups=None, network=None, base_url=DEFAULT_BASE_URL):
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(
         f'group expand groupList="{group_list}" network="SUID:{net_suid}"', base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -398,6 +404,7 @@ def remove_from_group(group_name, nodes=None, nodes_by_col='SUID', edges=None, e
     res = commands.commands_post(
         f'group remove groupName="{group_name}" nodeList="{node_list}" edgeList="{edge_list}" network="SUID:{net_suid}"',
         base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -445,5 +452,6 @@ def delete_group(groups=None, groups_by_col='SUID', network=None, base_url=DEFAU
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'group ungroup nodeList="{group_list}" network="SUID:{net_suid}"', base_url=base_url)
     # TODO: The R implementation uses the groupList parameter, which conflicts with the command documentation
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
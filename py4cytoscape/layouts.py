@@ -36,6 +36,7 @@ from . import networks
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_metadata import cached_metadata
 
 
 # ==============================================================================
@@ -199,6 +200,10 @@ def get_layout_names(base_url=DEFAULT_BASE_URL):
 
     Note that yFiles layouts are not available due to licensing restrictions with yWorks, the owner of yFiles.
 
+    The names are fetched once and then cached (see ``warm_metadata_cache()``). Installing or removing an app via
+    py4cytoscape discards the cache, but if you do so from Cytoscape's GUI, call ``warm_metadata_cache(refresh=True)``
+    afterward.
+
     Args:
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://localhost:1234
@@ -214,8 +219,8 @@ def get_layout_names(base_url=DEFAULT_BASE_URL):
         >>> get_layout_names()
         ['attribute-circle', 'stacked-node-layout', 'degree-circle', 'circular', 'attributes-layout', 'kamada-kawai', 'force-directed', 'cose', 'grid', 'hierarchical', 'fruchterman-rheingold', 'isom']
     """
-    res = commands.cyrest_get('apply/layouts', base_url=base_url)
-    return res
+    return cached_metadata('layout_names', lambda: commands.cyrest_get('apply/layouts', base_url=base_url),
+                           base_url=base_url)
 
 
 @cy_log
@@ -275,9 +280,11 @@ def get_layout_property_names(layout_name, base_url=DEFAULT_BASE_URL):
         >>> get_layout_property_names('force-directed')
         ['numIterations', 'defaultSpringCoefficient', 'defaultSpringLength', 'defaultNodeMass', 'isDeterministic', 'singlePartition']
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_names = [param_def['name'] for param_def in res]
-    return param_names
+    def fetch_layout_property_names():
+        res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
+        return [param_def['name'] for param_def in res]
+
+    return cached_metadata(f'layout_property_names:{layout_name}', fetch_layout_property_names, base_url=base_url)
 
 
 @cy_log
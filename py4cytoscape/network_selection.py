@@ -32,7 +32,9 @@ from . import networks
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
+from .py4cytoscape_utils import _get_name_index
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_client import get_client, NAME_INDEX_CACHE
 
 
 # ==============================================================================
@@ -387,6 +389,7 @@ def delete_selected_nodes(network=None, base_url=DEFAULT_BASE_URL):
     title = networks.get_network_name(network, base_url=base_url)
     res = commands.commands_post(f'network delete nodeList="selected" network="{title}"', base_url=base_url)
     # TODO: Added double quotes to network title
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -596,6 +599,7 @@ def delete_selected_edges(network=None, base_url=DEFAULT_BASE_URL):
     title = networks.get_network_name(network, base_url=base_url)
     res = commands.commands_post(f'network delete edgeList=selected network="{title}"', base_url=base_url)
     # TODO: Added double quotes to network title
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -851,7 +855,7 @@ def delete_duplicate_edges(network=None, base_url=DEFAULT_BASE_URL, *, ignore_di
     """
     net_suid = networks.get_network_suid(network, base_url=base_url)
     all_edges = networks.get_all_edges(net_suid, base_url=base_url)
-    suid_to_name_map_df = tables.get_table_columns('edge', ['name'], 'default', network=net_suid, base_url=base_url)
+    edge_name_index = _get_name_index('edge', net_suid, base_url=base_url)
 
     def build_sorted_edge_equivalents(parsed_edge):
         # Creates a tuple where first element is lexigraphically smaller than the second
@@ -867,10 +871,7 @@ def delete_duplicate_edges(network=None, base_url=DEFAULT_BASE_URL, *, ignore_di
         if edge_name is None:
             return []
         else:
-            try:
-                return list(suid_to_name_map_df[suid_to_name_map_df.name.eq(edge_name)].index.values)
-            except:
-                return []
+            return edge_name_index.name_to_suids.get(edge_name, [])
 
     # If ignoring direction, adjust all_edges to a canonical ordering of source and target
     if ignore_direction:
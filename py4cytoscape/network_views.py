@@ -36,6 +36,7 @@ from . import sandbox
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_client import get_client, NETWORK_SUID_CACHE
 from .py4cytoscape_utils import verify_supported_versions
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
@@ -239,6 +240,7 @@ def set_current_view(network=None, base_url=DEFAULT_BASE_URL):
     """
     view_suid = get_network_view_suid(network, base_url=base_url)
     res = commands.commands_post(f'view set current view="SUID:{view_suid}"', base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)  # The view's network is now current
     # Added double quotes for SUID
     return res
 
@@ -356,7 +358,7 @@ def export_image(filename=None, type='PNG', resolution=None, units=None, height=
                          or height is not None \
                          or width is not None
 
-    if check_supported_versions(1, "3.10", base_url=base_url):
+    if not has_capability('supports_v310_export', base_url=base_url):
         # Cytoscape appears to be pre-3.10
         if has_v10_params:
             raise CyError('Cannot use Cytoscape v3.10 parameters with pre-v3.10 Cytoscape')
@@ -40,11 +40,15 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
+import os
+import csv
+import json
+import itertools
+import shutil
+import tempfile
 import time
 import warnings
-import pandas as pd
-import igraph as ig
-import networkx as nx
+from concurrent.futures import ThreadPoolExecutor
 
 # Internal module imports
 from . import commands
@@ -56,8 +60,10 @@ from . import sandbox
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
-from .py4cytoscape_logger import cy_log
-from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS, CATCHUP_NETWORK_SECS, CATCHUP_NETWORK_TIMEOUT_SECS
+from .py4cytoscape_logger import cy_log, narrate, detail_logger
+from .py4cytoscape_notebook import check_execution_environment, ExecutionEnvironment
+from .py4cytoscape_client import get_client, NAME_INDEX_CACHE, NETWORK_SUID_CACHE
+from .py4cytoscape_tuning import wait_until_ready, wait_until_stable
 from .exceptions import CyError
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
@@ -91,9 +97,10 @@ def set_current_network(network=None, base_url=DEFAULT_BASE_URL):
         >>> set_current_network(1502) # sets network having SUID 1502 as current
         {}
     """
-    suid = get_network_suid(network)
+    suid = get_network_suid(network, base_url=base_url)
     cmd = f'network set current network="SUID:{suid}"'
     res = commands.commands_post(cmd, base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
     # TODO: Put double quotes around SUID
     return res
 
@@ -130,7 +137,9 @@ def rename_network(title, network=None, base_url=DEFAULT_BASE_URL):
     old_suid = get_network_suid(network, base_url=base_url)
     cmd = f'network rename name="{title}" sourceNetwork="SUID:{old_suid}"'
     # TODO: Put double quotes around SUID
-    return commands.commands_post(cmd, base_url=base_url)
+    res = commands.commands_post(cmd, base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
+    return res
 
 
 @cy_log
@@ -243,30 +252,19 @@ def get_network_suid(title=None, base_url=DEFAULT_BASE_URL):
         'current', and NULL). These functions are then used by all other functions
         that take a "network" argument.
     """
-    if isinstance(title, str):
-        # Title was provided
-        if title == 'current':
-            network_title = title
-        else:
-            net_names = get_network_list(base_url=base_url)
-            if title in net_names:
-                network_title = title
-            else:
-                raise CyError(f'Network does not exist for name "{title}"')
-    elif isinstance(title, int):
-        # SUID was provided
-        net_suids = commands.cyrest_get('networks', base_url=base_url)
-        if title in net_suids:
-            return title
-        raise CyError(f'Network does not exist for SUID "{title}"')
-    else:
-        # Don't understand, so use current network
-        network_title = 'current'
+    # Within one py4cytoscape call (or batch), resolve each network only once
+    resolved = get_client(base_url).scoped_cache(NETWORK_SUID_CACHE)
+    key = title if isinstance(title, (str, int)) else 'current'
+    if resolved is not None and key in resolved:
+        return resolved[key]
 
-    # Make requested network current and return its SUID
-    cmd = f'network get attribute network="{network_title}" namespace="default" columnList="SUID"'
-    response = commands.commands_post(cmd, base_url=base_url)
-    return int(response[0]['SUID'])
+    suid = _resolve_network_suid(title, base_url=base_url)
+    if resolved is not None:
+        if isinstance(key, str) and key != 'current':
+            resolved.pop('current', None)  # Resolving a name makes that network current
+        resolved[key] = suid
+        resolved[suid] = suid
+    return suid
 
 
 @cy_log
@@ -386,8 +384,9 @@ def delete_network(network=None, base_url=DEFAULT_BASE_URL):
         >>> delete_network('galFiltered.sif') # delete network having name
         ''
     """
-    suid = get_network_suid(network)
+    suid = get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete(f'networks/{suid}', base_url=base_url, require_json=False)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE, NETWORK_SUID_CACHE)
     return res
 
 
@@ -410,6 +409,7 @@ def delete_all_networks(base_url=DEFAULT_BASE_URL):
         >>> delete_all_networks()
     """
     res = commands.cyrest_delete('networks', base_url=base_url, require_json=False)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE, NETWORK_SUID_CACHE)
     return res
 
 
@@ -418,9 +418,13 @@ def delete_all_networks(base_url=DEFAULT_BASE_URL):
 # ------------------------------------------------------------------------------
 
 @cy_log
-def get_first_neighbors(node_names=None, as_nested_list=False, network=None, base_url=DEFAULT_BASE_URL):
+def get_first_neighbors(node_names=None, as_nested_list=False, network=None, as_dict=False, base_url=DEFAULT_BASE_URL):
     """Returns a non-redundant list of first neighbors of the supplied list of nodes or current node selection.
 
+    Each distinct node's neighbors are found once. For a few nodes, they're fetched with up to ``HTTP_POOL_SIZE``
+    neighbor queries at a time. For many nodes (relative to the number of edges), they're found in a single fetch of
+    the whole network instead.
+
     Args:
         node_names (str or list or int or None): List of nodes (as ``list`` of node names or SUIDs,
             comma-separated string of node names or SUIDs, or scalar node name or SUID). Node names should be found
@@ -428,6 +432,7 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
         as_nested_list (bool): Whether to return lists of neighbors per query node.
         network (SUID or str or None): Name or SUID of a network or view. Default is the
             "current" network active in Cytoscape.
+        as_dict (bool): Whether to return a dict of neighbors per query node (overrides ``as_nested_list``)
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
@@ -435,6 +440,7 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
     Returns:
         list: deduped list of nodes neighboring specified nodes.
             If as_nested_list parameter is True, a list of neighbor node lists, one per specified node
+        dict: if as_dict parameter is True, {node: [neighbor node names]} for each specified node
 
     Raises:
         CyError: if network name or SUID doesn't exist, if no nodes are selected, or if node doesn't exist
@@ -455,6 +461,8 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
         ['YGL035C', 'YOL051W', 'YPL248C', 'YML051W', 'YLR044C', 'YLR377C', 'YIL162W', ... ]
         >>> get_first_neighbors(515677, as_nested_list=False)
         ['YGL035C', 'YOL051W', 'YPL248C', 'YML051W']
+        >>> get_first_neighbors(['YBR020W', 'YGL035C'], as_dict=True)
+        {'YBR020W': ['YGL035C', 'YOL051W', 'YPL248C', 'YML051W'], 'YGL035C': ['YLR044C', 'YLR377C', ...]}
 
     Note:
         To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
@@ -463,7 +471,6 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
     See Also:
         :meth:`select_nodes`, :meth:`select_first_neighbors`
     """
-    # TODO: This looks very inefficient because for each node, the entire node table is fetched from Cytoscape and the neighbor list is de-dupped ... verify this and maybe do better
     if node_names is None:
         node_names = network_selection.get_selected_nodes(network=network, base_url=base_url)
     else:
@@ -472,24 +479,24 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
     if node_names is None or len(node_names) == 0: return None
 
     net_suid = get_network_suid(network, base_url=base_url)
-    neighbor_names = []
-
-    for node_name in node_names:
-        # get first neighbors for each node
-        node_suid = node_name_to_node_suid([node_name], net_suid, base_url=base_url, unique_list=True)[0]
-
-        first_neighbors_suids = commands.cyrest_get(
-            f'networks/{net_suid}/nodes/{node_suid}/neighbors', base_url=base_url)
-        first_neighbors_names = node_suid_to_node_name(first_neighbors_suids, net_suid, base_url=base_url)
-
-        if as_nested_list:
-            neighbor_names.append([node_name, first_neighbors_names])
-        else:
-            neighbor_names += first_neighbors_names
-            neighbor_names = list(dict.fromkeys(neighbor_names))  # dedup list
-
-    return neighbor_names
 
+    # Resolve each distinct name once (as its first node, if several nodes share it), fetch each distinct node's
+    # neighbors once, and then name all of the neighbors at once
+    unique_names = list(dict.fromkeys(node_names))
+    node_suids = [node_name_to_node_suid([node_name], net_suid, base_url=base_url, unique_list=True)[0]
+                  for node_name in unique_names]
+    neighbor_suids = _get_neighbor_suids(list(dict.fromkeys(node_suids)), net_suid, base_url=base_url)
+    all_neighbor_suids = list(dict.fromkeys(suid for suids in neighbor_suids.values() for suid in suids))
+    suid_to_name = dict(zip(all_neighbor_suids, node_suid_to_node_name(all_neighbor_suids, net_suid, base_url=base_url)))
+    neighbor_names = {node_name: [suid_to_name[suid] for suid in neighbor_suids[node_suid]]
+                      for node_name, node_suid in zip(unique_names, node_suids)}
+
+    if as_dict:
+        return neighbor_names
+    elif as_nested_list:
+        return [[node_name, neighbor_names[node_name]] for node_name in node_names]
+    else:
+        return list(dict.fromkeys(name for node_name in unique_names for name in neighbor_names[node_name]))
 
 @cy_log
 def add_cy_nodes(node_names, skip_duplicate_names=True, network=None, base_url=DEFAULT_BASE_URL):
@@ -531,6 +538,7 @@ def add_cy_nodes(node_names, skip_duplicate_names=True, network=None, base_url=D
         node_names = list(set(node_names) - set(all_nodes_list))
 
     res = commands.cyrest_post(f'networks/{net_suid}/nodes', body=node_names, base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -655,6 +663,7 @@ def add_cy_edges(source_target_list, edge_type='interacts with', directed=False,
                   'interaction': edge_type} for x in range(0, len(edge_suid_list) - 1, 2)]
 
     res = commands.cyrest_post(f'networks/{net_suid}/edges', body=edge_data, base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
@@ -820,6 +829,7 @@ def clone_network(network=None, base_url=DEFAULT_BASE_URL):
     """
     net_suid = get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'network clone network="SUID:{net_suid}"', base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
 
     # TODO: Put double quotes around SUID
     return res['network']
@@ -884,6 +894,7 @@ def create_subnetwork(nodes=None, nodes_by_col='SUID', edges=None, edges_by_col=
     if not subnetwork_name is None: json_sub['networkName'] = subnetwork_name
 
     res = commands.cyrest_post('commands/network/create', body=json_sub, base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
     return res['data']['network']
 
 
@@ -941,45 +952,10 @@ def create_network_from_igraph(igraph, title='From igraph', collection='My Igrap
     # TODO: Verify the undeclared parameter behaviors claimed in the R documents
     # TODO: Is this really faithful to the R implementation?
 
-    def rename_dup_columns(col_list, col_name):
-        # See if a column name exists, and if so, rename all other same-name columns.
-        # Especially important for graphs that come with a ``source`` or ``target`` name
-        # created by get_edge_dataframe (which creates these columns) when these columns
-        # were already in the graph as a result of creating the graph from a Cytoscape
-        # network.
-        first_index = col_list.index(col_name)
-        replacement_name = col_name + '.original'
-        new_cols = [replacement_name if i != first_index and col_list[i] == col_name else col_list[i] for i in range(len(col_list))]
-        return new_cols
-
-    # Get nodes as a table indexed by node number ... assume every node has at least a 'name' attribute as a string
-    node_df = ig.Graph.get_vertex_dataframe(igraph)
-    node_df['name'] = node_df['name'].astype(str)
-
-    # Get edges as a table ... assume every edge has a 'source' and 'target' column as indexes into node table
-    edge_df = ig.Graph.get_edge_dataframe(igraph)
-    # Make sure interaction is a string
-    if 'interaction' in edge_df.columns: edge_df['interaction'] = edge_df['interaction'].astype(str)
-
-    try:
-        # If the incoming graph contained a column named 'source' or 'target', rename them
-        edge_cols = rename_dup_columns(list(edge_df.columns), 'source')
-        edge_df.columns = rename_dup_columns(edge_cols, 'target')
-    except:
-        narrate('Edge table missing "source" or "target" attribute') # iGraph creates this df, so should never happen
-        edge_df = None
-
-    if edge_df is not None:
-        try:
-            # Convert edge 'source' and 'target' values from index into node table to actual node name
-            edge_df['source'] = edge_df['source'].apply(lambda x: node_df['name'][x])
-            edge_df['target'] = edge_df['target'].apply(lambda x: node_df['name'][x])
-        except:
-            narrate('Not all edge sources or targets resolve to vertex names') # iGraph creates this df, so should never happen
-            edge_df = None
+    node_df, edge_df = _igraph_to_data_frames(igraph)
 
     if len(node_df.index) == 0: node_df = None
-    if edge_df is not None and len(edge_df.index) == 0: edge_df = None
+    if len(edge_df.index) == 0: edge_df = None
 
     return create_network_from_data_frames(nodes=node_df, edges=edge_df, title=title, collection=collection,
                                            base_url=base_url, node_id_list='name')
@@ -987,7 +963,7 @@ def create_network_from_igraph(igraph, title='From igraph', collection='My Igrap
 
 @cy_log
 def create_network_from_networkx(netx, title='From networkx', collection='My NetworkX Network Collection',
-                                 base_url=DEFAULT_BASE_URL):
+                                 base_url=DEFAULT_BASE_URL, *, node_attributes=None, edge_attributes=None):
     """Create a Cytoscape network from a NetworkX graph.
 
     Args:
@@ -997,6 +973,9 @@ def create_network_from_networkx(netx, title='From networkx', collection='My Net
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        * :
+        node_attributes (list or None): Names of node attributes to send to Cytoscape; default is all
+        edge_attributes (list or None): Names of edge attributes to send to Cytoscape; default is all
 
     Returns:
         int: The ``SUID`` of the new network
@@ -1009,19 +988,22 @@ def create_network_from_networkx(netx, title='From networkx', collection='My Net
         31766
         >>> create_network_from_networkx(netx, 'Cool Networkx', 'Collection of Cool Networks')
         31766
+        >>> create_network_from_networkx(netx, edge_attributes=['weight'])
+        31790
 
     See Also:
         :meth:`create_networkx_from_network`
     """
-    netx_nodes = netx.nodes(data=True) # returns list of tuples (name, attrs)
-    netx_node_list = [{**attrs, 'name': name}    for name, attrs in netx_nodes]
-    node_df = pd.DataFrame.from_records(netx_node_list)
+    import pandas as pd  # Imported here so that importing py4cytoscape stays fast
 
-    netx_edges = netx.edges(data=True) # returns list of tuples (src, targ, attrs)
-    netx_edge_list = [{**attrs, 'source': src, 'target': targ}    for src, targ, attrs in netx_edges]
-    edge_df = pd.DataFrame.from_records(netx_edge_list)
+    # Fill a column per attribute, a node or edge at a time, instead of making a dict per node or edge
+    node_names, node_cols = _networkx_columns(netx.nodes(data=True), netx.number_of_nodes(), 1, node_attributes,
+                                              {'name'})
+    node_df = pd.DataFrame({**node_cols, 'name': node_names[0]})
 
-    # TODO: This will blow if there are no edges or no nodes ... so will create_network_from_igraph() ... will R blow, too?
+    edge_ends, edge_cols = _networkx_columns(netx.edges(data=True), netx.number_of_edges(), 2, edge_attributes,
+                                             {'source', 'target'})
+    edge_df = pd.DataFrame({**edge_cols, 'source': edge_ends[0], 'target': edge_ends[1]})
 
     # Make sure critical attributes are strings
     node_df['name'] = node_df['name'].astype(str)
@@ -1039,7 +1021,7 @@ def create_network_from_networkx(netx, title='From networkx', collection='My Net
 def create_network_from_data_frames(nodes=None, edges=None, title='From dataframe',
                                     collection='My Dataframe Network Collection', base_url=DEFAULT_BASE_URL, *,
                                     node_id_list='id', source_id_list='source', target_id_list='target',
-                                    interaction_type_list='interaction'):
+                                    interaction_type_list='interaction', inline_attributes=False):
     """Create a network from data frames.
 
     Takes data frames for nodes and edges, as well as naming parameters to generate the JSON data format required by
@@ -1059,6 +1041,14 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         Note that the extra ``id`` column is created in the node table because the ``id`` column is mandatory in the
         cytoscape.js format, which is what is sent to Cytoscape.
 
+        By default, the network is created first, and the node and edge attributes are loaded into it afterwards. With
+        ``inline_attributes=True``, the attributes are sent along with the nodes and edges instead, which saves
+        several calls (and matching each edge to its SUID), and so is much faster for large networks. The network is
+        the same, except that Cytoscape chooses each column's type from its values (e.g., a column of integers may be
+        a Long column), and the edge table has no ``source``, ``target`` or ``data.key.column`` columns. Missing
+        values are left empty, and lists become comma-separated strings. If a column holds values that can't be sent
+        this way (e.g., a mixture of strings and numbers), the attributes are loaded afterwards as usual.
+
     Args:
         nodes (DataFrame): see details and examples below; default NULL to derive nodes from edge sources and targets
         edges (DataFrame): see details and examples below; default NULL for disconnected set of nodes
@@ -1072,6 +1062,7 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         source_id_list (str): Name of column in ``edges`` containing source node name
         target_id_list (str): Name of column in ``edges``  containing target node name
         interaction_type_list (str): Name of column in ``edges``  containing interaction name
+        inline_attributes (bool): True to send node and edge attributes along with the nodes and edges (see Notes)
 
     Returns:
         int: The ``SUID`` of the new network
@@ -1094,67 +1085,85 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
         >>>
         >>> create_network_from_data_frames(nodes, edges, title='From node & edge dataframe')
         1477
+        >>> create_network_from_data_frames(nodes, edges, title='From node & edge dataframe', inline_attributes=True)
+        1502
     """
 
-    def compute_edge_name(source, target, interaction):
-        return source + ' (' + interaction + ') ' + target
-
-    # Create a node list even if we have to use the edges lists to infer nodes
+    # Create a node list even if we have to use the edges lists to infer nodes ... each node is listed once, in the
+    # order it first appears in the edges
     if nodes is None:
         if not edges is None:
-            id_list = []
-            for source, target in zip(edges['source'].values, edges['target'].values):
-                id_list.append(source)
-                id_list.append(target)
-            nodes = pd.DataFrame(data=id_list, columns=['id'])
+            import numpy as np
+            import pandas as pd
+            ends = np.column_stack((edges[source_id_list].to_numpy(dtype=object),
+                                    edges[target_id_list].to_numpy(dtype=object)))
+            nodes = pd.DataFrame({node_id_list: pd.unique(ends.ravel())})
         else:
             raise CyError('Must provide either nodes or edges')
 
-    # create the JSON for a node list ... in cytoscape.js format
     NODE_ID_COL_NAME = 'id'
-    json_nodes = [{'data': {NODE_ID_COL_NAME: node}} for node in nodes[node_id_list]]
-
-    # create the JSON for an edge list ... in cytoscape.js format
-    json_edges = []
+    edge_names = None
     if not edges is None:
         if not interaction_type_list in edges.columns: edges[interaction_type_list] = 'interacts with'
-        edges_sub = edges[[source_id_list, target_id_list, interaction_type_list]]
-        json_edges = [{'data': {'name': compute_edge_name(source, target, interaction), 'source': source,
-                                'target': target, 'interaction': interaction}} for source, target, interaction in
-                      zip(edges_sub[source_id_list], edges_sub[target_id_list], edges_sub[interaction_type_list])]
+        edge_names = _edge_names(edges[source_id_list], edges[target_id_list], edges[interaction_type_list])
+
+    # if attributes are to be sent along with the nodes and edges, find the columns to send ... but if some column
+    # can't be sent that way, fall back to loading all attributes after the network is created
+    node_attrs = edge_attrs = []
+    if inline_attributes:
+        node_attrs = [col for col in nodes.columns if col not in ['SUID', NODE_ID_COL_NAME]]
+        if not edges is None:
+            edge_attrs = [col for col in edges.columns if col not in _CYJS_EDGE_KEYS]
+        if not all(_cyjs_can_carry(nodes[col]) for col in node_attrs) or \
+                not all(_cyjs_can_carry(edges[col]) for col in edge_attrs):
+            detail_logger.debug('Loading attributes after creating network, as some can\'t be sent with it')
+            inline_attributes = False
+            node_attrs = edge_attrs = []
 
     # create the full JSON for a cytoscape.js-style network ... see http://manual.cytoscape.org/en/stable/Supported_Network_File_Formats.html#cytoscape-js-json
-    # Note that no node or edge attributes are included in this version of the network
-    json_network = {'data': [{'name': title}], 'elements': {'nodes': json_nodes, 'edges': json_edges}}
+    # Note that node and edge attributes are included in this version of the network only if inline_attributes
+    start_time = time.perf_counter()
+    node_columns = [(NODE_ID_COL_NAME, nodes[node_id_list])] + [(col, nodes[col]) for col in node_attrs]
+    edge_columns = []
+    if not edges is None:
+        edge_columns = [('name', edge_names), ('source', edges[source_id_list]), ('target', edges[target_id_list]),
+                        ('interaction', edges[interaction_type_list])] + [(col, edges[col]) for col in edge_attrs]
+    json_network = _cyjs_network_json(title, node_columns, edge_columns)
+    edge_count = 0 if edges is None else len(edges.index)
+    detail_logger.debug(f'Encoded {len(nodes.index)} nodes and {edge_count} edges as {len(json_network)} bytes in '
+                        f'{time.perf_counter() - start_time:.3f} secs')
 
     # call Cytoscape to create this network and return the SUID
     network_suid = commands.cyrest_post('networks', parameters={'title': title, 'collection': collection},
                                         body=json_network, base_url=base_url)['networkSUID']
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
     # TODO: There appears to be a race condition here ... the view isn't set for a while. Without an explicit delay, the
     # "vizmap apply" command below fails for lack of a valid view. So, we'll retry
     # the problem operations until they succeed (see _delay_until_stable() calls below)
 
     # Keep cycling until Cytoscape is able to return table information ... safe after that
-    _delay_until_stable(lambda: get_network_suid(network_suid, base_url=base_url) is not None,
-                        'verifying network SUID', vote_count=10)
+    _delay_until_stable(lambda: commands.cyrest_get(f'networks/{network_suid}/tables/defaultnode/columns',
+                                                    base_url=base_url) is not None,
+                        'verifying network SUID', vote_count=10, base_url=base_url)
 
     # drop the SUID column if one is present
     nodes = nodes.drop(['SUID'], axis=1, errors='ignore')
 
     # load node attributes into Cytoscape network
-    if len(set(nodes.columns) - {node_id_list}) != 0:
+    if inline_attributes:
+        pass # already loaded along with the nodes and edges
+    elif len(set(nodes.columns) - {node_id_list}) != 0:
         tables.load_table_data(nodes, data_key_column=node_id_list, table_key_column=NODE_ID_COL_NAME, network=network_suid,
                                base_url=base_url)
 
-    if not edges is None:
+    if not edges is None and not inline_attributes:
         # get rid of SUID column if one is present
         edges = edges.drop(['SUID'], axis=1, errors='ignore')
-        # create edge name out of source/interaction/target
-        edge_names = [compute_edge_name(source, target, interaction) for source, interaction, target in
-                      zip(edges[source_id_list], edges[interaction_type_list], edges[target_id_list])]
+        # use the edge name made out of source/interaction/target
         edges['name'] = edge_names
         # find out the SUID of each node so it can be used in a multigraph if needed
-        edges['data.key.column'] = edge_name_to_edge_suid(edge_names, network_suid, base_url=base_url, unique_list=True)
+        edges['data.key.column'] = edge_name_to_edge_suid(edge_names.tolist(), network_suid, base_url=base_url,
+                                                          unique_list=True)
 
         # if the edge list looks real, add the edge attributes (if any)
         if len(set(edges.columns) - set(['source', 'target', 'interaction', 'name', 'data.key.column'])) != 0:
@@ -1163,11 +1172,11 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
 
     narrate('Applying default style...')
     _delay_until_stable(lambda: commands.commands_post('vizmap apply styles="default"', base_url=base_url) is not None,
-                        'apply vizmap')
+                        'apply vizmap', base_url=base_url)
 
     narrate('Applying preferred layout')
-    _delay_until_stable(lambda: layouts.layout_network(network=network_suid) is not None,
-                        'layout network')
+    _delay_until_stable(lambda: layouts.layout_network(network=network_suid, base_url=base_url) is not None,
+                        'layout network', base_url=base_url)
 
     # TODO: Verify that attribute types are properly set in Cytoscape
 
@@ -1231,12 +1240,14 @@ def create_network_from_cytoscapejs(cytoscapejs, title=None, collection='My Cyto
 
     # Send JSON to Cytoscape to create new network/view
     res = commands.cyrest_post('networks', params, cytoscapejs, base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
     return res['networkSUID']
 
 
 
 @cy_log
-def import_network_from_tabular_file(file=None, first_row_as_column_names=False, start_load_row=1, column_type_list='s,i,t', delimiters='\\,,\t', base_url=DEFAULT_BASE_URL):
+def import_network_from_tabular_file(file=None, first_row_as_column_names=False, start_load_row=1, column_type_list='s,i,t', delimiters='\\,,\t', base_url=DEFAULT_BASE_URL,
+                                     *, data_type_list=None):
     """Loads a network from specified file.
 
     Note:
@@ -1253,6 +1264,8 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        data_type_list (str): comma-separated map of column data types ordered by column index (e.g., "s,s,i,d,b"
+            for String, String, Integer, Double, Boolean, or "l" for Long); None lets Cytoscape infer them
 
     Returns:
         dict: {"networks": [network suid], "views": [suid for views]} where networks and views lists have length 1
@@ -1276,7 +1289,7 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
         {'networks': [131481], 'views': [131850]}
 
     """
-    file = get_abs_sandbox_path(file)
+    file = get_abs_sandbox_path(file, base_url=base_url)
 
     # As of 3.9, the column_type_list is sufficient for specifying the layout of a data line. However,
     # per CYTOSCAPE-12764, pre-3.9 Cytoscape has trouble with the "interaction" tag. To accommodate all
@@ -1296,6 +1309,9 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
     if 'interaction' in type_list:
         index_params += f' indexColumnTypeInteraction="{type_list.index("interaction") + 1}"'
 
+    if data_type_list:
+        index_params += f' dataTypeList="{data_type_list}"'
+
     res = commands.commands_post(
         f'network import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}"{index_params} columnTypeList="{column_type_list}" delimiters="{delimiters}"',
         base_url=base_url)
@@ -1305,10 +1321,133 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
     # "network load file"'s own network. This is race condition that can be solved by "network load file"
     # not returning until it's actually done.
     # TODO: Fix this race condition
-    time.sleep(CATCHUP_NETWORK_SECS)
+    _wait_until_current_network(res, base_url=base_url)
 
     return res
 
+@cy_log
+def import_network_from_local_file(file, source_column='source', target_column='target', interaction_column=None,
+                                   base_url=DEFAULT_BASE_URL, *, source_attributes=None, target_attributes=None,
+                                   skip_columns=None, data_types=None, delimiter=None, dest_file=None,
+                                   progress=None):
+    """Loads a network from a large local CSV, TSV or Parquet file.
+
+    Each row of the file is an edge, named by its source and target columns (and optionally, an interaction column).
+    All other columns become edge attributes, except for those named as ``source_attributes`` or
+    ``target_attributes`` (which become node attributes) or ``skip_columns``.
+
+    Notes:
+        The file is never read into memory all at once. Cytoscape chooses a text file's column data types unless
+        ``data_types`` is given. Then, the columns it doesn't name get the widest type their first few thousand values
+        allow (Long, Double or String), since later values aren't looked at. A Parquet
+        file is converted a batch of rows at a time into a temporary TSV file by ``pyarrow`` (without going through
+        pandas), and its column data types come from the Parquet schema. Reading Parquet files requires the
+        ``pyarrow`` package, and its text values can't contain tabs, quotes or line breaks.
+
+        If Cytoscape can see the Python workflow's file system (i.e., no sandbox is in use), the file is imported in
+        place. Otherwise, it's streamed into the sandbox in one request (encoded a chunk at a time) and then imported
+        from there. Either way, the transfer's progress and throughput are reported.
+
+    Args:
+        file (str): Name of CSV (.csv), TSV (.tsv, .tab or .txt) or Parquet (.parquet) file in the Python workflow's
+            file system
+        source_column (str): Name of column containing source node names
+        target_column (str): Name of column containing target node names
+        interaction_column (str): Name of column containing edge interactions ... None means there isn't one
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        source_attributes (list): Names of columns to load as attributes of source nodes
+        target_attributes (list): Names of columns to load as attributes of target nodes
+        skip_columns (list): Names of columns not to load
+        data_types (dict): {column name: data type}, where the type is one of 's' (String), 'i' (Integer),
+            'l' (Long), 'd' (Double) or 'b' (Boolean) ... None lets Cytoscape type a text file's columns
+        delimiter (str): Column delimiter for a text file ... None means ',' for .csv, tab for .tsv, .tab or .txt, or
+            whatever the header row suggests for other files
+        dest_file (str): Name of file to create in the current sandbox ... None means the file's name (or for a
+            Parquet file, its name with .tsv added)
+        progress (func): Called as ``progress(bytes_sent, file_bytes)`` as the file is transferred
+
+    Returns:
+        dict: {"networks": [network suid], "views": [suid for views]} where networks and views lists have length 1
+
+    Raises:
+        CyError: if file cannot be read or loaded, if a named column isn't in the file, or if pyarrow isn't
+            available for a Parquet file
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> import_network_from_local_file('interactions.csv', 'protein1', 'protein2')
+        {'networks': [131481], 'views': [131850]}
+        >>> import_network_from_local_file('interactions.tsv', 'protein1', 'protein2', interaction_column='type',
+        >>>                                source_attributes=['species1'], target_attributes=['species2'],
+        >>>                                data_types={'score': 'd'})
+        {'networks': [131481], 'views': [131850]}
+        >>> import_network_from_local_file('interactions.parquet', 'protein1', 'protein2',
+        >>>                                progress=lambda sent, total: print(f'{sent * 100 // total}%'))
+        {'networks': [131481], 'views': [131850]}
+    """
+    if not os.path.isfile(file or ''):
+        raise CyError(f'File "{file}" does not exist')
+    temp_dir = None
+    try:
+        if file.lower().endswith(('.parquet', '.parq', '.pq')):
+            temp_dir = tempfile.mkdtemp(prefix='py4cytoscape_')
+            text_file = os.path.join(temp_dir, os.path.basename(file) + '.tsv')
+            delimiter = '\t'
+            names, schema_types = _parquet_to_tsv(file, text_file)
+        else:
+            text_file = file
+            delimiter, names = _sniff_text_columns(file, delimiter)
+            schema_types = None
+
+        # Map each column to its role and data type in the import
+        roles = {name: 'ea' for name in names}
+        for role, columns in [('x', skip_columns), ('sa', source_attributes), ('ta', target_attributes),
+                              ('s', [source_column]), ('t', [target_column]), ('i', [interaction_column])]:
+            for col in columns or []:
+                if col is None: continue
+                if col not in roles:
+                    raise CyError(f'Column "{col}" is not in file "{file}"')
+                roles[col] = role
+        column_type_list = ','.join(roles[name] for name in names)
+        if schema_types is None and not data_types:
+            data_type_list = None  # Cytoscape types the columns from all of their values
+        else:
+            if schema_types is None: schema_types = _sample_text_types(text_file, delimiter, names)
+            data_types = {**schema_types, **(data_types or {})}
+            for col in (source_column, target_column, interaction_column):
+                if col is not None: data_types[col] = 's'
+            data_type_list = ','.join(data_types[name] for name in names)
+
+        # Get the file to where Cytoscape can read it, if it can't already
+        file_bytes = os.path.getsize(text_file)
+        start_time = time.perf_counter()
+        sandbox_name, sandbox_path = commands.do_initialize_sandbox(base_url=base_url)
+        if sandbox_name:
+            if not dest_file: dest_file = os.path.basename(text_file)
+            sandbox.sandbox_send_to(text_file, dest_file, progress=progress, base_url=base_url)
+            import_file = dest_file
+            send_secs = time.perf_counter() - start_time
+            narrate(f'Sent {file_bytes / 1e6:.1f} MB to sandbox in {send_secs:.2f} secs '
+                    f'({file_bytes / 1e6 / max(send_secs, 1e-6):.1f} MB/s)')
+        else:
+            import_file = os.path.abspath(text_file)
+            if progress: progress(file_bytes, file_bytes)
+
+        res = import_network_from_tabular_file(import_file, first_row_as_column_names=True, start_load_row=1,
+                                               column_type_list=column_type_list,
+                                               delimiters='\\,' if delimiter == ',' else delimiter,
+                                               base_url=base_url, data_type_list=data_type_list)
+        total_secs = time.perf_counter() - start_time
+        narrate(f'Imported {file_bytes / 1e6:.1f} MB in {total_secs:.2f} secs '
+                f'({file_bytes / 1e6 / max(total_secs, 1e-6):.1f} MB/s)')
+        detail_logger.debug(f'Imported {file_bytes} bytes from "{file}" with columns "{column_type_list}" and types '
+                            f'"{data_type_list}" in {total_secs:.3f} secs')
+        return res
+    finally:
+        if temp_dir: shutil.rmtree(temp_dir, ignore_errors=True)
+
 @cy_log
 def import_network_from_file(file=None, base_url=DEFAULT_BASE_URL):
     """Loads a network from specified file.
@@ -1343,7 +1482,7 @@ def import_network_from_file(file=None, base_url=DEFAULT_BASE_URL):
     if file is None:
         file = 'sampleData/galFiltered.sif'
     else:
-        file = get_abs_sandbox_path(file)
+        file = get_abs_sandbox_path(file, base_url=base_url)
     res = commands.commands_post(f'network load file file="{file}"', base_url=base_url)
     # TODO: Fix R documentation to match what's really returned
     # TODO: Put double quotes around file
@@ -1353,7 +1492,7 @@ def import_network_from_file(file=None, base_url=DEFAULT_BASE_URL):
     # "network load file"'s own network. This is race condition that can be solved by "network load file"
     # not returning until it's actually done.
     # TODO: Fix this race condition
-    time.sleep(CATCHUP_NETWORK_SECS)
+    _wait_until_current_network(res, base_url=base_url)
 
     return res
 
@@ -1418,28 +1557,12 @@ def create_igraph_from_network(network=None, base_url=DEFAULT_BASE_URL):
         cyedges['source'] = [x[0] for x in src_trg]
         cyedges['target'] = [x[2] for x in src_trg]
 
-    # set up iGraph vertices ... first create vertex by naming it, then pile on attributes
-    # Tutorial: https://igraph.org/python/doc/tutorial/tutorial.html
-    # Source: https://github.com/igraph/python-igraph/blob/master/src/igraph/__init__.py
-    g = ig.Graph(directed=True)
-
-    # add all nodes and their attributes
-    g.add_vertices(list(cynodes['name']))
-    for col in cynodes.columns:
-        if not col in ['name', 'SUID']: g.vs[col] = list(cynodes[col])
-
-    # add all edges and their nodes
-    g.add_edges([(src, trg) for src, trg in zip(cyedges['source'], cyedges['target'])])
-    # TODO: Find out why this rename happens ... is this an iGraph thing? ... how does the roundtrip work?
-    # cyedges.rename(columns={'source': 'from', 'target': 'to'}, inplace=True)
-    for col in cyedges.columns:
-        if not col in ['SUID']: g.es[col] = list(cyedges[col])
-
-    return g
+    return _data_frames_to_igraph(cynodes, cyedges)
 
 
 @cy_log
-def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
+def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL, *, node_attributes=None,
+                                 edge_attributes=None):
     """Return the Cytoscape network as a networkx multi-di-graph.
 
     Args:
@@ -1448,6 +1571,11 @@ def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        * :
+        node_attributes (list or None): Names of node table columns to fetch as node attributes, in addition to
+            ``SUID`` and ``name``; default is all
+        edge_attributes (list or None): Names of edge table columns to fetch as edge attributes, in addition to
+            ``SUID``, ``name``, ``source`` and ``target``; default is all
 
     Returns:
         MultiDiGraph: The new ``networkx`` object
@@ -1465,15 +1593,21 @@ def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
         Number of edges: 359
         Average in degree:   1.0879
         Average out degree:   1.0879
+        >>> n = create_networkx_from_network(network='galFiltered.sif', node_attributes=['Degree'], edge_attributes=[])
 
     See Also:
         :meth:`create_network_from_networkx`
     """
     suid = get_network_suid(network, base_url=base_url)
 
-    # get dataframes
-    cyedges = tables.get_table_columns('edge', network=suid, base_url=base_url)
-    cynodes = tables.get_table_columns('node', network=suid, base_url=base_url)
+    # get dataframes ... only the columns asked for (and the ones needed to build the graph), if any were
+    cyedges = tables.get_table_columns('edge', columns=_table_columns_to_fetch('edge', edge_attributes,
+                                                                               ['SUID', 'name', 'source', 'target'],
+                                                                               suid, base_url),
+                                       network=suid, base_url=base_url)
+    cynodes = tables.get_table_columns('node', columns=_table_columns_to_fetch('node', node_attributes,
+                                                                               ['SUID', 'name'], suid, base_url),
+                                       network=suid, base_url=base_url)
 
     # check for source and target columns ... if they're not present, dig them out of the full name
     if not {'source', 'target'} <= set(cyedges.columns):
@@ -1481,24 +1615,7 @@ def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
         cyedges['source'] = [x[0] for x in src_trg]
         cyedges['target'] = [x[2] for x in src_trg]
 
-    # Create a list of edges as tuples (src, targ, suid, attrs) with 'source' & 'target' removed from attrs
-    edges_dict = cyedges.to_dict(orient='records')
-    e_bunch = [(row['source'],
-                row['target'],
-                row['SUID'],
-                {k: row[k]     for k in row if k not in {'source', 'target'}}
-                ) for row in edges_dict]
-
-    # Create a list of nodes as tuples (name, attrs) with 'name' removed from attrs
-    nodes_dict = cynodes.to_dict(orient='records')
-    n_bunch = [(row['name'], {k: row[k]     for k in row if k not in {'name'}}) for row in nodes_dict]
-
-    # Create the networkx graph modeled as directed edges with ability to have multiple edges connecting two nodes
-    md_graph = nx.MultiDiGraph()
-    md_graph.add_edges_from(e_bunch)
-    md_graph.add_nodes_from(n_bunch)
-
-    return md_graph
+    return _data_frames_to_networkx(cynodes, cyedges)
 
 @cy_log
 def create_cytoscapejs_from_network(network=None, base_url=DEFAULT_BASE_URL):
@@ -1551,20 +1668,312 @@ def create_cytoscapejs_from_network(network=None, base_url=DEFAULT_BASE_URL):
 # functions.
 # ------------------------------------------------------------------------------
 
-def _delay_until_stable(attempt_op, error_text, vote_count=1):
-    catchup_network_timeout = time.time() + CATCHUP_NETWORK_TIMEOUT_SECS
-    is_stable = False
-    while not is_stable and time.time() < catchup_network_timeout:
-        try:
-            votes = 1
-            is_stable = attempt_op()
-            while votes < vote_count and is_stable:
-                votes += 1
-                is_stable = attempt_op()
-        except:
-            is_stable = False
-        if not is_stable:
-#                print(f'Sleeping for {CATCHUP_NETWORK_SECS} seconds')
-            time.sleep(CATCHUP_NETWORK_SECS)
-    if not is_stable:
+def _resolve_network_suid(title, base_url=DEFAULT_BASE_URL):
+    if isinstance(title, str):
+        # Title was provided
+        if title == 'current':
+            network_title = title
+        else:
+            net_names = get_network_list(base_url=base_url)
+            if title in net_names:
+                network_title = title
+            else:
+                raise CyError(f'Network does not exist for name "{title}"')
+    elif isinstance(title, int):
+        # SUID was provided
+        net_suids = commands.cyrest_get('networks', base_url=base_url)
+        if title in net_suids:
+            return title
+        raise CyError(f'Network does not exist for SUID "{title}"')
+    else:
+        # Don't understand, so use current network
+        network_title = 'current'
+
+    # Make requested network current and return its SUID
+    cmd = f'network get attribute network="{network_title}" namespace="default" columnList="SUID"'
+    response = commands.commands_post(cmd, base_url=base_url)
+    return int(response[0]['SUID'])
+
+def _sniff_text_columns(file, delimiter):
+    # Find a text file's delimiter and column names
+    if delimiter is None:
+        delimiter = _TEXT_DELIMITERS.get(os.path.splitext(file)[1].lower())
+    try:
+        with open(file, newline='', encoding='utf-8') as f:
+            if delimiter is None:
+                delimiter = csv.Sniffer().sniff(f.readline(), delimiters=',\t;| ').delimiter
+                f.seek(0)
+            names = next(csv.reader(f, delimiter=delimiter), [])
+    except (OSError, UnicodeError, csv.Error) as e:
+        raise CyError(f'Could not read file "{file}": {e}')
+    return delimiter, names
+
+def _sample_text_types(file, delimiter, names):
+    # Guess each column's data type from its first rows. Later rows aren't seen, so the guess is the widest type the
+    # sample allows (Long rather than Integer, and String rather than Boolean), which is less likely to be wrong.
+    samples = [[] for name in names]
+    try:
+        with open(file, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            next(reader, None)
+            for row in itertools.islice(reader, _TYPE_SAMPLE_ROWS):
+                for values, value in zip(samples, row):
+                    if value != '': values.append(value)
+    except (OSError, UnicodeError, csv.Error) as e:
+        raise CyError(f'Could not read file "{file}": {e}')
+    return {name: _widest_data_type(values) for name, values in zip(names, samples)}
+
+def _widest_data_type(values):
+    # Choose the widest Cytoscape data type that fits all of the (non-empty) text values
+    if not values: return 's'
+    try:
+        for value in values: int(value)
+        return 'l'
+    except ValueError:
+        pass
+    try:
+        for value in values: float(value)
+        return 'd'
+    except ValueError:
+        pass
+    return 's'
+
+def _parquet_to_tsv(file, tsv_file):
+    # Convert a Parquet file to a TSV file a batch of rows at a time with pyarrow's CSV writer (so rows never become
+    # Python or pandas objects), and get its column data types from its schema
+    try:
+        import pyarrow
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+        import pyarrow.types as pa_types
+    except ImportError:
+        raise CyError(f'Reading Parquet file "{file}" requires the pyarrow package')
+    try:
+        parquet = pq.ParquetFile(file)
+        data_types = {}
+        for field in parquet.schema_arrow:
+            if pa_types.is_boolean(field.type):
+                data_types[field.name] = 'b'
+            elif pa_types.is_integer(field.type):
+                signed_int32 = field.type.bit_width == 32 and pa_types.is_signed_integer(field.type)
+                data_types[field.name] = 'i' if field.type.bit_width < 32 or signed_int32 else 'l'
+            elif pa_types.is_floating(field.type):
+                data_types[field.name] = 'd'
+            else:
+                data_types[field.name] = 's'
+        # Write the header unquoted, the same as the values, since quotes would become part of the column names
+        write_options = pa_csv.WriteOptions(include_header=False, delimiter='\t', quoting_style='none')
+        with open(tsv_file, 'wb') as f:
+            f.write(('\t'.join(parquet.schema_arrow.names) + '\n').encode('utf-8'))
+            with pa_csv.CSVWriter(f, parquet.schema_arrow, write_options=write_options) as writer:
+                for batch in parquet.iter_batches():
+                    writer.write_batch(batch)
+    except (OSError, pyarrow.ArrowException) as e:
+        raise CyError(f'Could not convert Parquet file "{file}": {e}')
+    return parquet.schema_arrow.names, data_types
+
+def _networkx_columns(items, count, end_count, attributes, reserved):
+    # Return the ends (names, or sources and targets) and attribute columns of a NetworkX node or edge view, going
+    # through it once and filling lists of count values. An attribute missing from some nodes or edges is None for
+    # them. Only the named attributes are kept (if any are named), and reserved ones are left out.
+    ends = [[None] * count for i in range(end_count)]
+    first_ends, last_ends = ends[0], ends[-1]
+    cols = {}
+    wanted = None if attributes is None else set(attributes) - reserved
+    for i, item in enumerate(items):
+        first_ends[i] = item[0]
+        last_ends[i] = item[end_count - 1]
+        for key, value in item[end_count].items():
+            if key in reserved or wanted is not None and key not in wanted: continue
+            col = cols.get(key)
+            if col is None: col = cols[key] = [None] * count
+            col[i] = value
+    return ends, cols
+
+
+def _data_frames_to_networkx(cynodes, cyedges):
+    # Return a networkx multi-di-graph with a node per node and an edge per edge, given their Cytoscape tables.
+    # Generate edges as tuples (src, targ, suid, attrs) with 'source' & 'target' removed from attrs ... each attrs
+    # dict is made only as networkx takes it, from columns converted to Python values all at once
+    edge_attr_cols = [col for col in cyedges.columns if col not in {'source', 'target'}]
+    e_bunch = ((src, targ, suid, dict(zip(edge_attr_cols, attrs)))
+               for src, targ, suid, attrs in zip(cyedges['source'].tolist(), cyedges['target'].tolist(),
+                                                 cyedges['SUID'].tolist(),
+                                                 zip(*[cyedges[col].tolist() for col in edge_attr_cols])))
+
+    # Generate nodes as tuples (name, attrs) with 'name' removed from attrs
+    node_attr_cols = [col for col in cynodes.columns if col != 'name']
+    n_bunch = ((name, dict(zip(node_attr_cols, attrs)))
+               for name, attrs in zip(cynodes['name'].tolist(), zip(*[cynodes[col].tolist() for col in node_attr_cols])))
+
+    # Create the networkx graph modeled as directed edges with ability to have multiple edges connecting two nodes
+    import networkx as nx
+    md_graph = nx.MultiDiGraph()
+    md_graph.add_edges_from(e_bunch)
+    md_graph.add_nodes_from(n_bunch)
+    return md_graph
+
+
+def _table_columns_to_fetch(table, attributes, required, network_suid, base_url):
+    # Return the table columns to fetch for the named attributes, plus the required ones the table has ... or None to
+    # fetch all columns if no attributes are named
+    if attributes is None: return None
+    table_cols = tables.get_table_column_names(table, network=network_suid, base_url=base_url)
+    return [col for col in dict.fromkeys(required + list(attributes)) if col in table_cols]
+
+
+def _igraph_to_data_frames(igraph):
+    # Return the vertex and edge tables of an igraph network, with each edge's source and target as vertex names. The
+    # names are looked up by indexing an array with the vertex IDs of all edges at once, and attributes are copied a
+    # column at a time. Any 'source' or 'target' attribute (e.g., from a graph made from a Cytoscape network) is
+    # renamed 'source.original' or 'target.original'.
+    import numpy as np
+    import pandas as pd
+    node_df = igraph.get_vertex_dataframe()
+    node_df['name'] = node_df['name'].astype(str)
+    names = node_df['name'].to_numpy(dtype=object)
+    ends = np.array(igraph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    edge_cols = {'source': names[ends[:, 0]], 'target': names[ends[:, 1]]}
+    for attr in igraph.edge_attributes():
+        edge_cols[attr + '.original' if attr in ['source', 'target'] else attr] = igraph.es[attr]
+    edge_df = pd.DataFrame(edge_cols)
+    # Make sure interaction is a string
+    if 'interaction' in edge_df.columns: edge_df['interaction'] = edge_df['interaction'].astype(str)
+    return node_df, edge_df
+
+
+def _data_frames_to_igraph(cynodes, cyedges):
+    # Return a directed igraph network with a vertex per node and an edge per edge, given their Cytoscape tables.
+    # Each edge's source and target names are turned into vertex IDs by one hashed lookup of the whole column, so
+    # igraph never looks up a name, and attributes are assigned a whole column at a time.
+    # Tutorial: https://igraph.org/python/doc/tutorial/tutorial.html
+    import numpy as np
+    import pandas as pd
+    import igraph as ig
+    vertex_ids = pd.Series(np.arange(len(cynodes.index)), index=cynodes['name'].to_numpy(dtype=object))
+    vertex_ids = vertex_ids[~vertex_ids.index.duplicated()]  # A name shared by several nodes means its first one
+    ends = []
+    for col in ['source', 'target']:
+        positions = vertex_ids.index.get_indexer(cyedges[col].to_numpy(dtype=object))
+        if (positions < 0).any():
+            raise CyError(f'Edge {col} "{cyedges[col].to_numpy()[positions < 0][0]}" is not a node name')
+        ends.append(vertex_ids.to_numpy()[positions].tolist())
+    # igraph takes a list of ID pairs much faster than an array, and attributes faster one by one than all at once
+    g = ig.Graph(n=len(cynodes.index), edges=list(zip(*ends)), directed=True)
+    for col in cynodes.columns:
+        if col != 'SUID': g.vs[col] = cynodes[col].tolist()
+    for col in cyedges.columns:
+        if col != 'SUID': g.es[col] = cyedges[col].tolist()
+    return g
+
+
+_CYJS_EDGE_KEYS = {'SUID', 'id', 'name', 'source', 'target', 'interaction'}  # Edge data keys that aren't attributes
+
+
+def _cyjs_can_carry(values):
+    # Return whether a column's values can be sent as CyJS attributes, and given the same type by Cytoscape as by
+    # load_table_data() ... i.e., numbers, booleans, or strings and lists of strings (as comma-separated strings)
+    import numpy as np
+    from pandas.api.types import infer_dtype
+    kind = values.dtype.kind if isinstance(values.dtype, np.dtype) else None  # i.e., nullable types have no buffer
+    if kind == 'f':
+        return not np.isinf(values.to_numpy()).any() and not values.isna().all()
+    elif kind in ['b', 'i', 'u']:
+        return True
+    value_type = infer_dtype(values, skipna=True)
+    if value_type == 'mixed':
+        return all(isinstance(value, list) and all(isinstance(x, str) for x in value) or value is None or
+                   isinstance(value, str) or isinstance(value, float) and value != value
+                   for value in values.tolist())
+    return value_type in ['string', 'integer', 'boolean']  # i.e., not all missing, either
+
+
+def _edge_names(sources, targets, interactions):
+    # Return the name of each edge, "source (interaction) target", made a column at a time
+    return sources.astype(str) + ' (' + interactions.astype(str) + ') ' + targets.astype(str)
+
+
+def _cyjs_network_json(title, node_columns, edge_columns):
+    # Return the CyJS JSON for a network, given the (key, Series) pairs for the data of its nodes and edges. The
+    # first one (for nodes) or four (for edges) keys are always sent, and missing values of the rest are left out.
+    parts = [b'{"data":' + json.dumps([{'name': title}]).encode('ascii') + b',"elements":{"nodes":[']
+    parts.extend(_iter_cyjs_elements(node_columns, 1))
+    parts.append(b'],"edges":[')
+    parts.extend(_iter_cyjs_elements(edge_columns, 4))
+    parts.append(b']}}')
+    return b''.join(parts)
+
+
+def _iter_cyjs_elements(columns, required_count):
+    # Yield the JSON for a list of CyJS elements a chunk of rows at a time, separated by commas. As in
+    # load_table_data(), columns are encoded whole and then interleaved into elements, so no dict is created per element.
+    if not columns: return
+    keys = [json.dumps(str(key)) for key, values in columns]
+    element_format = '{"data":{' + ','.join(key.replace('%', '%%') + ':%s' for key in keys[:required_count]) + \
+                     '%s' * (len(keys) - required_count) + '}}'
+    row_count = len(columns[0][1])
+    for start in range(0, row_count, _CYJS_ENCODE_ROWS):
+        col_json = []
+        for i, (key, values) in enumerate(columns):
+            texts = tables._column_to_json(values.iloc[start:start + _CYJS_ENCODE_ROWS], key)
+            if i >= required_count:
+                prefix = ',' + keys[i] + ':'
+                texts = ['' if text == 'null' else prefix + text for text in texts]
+            col_json.append(texts)
+        if start: yield b','
+        yield ','.join([element_format % element for element in zip(*col_json)]).encode('ascii')
+
+
+_TEXT_DELIMITERS = {'.csv': ',', '.tsv': '\t', '.tab': '\t', '.txt': '\t'}  # Delimiter implied by a file's extension
+_TYPE_SAMPLE_ROWS = 5000  # Rows of a text file to guess the types of columns not in data_types from
+_CYJS_ENCODE_ROWS = 10000  # Elements encoded at a time, which bounds the number of temporary strings
+_NEIGHBOR_QUERIES_PER_FETCH = 100  # Neighbor queries worth fetching the whole network for, at the least
+_EDGES_PER_NEIGHBOR_QUERY = 200  # Edges in a whole network fetch that take about as long as one neighbor query
+
+
+def _get_neighbor_suids(node_suids, net_suid, base_url=DEFAULT_BASE_URL):
+    # Return {node SUID: [distinct neighbor SUIDs]}. CyREST has no bulk neighbor query, so for many nodes, fetch the
+    # whole network (as CyJS) once and find the neighbors in its edges, so long as that isn't more data than the
+    # neighbor queries would take.
+    if len(node_suids) >= _NEIGHBOR_QUERIES_PER_FETCH and \
+            len(node_suids) * _EDGES_PER_NEIGHBOR_QUERY >= get_edge_count(net_suid, base_url=base_url):
+        start_time = time.perf_counter()
+        neighbor_suids = {node_suid: {} for node_suid in node_suids}
+        cyjs = commands.cyrest_get(f'networks/{net_suid}', base_url=base_url)
+        for edge in cyjs['elements'].get('edges', []):
+            source, target = int(edge['data']['source']), int(edge['data']['target'])
+            if source in neighbor_suids: neighbor_suids[source][target] = None
+            if target in neighbor_suids: neighbor_suids[target][source] = None
+        detail_logger.debug(f'Found neighbors of {len(node_suids)} nodes in network {net_suid} in '
+                            f'{time.perf_counter() - start_time:.3f} secs')
+        return {node_suid: list(neighbors) for node_suid, neighbors in neighbor_suids.items()}
+
+    # Otherwise, fan the per-node queries out across the pooled connections. Jupyter-Bridge relays one request at a
+    # time, so don't fan out through it.
+    client = get_client(base_url)
+    if check_execution_environment(base_url) == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE:
+        workers = 1
+    else:
+        workers = max(1, client.tuning.HTTP_POOL_SIZE)
+
+    def get_neighbors(node_suid):
+        return list(dict.fromkeys(commands.cyrest_get(f'networks/{net_suid}/nodes/{node_suid}/neighbors',
+                                                      base_url=base_url)))
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='py4cytoscape-neighbors') as executor:
+        neighbor_suids = dict(zip(node_suids, executor.map(get_neighbors, node_suids)))  # Raises the first error
+    detail_logger.debug(f'Fetched neighbors of {len(node_suids)} nodes in {time.perf_counter() - start_time:.3f} secs')
+    return neighbor_suids
+
+def _wait_until_current_network(res, base_url=DEFAULT_BASE_URL):
+    # Wait until a network just loaded becomes the current network, which Cytoscape does after "network load" returns
+    tuning = get_client(base_url).tuning
+    loaded_suids = res.get('networks', []) if isinstance(res, dict) else []
+    wait_until_ready(lambda: _resolve_network_suid(None, base_url=base_url) in loaded_suids,
+                     tuning.CATCHUP_NETWORK_SECS, tuning=tuning)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
+
+def _delay_until_stable(attempt_op, error_text, vote_count=1, base_url=DEFAULT_BASE_URL):
+    if not wait_until_stable(attempt_op, error_text, vote_count=vote_count, tuning=get_client(base_url).tuning):
         raise CyError(f'Timeout trying to {error_text}')
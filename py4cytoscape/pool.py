@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+"""Functions for spreading work across several Cytoscape instances.
+
+A ``CytoscapePool`` dispatches jobs to a set of Cytoscape instances (e.g., headless Cytoscapes in Docker containers),
+each identified by its ``base_url``. A job is any callable that accepts a ``base_url`` argument, and so can be a
+py4cytoscape function or a workflow function that passes its ``base_url`` along to py4cytoscape functions. Each job
+goes to the healthy instance with the fewest jobs in progress. If an instance fails while running a job, it is taken
+out of the pool and the job is retried on another instance.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+# Internal module convenience imports
+from .exceptions import CyError
+from .py4cytoscape_client import get_client
+from .py4cytoscape_logger import narrate
+
+
+class CytoscapePool:
+    """Run jobs on whichever of several Cytoscape instances is least loaded.
+
+    Args:
+        base_urls (list): the ``base_url`` of each Cytoscape instance (e.g., 'http://10.0.0.12:1234/v1')
+        jobs_per_instance (int): the most jobs any one instance runs at the same time
+        max_retries (int): how many other instances to try a job on if the instance running it fails
+        ping_timeout_secs (float): how long a health check waits for an instance to connect, and then to answer
+
+    Returns:
+        CytoscapePool: a pool containing the instances that responded to a health check
+
+    Raises:
+        CyError: if none of the instances respond
+
+    Examples:
+        >>> def render(base_url, file):
+        ...     import_network_from_file(file, base_url=base_url)
+        ...     return export_image(file + '.png', base_url=base_url)
+        >>> with CytoscapePool(['http://10.0.0.12:1234/v1', 'http://10.0.0.13:1234/v1']) as pool:
+        ...     results = pool.map(render, ['a.sif', 'b.sif', 'c.sif'])
+        ...     pool.stats()
+        {'http://10.0.0.12:1234/v1': {'healthy': True, 'active': 0, 'completed': 2, 'failed': 0, 'retried': 0,
+         'busy_secs': 4.1, 'jobs_per_sec': 0.45}, 'http://10.0.0.13:1234/v1': {...}}
+    """
+
+    def __init__(self, base_urls, jobs_per_instance=1, max_retries=2, ping_timeout_secs=5):
+        self.jobs_per_instance = jobs_per_instance
+        self.max_retries = max_retries
+        self.ping_timeout_secs = ping_timeout_secs
+        self._last_error = None  # Why an instance was last taken out of the pool, to explain running out of them
+        self._instances = {base_url: _Instance(base_url) for base_url in base_urls}
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self._instances) * jobs_per_instance),
+                                            thread_name_prefix='py4cytoscape-pool')
+        self._start_time = time.perf_counter()
+
+        if not any(self.check_health().values()):
+            self._executor.shutdown(wait=False)
+            raise CyError(f'None of the Cytoscape instances responded: {list(base_urls)}') from self._last_error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self, wait=True):
+        """Stop accepting jobs, and (optionally) wait for jobs already submitted to finish."""
+        self._executor.shutdown(wait=wait)
+
+    def check_health(self):
+        """Ping each instance, and return it to (or take it out of) the pool accordingly.
+
+        Returns:
+            dict: {<base_url>: <True if instance responded>}
+        """
+        errors = {base_url: self._ping(base_url) for base_url in self._instances}
+        with self._condition:
+            for base_url, error in errors.items():
+                self._instances[base_url].healthy = error is None
+                if error is not None: self._last_error = error
+            self._condition.notify_all()
+        return {base_url: error is None for base_url, error in errors.items()}
+
+    def submit(self, job, *args, **kwargs):
+        """Queue a job to run on the least loaded instance.
+
+        Args:
+            job (function): called as ``job(*args, base_url=<instance base_url>, **kwargs)``
+            *args: positional arguments for ``job``
+            **kwargs: named arguments for ``job``
+
+        Returns:
+            concurrent.futures.Future: resolves to whatever ``job`` returns (or raises)
+        """
+        return self._executor.submit(self._run, job, args, kwargs)
+
+    def map(self, job, *iterables):
+        """Run ``job`` once for each set of arguments, and return the results in order.
+
+        Args:
+            job (function): called as ``job(*args, base_url=<instance base_url>)``
+            *iterables: argument lists, as for Python's ``map()``
+
+        Returns:
+            list: the result of each job
+
+        Raises:
+            whatever the first failing job raised
+        """
+        futures = [self.submit(job, *args) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def stats(self):
+        """Return per-instance job counts and throughput.
+
+        Returns:
+            dict: {<base_url>: {'healthy': bool, 'active': int, 'completed': int, 'failed': int, 'retried': int,
+                'busy_secs': float, 'jobs_per_sec': float}}
+        """
+        elapsed = time.perf_counter() - self._start_time
+        with self._condition:
+            return {base_url: instance.stats(elapsed) for base_url, instance in self._instances.items()}
+
+    def _run(self, job, args, kwargs):
+        # Run a job, moving it to a different instance if the one it ran on stops responding
+        tried = set()
+        while True:
+            instance = self._acquire(tried)
+            start_time = time.perf_counter()
+            try:
+                res = job(*args, base_url=instance.base_url, **kwargs)
+                self._release(instance, start_time, completed=True)
+                return res
+            except Exception as e:
+                self._release(instance, start_time, completed=False)
+                if not self._instance_failed(instance, e) or len(tried) >= self.max_retries:
+                    raise
+                tried.add(instance.base_url)
+                with self._condition:
+                    instance.retried += 1
+                narrate(f'Cytoscape at {instance.base_url} failed ... retrying job elsewhere')
+
+    def _acquire(self, tried):
+        # Wait for the least loaded healthy instance that hasn't already failed this job to have a free slot
+        with self._condition:
+            while True:
+                candidates = [instance for instance in self._instances.values()
+                              if instance.healthy and instance.base_url not in tried]
+                if not candidates:
+                    raise CyError('No healthy Cytoscape instances are available') from self._last_error
+                available = [instance for instance in candidates if instance.active < self.jobs_per_instance]
+                if available:
+                    instance = min(available, key=lambda x: (x.active, x.completed))
+                    instance.active += 1
+                    return instance
+                self._condition.wait()
+
+    def _release(self, instance, start_time, completed):
+        with self._condition:
+            instance.active -= 1
+            instance.busy_secs += time.perf_counter() - start_time
+            if completed:
+                instance.completed += 1
+            else:
+                instance.failed += 1
+            self._condition.notify_all()
+
+    def _instance_failed(self, instance, e):
+        # A job error means the instance failed only if the instance can't be reached anymore. Otherwise, the job
+        # itself failed, and retrying it elsewhere wouldn't help.
+        if isinstance(e, CyError) or isinstance(e, requests.exceptions.HTTPError) or \
+                self._ping(instance.base_url) is None:
+            return False
+        with self._condition:
+            instance.healthy = False
+            self._last_error = e
+            self._condition.notify_all()
+        get_client(instance.base_url).reset()  # If it comes back, it may be a fresh Cytoscape
+        return True
+
+    def _ping(self, base_url):
+        # Ask for the CyREST version directly (instead of through cytoscape_ping()), so an instance that accepts the
+        # connection but never answers is given up on after ping_timeout_secs rather than the usual (unlimited) wait.
+        # Return None if the instance answered, or else the error.
+        try:
+            r = requests.get(f'{base_url}/version', timeout=self.ping_timeout_secs)
+            r.raise_for_status()
+            if 'apiVersion' not in r.json():
+                return CyError(f'Cytoscape at {base_url} returned an unexpected version: {r.text}')
+            return None
+        except Exception as e:
+            return e
+
+
+class _Instance:
+    # Bookkeeping for one Cytoscape in the pool ... guarded by the pool's condition variable
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.healthy = False
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.busy_secs = 0.0
+
+    def stats(self, elapsed):
+        return {'healthy': self.healthy, 'active': self.active, 'completed': self.completed, 'failed': self.failed,
+                'retried': self.retried, 'busy_secs': self.busy_secs,
+                'jobs_per_sec': self.completed / elapsed if elapsed else 0.0}
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+"""Per-Cytoscape connection state, so that one Python process can work with several Cytoscape instances at once.
+
+Each Cytoscape instance (identified by its ``base_url``) is represented by a ``CytoscapeClient``, which owns the state
+that used to be process-wide: the HTTP transport, the execution environment (i.e., local, remote or via
+Jupyter-Bridge), the sandbox, tuning values and any cached Cytoscape metadata. Every py4cytoscape function already
+accepts a ``base_url`` parameter, and uses it to find the client for that Cytoscape via ``get_client()``. A call that
+doesn't supply a ``base_url`` uses the default client (i.e., the one for ``DEFAULT_BASE_URL``).
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import functools
+import inspect
+import threading
+
+# Internal module imports
+from . import py4cytoscape_tuning
+
+# Internal module convenience imports
+from .py4cytoscape_utils import DEFAULT_BASE_URL
+from .py4cytoscape_http import get_http_session
+from .py4cytoscape_logger import call_scope, call_batch
+
+# print(f'Starting {__name__} module')
+
+
+# Relationship between py4cytoscape execution environment and Cytoscape execution environment
+#from enum import Enum, auto  # This causes major build problems, so leave it out
+class ExecutionEnvironment(): # (Enum):
+    UNKNOWN = 0 # auto()
+    SHARED_WORKSTATION = 1 # auto()
+    REMOTE_DIRECT_URL = 2 # auto()
+    REMOTE_JUPYTER_BRIDGE = 3 # auto()
+
+
+class ClientTuning:
+    """Tuning values for one Cytoscape. Any value not set explicitly falls back to the ``py4cytoscape_tuning`` value.
+
+    Examples:
+        >>> get_client().tuning.MODEL_PROPAGATION_SECS = 0
+    """
+
+    def __getattr__(self, name):
+        return getattr(py4cytoscape_tuning, name)
+
+
+class CytoscapeClient:
+    """Connection to one Cytoscape instance, and the state that goes with it.
+
+    Creating a client (re)connects to the Cytoscape at ``base_url``: it replaces any client previously registered for
+    that ``base_url``, so environment detection and sandbox initialization are carried out again on the next call.
+    Use ``get_client()`` to get the existing client instead.
+
+    Any py4cytoscape function that accepts a ``base_url`` can be called as a method of the client, in which case it
+    operates on the client's Cytoscape.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        CytoscapeClient: client bound to ``base_url``
+
+    Raises:
+        none
+
+    Examples:
+        >>> worker = CytoscapeClient('http://10.0.0.12:1234/v1')
+        >>> worker.get_network_list()
+        ['galFiltered.sif']
+        >>> get_network_list(base_url='http://10.0.0.12:1234/v1') # same as above
+        ['galFiltered.sif']
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        self.base_url = base_url
+        self.lock = threading.RLock()  # Serializes state changes (e.g., sandbox initialization) for this Cytoscape
+        self.tuning = ClientTuning()
+        self.caches = {}
+        self.reset()
+        with _clients_lock:
+            _clients[base_url] = self
+
+    def reset(self):
+        """Forget everything learned about this Cytoscape, as would be needed after it restarts."""
+        with self.lock:
+            self.execution_environment = ExecutionEnvironment.UNKNOWN
+            self.reset_sandbox()
+            self.invalidate_caches()
+
+    def reset_sandbox(self):
+        """Reset the entire state of the sandbox system for this Cytoscape."""
+        with self.lock:
+            self.default_sandbox = {}  # Once a sandbox is explicitly defined, it'll override this default
+            self.default_sandbox_path = None
+            self.current_sandbox_name = None
+            self.current_sandbox_path = None  # Resolve this by explicitly setting it or when first command is issued
+            self.sandbox_reinitialize = True
+
+    def invalidate_caches(self, *cache_names):
+        """Discard Cytoscape data cached for this Cytoscape.
+
+        Args:
+            *cache_names (str): names of caches to discard (e.g., NAME_INDEX_CACHE). Default is all caches.
+        """
+        with self.lock:
+            if cache_names:
+                for cache_name in cache_names:
+                    self.caches.pop(cache_name, None)
+            else:
+                self.caches.clear()
+        scope = call_scope()
+        if scope is not None:
+            for cache_name in cache_names or SCOPED_CACHES:
+                scope.pop((self.base_url, cache_name), None)
+
+    def scoped_cache(self, cache_name):
+        """Return a cache that lasts only as long as the outermost py4cytoscape call (or ``batch()``) in progress.
+
+        Args:
+            cache_name (str): name of cache (e.g., NETWORK_SUID_CACHE)
+
+        Returns:
+            dict: the cache, or None if no py4cytoscape call or batch is in progress on this thread
+        """
+        scope = call_scope()
+        return None if scope is None else scope.setdefault((self.base_url, cache_name), {})
+
+    def batch(self):
+        """Treat the calls made within a ``with`` block as one call, so they can share short-lived cached data.
+
+        Each py4cytoscape call resolves a network name (or the current network) to its SUID only once, no matter how
+        many helper functions need it. Within a batch, calls made by the same thread share those resolutions, too, so
+        a network is resolved only once for the whole block. Calls that create, delete, rename or switch networks via
+        py4cytoscape discard the resolutions as needed, but changes made any other way (e.g., via ``commands_post()``
+        or Cytoscape's GUI) aren't noticed until the batch ends.
+
+        Returns:
+            context manager: the batch
+
+        Examples:
+            >>> with get_client().batch():
+            ...     for node, color in node_colors.items():
+            ...         set_node_color_bypass(node, color, network='galFiltered.sif')
+        """
+        return call_batch()
+
+    @property
+    def session(self):
+        """requests.Session: the pooled HTTP session used to reach this Cytoscape"""
+        return get_http_session(self.base_url)
+
+    def __getattr__(self, name):
+        # Called only for attributes not found on the client, so expose py4cytoscape functions bound to this client
+        if name.startswith('_'):
+            raise AttributeError(name)
+        import py4cytoscape
+        func = getattr(py4cytoscape, name, None)
+        if not callable(func) or isinstance(func, type) or 'base_url' not in inspect.signature(func).parameters:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return functools.partial(func, base_url=self.base_url)
+
+    def __repr__(self):
+        return f'<CytoscapeClient [{self.base_url}]>'
+
+
+# Names of caches kept in CytoscapeClient.caches
+NAME_INDEX_CACHE = 'name_index'  # {(table, network SUID): name<->SUID index} for node and edge tables
+VERSION_INFO_CACHE = 'version_info'  # CyREST and Cytoscape versions, as returned by cytoscape_version_info()
+NETWORK_SUID_CACHE = 'network_suid'  # {network name or SUID or 'current': SUID} ... scoped to one call, see batch()
+METADATA_CACHE = 'metadata'  # {'key': METADATA_CACHE_FILE key, 'values': {name: value}} for fixed lists (e.g., node shapes)
+
+SCOPED_CACHES = {NETWORK_SUID_CACHE}  # Caches kept by scoped_cache() instead of in CytoscapeClient.caches
+
+_clients = {}  # One client per base_url
+_clients_lock = threading.RLock()
+
+
+def get_client(base_url=DEFAULT_BASE_URL):
+    """Return the client for a Cytoscape, creating it if it doesn't exist yet.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        CytoscapeClient: the client bound to ``base_url``
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_client()
+        <CytoscapeClient [http://127.0.0.1:1234/v1]>
+        >>> get_client('http://10.0.0.12:1234/v1')
+        <CytoscapeClient [http://10.0.0.12:1234/v1]>
+    """
+    client = _clients.get(base_url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(base_url)
+            if client is None:
+                client = CytoscapeClient(base_url)
+    return client
+
+
+def invalidate_caches(base_url=DEFAULT_BASE_URL):
+    """Discard all data py4cytoscape has cached for a Cytoscape.
+
+    py4cytoscape keeps some Cytoscape data (e.g., the mapping between node and edge names and their SUIDs) so that it
+    doesn't have to be fetched again on each call. py4cytoscape functions that change that data discard it
+    automatically. Call this function after changing networks in any other way, such as from Cytoscape's GUI or via
+    ``commands_post()``.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        None
+
+    Raises:
+        none
+
+    Examples:
+        >>> commands_post('network delete nodeList=selected')
+        >>> invalidate_caches()
+    """
+    get_client(base_url).invalidate_caches()
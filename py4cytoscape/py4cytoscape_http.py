@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""Low level HTTP connection pooling broken out into this file to avoid circular module usage.
+
+All CyREST and Commands API traffic for a given Cytoscape (i.e., a scheme+host+port) goes through a single
+requests.Session, so that TCP connections are kept alive and reused across calls instead of being set up for
+every call. Retries for failed connections are handled by the session's transport adapter.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import threading
+import urllib.parse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Internal module imports
+from . import py4cytoscape_tuning as tuning
+
+# print(f'Starting {__name__} module')
+
+
+_sessions = {} # One session per Cytoscape origin (e.g., 'http://127.0.0.1:1234')
+_sessions_lock = threading.Lock()
+
+
+def get_http_session(url):
+    # Return the pooled session for whatever Cytoscape the URL addresses, creating it if needed
+    origin = _url_origin(url)
+    session = _sessions.get(origin)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(origin)
+            if session is None:
+                session = _sessions[origin] = _create_session()
+    return session
+
+
+def pooled_request(method, url, **kwargs):
+    # Issue a request on the pooled session, applying the default timeouts unless the caller provided one
+    if 'timeout' not in kwargs and (tuning.HTTP_CONNECT_TIMEOUT_SECS or tuning.HTTP_READ_TIMEOUT_SECS):
+        kwargs['timeout'] = (tuning.HTTP_CONNECT_TIMEOUT_SECS, tuning.HTTP_READ_TIMEOUT_SECS)
+    return get_http_session(url).request(method, url, **kwargs)
+
+
+def reset_http_sessions():
+    # Close all pooled connections ... sessions will be re-created (with current tuning values) on next use
+    global _sessions
+    with _sessions_lock:
+        old_sessions = _sessions
+        _sessions = {}
+    for session in old_sessions.values():
+        session.close()
+
+
+def _create_session():
+    # Connection failures are retried for all methods because the request never reached Cytoscape. Read failures
+    # are retried only for idempotent methods (i.e., not POST) so that a command isn't executed twice.
+    retry = Retry(total=tuning.HTTP_MAX_RETRIES, connect=tuning.HTTP_MAX_RETRIES, read=tuning.HTTP_MAX_RETRIES,
+                  status=0, redirect=None, backoff_factor=tuning.HTTP_RETRY_BACKOFF_SECS, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=tuning.HTTP_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not tuning.HTTP_KEEP_ALIVE:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def _url_origin(url):
+    parts = urllib.parse.urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
@@ -28,9 +28,11 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # External library imports
 import logging
 from logging.handlers import RotatingFileHandler
+import contextlib
 import functools
 import os
 import sys
+import threading
 
 from .py4cytoscape_logger_settings import _DETAIL_LOG_DIR, _DETAIL_LOG_LEVEL, _DETAIL_LOG_NAME, _DETAIL_ENABLE_HTTP_CALLS, _SUMMARY_LOG_LEVEL, _SUMMARY_ENABLE_HTTP_CALLS, _DETAIL_ENABLE_HTTP_CONTENT, _SUMMARY_ENABLE_HTTP_CONTENT
 
@@ -64,62 +66,77 @@ def set_summary_logger(enable):
 _NESTING_SPACER = '\u01c0' # Use latin dental click character to represent spacing = nesting
 _FUNCTION_SPACER = '-' * 20
 
-# Decorator so functions can get automatic logging
-_logger_nesting = -1
-_logger_nesting_spacer = ''
+# Decorator so functions can get automatic logging. Nesting is tracked per thread so that calls made concurrently
+# (e.g., to several Cytoscape instances) don't garble each other's indentation.
+class _LoggerNesting(threading.local):
+    nesting = -1
+    spacer = ''
+    batches = 0  # Number of call_batch() contexts open
+    scope = None  # Cache shared by an outermost call (or batch) and everything it calls ... see call_scope()
+    quiet = 0  # Number of errors_quieted() contexts open
+
+_logger_nesting = _LoggerNesting()
+
+def call_scope():
+    """Return the cache for the outermost logged call (or ``call_batch()``) in progress on this thread.
+
+    Values that can't change during a single py4cytoscape call (e.g., the SUID a network name resolves to) can be
+    kept here so that nested calls don't fetch them again. The cache is discarded when the outermost call returns.
+
+    Returns:
+        dict: the cache, or None if no logged call or batch is in progress
+    """
+    return _logger_nesting.scope
+
+@contextlib.contextmanager
+def call_batch():
+    """Share one ``call_scope()`` cache across all calls made on this thread within a ``with`` block."""
+    _logger_nesting.batches += 1
+    if _logger_nesting.scope is None: _logger_nesting.scope = {}
+    try:
+        yield
+    finally:
+        _logger_nesting.batches -= 1
+        if _logger_nesting.batches == 0 and _logger_nesting.nesting == -1: _logger_nesting.scope = None
 
 _SPHINX_BUILD = (os.environ.get('SPHINX_BUILD', 'FALSE').upper() == 'TRUE')
 def cy_log(func):
     """Log function call parameters and results"""
 
     def log_incoming(func, *args, **kwargs):
-        global _logger_nesting
-        global _logger_nesting_spacer
-        global _summary_logger_enable
-
-        _logger_nesting += 1
-        _logger_nesting_spacer = _NESTING_SPACER * _logger_nesting
+        _logger_nesting.nesting += 1
+        _logger_nesting.spacer = _NESTING_SPACER * _logger_nesting.nesting
+        if _logger_nesting.scope is None: _logger_nesting.scope = {}
 
         if detail_logger.isEnabledFor(logging.DEBUG):
             # Show function name and all positional and named arguments
             args_repr = [repr(a) for a in args]
             kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
             signature = ", ".join(args_repr + kwargs_repr)
-            detail_logger.debug(f"{_logger_nesting_spacer}Calling {func.__name__}({signature})")
+            detail_logger.debug(f"{_logger_nesting.spacer}Calling {func.__name__}({signature})")
 
         if _summary_logger_enable:
-            summary_logger.debug(f"{_logger_nesting_spacer}Into {func.__name__}()")
+            summary_logger.debug(f"{_logger_nesting.spacer}Into {func.__name__}()")
 
     def log_return(func, value):
-        global _logger_nesting
-        global _logger_nesting_spacer
-        global _summary_logger_enable
-
         if _summary_logger_enable:
-            summary_logger.debug(f"{_logger_nesting_spacer}Out of {func.__name__!r}")
+            summary_logger.debug(f"{_logger_nesting.spacer}Out of {func.__name__!r}")
         if detail_logger.isEnabledFor(logging.DEBUG): detail_logger.debug(
-            f"{_logger_nesting_spacer}Returning {func.__name__!r}: {value!r}")
+            f"{_logger_nesting.spacer}Returning {func.__name__!r}: {value!r}")
         return value
 
     def log_exception(func, e):
-        global _logger_nesting
-        global _logger_nesting_spacer
-        global _summary_logger_enable
-
         if _summary_logger_enable:
-            summary_logger.debug(f"{_logger_nesting_spacer}Exception from {func.__name__!r}")
+            summary_logger.debug(f"{_logger_nesting.spacer}Exception from {func.__name__!r}")
         if detail_logger.isEnabledFor(logging.DEBUG): detail_logger.debug(
-            f"{_logger_nesting_spacer}{func.__name__!r} exception {e!r}")
+            f"{_logger_nesting.spacer}{func.__name__!r} exception {e!r}")
         raise
 
     def log_finally():
-        global _logger_nesting
-        global _logger_nesting_spacer
-        global _summary_logger_enable
-
-        _logger_nesting -= 1
-        _logger_nesting_spacer = _NESTING_SPACER * _logger_nesting
-        if _logger_nesting == -1:
+        _logger_nesting.nesting -= 1
+        _logger_nesting.spacer = _NESTING_SPACER * _logger_nesting.nesting
+        if _logger_nesting.nesting == -1:
+            if _logger_nesting.batches == 0: _logger_nesting.scope = None
             if detail_logger.isEnabledFor(logging.DEBUG): detail_logger.debug(_FUNCTION_SPACER)
             if _summary_logger_enable: summary_logger.debug(_FUNCTION_SPACER)
 
@@ -146,22 +163,31 @@ def log_http_request(method, url, **kwargs):
         json = kwargs.get('json')
         json = '' if json is None else ', json: ' + str(json)
         data = kwargs.get('data')
-        data = '' if data is None else ', data: ' + str(data)
+        data = '' if data is None else ', data: ' + _abbreviate(data)
 
         if _DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG):
-            detail_logger.debug(_logger_nesting_spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
+            detail_logger.debug(_logger_nesting.spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
-            summary_logger.info(' ' + _logger_nesting_spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
+            summary_logger.info(' ' + _logger_nesting.spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
 
 def log_http_result(r):
     if (_DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG)) or \
         (_SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.DEBUG)):
         if _DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG):
-            content = ', content: ' + r.text if _DETAIL_ENABLE_HTTP_CONTENT else ''
-            detail_logger.debug(_logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
+            content = ', content: ' + _abbreviate(getattr(r, 'content', None) or r.text) if _DETAIL_ENABLE_HTTP_CONTENT else ''
+            detail_logger.debug(_logger_nesting.spacer + r.reason + '[' + str(r.status_code) + ']' + content)
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
-            content = ', content: ' + r.text if _SUMMARY_ENABLE_HTTP_CONTENT else ''
-            summary_logger.info(' ' + _logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
+            content = ', content: ' + _abbreviate(getattr(r, 'content', None) or r.text) if _SUMMARY_ENABLE_HTTP_CONTENT else ''
+            summary_logger.info(' ' + _logger_nesting.spacer + r.reason + '[' + str(r.status_code) + ']' + content)
+
+_HTTP_LOG_MAX_CHARS = 10000 # Longest request or reply body to log in full
+
+def _abbreviate(body):
+    # Show the start of a large body (e.g., a file encoded as base64) instead of copying all of it into the log
+    if not isinstance(body, (str, bytes)): body = str(body)
+    text = body[:_HTTP_LOG_MAX_CHARS]
+    if isinstance(text, bytes): text = text.decode('utf-8', errors='replace')
+    return text if len(body) <= _HTTP_LOG_MAX_CHARS else f'{text}... ({len(body)} total)'
 
 def narrate(progress):
     from .py4cytoscape_notebook import get_notebook_is_running
@@ -170,4 +196,16 @@ def narrate(progress):
     return progress
 
 def show_error(error_text):
-    print(error_text, file=sys.stderr)
+    if _logger_nesting.quiet:
+        detail_logger.debug(f'Quieted error: {error_text}')
+    else:
+        print(error_text, file=sys.stderr)
+
+@contextlib.contextmanager
+def errors_quieted():
+    """Log errors raised on this thread within a ``with`` block instead of showing them (e.g., while polling)."""
+    _logger_nesting.quiet += 1
+    try:
+        yield
+    finally:
+        _logger_nesting.quiet -= 1
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""Cache of Cytoscape metadata that doesn't change while Cytoscape is running.
+
+Lists such as visual property names, node shapes, line styles, arrow shapes and layout names are fixed for a given
+Cytoscape (i.e., its version and installed apps), but py4cytoscape needs them over and over (e.g., to validate each
+style mapping or bypass value). Each list is fetched from a Cytoscape once and kept in the METADATA_CACHE of that
+Cytoscape's client, which is discarded when the client is reset (e.g., on reconnect) or when apps change.
+
+If ``METADATA_CACHE_FILE`` is set (see ``set_metadata_cache_file()``), the lists are also saved in that file, keyed
+by Cytoscape version and installed apps, so later runs against the same Cytoscape and apps don't need to fetch them
+at all. If the installed apps can't be listed, the lists are kept in memory only.
+"""
+
+"""Copyright 2020-2022 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import copy
+import hashlib
+import json
+import os
+import threading
+
+# Internal module imports
+
+# Internal module convenience imports
+from .py4cytoscape_utils import DEFAULT_BASE_URL, cached_version_info
+from .py4cytoscape_logger import cy_log, detail_logger, errors_quieted
+from .py4cytoscape_client import get_client, METADATA_CACHE
+
+# print(f'Starting {__name__} module')
+
+
+def cached_metadata(key, fetch, base_url=DEFAULT_BASE_URL):
+    """Return a metadata value for a Cytoscape, fetching it only if it isn't cached already.
+
+    Args:
+        key (str): name of the value (e.g., 'node_shapes')
+        fetch (func): fetches the value from Cytoscape ... the value must be JSON-serializable
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        a copy of the cached value, so the caller can change it freely
+
+    Raises:
+        whatever ``fetch`` raises
+    """
+    metadata = _client_metadata(base_url)
+    value = metadata['values'].get(key)
+    if value is None:
+        value = fetch()
+        client = get_client(base_url)
+        with client.lock:
+            metadata['values'][key] = value
+            if client.tuning.METADATA_CACHE_FILE:
+                _save_metadata(client.tuning.METADATA_CACHE_FILE, metadata)
+    return copy.deepcopy(value)
+
+
+def forget_metadata(base_url=DEFAULT_BASE_URL):
+    """Discard the metadata cached for a Cytoscape, both in memory and in METADATA_CACHE_FILE.
+
+    Call this after anything that can change Cytoscape's metadata (e.g., installing an app that adds a layout).
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+    """
+    client = get_client(base_url)
+    with client.lock:
+        metadata = client.caches.get(METADATA_CACHE)
+        if metadata is not None and metadata['key'] is not None:
+            # Record that there's nothing known about this Cytoscape and its apps now
+            metadata['values'] = {}
+            _save_metadata(client.tuning.METADATA_CACHE_FILE, metadata)
+        client.invalidate_caches(METADATA_CACHE)  # So the key is recomputed, in case the installed apps changed
+
+
+@cy_log
+def warm_metadata_cache(layout_properties=False, refresh=False, base_url=DEFAULT_BASE_URL):
+    """Fetch the Cytoscape metadata that py4cytoscape caches, so later calls don't have to.
+
+    Visual property names, node shapes, line styles, arrow shapes and layout names are fetched once per Cytoscape
+    anyway, the first time they're needed. Warming the cache right after connecting moves that cost up front (e.g.,
+    before timing a workflow), and saves it to ``METADATA_CACHE_FILE`` if one is set. Refreshing the cache is needed
+    only if Cytoscape's metadata changes other than via py4cytoscape (e.g., an app is installed from Cytoscape's GUI).
+
+    Args:
+        layout_properties (bool): if True, also fetch the property names of each layout
+        refresh (bool): if True, discard the cached metadata (including any in ``METADATA_CACHE_FILE``) first
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        list: names of the cached values
+
+    Raises:
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> warm_metadata_cache()
+        ['visual_property_names', 'node_shapes', 'line_styles', 'arrow_shapes', 'layout_names']
+        >>> warm_metadata_cache(refresh=True) # after installing an app from Cytoscape's GUI
+        ['visual_property_names', 'node_shapes', 'line_styles', 'arrow_shapes', 'layout_names']
+        >>> CytoscapeClient('http://10.0.0.12:1234/v1').warm_metadata_cache(layout_properties=True)
+        ['visual_property_names', 'node_shapes', 'line_styles', 'arrow_shapes', 'layout_names', 'layout_property_names:attribute-circle', ...]
+    """
+    from . import styles, layouts  # Imported here because both of those modules use this one
+
+    if refresh: forget_metadata(base_url=base_url)
+    styles.get_visual_property_names(base_url=base_url)
+    styles.get_node_shapes(base_url=base_url)
+    styles.get_line_styles(base_url=base_url)
+    styles.get_arrow_shapes(base_url=base_url)
+    layout_names = layouts.get_layout_names(base_url=base_url)
+    if layout_properties:
+        for layout_name in layout_names:
+            layouts.get_layout_property_names(layout_name, base_url=base_url)
+    return list(_client_metadata(base_url)['values'])
+
+
+# ==============================================================================
+# I. Internal functions
+#
+# Dev Notes: Prefix internal functions with a '_'. Skip doc_strings for these
+# functions.
+# ------------------------------------------------------------------------------
+
+_file_lock = threading.Lock()  # Serializes reading and writing METADATA_CACHE_FILE across clients
+
+
+def _client_metadata(base_url):
+    # Return the client's metadata cache ({'key': file key or None, 'values': {key: value}}), creating it on first
+    # use. The file key is needed only to find this Cytoscape's values in METADATA_CACHE_FILE.
+    client = get_client(base_url)
+    metadata = client.caches.get(METADATA_CACHE)
+    if metadata is None:
+        with client.lock:
+            metadata = client.caches.get(METADATA_CACHE)
+            if metadata is None:
+                metadata = {'key': None, 'values': {}}
+                file_name = client.tuning.METADATA_CACHE_FILE
+                if file_name:
+                    metadata['key'] = _metadata_file_key(base_url)
+                    if metadata['key'] is not None:
+                        with _file_lock:
+                            metadata['values'] = _load_metadata(file_name).get(metadata['key'], {})
+                client.caches[METADATA_CACHE] = metadata
+    return metadata
+
+
+def _metadata_file_key(base_url):
+    # Return the key of this Cytoscape's values in METADATA_CACHE_FILE (e.g., '3.10.0 apps:1f2e...'), or None if the
+    # installed apps can't be listed. Apps can add layouts and their properties, so the version alone isn't enough.
+    from . import apps  # Imported here because that module uses this one
+
+    version = cached_version_info(base_url=base_url)['cytoscapeVersion']
+    try:
+        with errors_quieted():
+            installed_apps = apps.get_installed_apps(base_url=base_url)
+    except Exception as e:
+        detail_logger.debug(f'Not saving metadata to file because installed apps are unknown: {e}')
+        return None
+    app_list = '\n'.join(sorted(f"{app.get('appName')} {app.get('version')} {app.get('status')}"
+                                for app in installed_apps))
+    return f"{version} apps:{hashlib.sha256(app_list.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _load_metadata(file_name):
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        detail_logger.debug(f'Ignoring metadata cache file {file_name}: {e}')
+        return {}
+
+
+def _save_metadata(file_name, metadata):
+    if not file_name or metadata['key'] is None: return
+    with _file_lock:
+        all_metadata = _load_metadata(file_name)
+        all_metadata[metadata['key']] = metadata['values']
+        temp_name = f'{file_name}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_name, 'w', encoding='utf-8') as f:
+            json.dump(all_metadata, f)
+        os.replace(temp_name, file_name)  # So a reader never sees a partly written file
@@ -25,7 +25,8 @@ import uuid
 
 # Internal module convenience imports
 from .py4cytoscape_logger import log_http_result, log_http_request, detail_logger
-from .py4cytoscape_utils import LOCAL_BASE_URL
+from .py4cytoscape_utils import LOCAL_BASE_URL, DEFAULT_BASE_URL
+from .py4cytoscape_client import ExecutionEnvironment, get_client
 
 # print(f'Starting {__name__} module')
 
@@ -57,14 +58,6 @@ class SpoofResponse:
             raise requests.exceptions.HTTPError(
                 u'%s Server Error: %s for url: %s' % (self.status_code, self.reason, self.url), response=self)
 
-# Relationship between py4cytoscape execution environment and Cytoscape execution environment
-#from enum import Enum, auto  # This causes major build problems, so leave it out
-class ExecutionEnvironment(): # (Enum):
-    UNKNOWN = 0 # auto()
-    SHARED_WORKSTATION = 1 # auto()
-    REMOTE_DIRECT_URL = 2 # auto()
-    REMOTE_JUPYTER_BRIDGE = 3 # auto()
-
 # Create a unique channel that identifies this process so other processes don't mix up messages
 _CHANNEL = None
 
@@ -87,7 +80,9 @@ def do_request_jupyter_bridge(method, url, **kwargs):
     if 'json' in kwargs:
         data = kwargs['json']
     elif 'data' in kwargs:
-        data = kwargs['data'].decode('utf-8')
+        data = kwargs['data']
+        if hasattr(data, 'read'): data = data.read()  # Jupyter-Bridge relays the whole body at once
+        data = data.decode('utf-8')
     else:
         data = None
 
@@ -198,41 +193,42 @@ _check_notebook_is_running()
         File System - assume py4cytoscape and Cytoscape file systems are different -- sandbox required  
 
 Note that Jupyter-Bridge requires that a browser be running on the Cytoscape workstation, and that the
-browser be connected to the Notebook server."""
+browser be connected to the Notebook server.
+
+Each Cytoscape (i.e., base_url) has its own execution environment, which is kept in its CytoscapeClient."""
 
-_execution_environment = ExecutionEnvironment.UNKNOWN
-def execution_environment(new_state=None):
-    global _execution_environment
-    old_state = _execution_environment
+def execution_environment(new_state=None, base_url=DEFAULT_BASE_URL):
+    client = get_client(base_url)
+    old_state = client.execution_environment
     if not new_state is None:
-        _execution_environment = new_state
+        client.execution_environment = new_state
     return old_state
 
 def check_execution_environment(base_url):
-    global _execution_environment
-    if _execution_environment == ExecutionEnvironment.UNKNOWN:
+    client = get_client(base_url)
+    if client.execution_environment == ExecutionEnvironment.UNKNOWN:
         try:
             # Try connecting to a local or remote Cytoscape directly reachable via URL
             detail_logger.debug(f'Attempting to direct connect to Cytoscape on {base_url}')
             r = requests.request('GET', base_url, headers={'Content-Type': 'application/json'})
             r.raise_for_status()
             if base_url == _CYREST_URL_V1:
-                _execution_environment = ExecutionEnvironment.SHARED_WORKSTATION
+                client.execution_environment = ExecutionEnvironment.SHARED_WORKSTATION
                 detail_logger.debug(f'Detected py4cytoscape running on Cytoscape workstation')
             else:
-                _execution_environment = ExecutionEnvironment.REMOTE_DIRECT_URL
+                client.execution_environment = ExecutionEnvironment.REMOTE_DIRECT_URL
                 detail_logger.debug(f'Detected py4cytoscape running on Cytoscape workstation at {base_url}')
         except Exception as e1:
             # Cytoscape doesn't appear to be reachable via URL, so try reaching a remote Cytoscape via Jupyter-bridge
             try:
                 detail_logger.debug(f'Attempting to connect to remote Cytoscape because of error {_error_content(e1)}')
                 do_request_jupyter_bridge('GET', _CYREST_URL_V1, headers={'Content-Type': 'application/json'})
-                _execution_environment = ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE
+                client.execution_environment = ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE
                 detail_logger.debug(f'Detected Cytoscape via Jupyter-Bridge')
             except Exception as e:
                 # Couldn't reach a local or remote Cytoscape ... use probably didn't start a Cytoscape, so assume he will eventually
                 detail_logger.debug(f'Error initially contacting Jupyter-bridge: {_error_content(e)}')
-    return _execution_environment
+    return client.execution_environment
 
 
 
@@ -25,16 +25,14 @@ import os
 # Internal module imports
 
 # Internal module convenience imports
+from .py4cytoscape_utils import DEFAULT_BASE_URL
+from .py4cytoscape_client import get_client
 
 # print(f'Starting {__name__} module')
 
 
-_default_sandbox = {} # Once a sandbox is explicitly defined, it'll override this default
-_default_sandbox_path = None
+# Sandbox state is kept per Cytoscape instance (i.e., per base_url) in its CytoscapeClient
 PREDEFINED_SANDBOX_NAME = 'default_sandbox'
-_current_sandbox_name = None
-_current_sandbox_path = None # Resolve this by explicitly setting it or when first Cytoscape command is issued
-_sandbox_reinitialize = True
 
 
 _SANDBOX_TEMPLATE = {'sandboxName': None, 'copySamples': True, 'reinitialize': True}
@@ -52,57 +50,58 @@ def sandbox_initializer(**new_sandbox):
             raise Exception(f'Invalid key {key} in sandbox parameter list')
     return sandbox
 
-def set_default_sandbox(**new_sandbox):
+def set_default_sandbox(base_url=DEFAULT_BASE_URL, **new_sandbox):
     # Set and return the sandbox properties to be used as a default, probably based on whether running remote
-    global _default_sandbox
-    _default_sandbox = sandbox_initializer(init=new_sandbox)
-    return _default_sandbox
+    client = get_client(base_url)
+    client.default_sandbox = sandbox_initializer(init=new_sandbox)
+    return client.default_sandbox
 
-def get_default_sandbox():
+def get_default_sandbox(base_url=DEFAULT_BASE_URL):
     # Return whatever is the current default sandbox properties
-    return _default_sandbox
+    return get_client(base_url).default_sandbox
 
-def set_default_sandbox_path(newPath):
+def set_default_sandbox_path(newPath, base_url=DEFAULT_BASE_URL):
     # Set and return the default path, which isn't one of the properties tracked in the default_sandbox
-    global _default_sandbox_path
-    _default_sandbox_path = newPath
-    return _default_sandbox_path
+    client = get_client(base_url)
+    client.default_sandbox_path = newPath
+    return client.default_sandbox_path
 
-def get_default_sandbox_path():
+def get_default_sandbox_path(base_url=DEFAULT_BASE_URL):
     # Return the default path, which isn't one of the properties tracked in the default_sandbox
-    return _default_sandbox_path
+    return get_client(base_url).default_sandbox_path
 
-def get_current_sandbox_name():
+def get_current_sandbox_name(base_url=DEFAULT_BASE_URL):
     # Return the current sandbox name
-    return _current_sandbox_name
+    return get_client(base_url).current_sandbox_name
 
-def get_current_sandbox_path():
+def get_current_sandbox_path(base_url=DEFAULT_BASE_URL):
     # Return the current sandbox path
-    return _current_sandbox_path
+    return get_client(base_url).current_sandbox_path
 
-def get_current_sandbox():
+def get_current_sandbox(base_url=DEFAULT_BASE_URL):
     # Return both the current sandbox name and path
-    return _current_sandbox_name, _current_sandbox_path
+    client = get_client(base_url)
+    return client.current_sandbox_name, client.current_sandbox_path
 
-def set_current_sandbox(sandbox_name, sandbox_path):
+def set_current_sandbox(sandbox_name, sandbox_path, base_url=DEFAULT_BASE_URL):
     # Set and return the current sandbox name and path
-    global _current_sandbox_name, _current_sandbox_path
-    _current_sandbox_name = sandbox_name
-    _current_sandbox_path = sandbox_path
-    return get_current_sandbox()
+    client = get_client(base_url)
+    client.current_sandbox_name = sandbox_name
+    client.current_sandbox_path = sandbox_path
+    return get_current_sandbox(base_url=base_url)
 
-def set_sandbox_reinitialize(do_reinitialize=True):
+def set_sandbox_reinitialize(do_reinitialize=True, base_url=DEFAULT_BASE_URL):
     # Set and return flag indicating that next command should reinitialize the sandbox according to the default_sandbox
-    global _sandbox_reinitialize
-    _sandbox_reinitialize = do_reinitialize
-    return _sandbox_reinitialize
+    client = get_client(base_url)
+    client.sandbox_reinitialize = do_reinitialize
+    return client.sandbox_reinitialize
 
-def get_sandbox_reinitialize():
+def get_sandbox_reinitialize(base_url=DEFAULT_BASE_URL):
     # Return flag indicating that next command should reinitialize the sandbox according to the default_sandbox
-    return _sandbox_reinitialize
+    return get_client(base_url).sandbox_reinitialize
 
-def get_abs_sandbox_path(file_location):
-    sandbox_name, sandbox_path = get_current_sandbox()
+def get_abs_sandbox_path(file_location, base_url=DEFAULT_BASE_URL):
+    sandbox_name, sandbox_path = get_current_sandbox(base_url=base_url)
     if not sandbox_name:
         return os.path.abspath(file_location)
     elif sandbox_name and sandbox_path:
@@ -110,16 +109,9 @@ def get_abs_sandbox_path(file_location):
     else:
         return file_location
 
-def reset_default_sandbox():
+def reset_default_sandbox(base_url=DEFAULT_BASE_URL):
     # Reset the entire state of the sandbox system
-    global _default_sandbox, _default_sandbox_path , _sandbox_reinitialize
-    _default_sandbox = {}
-    _default_sandbox_path = None
-    set_current_sandbox(None, None)
-    _sandbox_reinitialize = True
-
-
-reset_default_sandbox() # Create a clean slate
+    get_client(base_url).reset_sandbox()
 
 
 """There are four cases: {Raw Python, Notebook Python} x {Local Execution, Remote Execution}. We have
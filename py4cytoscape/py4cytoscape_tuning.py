@@ -22,6 +22,15 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 # print(f'Starting {__name__} module')
 
 from os import environ
+import bisect
+import collections
+import random
+import statistics
+import sys
+import threading
+import time
+
+from .py4cytoscape_logger import detail_logger, errors_quieted, show_error
 
 CATCHUP_FILTER_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_FILTER_SECS', '0')) # '1'
 MODEL_PROPAGATION_SECS = int(environ.get('PY4CYTOSCAPE_MODEL_PROPAGATION_SECS', '2'))
@@ -29,6 +38,24 @@ CATCHUP_NETWORK_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_SECS', '4')
 CATCHUP_NETWORK_TIMEOUT_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_TIMEOUT_SECS', '60')) # How long to keep retrying network operation
 CATCHUP_NETWORK_MERGE_SECS = int(environ.get('PY4CYTOSCAPE_CATCHUP_NETWORK_MERGE_SECS', '1')) # How long to sleep waiting for merge to complete Network table
 
+HTTP_POOL_SIZE = int(environ.get('PY4CYTOSCAPE_HTTP_POOL_SIZE', '10')) # How many connections to keep open to each Cytoscape
+HTTP_KEEP_ALIVE = (environ.get('PY4CYTOSCAPE_HTTP_KEEP_ALIVE', 'TRUE').upper() == 'TRUE') # Reuse connections between calls
+HTTP_MAX_RETRIES = int(environ.get('PY4CYTOSCAPE_HTTP_MAX_RETRIES', '2')) # How many times to retry a failed connection
+HTTP_RETRY_BACKOFF_SECS = float(environ.get('PY4CYTOSCAPE_HTTP_RETRY_BACKOFF_SECS', '0.5')) # Base of exponential retry delay
+HTTP_CONNECT_TIMEOUT_SECS = float(environ.get('PY4CYTOSCAPE_HTTP_CONNECT_TIMEOUT_SECS', '0')) or None # 0 means wait forever
+HTTP_READ_TIMEOUT_SECS = float(environ.get('PY4CYTOSCAPE_HTTP_READ_TIMEOUT_SECS', '0')) or None # 0 means wait forever
+
+BYPASS_BATCH_SIZE = int(environ.get('PY4CYTOSCAPE_BYPASS_BATCH_SIZE', '500')) # How many node/edge bypasses to clear per timed batch
+
+TABLE_LOAD_CHUNK_ROWS = int(environ.get('PY4CYTOSCAPE_TABLE_LOAD_CHUNK_ROWS', '100000')) # Rows per table data upload (0 means all rows at once)
+TABLE_LOAD_WORKERS = int(environ.get('PY4CYTOSCAPE_TABLE_LOAD_WORKERS', '2')) # How many table data chunks to upload at a time
+TABLE_LOAD_MAX_BYTES = int(environ.get('PY4CYTOSCAPE_TABLE_LOAD_MAX_BYTES', str(256 * 2 ** 20))) # Most encoded table data to hold at once
+
+METADATA_CACHE_FILE = environ.get('PY4CYTOSCAPE_METADATA_CACHE_FILE') or None # File to keep Cytoscape metadata in between runs
+
+READINESS_POLL_SECS = float(environ.get('PY4CYTOSCAPE_READINESS_POLL_SECS', '0.05')) # First pause between readiness checks
+READINESS_POLL_MAX_SECS = float(environ.get('PY4CYTOSCAPE_READINESS_POLL_MAX_SECS', '0.5')) # Longest pause between readiness checks
+
 def set_catchup_filter_secs(delay_secs):
     global CATCHUP_FILTER_SECS
     CATCHUP_FILTER_SECS = delay_secs
@@ -49,4 +76,268 @@ def set_catchup_network_merge_secs(delay_secs):
     global CATCHUP_NETWORK_MERGE_SECS
     CATCHUP_NETWORK_MERGE_SECS = delay_secs
 
+def set_http_pool_size(pool_size):
+    global HTTP_POOL_SIZE
+    HTTP_POOL_SIZE = pool_size
+    _reset_http_sessions()
+
+def set_http_keep_alive(keep_alive):
+    global HTTP_KEEP_ALIVE
+    HTTP_KEEP_ALIVE = keep_alive
+    _reset_http_sessions()
+
+def set_http_max_retries(max_retries):
+    global HTTP_MAX_RETRIES
+    HTTP_MAX_RETRIES = max_retries
+    _reset_http_sessions()
+
+def set_http_retry_backoff_secs(backoff_secs):
+    global HTTP_RETRY_BACKOFF_SECS
+    HTTP_RETRY_BACKOFF_SECS = backoff_secs
+    _reset_http_sessions()
+
+def set_http_timeout_secs(connect_secs=None, read_secs=None):
+    global HTTP_CONNECT_TIMEOUT_SECS, HTTP_READ_TIMEOUT_SECS
+    HTTP_CONNECT_TIMEOUT_SECS = connect_secs or None
+    HTTP_READ_TIMEOUT_SECS = read_secs or None
+
+def set_bypass_batch_size(batch_size):
+    global BYPASS_BATCH_SIZE
+    BYPASS_BATCH_SIZE = batch_size
+
+def set_table_load_chunking(chunk_rows=None, workers=None, max_bytes=None):
+    global TABLE_LOAD_CHUNK_ROWS, TABLE_LOAD_WORKERS, TABLE_LOAD_MAX_BYTES
+    if chunk_rows is not None: TABLE_LOAD_CHUNK_ROWS = chunk_rows
+    if workers is not None: TABLE_LOAD_WORKERS = workers
+    if max_bytes is not None: TABLE_LOAD_MAX_BYTES = max_bytes
+
+def set_metadata_cache_file(file_name):
+    global METADATA_CACHE_FILE
+    METADATA_CACHE_FILE = file_name or None
+
+def set_readiness_poll_secs(poll_secs=None, max_poll_secs=None):
+    global READINESS_POLL_SECS, READINESS_POLL_MAX_SECS
+    if poll_secs is not None: READINESS_POLL_SECS = poll_secs
+    if max_poll_secs is not None: READINESS_POLL_MAX_SECS = max_poll_secs
+
+def wait_until_ready(is_ready, timeout_secs, tuning=None):
+    """Wait until Cytoscape shows that an operation has taken effect, but no longer than a timeout.
+
+    This replaces a fixed sleep after an operation that Cytoscape acknowledges before it's done. ``is_ready`` is
+    called right away, and then after pauses that start at READINESS_POLL_SECS and double up to
+    READINESS_POLL_MAX_SECS, until it returns a true value or ``timeout_secs`` have passed. An exception raised by
+    ``is_ready`` counts as not ready, and errors it would show are only logged ... if the wait times out, the last
+    one is shown. A ``timeout_secs`` of 0 skips the wait (and the check) altogether. The time
+    spent waiting is added to the statistics returned by ``get_readiness_wait_stats()``.
+
+    Args:
+        is_ready (func): cheap check (e.g., reading back a value just written) that returns True once the operation
+            has taken effect
+        timeout_secs (float): longest time to wait ... typically the tuning value for the sleep being replaced
+        tuning (ClientTuning): source of READINESS_POLL_SECS and READINESS_POLL_MAX_SECS (e.g., a client's
+            ``tuning``); default is this module's values
+
+    Returns:
+        bool: True if ``is_ready`` succeeded, False if the wait timed out or was skipped
+
+    Examples:
+        >>> wait_until_ready(lambda: get_current_style() == 'galFiltered Style', 2)
+        True
+    """
+    if not timeout_secs or timeout_secs <= 0: return False
+    if tuning is None: tuning = sys.modules[__name__]
+
+    start = time.perf_counter()
+    deadline = start + timeout_secs
+    poll_secs = tuning.READINESS_POLL_SECS
+    checks = 0
+    last_error = None
+    while True:
+        checks += 1
+        try:
+            with errors_quieted():  # A failed check is expected until the operation takes effect
+                ready = bool(is_ready())
+        except Exception as e:
+            ready = False
+            last_error = e
+        remaining = deadline - time.perf_counter()
+        if ready or remaining <= 0: break
+        time.sleep(min(poll_secs, remaining))
+        poll_secs = min(poll_secs * 2, tuning.READINESS_POLL_MAX_SECS)
+
+    wait_secs = time.perf_counter() - start
+    with _readiness_stats_lock:
+        _readiness_stats['waits'] += 1
+        _readiness_stats['checks'] += checks
+        _readiness_stats['timeouts'] += 0 if ready else 1
+        _readiness_stats['wait_secs'] += wait_secs
+    detail_logger.debug(f'Readiness wait {"succeeded" if ready else "timed out"} after {checks} checks in '
+                        f'{wait_secs:.3f} secs')
+    if not ready and last_error is not None:
+        show_error(f'Timed out after {wait_secs:.3f} secs waiting for Cytoscape: {last_error}')
+    return ready
+
+def settled(read):
+    """Make a readiness check that succeeds once two consecutive calls to ``read`` return the same value.
+
+    Use this with ``wait_until_ready()`` when there's no expected value to check for, only a value that stops
+    changing once Cytoscape has caught up (e.g., the set of selected nodes after a filter executes).
+
+    Args:
+        read (func): reads the value that should settle
+
+    Returns:
+        func: readiness check to pass to ``wait_until_ready()``
+
+    Examples:
+        >>> wait_until_ready(settled(lambda: get_selected_node_count()), 1)
+        True
+    """
+    previous = []
+    def is_settled():
+        value = read()
+        is_same = len(previous) != 0 and previous[0] == value
+        previous[:] = [value]
+        return is_same
+    return is_settled
+
+def get_readiness_wait_stats():
+    """Return the statistics for all readiness waits (see ``wait_until_ready()``) since the last reset.
+
+    Returns:
+        dict: {'waits': number of waits, 'checks': number of readiness checks, 'timeouts': number of waits that
+        timed out, 'wait_secs': total time spent waiting}
+
+    Examples:
+        >>> get_readiness_wait_stats()
+        {'waits': 30, 'checks': 31, 'timeouts': 0, 'wait_secs': 0.652}
+    """
+    with _readiness_stats_lock:
+        return dict(_readiness_stats)
+
+def reset_readiness_wait_stats():
+    """Set the readiness wait statistics (see ``get_readiness_wait_stats()``) back to 0."""
+    with _readiness_stats_lock:
+        _readiness_stats.update({'waits': 0, 'checks': 0, 'timeouts': 0, 'wait_secs': 0.0})
+
+_readiness_stats_lock = threading.Lock()
+_readiness_stats = {}
+reset_readiness_wait_stats()
+
+def wait_until_stable(attempt_op, operation, vote_count=1, timeout_secs=None, tuning=None):
+    """Retry an operation that Cytoscape can't carry out reliably until it's caught up, until it succeeds.
+
+    ``attempt_op`` is tried right away. If it fails, it's retried after pauses that start at READINESS_POLL_SECS
+    and double (with +/-20% jitter) up to CATCHUP_NETWORK_SECS, until it succeeds or ``timeout_secs`` have passed.
+    The time each ``operation`` takes to succeed is remembered for the rest of the session, so once an operation
+    has a history, the first retry is put off until the operation's typical (median) settle time instead of
+    polling Cytoscape while it's still busy. Settle times are kept as histograms returned by
+    ``get_stability_wait_stats()``.
+
+    Args:
+        attempt_op (func): tries the operation, and returns True if it succeeded; an exception counts as failure
+        operation (str): label that identifies the operation in the statistics (e.g., 'apply vizmap')
+        vote_count (int): number of times in a row ``attempt_op`` must succeed for an attempt to count as success
+        timeout_secs (float): longest time to keep trying; default is CATCHUP_NETWORK_TIMEOUT_SECS
+        tuning (ClientTuning): source of tuning values (e.g., a client's ``tuning``); default is this module's values
+
+    Returns:
+        bool: True if the operation succeeded, False if it timed out
+
+    Examples:
+        >>> wait_until_stable(lambda: commands_post('vizmap apply styles="default"') is not None, 'apply vizmap')
+        True
+    """
+    if tuning is None: tuning = sys.modules[__name__]
+    if timeout_secs is None: timeout_secs = tuning.CATCHUP_NETWORK_TIMEOUT_SECS
+
+    start = time.perf_counter()
+    deadline = start + timeout_secs
+    typical_secs = _typical_settle_secs(operation)
+    pause_secs = tuning.READINESS_POLL_SECS
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            with errors_quieted():  # A failed attempt is expected until Cytoscape catches up
+                votes = 1
+                is_stable = attempt_op()
+                while votes < vote_count and is_stable:
+                    votes += 1
+                    is_stable = attempt_op()
+        except Exception:
+            is_stable = False
+        now = time.perf_counter()
+        if is_stable or now >= deadline: break
+
+        if typical_secs is not None and now - start < typical_secs:
+            wait_secs = typical_secs - (now - start)  # Don't bother Cytoscape before it's usually done
+        else:
+            wait_secs = pause_secs
+            pause_secs = min(pause_secs * 2, tuning.CATCHUP_NETWORK_SECS)
+        wait_secs = min(wait_secs * random.uniform(0.8, 1.2), tuning.CATCHUP_NETWORK_SECS, deadline - now)
+        time.sleep(wait_secs)
+
+    settle_secs = time.perf_counter() - start
+    _record_settle_secs(operation, settle_secs, is_stable)
+    detail_logger.debug(f'Stability wait for "{operation}" {"succeeded" if is_stable else "timed out"} after '
+                        f'{attempts} attempts in {settle_secs:.3f} secs')
+    return is_stable
+
+def get_stability_wait_stats():
+    """Return the statistics for each operation retried by ``wait_until_stable()`` since the last reset.
+
+    Each histogram maps the upper bound of a settle time bucket (in seconds) to the number of times the operation
+    succeeded within that bucket's time. Timeouts aren't included in the histogram.
+
+    Returns:
+        dict: {operation: {'count': number of waits, 'timeouts': number of waits that timed out,
+        'typical_secs': median recent settle time, 'max_secs': longest settle time, 'total_secs': total time spent,
+        'histogram': {bucket bound: count}}}
+
+    Examples:
+        >>> get_stability_wait_stats()['apply vizmap']
+        {'count': 12, 'timeouts': 0, 'typical_secs': 0.21, 'max_secs': 0.85, 'total_secs': 3.1,
+         'histogram': {0.01: 0, 0.03: 0, 0.1: 2, 0.3: 8, 1.0: 2, 3.0: 0, 10.0: 0, 30.0: 0, inf: 0}}
+    """
+    with _stability_stats_lock:
+        return {operation: {'count': stats['count'], 'timeouts': stats['timeouts'],
+                            'typical_secs': _typical_settle_secs(operation), 'max_secs': stats['max_secs'],
+                            'total_secs': stats['total_secs'],
+                            'histogram': dict(zip(_SETTLE_BUCKET_BOUNDS, stats['histogram']))}
+                for operation, stats in _stability_stats.items()}
+
+def reset_stability_wait_stats():
+    """Forget the settle times and statistics kept by ``wait_until_stable()``."""
+    with _stability_stats_lock:
+        _stability_stats.clear()
+
+_SETTLE_BUCKET_BOUNDS = [0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, float('inf')]
+_SETTLE_HISTORY_LEN = 20  # How many recent settle times to derive an operation's typical settle time from
+_stability_stats_lock = threading.RLock()
+_stability_stats = {}
+
+def _record_settle_secs(operation, settle_secs, is_stable):
+    with _stability_stats_lock:
+        stats = _stability_stats.setdefault(operation, {'count': 0, 'timeouts': 0, 'max_secs': 0.0, 'total_secs': 0.0,
+                                                        'histogram': [0] * len(_SETTLE_BUCKET_BOUNDS),
+                                                        'recent_secs': collections.deque(maxlen=_SETTLE_HISTORY_LEN)})
+        stats['count'] += 1
+        stats['total_secs'] += settle_secs
+        if is_stable:
+            stats['max_secs'] = max(stats['max_secs'], settle_secs)
+            stats['histogram'][bisect.bisect_left(_SETTLE_BUCKET_BOUNDS, settle_secs)] += 1
+            stats['recent_secs'].append(settle_secs)
+        else:
+            stats['timeouts'] += 1
+
+def _typical_settle_secs(operation):
+    with _stability_stats_lock:
+        stats = _stability_stats.get(operation)
+        if stats is None or len(stats['recent_secs']) == 0: return None
+        return statistics.median(stats['recent_secs'])
 
+def _reset_http_sessions():
+    # Connection pools are configured when they're created, so drop them and let them be re-created on next use
+    from .py4cytoscape_http import reset_http_sessions
+    reset_http_sessions()
@@ -32,7 +32,9 @@ from colour import Color
 
 # Internal module imports
 from . import tables
+from . import networks
 from . import cytoscape_system
+from . import py4cytoscape_client
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -585,17 +587,14 @@ def node_suid_to_node_name(node_suids, network=None, base_url=DEFAULT_BASE_URL):
     if node_suids is None: return None
     node_suids = normalize_list(node_suids)
 
-    df = tables.get_table_columns('node', ['name'], 'default', network, base_url=base_url)
-    all_names = df['name'].values
+    name_index = _get_name_index('node', network, base_url)
 
-    test_present = [x in all_names for x in node_suids]
-    if not False in test_present:
+    if all(x in name_index.name_to_suids for x in node_suids):
         return node_suids
 
-    all_suids_list = df.index.tolist()
     try:
         # map all SUIDS into column names ... all SUIDs *must* be actual SUIDs
-        node_names = [all_names[all_suids_list.index(node_suid)] for node_suid in node_suids]
+        node_names = [name_index.suid_to_name[node_suid] for node_suid in node_suids]
         return node_names
     except Exception as e:
         raise CyError(f'Invalid node SUID in list: {node_suids}')
@@ -686,16 +685,14 @@ def edge_suid_to_edge_name(edge_suids, network=None, base_url=DEFAULT_BASE_URL):
     if edge_suids is None: return None
     edge_suids = normalize_list(edge_suids)
 
-    df = tables.get_table_columns('edge', ['name'], 'default', network, base_url=base_url)
-    all_names = df['name'].values
+    name_index = _get_name_index('edge', network, base_url)
 
-    test = [edge_suid in all_names for edge_suid in edge_suids]
-    if not False in test: return edge_suids  # the list already had valid names
+    if all(x in name_index.name_to_suids for x in edge_suids):
+        return edge_suids  # the list already had valid names
 
-    all_suids_list = df.index.tolist()
     try:
         # map all SUIDS into column names ... all SUIDs *must* be actual SUIDs
-        edge_names = [all_names[all_suids_list.index(edge_suid)] for edge_suid in edge_suids]
+        edge_names = [name_index.suid_to_name[edge_suid] for edge_suid in edge_suids]
         return edge_names
     except Exception as e:
         raise CyError(f'Invalid edge SUID in list: {edge_suids}')
@@ -738,7 +735,8 @@ def table_column_exists(table_column, table, network=None, base_url=DEFAULT_BASE
 def check_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL, caller=None):
     """Checks to see if min supported versions of api and cytoscape are running.
 
-    Extracts numerics from api and major cytoscape versions before making comparison.
+    Extracts numerics from api and major cytoscape versions before making comparison. The versions are fetched from
+    Cytoscape only once (see ``cached_version_info()``).
 
     Args:
         cyrest (int): minimum CyREST version
@@ -759,7 +757,7 @@ def check_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL,
     """
     if isinstance(cytoscape, float): cytoscape = str(cytoscape)
 
-    v = cytoscape_system.cytoscape_version_info(base_url=base_url)
+    v = cached_version_info(base_url=base_url)
     v_api_str = v['apiVersion']
     v_cy_str = v['cytoscapeVersion']
     v_api_num = int(re.match('v([0-9]+)$', v_api_str).group(1))
@@ -817,6 +815,93 @@ def verify_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL
         raise CyError(f'Function not run due to unsupported version: {nogo}', caller=caller)
 
 
+# Features whose availability depends on the Cytoscape version, each with the minimum CyREST and Cytoscape versions
+# that support it. Version-gated code should check a feature with has_capability() instead of comparing versions.
+CAPABILITIES = {
+    'supports_filter_apply_flag': (1, '3.9'),  # Filter creation honors "apply", and selection is settled on return
+    'supports_regex_filter': (1, '3.9'),  # REGEX column filters don't hang
+    'supports_v310_export': (1, '3.10'),  # Image export accepts zoom, transparent_background, etc.
+}
+
+
+def cached_version_info(base_url=DEFAULT_BASE_URL):
+    """Return the CyREST and Cytoscape versions, fetching them only the first time they're needed.
+
+    The versions are kept with the Cytoscape's client, so they're fetched again only after the client is reset (e.g.,
+    on reconnect, or when Cytoscape can't be reached) or ``invalidate_caches()`` is called. Use ``cytoscape_version_info()`` to always fetch them.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dict: {'apiVersion': <version>, 'cytoscapeVersion': <version>, 'automationAPIVersion': <version>,
+        'py4cytoscapeVersion': <version>}
+
+    Raises:
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> cached_version_info()
+        {'apiVersion': 'v1', 'cytoscapeVersion': '3.10.0', 'automationAPIVersion': '1.7.0', 'py4cytoscapeVersion': '1.7.0'}
+    """
+    client = py4cytoscape_client.get_client(base_url)
+    version_info = client.caches.get(py4cytoscape_client.VERSION_INFO_CACHE)
+    if version_info is None:
+        version_info = cytoscape_system.cytoscape_version_info(base_url=base_url)
+        client.caches[py4cytoscape_client.VERSION_INFO_CACHE] = version_info
+    return dict(version_info)
+
+
+def get_capabilities(base_url=DEFAULT_BASE_URL):
+    """Return which version-dependent features (see ``CAPABILITIES``) a Cytoscape supports.
+
+    Only the first call for a Cytoscape costs a call to Cytoscape (see ``cached_version_info()``).
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dict: {feature name: True if supported}
+
+    Raises:
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_capabilities()
+        {'supports_filter_apply_flag': True, 'supports_regex_filter': True, 'supports_v310_export': False}
+    """
+    return {name: check_supported_versions(cyrest=cyrest, cytoscape=cytoscape, base_url=base_url) is None
+            for name, (cyrest, cytoscape) in CAPABILITIES.items()}
+
+
+def has_capability(name, base_url=DEFAULT_BASE_URL):
+    """Determine whether a Cytoscape supports a version-dependent feature.
+
+    Args:
+        name (str): name of feature in ``CAPABILITIES`` (e.g., 'supports_v310_export')
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        bool: True if the feature is supported
+
+    Raises:
+        KeyError: if the feature name is unknown
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> has_capability('supports_v310_export')
+        True
+    """
+    cyrest, cytoscape = CAPABILITIES[name]
+    return check_supported_versions(cyrest=cyrest, cytoscape=cytoscape, base_url=base_url) is None
+
+
 def normalize_list(entity):
     # Return a Python list of strings given a Python list, a string list of strings, a string list of ints, or a scalar
     if isinstance(entity, str):  # If it's a string, it could be names, SUIDs, or whatever
@@ -915,29 +1000,50 @@ def _item_to_suid(item_names, table_name, network=None, base_url=DEFAULT_BASE_UR
     if item_names is None: return None
     item_names = normalize_list(item_names)
 
-    df = tables.get_table_columns(table_name, ['name'], 'default', network, base_url=base_url)
+    name_index = _get_name_index(table_name, network, base_url)
 
     # Check all item names to see if they're all valid SUIDs ... if so, we're already done
-    all_suids = df.index
     try:
         item_names = [int(i) for i in item_names]
-        found_valid_suids = [i in all_suids for i in item_names]
-        if False not in found_valid_suids:
+        if all(i in name_index.suid_to_name for i in item_names):
             return item_names
     except:
         pass
 
     # map all names into SUIDs ... all names *must* be actual names ... and must be str() to match the 'name' column
     item_names = [str(item_name) for item_name in item_names]
-    item_name_to_suid_list = {item_name: list(df[df.name.eq(item_name)].index.values) for item_name in item_names}
     try:
         if unique_list:
+            item_name_to_suid_list = {item_name: list(name_index.name_to_suids[item_name]) for item_name in item_names}
             suid_list = [item_name_to_suid_list[item_name].pop(0) for item_name in item_names]
         else:
-            suid_list = [item_name_to_suid_list[item_name] for item_name in item_names]
-            suid_list = [s[0] if len(s) <= 1 else s for s in
-                         suid_list]  # return scalar if len(list) = 1, blow up if len(list) = 0
+            suid_list = [name_index.name_to_suids[item_name] for item_name in item_names]
+            suid_list = [s[0] if len(s) == 1 else list(s) for s in suid_list]  # return scalar if len(list) = 1
     except:
         raise CyError(f'Invalid name in {table_name} name list: {item_names}')
 
     return suid_list
+
+
+class _NameIndex:
+    # Hash maps between names and SUIDs for one node or edge table ... names needn't be unique, so map each name to
+    # the list of SUIDs having that name (in table order)
+    def __init__(self, suids, names):
+        self.suid_to_name = dict(zip(suids, names))
+        self.name_to_suids = {}
+        for suid, name in zip(suids, names):
+            self.name_to_suids.setdefault(name, []).append(suid)
+
+
+def _get_name_index(table_name, network=None, base_url=DEFAULT_BASE_URL):
+    # Return the name index for a network's node or edge table, fetching the name column only if it isn't cached.
+    # Functions that change node or edge names or SUIDs must invalidate NAME_INDEX_CACHE.
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    client = py4cytoscape_client.get_client(base_url)
+    name_index = client.caches.get(py4cytoscape_client.NAME_INDEX_CACHE, {}).get((table_name, net_suid))
+    if name_index is None:
+        df = tables.get_table_columns(table_name, ['name'], 'default', net_suid, base_url=base_url)
+        name_index = _NameIndex(df.index.tolist(), df['name'].tolist())
+        with client.lock:
+            client.caches.setdefault(py4cytoscape_client.NAME_INDEX_CACHE, {})[(table_name, net_suid)] = name_index
+    return name_index
@@ -54,6 +54,9 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import base64
+import hashlib
+import io
+import json
 import os
 import time
 
@@ -164,12 +167,12 @@ def sandbox_remove(sandbox_name=None, base_url=DEFAULT_BASE_URL):
     # removal should be of the current sandbox (set in sandbox_set or as the default startup sandbox). If there is no
     # default startup sandbox (because we're running as standalone Python instead of remotely or as a notebook), this
     # removal is essentially an error because it's very bad to remove the whole Cytoscape file system.
-    default_sandbox_name = get_default_sandbox()['sandboxName']
-    current_sandbox_before_remove = get_current_sandbox_name()
+    default_sandbox_name = get_default_sandbox(base_url=base_url)['sandboxName']
+    current_sandbox_before_remove = get_current_sandbox_name(base_url=base_url)
 
     res = _sandbox_op(f'filetransfer removeSandbox', sandbox_name, base_url=base_url)
     if sandbox_name is None or sandbox_name == current_sandbox_before_remove:
-        set_current_sandbox(default_sandbox_name, get_default_sandbox_path()) # There is no more current sandbox ... wipe out name of sandbox
+        set_current_sandbox(default_sandbox_name, get_default_sandbox_path(base_url=base_url), base_url=base_url) # There is no more current sandbox ... wipe out name of sandbox
         sandbox_name = current_sandbox_before_remove
 
     # At this point, the sandbox has been deleted. If it was the current sandbox, there is no more current sandbox.
@@ -179,7 +182,7 @@ def sandbox_remove(sandbox_name=None, base_url=DEFAULT_BASE_URL):
     # re-initialize so it gets re-created.
 
     if sandbox_name == default_sandbox_name and default_sandbox_name == current_sandbox_before_remove:
-        set_sandbox_reinitialize() # Recreate the default sandbox before the next command executes
+        set_sandbox_reinitialize(base_url=base_url) # Recreate the default sandbox before the next command executes
     elif sandbox_name == current_sandbox_before_remove:
         # A user-created sandbox was removed, so fall back to the making the default sandbox current ...
         # be sure not to wipe out any work that's already there
@@ -219,13 +222,13 @@ def sandbox_get_file_info(file_name, sandbox_name=None, base_url=DEFAULT_BASE_UR
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
     try:
-        return _sandbox_op(f'filetransfer getFileInfo', sandbox_name, file_name=file_name, base_url=base_url)
+        return _sandbox_op('filetransfer getFileInfo', sandbox_name, file_name=file_name, base_url=base_url)
     except Exception as e:
         # This is a nasty case ... there isn't much way for getFileInfo to fail as long as the FileTransfer app
         # is installed. We'll assume failure means it isn't installed. And if that's so, it must mean that we're
         # running on the Cytoscape workstation. If so, get the file metadata the old fashioned way. This way,
         # callers don't have to know or care about the case of the uninstalled FileTransfer app.
-        if not sandbox_name and not get_current_sandbox_name() and file_name and file_name.strip() and base_url == LOCAL_BASE_URL:
+        if not sandbox_name and not get_current_sandbox_name(base_url=base_url) and file_name and file_name.strip() and base_url == LOCAL_BASE_URL:
             file_path = os.path.abspath(file_name)
             if os.path.exists(file_path):
                 is_file = os.path.isfile(file_name)
@@ -238,7 +241,8 @@ def sandbox_get_file_info(file_name, sandbox_name=None, base_url=DEFAULT_BASE_UR
             raise e
 
 @cy_log
-def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name = None, base_url=DEFAULT_BASE_URL):
+def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name = None, verify=False, progress=None,
+                    base_url=DEFAULT_BASE_URL):
     """Transfer a file to a sandbox.
 
     The source file is transferred to the named (or current) sandbox, overwriting an existing file if one
@@ -250,11 +254,17 @@ def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name =
     to make a sandbox current, it is possible to copy the Cytoscape sample data directories into to the sandbox at the
     same time.
 
+    The file is read and encoded a chunk at a time while it's being sent, so it's never all held in memory. If
+    ``verify`` is True, the file is read back from the sandbox afterwards and its SHA-256 checksum is compared with the
+    source file's, which doubles the transfer time.
+
     Args:
         source_file (str): Name of file in the Python workflow's file system
         dest_file (str): Name of file to write (as absolute path or sandbox-relative path) ... if None, use file name in source_file
         overwrite (bool): False causes error if dest_file already exists; True replaces it if it exists
         sandbox_name (str): Name of sandbox containing file. None means "the current sandbox".
+        verify (bool): True to verify the sandbox file's checksum after the transfer
+        progress (func): Called as ``progress(bytes_sent, file_bytes)`` after each chunk of the file is read for sending
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://localhost:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
@@ -263,7 +273,7 @@ def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name =
         dict: {'filePath': <new file's absolute path in Cytoscape workstation>}
 
     Raises:
-        CyError: if file name is invalid
+        CyError: if file name is invalid, or the sandbox file's checksum doesn't match
         requests.exceptions.HTTPError: if can't connect to Cytoscape, Cytoscape returns an error, or sandbox is invalid
 
     Examples:
@@ -273,21 +283,40 @@ def sandbox_send_to(source_file, dest_file=None, overwrite=True, sandbox_name =
         {'filePath': 'C:\\Users\\CyDeveloper\\CytoscapeConfiguration\\filetransfer\\default_sandbox\\myData.csv'}
         >>> sandbox_send_to('myData01.csv', 'myData.csv', sandbox_name='mySand')
         {'filePath': 'C:\\Users\\CyDeveloper\\CytoscapeConfiguration\\filetransfer\\mySand\\myData.csv'}
+        >>> sandbox_send_to('myData.csv', verify=True)
+        {'filePath': 'C:\\Users\\CyDeveloper\\CytoscapeConfiguration\\filetransfer\\default_sandbox\\myData.csv'}
 
     See Also:
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
+    if not dest_file or not dest_file.strip():
+        head, dest_file = os.path.split(source_file or '')
+
+    # Encode the file straight into the command's JSON body as it's sent, instead of into a command string that would
+    # be parsed. If the request is retried, the file is read (and its checksum computed) again from its start.
     try:
-        with open(source_file, mode='rb') as file:
-            file_content = file.read()
-        file_content64 = base64.b64encode(file_content).decode('utf-8')
+        file_size = os.path.getsize(source_file)
+        with open(source_file, mode='rb'): pass
     except Exception as e:
         raise CyError(f'Could not read file "{source_file}": {e}')
-
-    if not dest_file or not dest_file.strip():
-        head, dest_file = os.path.split(source_file)
-
-    return _sandbox_op(f'filetransfer toSandbox fileByteCount={len(file_content)} overwrite={overwrite} fileBase64="{file_content64}"', sandbox_name, file_name=dest_file, base_url=base_url)
+    checksum = None
+
+    def file_content64():
+        nonlocal checksum
+        checksum = hashlib.sha256()
+        return _iter_file_content64(source_file, file_size, checksum, progress)
+
+    res = _sandbox_op('filetransfer toSandbox', sandbox_name, file_name=dest_file,
+                      args={'fileByteCount': file_size, 'overwrite': overwrite},
+                      file_content64=(file_content64, (file_size + 2) // 3 * 4), base_url=base_url)
+
+    if verify:
+        sandbox_file = _sandbox_op('filetransfer fromSandbox', sandbox_name, file_name=dest_file, base_url=base_url)
+        sandbox_checksum = hashlib.sha256()
+        _write_file_content64(sandbox_file, dest_file, sandbox_checksum.update)
+        if sandbox_checksum.digest() != checksum.digest():
+            raise CyError(f'File "{dest_file}" in sandbox does not match "{source_file}"')
+    return res
 
 @cy_log
 def sandbox_url_to(source_url, dest_file, overwrite=True, sandbox_name = None, base_url=DEFAULT_BASE_URL):
@@ -350,7 +379,8 @@ def sandbox_url_to(source_url, dest_file, overwrite=True, sandbox_name = None, b
     if not dest_file:
         raise CyError(f'Destination file cannot be null')
 
-    return _sandbox_op(f'filetransfer urlToSandbox overwrite={overwrite} sourceURL={source_url}', sandbox_name, file_name=dest_file, base_url=base_url)
+    return _sandbox_op('filetransfer urlToSandbox', sandbox_name, file_name=dest_file,
+                       args={'overwrite': overwrite, 'sourceURL': source_url}, base_url=base_url)
 
 @cy_log
 def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name = None, base_url=DEFAULT_BASE_URL):
@@ -363,6 +393,9 @@ def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name =
 
     Note that there is no function that transfers an entire directory.
 
+    The file is decoded and written a chunk at a time, and is checked against the byte count reported by the sandbox.
+    It's written to a temporary file first, so a failed transfer never leaves a partial ``dest_file``.
+
     Args:
         source_file (str): Name of file to read (as absolute path or sandbox-relative path)
         dest_file (str): Name of file in the Python workflow's file system ... if None, use file name in source_file
@@ -375,7 +408,7 @@ def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name =
         dict: {'filePath': <source file's absolute path in Cytoscape workstation>}
 
     Raises:
-        CyError: if file name is invalid
+        CyError: if file name is invalid, or the file received is incomplete
         requests.exceptions.HTTPError: if can't connect to Cytoscape, Cytoscape returns an error, or sandbox is invalid
 
     Examples:
@@ -394,16 +427,18 @@ def sandbox_get_from(source_file, dest_file=None, overwrite=True, sandbox_name =
     if not overwrite and os.path.exists(dest_file):
         raise CyError(f'File "{dest_file}" already exists')
 
-    res = _sandbox_op(f'filetransfer fromSandbox', sandbox_name, file_name=source_file, base_url=base_url)
+    res = _sandbox_op('filetransfer fromSandbox', sandbox_name, file_name=source_file, base_url=base_url)
 
-    file_content = base64.b64decode(res['fileBase64'], validate=True)
+    temp_file = f'{dest_file}.{os.getpid()}.part'
     try:
-        with open(dest_file, mode='wb') as file:
-            file.write(file_content)
-    except Exception as e:
+        with open(temp_file, mode='wb') as file:
+            _write_file_content64(res, source_file, file.write)
+        os.replace(temp_file, dest_file)
+    except OSError as e:
         raise CyError(f'Could not write to file "{dest_file}": {e}')
+    finally:
+        if os.path.exists(temp_file): os.remove(temp_file)
 
-    del res['fileBase64']
     return res
 
 @cy_log
@@ -439,13 +474,113 @@ def sandbox_remove_file(file_name, sandbox_name=None, base_url=DEFAULT_BASE_URL)
     See Also:
         `Sandboxing <https://py4cytoscape.readthedocs.io/en/latest/concepts.html#sandboxing>`_ in the Concepts section in the py4cytoscape User Manual.
     """
-    return _sandbox_op(f'filetransfer removeFile', sandbox_name, file_name=file_name, base_url=base_url)
-
-def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL):
+    return _sandbox_op('filetransfer removeFile', sandbox_name, file_name=file_name, base_url=base_url)
+
+# ==============================================================================
+# I. Internal functions
+#
+# Dev Notes: Prefix internal functions with a '_'. Skip doc_strings for these
+# functions.
+# ------------------------------------------------------------------------------
+
+_TRANSFER_CHUNK_BYTES = 3 * 2 ** 20  # File bytes encoded at a time ... a multiple of 3, so chunks encode without padding
+
+
+def _iter_file_content64(source_file, file_size, checksum, progress):
+    # Read a file a chunk at a time, adding it to a checksum and yielding it encoded as base64. The file is opened
+    # only when the first chunk is asked for, and closed when the last one is read or the generator is closed. Each
+    # chunk is a multiple of 3 bytes, so the encoded chunks can simply be concatenated.
+    with open(source_file, mode='rb') as file:
+        byte_count = 0
+        for chunk in iter(lambda: file.read(_TRANSFER_CHUNK_BYTES), b''):
+            checksum.update(chunk)
+            byte_count += len(chunk)
+            if byte_count > file_size: break
+            if progress: progress(byte_count, file_size)
+            yield base64.b64encode(chunk)
+    if byte_count != file_size:
+        raise CyError(f'File "{source_file}" changed size while being sent')
+
+
+class _StreamedBody:
+    # A request body whose chunks are made while it's being sent, so they're never all in memory at once. Its length
+    # is known in advance, so it's sent with a Content-Length (rather than chunked). requests reads it like a file.
+    # make_chunks() starts a new pass over the chunks, so the body can be rewound (by seek()) when urllib3 retries
+    # the request after a failed connection ... otherwise, the retry would send only what's left of the body.
+    def __init__(self, make_chunks, length):
+        self._make_chunks = make_chunks
+        self._length = length
+        self._chunks = None
+        self.seek(0)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(lambda: self.read(_TRANSFER_CHUNK_BYTES), b'')
+
+    def __repr__(self):
+        return f'<{self._length} bytes, streamed>'
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        # Start the chunks over, and skip to offset (which is always 0 for urllib3)
+        if whence != 0:
+            raise io.UnsupportedOperation('Streamed body can only seek from its start')
+        self.close()
+        self._chunks = iter(self._make_chunks())
+        self._chunk = memoryview(b'')
+        self._offset = self._position = 0
+        while self._position < offset and self.read(min(offset - self._position, _TRANSFER_CHUNK_BYTES)):
+            pass
+        return self._position
+
+    def close(self):
+        # Stop the current pass over the chunks, which closes any file it's reading
+        if hasattr(self._chunks, 'close'): self._chunks.close()
+
+    def read(self, size=-1):
+        # Return the next size bytes (or all of the rest), slicing the current chunk instead of copying it
+        remaining = self._length if size is None or size < 0 else size
+        parts = []
+        while remaining > 0:
+            if self._offset >= len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None: break
+                self._chunk, self._offset = memoryview(chunk), 0
+            part = self._chunk[self._offset:self._offset + remaining]
+            self._offset += len(part)
+            remaining -= len(part)
+            parts.append(part)
+        data = b''.join(parts)
+        self._position += len(data)
+        return data
+
+
+def _write_file_content64(res, file_name, write):
+    # Decode the file content in a fromSandbox reply, passing it to write() a chunk at a time so there's never a
+    # decoded copy of the whole file, and remove it from the reply
+    file_content64 = res.pop('fileBase64')
+    chunk_chars = _TRANSFER_CHUNK_BYTES // 3 * 4
+    byte_count = 0
+    for start in range(0, len(file_content64), chunk_chars):
+        try:
+            chunk = base64.b64decode(file_content64[start:start + chunk_chars], validate=True)
+        except ValueError as e:
+            raise CyError(f'File "{file_name}" was received incorrectly: {e}')
+        byte_count += len(chunk)
+        write(chunk)
+    if 'fileByteCount' in res and byte_count != res['fileByteCount']:
+        raise CyError(f'File "{file_name}" was received incomplete: {byte_count} of {res["fileByteCount"]} bytes')
+
+
+def _sandbox_op(command, sandbox_name, file_name=None, args=None, file_content64=None, base_url=DEFAULT_BASE_URL):
     if file_name: file_name = file_name.strip()
     if sandbox_name:
         sandbox_name = sandbox_name.strip()
-        sandbox_path = get_current_sandbox_path()
+        sandbox_path = get_current_sandbox_path(base_url=base_url)
     else:
         # An empty sandbox name (either None or "") means to use the currently set sandbox (from sandbox_set).
         # Fetch the current sandbox name and use it. After that, the sandbox name could still be None ... meaning
@@ -464,13 +599,15 @@ def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL
         # beyond that, what the current sandbox name is.
         sandbox_name, sandbox_path = commands.do_initialize_sandbox(base_url=base_url)
 
+    # Pass arguments as strings, the same as if they had been part of a command string
+    args = {name: str(value) for name, value in (args or {}).items()}
     if sandbox_name:
         # Either running remotely or a sandbox has been defined for local execution. Either way,
         # use the sandbox and interpret the file_name as relative to the sandbox directory. This
         # works well when file_name is a relative name. If it's absolute, it'll be appended to the
         # sandbox directory name, which will create something unintelligible that will be trapped
         # by the FileTransfer app.
-        command += f' sandboxName="{sandbox_name}"'
+        args['sandboxName'] = sandbox_name
     elif file_name:
         # Running locally with no sandbox defined ... essentially passing through to the whole workstation
         # file system. If the caller supplies an absolute path, use it ... otherwise, make it relative to
@@ -479,7 +616,23 @@ def _sandbox_op(command, sandbox_name, file_name=None, base_url=DEFAULT_BASE_URL
             pass
         else:
             file_name = os.path.join(sandbox_path, file_name)
-    if file_name: command += f' fileName="{file_name}"'
+    if file_name: args['fileName'] = file_name
 
-    res = commands.commands_post(command, base_url=base_url)
-    return res
+    if file_content64 is None:
+        body = args
+    else:
+        # Splice the base64 chunks into the JSON body as one string, encoding them only as the body is sent
+        make_chunks, length = file_content64
+        args_json = json.dumps({**args, 'fileBase64': ''}).encode('utf-8')
+        prefix, suffix = args_json[:-len(b'"}')], b'"}'
+
+        def body_chunks():
+            yield prefix
+            yield from make_chunks()
+            yield suffix
+
+        body = _StreamedBody(body_chunks, len(prefix) + length + len(suffix))
+    try:
+        return commands._commands_post_args(command, body, base_url=base_url)
+    finally:
+        if isinstance(body, _StreamedBody): body.close()  # e.g., if the request failed before all of it was read
@@ -28,6 +28,7 @@ from . import sandbox
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_client import get_client, NAME_INDEX_CACHE, NETWORK_SUID_CACHE
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
 
@@ -67,7 +68,9 @@ def close_session(save_before_closing, filename=None, base_url=DEFAULT_BASE_URL)
     """
     if save_before_closing: save_session(filename, base_url=base_url)
 
-    return commands.commands_post('session new', base_url=base_url)
+    res = commands.commands_post('session new', base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE, NETWORK_SUID_CACHE)
+    return res
 
 
 @cy_log
@@ -110,12 +113,14 @@ def open_session(file_location=None, base_url=DEFAULT_BASE_URL):
     else:
         type = 'file'
         if file_location:
-            file_location = get_abs_sandbox_path(file_location)
+            file_location = get_abs_sandbox_path(file_location, base_url=base_url)
         else:
             file_location = 'sampleData/sessions/Yeast Perturbation.cys' # relative to Cytoscape install directory
 
     narrate(f'Opening {file_location}...')
-    return commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    res = commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE, NETWORK_SUID_CACHE)
+    return res
 
 
 @cy_log
@@ -168,4 +173,4 @@ def save_session(filename=None, base_url=DEFAULT_BASE_URL, *, overwrite_file=Tru
             else:
                 raise CyError(f'File "{filename}" already exists ... session not saved.')
 
-        return commands.commands_post(f'session save as file="{get_abs_sandbox_path(filename)}"', base_url=base_url)
+        return commands.commands_post(f'session save as file="{get_abs_sandbox_path(filename, base_url=base_url)}"', base_url=base_url)
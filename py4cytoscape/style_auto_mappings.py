@@ -26,11 +26,8 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # External library imports
-import colorbrewer
 import random
-import numpy as np
 import functools
-import pandas as pd
 
 
 # Internal module imports
@@ -97,7 +94,7 @@ def palette_color_brewer_q_Pastel2(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Pastel2, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Pastel2', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Pastel1(reverse=False):
@@ -112,7 +109,7 @@ def palette_color_brewer_q_Pastel1(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Pastel1, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Pastel1', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Dark2(reverse=False):
@@ -127,7 +124,7 @@ def palette_color_brewer_q_Dark2(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Dark2, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Dark2', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Accent(reverse=False):
@@ -142,7 +139,7 @@ def palette_color_brewer_q_Accent(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Accent, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Accent', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Paired(reverse=False):
@@ -157,7 +154,7 @@ def palette_color_brewer_q_Paired(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Paired, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Paired', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Set1(reverse=False):
@@ -172,7 +169,7 @@ def palette_color_brewer_q_Set1(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Set1, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Set1', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Set2(reverse=False):
@@ -187,7 +184,7 @@ def palette_color_brewer_q_Set2(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Set2, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Set2', reverse)
 
 @_palette('qualitative')
 def palette_color_brewer_q_Set3(reverse=False):
@@ -202,7 +199,7 @@ def palette_color_brewer_q_Set3(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Set3, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Set3', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_YlGn(reverse=False):
@@ -217,7 +214,7 @@ def palette_color_brewer_s_YlGn(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.YlGn, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'YlGn', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_YlGnBu(reverse=False):
@@ -232,7 +229,7 @@ def palette_color_brewer_s_YlGnBu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.YlGnBu, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'YlGnBu', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_GnBu(reverse=False):
@@ -247,7 +244,7 @@ def palette_color_brewer_s_GnBu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.GnBu, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'GnBu', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_BuGn(reverse=False):
@@ -262,7 +259,7 @@ def palette_color_brewer_s_BuGn(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.BuGn, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'BuGn', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_PuBuGn(reverse=False):
@@ -277,7 +274,7 @@ def palette_color_brewer_s_PuBuGn(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PuBuGn, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PuBuGn', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_PuBu(reverse=False):
@@ -292,7 +289,7 @@ def palette_color_brewer_s_PuBu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PuBu, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PuBu', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_BuPu(reverse=False):
@@ -307,7 +304,7 @@ def palette_color_brewer_s_BuPu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.BuPu, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'BuPu', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_RdPu(reverse=False):
@@ -322,7 +319,7 @@ def palette_color_brewer_s_RdPu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.RdPu, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'RdPu', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_PuRd(reverse=False):
@@ -337,7 +334,7 @@ def palette_color_brewer_s_PuRd(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PuRd, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PuRd', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_OrRd(reverse=False):
@@ -352,7 +349,7 @@ def palette_color_brewer_s_OrRd(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.OrRd, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'OrRd', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_YlOrRd(reverse=False):
@@ -367,7 +364,7 @@ def palette_color_brewer_s_YlOrRd(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.YlOrRd, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'YlOrRd', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_YlOrBr(reverse=False):
@@ -382,7 +379,7 @@ def palette_color_brewer_s_YlOrBr(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.YlOrBr, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'YlOrBr', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Purples(reverse=False):
@@ -397,7 +394,7 @@ def palette_color_brewer_s_Purples(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Purples, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Purples', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Blues(reverse=False):
@@ -412,7 +409,7 @@ def palette_color_brewer_s_Blues(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Blues, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Blues', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Greens(reverse=False):
@@ -427,7 +424,7 @@ def palette_color_brewer_s_Greens(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Greens, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Greens', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Oranges(reverse=False):
@@ -442,7 +439,7 @@ def palette_color_brewer_s_Oranges(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Oranges, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Oranges', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Reds(reverse=False):
@@ -457,7 +454,7 @@ def palette_color_brewer_s_Reds(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Reds, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Reds', reverse)
 
 @_palette('sequential')
 def palette_color_brewer_s_Greys(reverse=False):
@@ -472,7 +469,7 @@ def palette_color_brewer_s_Greys(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Greys, reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Greys', reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_PuOr(reverse=False):
@@ -491,7 +488,7 @@ def palette_color_brewer_d_PuOr(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PuOr, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PuOr', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_BrBG(reverse=False):
@@ -510,7 +507,7 @@ def palette_color_brewer_d_BrBG(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.BrBG, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'BrBG', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_PRGn(reverse=False):
@@ -529,7 +526,7 @@ def palette_color_brewer_d_PRGn(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PRGn, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PRGn', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_PiYG(reverse=False):
@@ -548,7 +545,7 @@ def palette_color_brewer_d_PiYG(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.PiYG, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'PiYG', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_RdBu(reverse=False):
@@ -567,7 +564,7 @@ def palette_color_brewer_d_RdBu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.RdBu, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'RdBu', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_RdGy(reverse=False):
@@ -586,7 +583,7 @@ def palette_color_brewer_d_RdGy(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.RdGy, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'RdGy', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_RdYlBu(reverse=False):
@@ -605,7 +602,7 @@ def palette_color_brewer_d_RdYlBu(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.RdYlBu, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'RdYlBu', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_Spectral(reverse=False):
@@ -624,7 +621,7 @@ def palette_color_brewer_d_Spectral(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.Spectral, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'Spectral', not reverse)
 
 @_palette('divergent')
 def palette_color_brewer_d_RdYlGn(reverse=False):
@@ -643,7 +640,7 @@ def palette_color_brewer_d_RdYlGn(reverse=False):
     See Also:
         :meth:`gen_node_color_map`, :meth:`gen_edge_color_map`
     """
-    return lambda value_count: _palette_color_brewer(value_count, colorbrewer.RdYlGn, not reverse)
+    return lambda value_count: _palette_color_brewer(value_count, 'RdYlGn', not reverse)
 
 
 # ==============================================================================
@@ -1376,7 +1373,10 @@ def gen_edge_arrow_map(table_column,
     return _gen_d_shape_map('edge', table_column, scheme_d_arrow_shapes(), 'shapes', 'default_shape', default_shape, style_name, network, base_url)
 
 # Generate a brewer palette of a given size, and interpolate if there isn't a palette of the desired size
-def _palette_color_brewer(value_count, palette, reverse):
+def _palette_color_brewer(value_count, palette_name, reverse):
+    import colorbrewer  # Imported here so that only callers that use palettes pay for loading it
+    palette = getattr(colorbrewer, palette_name)
+
     # Get the list of palette lengths available for this palette
     # A palette is a list of color lists tuned for the number of colors needed. For example,
     # palette A may have 3:[color1, color2, color3] and 4:[color1, color2, color3, color4]. If
@@ -1481,6 +1481,8 @@ def _gen_c_color_map(table,
                      network,
                      base_url):
 
+    import numpy as np  # Already loaded by pandas, but not imported by py4cytoscape until needed
+
     # Find out all of the values in the named column
     df_values = tables.get_table_columns(table=table, columns=table_column, network=network, base_url=base_url)
 
@@ -1639,6 +1641,8 @@ def _gen_c_map(table,
     if 'continuous' not in scheme_type:
         raise CyError(f'Scheme {scheme_func_name} cannot be used for continuous mappings')
 
+    import numpy as np
+
     # Find out all of the values in the named column
     df_values = tables.get_table_columns(table=table, columns=table_column, network=network, base_url=base_url)
 
@@ -31,6 +31,7 @@ import sys
 import time
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Internal module imports
 from . import commands
@@ -43,7 +44,9 @@ from . import styles
 # Internal module convenience imports
 from .exceptions import CyError
 from .py4cytoscape_utils import *
-from .py4cytoscape_logger import cy_log, show_error
+from .py4cytoscape_logger import cy_log, show_error, detail_logger
+from .py4cytoscape_notebook import check_execution_environment, ExecutionEnvironment
+from .py4cytoscape_client import get_client
 from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS
 from .style_visual_props import *
 
@@ -120,20 +123,7 @@ def set_node_property_bypass(node_names, new_values, visual_property, bypass=Tru
     if not isinstance(new_values, list): new_values = [new_values]
 
     # If the property is verifiable, verify the values and adjust as appropriate
-    if visual_property in NODE_COLOR_PROPERTIES:
-        new_values = verify_hex_colors(new_values)
-    elif visual_property in NODE_DIMENSION_PROPERTIES.keys():
-        new_values = verify_dimensions(NODE_DIMENSION_PROPERTIES[visual_property], new_values)
-    elif visual_property in NODE_OPACITY_PROPERTIES:
-        new_values = verify_opacities(new_values)
-    elif visual_property in NODE_SHAPE_PROPERTIES:
-        new_values = verify_node_shapes(new_values, styles.get_node_shapes(base_url=base_url))
-    elif visual_property in NODE_VISIBLE_PROPERTIES:
-        new_values = verify_bools(new_values)
-    elif visual_property in NODE_LABEL_PROPERTIES | NODE_TOOLTIP_PROPERTIES | NODE_FONT_FACE_PROPERTIES:
-        new_values = verify_strs(new_values)
-    else:
-        show_error(f'Warning: setting unknown node bypass property "{visual_property}"')
+    new_values = _verify_node_bypass_values(visual_property, new_values, {}, base_url=base_url)
 
     # there can be more than one node.SUID per node.name!
     # 'node.SUIDs' and 'new.values' must have the same length
@@ -153,6 +143,84 @@ def set_node_property_bypass(node_names, new_values, visual_property, bypass=Tru
     return res
 
 
+@cy_log
+def set_node_properties_bypass(node_names, new_values, bypass=True, network=None, base_url=DEFAULT_BASE_URL):
+    """Set Bypass Values for Several Node Properties at Once.
+
+    Set bypass values for several node properties of the specified nodes in a single call to Cytoscape. This is the
+    same as calling ``set_node_property_bypass()`` once for each property, but the nodes, network and view are looked
+    up only once, and all of the values are sent together.
+
+    Args:
+        node_names (str or list or int or None): List of nodes as ``list`` of node names or SUIDs,
+            comma-separated string of node names or SUIDs, or scalar node name
+            or SUID. Node names should be found in the ``name`` column of the ``nodes table``.
+        new_values (dict): {visual property name: list of values to set, or single value}. See
+            ``get_visual_property_names``.
+        bypass (bool): Whether to set permanent bypass value. Default is True
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        str: ''
+
+    Raises:
+        CyError: if node, visual property, value or network name doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> node_names = list(get_table_columns(columns='name')['name'])
+        >>> set_node_properties_bypass(node_names, {'NODE_FILL_COLOR': '#FF00FF', 'NODE_SIZE': 60, 'NODE_SHAPE': 'DIAMOND'})
+        ''
+        >>> set_node_properties_bypass('YDL194W, YDR277C', {'NODE_FILL_COLOR': ['#FF00FF', '#00FF00'], 'NODE_LABEL': ['A', 'B']})
+        ''
+        >>> set_node_properties_bypass(12755, {'NODE_WIDTH': 80, 'NODE_HEIGHT': 20}, network='galFiltered.sif')
+        ''
+
+    Note:
+        As with ``set_node_property_bypass()``, the values for each property must be either a single value (which
+        applies to all nodes) or a list containing one value per node. All properties are validated before any
+        are sent, so if any value is invalid, none are set.
+
+    See Also:
+        :meth:`set_node_property_bypass`, :meth:`clear_node_property_bypass`
+    """
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
+    node_suids = node_name_to_node_suid(node_names, network=network, base_url=base_url, unique_list=True)
+    if node_suids is None: return ''
+
+    if not isinstance(new_values, dict):
+        raise CyError('new_values must be a dict of {visual property: values}')
+
+    # Verify all properties' values before sending any ... valid shapes and styles are fetched once for all properties
+    valid_values = {}
+    view_values = []
+    for visual_property, values in new_values.items():
+        visual_property = normalize_prop_name(visual_property)
+        if not isinstance(values, list): values = [values]
+        values = _verify_node_bypass_values(visual_property, values, valid_values, base_url=base_url)
+        if len(values) == 1: values = values * len(node_suids)
+        if len(values) != len(node_suids):
+            raise CyError(f'The number of nodes {len(node_suids)} and new {visual_property} values {len(values)} are not '
+                          f'the same >> node(s) attribute couldn\'t be set. Note that having multiple nodes with the same '
+                          f'name in the network can cause this error. Use node SUIDs or pass in duplicated names on '
+                          f'their own.')
+        view_values.append((visual_property, values))
+
+    body_list = [{'SUID': str(suid),
+                  'view': [{'visualProperty': visual_property, 'value': values[i]}
+                           for visual_property, values in view_values]}
+                 for i, suid in enumerate(node_suids)]
+
+    res = commands.cyrest_put(f'networks/{net_suid}/views/{view_suid}/nodes',
+                              parameters={'bypass': bypass}, body=body_list, base_url=base_url, require_json=False)
+    return res
+
+
 @cy_log
 def clear_node_property_bypass(node_names, visual_property, network=None, base_url=DEFAULT_BASE_URL):
     """Clear Node Property Bypass.
@@ -163,9 +231,9 @@ def clear_node_property_bypass(node_names, visual_property, network=None, base_u
     Args:
         node_names (str or list or int or None): List of nodes as ``list`` of node names or SUIDs,
             comma-separated string of node names or SUIDs, or scalar node name
-            or SUID. Node names should be found in the ``name`` column of the ``nodes table``.
+            or SUID. Node names should be found in the ``name`` column of the ``nodes table``. 'all' selects
+            all nodes in the network.
         visual_property (str): Name of a visual property. See ``get_visual_property_names``.
-        bypass (bool): Whether to set permanent bypass value. Default is True
         network (SUID or str or None): Name or SUID of a network. Default is the
             "current" network active in Cytoscape.
         base_url (str): Ignore unless you need to specify a custom domain,
@@ -193,11 +261,17 @@ def clear_node_property_bypass(node_names, visual_property, network=None, base_u
         ''
         >>> clear_node_property_bypass(12755, 'NODE_FILL_COLOR', network='galFiltered.sif')
         ''
+        >>> clear_node_property_bypass('all', 'NODE_FILL_COLOR')
+        ''
 
     Note:
         To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
         'node1, node\\\\,2' identifies 'node1' and 'node,2'.
 
+        CyREST clears bypasses one node at a time, so nodes are cleared in batches of ``BYPASS_BATCH_SIZE`` (see
+        ``set_bypass_batch_size()``), with the nodes in a batch cleared concurrently over the pooled connections to
+        Cytoscape. The time taken by each batch is written to the detail log.
+
     See Also:
         :meth:`set_node_property_bypass`
     """
@@ -207,20 +281,12 @@ def clear_node_property_bypass(node_names, visual_property, network=None, base_u
     visual_property = normalize_prop_name(visual_property)
 
     if node_names == 'all':
-        raise CyError('"all" node_names is not yet supported by CyREST. Please provide a valid node list.')
-
-    # TODO: Do we need to pass in net_suid ... other calls just let the function figure it out
-    node_suids = node_name_to_node_suid(node_names, network=net_suid, base_url=base_url, unique_list=True)
-
-    if node_suids == []:
-        res = {'data': {}, 'errors': []}
+        node_suids = commands.cyrest_get(f'networks/{net_suid}/nodes', base_url=base_url)
     else:
-        for suid in node_suids:
-            res = commands.cyrest_delete(f'networks/{net_suid}/views/{view_suid}/nodes/{suid}/{visual_property}/bypass',
-                                         base_url=base_url)
+        # TODO: Do we need to pass in net_suid ... other calls just let the function figure it out
+        node_suids = node_name_to_node_suid(node_names, network=net_suid, base_url=base_url, unique_list=True)
 
-    return res
-    # TODO: OK to miss res values during the loop?
+    return _clear_property_bypasses('node', node_suids, visual_property, net_suid, view_suid, base_url=base_url)
 
 
 # ==============================================================================
@@ -294,22 +360,7 @@ def set_edge_property_bypass(edge_names, new_values, visual_property, bypass=Tru
     if not isinstance(new_values, list): new_values = [new_values]
 
     # If the property is verifiable, verify the values and adjust as appropriate
-    if visual_property in EDGE_COLOR_PROPERTIES:
-        new_values = verify_hex_colors(new_values)
-    elif visual_property in EDGE_DIMENSION_PROPERTIES.keys():
-        new_values = verify_dimensions(EDGE_DIMENSION_PROPERTIES[visual_property], new_values)
-    elif visual_property in EDGE_OPACITY_PROPERTIES:
-        new_values = verify_opacities(new_values)
-    elif visual_property in EDGE_LINE_STYLE_PROPERTIES:
-        new_values = verify_edge_shapes(new_values, styles.get_line_styles(base_url=base_url), 'line style', 'get_line_styles')
-    elif visual_property in EDGE_ARROW_STYLE_PROPERTIES:
-        new_values = verify_edge_shapes(new_values, styles.get_arrow_shapes(base_url=base_url), 'arrow shape', 'get_arrow_shapes')
-    elif visual_property in EDGE_VISIBLE_PROPERTIES:
-        new_values = verify_bools(new_values)
-    elif visual_property in EDGE_LABEL_PROPERTIES | EDGE_TOOLTIP_PROPERTIES | EDGE_FONT_FACE_PROPERTIES:
-        new_values = verify_strs(new_values)
-    else:
-        show_error(f'Warning: setting unknown edge bypass property "{visual_property}"')
+    new_values = _verify_edge_bypass_values(visual_property, new_values, {}, base_url=base_url)
 
     # there can be more than one edge.SUID per edge.name!
     # 'edge.SUIDs' and 'new.values' must have the same length
@@ -329,6 +380,84 @@ def set_edge_property_bypass(edge_names, new_values, visual_property, bypass=Tru
     return res
 
 
+@cy_log
+def set_edge_properties_bypass(edge_names, new_values, bypass=True, network=None, base_url=DEFAULT_BASE_URL):
+    """Set Bypass Values for Several Edge Properties at Once.
+
+    Set bypass values for several edge properties of the specified edges in a single call to Cytoscape. This is the
+    same as calling ``set_edge_property_bypass()`` once for each property, but the edges, network and view are looked
+    up only once, and all of the values are sent together.
+
+    Args:
+        edge_names (str or list or int or None): List of edges as ``list`` of edge names or SUIDs,
+            comma-separated string of edge names or SUIDs, or scalar edge name
+            or SUID. Edge names should be found in the ``name`` column of the ``edges table``.
+        new_values (dict): {visual property name: list of values to set, or single value}. See
+            ``get_visual_property_names``.
+        bypass (bool): Whether to set permanent bypass value. Default is True
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://localhost:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        str: ''
+
+    Raises:
+        CyError: if edge, visual property, value or network name doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> edge_names = list(get_table_columns(table='edge', columns='name')['name'])
+        >>> set_edge_properties_bypass(edge_names, {'EDGE_UNSELECTED_PAINT': '#FF00FF', 'EDGE_WIDTH': 4, 'EDGE_LINE_TYPE': 'DOT'})
+        ''
+        >>> set_edge_properties_bypass('YDR277C (pp) YDL194W, YDR277C (pp) YJR022W', {'EDGE_LABEL': ['A', 'B'], 'EDGE_TARGET_ARROW_SHAPE': 'ARROW'})
+        ''
+        >>> set_edge_properties_bypass(12755, {'EDGE_TRANSPARENCY': 120}, network='galFiltered.sif')
+        ''
+
+    Note:
+        As with ``set_edge_property_bypass()``, the values for each property must be either a single value (which
+        applies to all edges) or a list containing one value per edge. All properties are validated before any
+        are sent, so if any value is invalid, none are set.
+
+    See Also:
+        :meth:`set_edge_property_bypass`, :meth:`clear_edge_property_bypass`
+    """
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
+    edge_suids = edge_name_to_edge_suid(edge_names, network=network, base_url=base_url, unique_list=True)
+    if edge_suids is None: return ''
+
+    if not isinstance(new_values, dict):
+        raise CyError('new_values must be a dict of {visual property: values}')
+
+    # Verify all properties' values before sending any ... valid shapes and styles are fetched once for all properties
+    valid_values = {}
+    view_values = []
+    for visual_property, values in new_values.items():
+        visual_property = normalize_prop_name(visual_property)
+        if not isinstance(values, list): values = [values]
+        values = _verify_edge_bypass_values(visual_property, values, valid_values, base_url=base_url)
+        if len(values) == 1: values = values * len(edge_suids)
+        if len(values) != len(edge_suids):
+            raise CyError(f'The number of edges {len(edge_suids)} and new {visual_property} values {len(values)} are not '
+                          f'the same >> edge(s) attribute couldn\'t be set. Note that having multiple edges with the same '
+                          f'name in the network can cause this error. Use edge SUIDs or pass in duplicated names on '
+                          f'their own.')
+        view_values.append((visual_property, values))
+
+    body_list = [{'SUID': str(suid),
+                  'view': [{'visualProperty': visual_property, 'value': values[i]}
+                           for visual_property, values in view_values]}
+                 for i, suid in enumerate(edge_suids)]
+
+    res = commands.cyrest_put(f'networks/{net_suid}/views/{view_suid}/edges',
+                              parameters={'bypass': bypass}, body=body_list, base_url=base_url, require_json=False)
+    return res
+
+
 @cy_log
 def clear_edge_property_bypass(edge_names, visual_property, network=None, base_url=DEFAULT_BASE_URL):
     """Clear Edge Property Bypass.
@@ -339,9 +468,9 @@ def clear_edge_property_bypass(edge_names, visual_property, network=None, base_u
     Args:
         edge_names (str or list or int or None): List of edges as ``list`` of edge names or SUIDs,
             comma-separated string of edge names or SUIDs, or scalar edge name
-            or SUID. Edge names should be found in the ``name`` column of the ``edges table``.
+            or SUID. Edge names should be found in the ``name`` column of the ``edges table``. 'all' selects
+            all edges in the network.
         visual_property (str): Name of a visual property. See ``get_visual_property_names``.
-        bypass (bool): Whether to set permanent bypass value. Default is True
         network (SUID or str or None): Name or SUID of a network. Default is the
             "current" network active in Cytoscape.
         base_url (str): Ignore unless you need to specify a custom domain,
@@ -369,6 +498,13 @@ def clear_edge_property_bypass(edge_names, visual_property, network=None, base_u
         {'data': {}, 'errors': []}
         >>> clear_edge_property_bypass(12755, 'EDGE_UNSELECTED_PAINT', network='galFiltered.sif')
         {'data': {}, 'errors': []}
+        >>> clear_edge_property_bypass('all', 'EDGE_UNSELECTED_PAINT')
+        {'data': {}, 'errors': []}
+
+    Note:
+        CyREST clears bypasses one edge at a time, so edges are cleared in batches of ``BYPASS_BATCH_SIZE`` (see
+        ``set_bypass_batch_size()``), with the edges in a batch cleared concurrently over the pooled connections to
+        Cytoscape. The time taken by each batch is written to the detail log.
 
     See Also:
         :meth:`set_edge_property_bypass`
@@ -379,20 +515,12 @@ def clear_edge_property_bypass(edge_names, visual_property, network=None, base_u
     visual_property = normalize_prop_name(visual_property)
 
     if edge_names == 'all':
-        raise CyError('"all" edge_names is not yet supported by CyREST. Please provide a valid edge list.')
-
-    # TODO: Do we need to pass in net_suid ... other calls just let the function figure it out
-    edge_suids = edge_name_to_edge_suid(edge_names, network=net_suid, base_url=base_url, unique_list=True)
-
-    if edge_suids == []:
-        res = {'data': {}, 'errors': []}
+        edge_suids = commands.cyrest_get(f'networks/{net_suid}/edges', base_url=base_url)
     else:
-        for suid in edge_suids:
-            res = commands.cyrest_delete(f'networks/{net_suid}/views/{view_suid}/edges/{suid}/{visual_property}/bypass',
-                                         base_url=base_url)
+        # TODO: Do we need to pass in net_suid ... other calls just let the function figure it out
+        edge_suids = edge_name_to_edge_suid(edge_names, network=net_suid, base_url=base_url, unique_list=True)
 
-    return res
-    # TODO: OK to miss res values during the loop?
+    return _clear_property_bypasses('edge', edge_suids, visual_property, net_suid, view_suid, base_url=base_url)
 
 
 @cy_log
@@ -2645,3 +2773,80 @@ def clear_network_center_bypass(network=None, base_url=DEFAULT_BASE_URL):
     res = clear_network_property_bypass('NETWORK_CENTER_Y_LOCATION', network=network, base_url=base_url)
     return res
 
+
+# ==============================================================================
+# III. Internal functions
+# ------------------------------------------------------------------------------
+
+def _clear_property_bypasses(table, suids, visual_property, net_suid, view_suid, base_url=DEFAULT_BASE_URL):
+    # CyREST has no bulk bypass delete, so issue the per-SUID deletes in batches, with each batch fanned out across
+    # the pooled connections. Jupyter-Bridge relays one request at a time, so don't fan out through it.
+    if len(suids) == 0:
+        return {'data': {}, 'errors': []}
+
+    client = get_client(base_url)
+    if check_execution_environment(base_url) == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE:
+        workers = 1
+    else:
+        workers = max(1, client.tuning.HTTP_POOL_SIZE)
+    batch_size = max(1, client.tuning.BYPASS_BATCH_SIZE)
+
+    def clear_bypass(suid):
+        return commands.cyrest_delete(f'networks/{net_suid}/views/{view_suid}/{table}s/{suid}/{visual_property}/bypass',
+                                      base_url=base_url)
+
+    batch_count = (len(suids) + batch_size - 1) // batch_size
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='py4cytoscape-bypass') as executor:
+        for batch_num, batch_start in enumerate(range(0, len(suids), batch_size), start=1):
+            start_time = time.perf_counter()
+            batch = suids[batch_start:batch_start + batch_size]
+            res = list(executor.map(clear_bypass, batch))[-1]  # Raises the first error in the batch
+            detail_logger.debug(f'Cleared {visual_property} bypass for {len(batch)} {table}s (batch {batch_num} of '
+                                f'{batch_count}) in {time.perf_counter() - start_time:.3f} secs')
+    return res
+
+def _verify_node_bypass_values(visual_property, new_values, valid_values, base_url=DEFAULT_BASE_URL):
+    # Verify and normalize a node property's values, if the property is verifiable. Lists of valid values fetched from
+    # Cytoscape are kept in valid_values so they're fetched once when verifying several properties.
+    if visual_property in NODE_COLOR_PROPERTIES:
+        return verify_hex_colors(new_values)
+    elif visual_property in NODE_DIMENSION_PROPERTIES.keys():
+        return verify_dimensions(NODE_DIMENSION_PROPERTIES[visual_property], new_values)
+    elif visual_property in NODE_OPACITY_PROPERTIES:
+        return verify_opacities(new_values)
+    elif visual_property in NODE_SHAPE_PROPERTIES:
+        if 'node_shapes' not in valid_values:
+            valid_values['node_shapes'] = styles.get_node_shapes(base_url=base_url)
+        return verify_node_shapes(new_values, valid_values['node_shapes'])
+    elif visual_property in NODE_VISIBLE_PROPERTIES:
+        return verify_bools(new_values)
+    elif visual_property in NODE_LABEL_PROPERTIES | NODE_TOOLTIP_PROPERTIES | NODE_FONT_FACE_PROPERTIES:
+        return verify_strs(new_values)
+    else:
+        show_error(f'Warning: setting unknown node bypass property "{visual_property}"')
+        return new_values
+
+def _verify_edge_bypass_values(visual_property, new_values, valid_values, base_url=DEFAULT_BASE_URL):
+    # Verify and normalize an edge property's values, if the property is verifiable. Lists of valid values fetched from
+    # Cytoscape are kept in valid_values so they're fetched once when verifying several properties.
+    if visual_property in EDGE_COLOR_PROPERTIES:
+        return verify_hex_colors(new_values)
+    elif visual_property in EDGE_DIMENSION_PROPERTIES.keys():
+        return verify_dimensions(EDGE_DIMENSION_PROPERTIES[visual_property], new_values)
+    elif visual_property in EDGE_OPACITY_PROPERTIES:
+        return verify_opacities(new_values)
+    elif visual_property in EDGE_LINE_STYLE_PROPERTIES:
+        if 'line_styles' not in valid_values:
+            valid_values['line_styles'] = styles.get_line_styles(base_url=base_url)
+        return verify_edge_shapes(new_values, valid_values['line_styles'], 'line style', 'get_line_styles')
+    elif visual_property in EDGE_ARROW_STYLE_PROPERTIES:
+        if 'arrow_shapes' not in valid_values:
+            valid_values['arrow_shapes'] = styles.get_arrow_shapes(base_url=base_url)
+        return verify_edge_shapes(new_values, valid_values['arrow_shapes'], 'arrow shape', 'get_arrow_shapes')
+    elif visual_property in EDGE_VISIBLE_PROPERTIES:
+        return verify_bools(new_values)
+    elif visual_property in EDGE_LABEL_PROPERTIES | EDGE_TOOLTIP_PROPERTIES | EDGE_FONT_FACE_PROPERTIES:
+        return verify_strs(new_values)
+    else:
+        show_error(f'Warning: setting unknown edge bypass property "{visual_property}"')
+        return new_values
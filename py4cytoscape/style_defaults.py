@@ -24,7 +24,6 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
-import time
 import re
 import json
 
@@ -39,7 +38,8 @@ from . import tables
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, show_error
-from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS
+from .py4cytoscape_client import get_client
+from .py4cytoscape_tuning import wait_until_ready
 from .style_visual_props import *
 
 
@@ -167,8 +167,11 @@ def set_visual_property_default(style_string, style_name=None, base_url=DEFAULT_
     # TODO: Should the property name be mapped like in update_style_defaults?
     res = commands.cyrest_put(f'styles/{style_name}/defaults', body=[style_string], base_url=base_url,
                               require_json=False)
-    time.sleep(
-        MODEL_PROPAGATION_SECS)  # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [BUG]
+    # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [BUG]
+    tuning = get_client(base_url).tuning
+    wait_until_ready(lambda: _is_same_value(
+        commands.cyrest_get(f'styles/{style_name}/defaults/{style_string["visualProperty"]}', base_url=base_url)['value'],
+        style_string['value']), tuning.MODEL_PROPAGATION_SECS, tuning=tuning)
     return res
 
 
@@ -1801,6 +1804,14 @@ def set_background_color_default(new_color, style_name=None, base_url=DEFAULT_BA
     res = set_visual_property_default(style, style_name, base_url=base_url)
     return res
 
+def _is_same_value(value, expected):
+    # Compare a value read back from Cytoscape with the value written, allowing for Cytoscape's own formatting
+    if str(value).upper() == str(expected).upper(): return True
+    try:
+        return float(value) == float(expected)
+    except (TypeError, ValueError):
+        return False
+
 def _validate_prop_value(prop, prop_val):
     # Check property value to make sure it fits syntax
 
@@ -26,7 +26,6 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
-import time
 
 # Internal module imports
 from . import networks
@@ -39,7 +38,8 @@ from . import style_dependencies
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
-from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS
+from .py4cytoscape_client import get_client
+from .py4cytoscape_tuning import wait_until_ready
 from .style_visual_props import *
 
 
@@ -228,8 +228,11 @@ def update_style_mapping(style_name, mapping, base_url=DEFAULT_BASE_URL):
     else:
         res = commands.cyrest_post(f'styles/{style_name}/mappings', body=[mapping], base_url=base_url,
                                    require_json=False)
-    time.sleep(
-        MODEL_PROPAGATION_SECS)  # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [Cytoscape BUG]
+    # wait for attributes to be applied ... it looks like Cytoscape returns before this is complete [Cytoscape BUG]
+    tuning = get_client(base_url).tuning
+    wait_until_ready(lambda: _is_same_mapping(
+        commands.cyrest_get(f'styles/{style_name}/mappings/{visual_prop_name}', base_url=base_url), mapping),
+        tuning.MODEL_PROPAGATION_SECS, tuning=tuning)
     return res
 
 
@@ -2044,3 +2047,28 @@ def _update_visual_property(visual_prop_name, table_column, table_column_values=
 
 
 
+
+# Check whether a mapping read back from Cytoscape matches the mapping written, including its discrete map or
+# continuous points (so an update to an existing mapping isn't mistaken for having taken effect already)
+def _is_same_mapping(mapping, expected):
+    if not (mapping['visualProperty'] == expected['visualProperty'] and
+            mapping['mappingType'] == expected['mappingType'] and
+            mapping['mappingColumn'] == expected['mappingColumn']):
+        return False
+    if 'map' in expected:
+        return _mapping_entries(mapping.get('map', []), ['key', 'value']) == \
+               _mapping_entries(expected['map'], ['key', 'value'])
+    if 'points' in expected:
+        return _mapping_entries(mapping.get('points', []), ['value', 'lesser', 'equal', 'greater']) == \
+               _mapping_entries(expected['points'], ['value', 'lesser', 'equal', 'greater'])
+    return True
+
+# Make mapping entries comparable, whatever form Cytoscape returns their values in (e.g., '1' or 1.0 for 1, or
+# 'ELLIPSE' for 'ellipse')
+def _mapping_entries(entries, fields):
+    def comparable(value):
+        try:
+            return (0, float(value), '')
+        except (TypeError, ValueError):
+            return (1, 0.0, str(value).lower())
+    return sorted(tuple(comparable(entry.get(field)) for field in fields) for entry in entries)
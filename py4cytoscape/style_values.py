@@ -24,7 +24,6 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
-import pandas as df
 
 # Internal module imports
 from . import networks
@@ -84,25 +83,11 @@ def get_node_property(node_names=None, visual_property=None, network=None, base_
         To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
         'node1, node\\\\,2' identifies 'node1' and 'node,2'.
     """
-    net_suid = networks.get_network_suid(network, base_url=base_url)
-    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
-
     visual_property = normalize_prop_name(visual_property)
 
-    if node_names is None:
-        res = commands.cyrest_get('networks/' + str(net_suid) + '/views/' + str(view_suid) + '/nodes',
-                                  {'visualProperty': visual_property}, base_url=base_url)
-        node_suids = [node['SUID'] for node in res]
-        node_names = node_suid_to_node_name(node_suids, network=network, base_url=base_url)
-        node_props = {name: node['view'][0]['value'] for node, name in zip(res, node_names)}
-        return node_props
-    else:
-        node_names = normalize_list(node_names)
-        node_suids = node_name_to_node_suid(node_names, network=network, base_url=base_url, unique_list=True)
-        node_props = {node_name: commands.cyrest_get(
-            f'networks/{net_suid}/views/{view_suid}/nodes/{node_suid}/{visual_property}', base_url=base_url)['value']
-                      for node_suid, node_name in zip(node_suids, node_names)}
-        return node_props
+    node_names, prop_values = _get_view_property_values('node', node_names, [visual_property], network, base_url)
+    node_props = dict(zip(node_names, prop_values[visual_property]))
+    return node_props
 
 
 @cy_log
@@ -151,25 +136,111 @@ def get_edge_property(edge_names=None, visual_property=None, network=None, base_
         To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
         'node1 (pd) node\\\\,2' identifies 'node1 (pd) node,2'.
     """
-    net_suid = networks.get_network_suid(network, base_url=base_url)
-    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
-
     visual_property = normalize_prop_name(visual_property)
 
-    if edge_names is None:
-        res = commands.cyrest_get(f'networks/{net_suid}/views/{view_suid}/edges',
-                                  {'visualProperty': visual_property}, base_url=base_url)
-        edge_suids = [edge['SUID'] for edge in res]
-        edge_names = edge_suid_to_edge_name(edge_suids, network=network, base_url=base_url)
-        edge_props = {name: edge['view'][0]['value'] for edge, name in zip(res, edge_names)}
-        return edge_props
-    else:
-        edge_names = normalize_list(edge_names)
-        edge_suids = edge_name_to_edge_suid(edge_names, network=network, base_url=base_url, unique_list=True)
-        edge_props = {edge_name: commands.cyrest_get(
-            f'networks/{net_suid}/views/{view_suid}/edges/{edge_suid}/{visual_property}', base_url=base_url)['value']
-                      for edge_suid, edge_name in zip(edge_suids, edge_names)}
-        return edge_props
+    edge_names, prop_values = _get_view_property_values('edge', edge_names, [visual_property], network, base_url)
+    edge_props = dict(zip(edge_names, prop_values[visual_property]))
+    return edge_props
+
+
+@cy_log
+def get_node_properties(node_names=None, visual_properties=None, network=None, base_url=DEFAULT_BASE_URL):
+    """Get values for several node properties of the specified nodes.
+
+    Each property is fetched for all nodes in a single call, no matter how many nodes are requested.
+
+    Args:
+        nodes_names (str or list or int or None): List of nodes or None. If node list:
+            ``list`` of node names or SUIDs, comma-separated string of node names or SUIDs, or scalar node name
+            or SUID. Node names should be found in the ``name`` column of the ``node table``. If list is None,
+            default is all nodes.
+        visual_properties (str or list): Names of visual properties as list object or comma-separated list. See
+            ``get_visual_property_names``
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dataframe: with index as node_names values and a column for each visual property
+
+    Raises:
+        CyError: if network name, node name or property name doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_node_properties(visual_properties=['NODE_X_LOCATION', 'NODE_Y_LOCATION', 'NODE_SIZE'])
+                 NODE_X_LOCATION  NODE_Y_LOCATION  NODE_SIZE
+        YIL052C  2628.866343678256  1180.9601936051579  50.0
+        YDL215C  1723.7108261001308  2230.935871095392  50.0
+        ...
+        >>> get_node_properties(['YIL070C', 'YHR198C'], 'NODE_LABEL, NODE_FILL_COLOR')
+                 NODE_LABEL NODE_FILL_COLOR
+        YIL070C       MAM33         #89D0F5
+        YHR198C     YHR198C         #89D0F5
+        >>> get_node_properties([391173, 391172], ['NODE_LABEL'], network='galFiltered.sif')
+                NODE_LABEL
+        391173      RPL11B
+        391172        SXM1
+
+    Note:
+        To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
+        'node1, node\\\\,2' identifies 'node1' and 'node,2'.
+    """
+    visual_properties = [normalize_prop_name(prop) for prop in normalize_list(visual_properties) or [None]]
+
+    node_names, prop_values = _get_view_property_values('node', node_names, visual_properties, network, base_url)
+    import pandas as df  # Imported here so that importing py4cytoscape stays fast
+    return df.DataFrame(index=node_names, data=prop_values, columns=visual_properties)
+
+
+@cy_log
+def get_edge_properties(edge_names=None, visual_properties=None, network=None, base_url=DEFAULT_BASE_URL):
+    """Get values for several edge properties of the specified edges.
+
+    Each property is fetched for all edges in a single call, no matter how many edges are requested.
+
+    Args:
+        edge_names (str or list or int or None): List of edges or None. If node list:
+            ``list`` of edge names or SUIDs, comma-separated string of edge names or SUIDs, or scalar edge name
+            or SUID. Edge names should be found in the ``name`` column of the ``edge table``. If list is None,
+            default is all edges.
+        visual_properties (str or list): Names of visual properties as list object or comma-separated list. See
+            ``get_visual_property_names``
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dataframe: with index as edge_names values and a column for each visual property
+
+    Raises:
+        CyError: if network name, edge name or property name doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_edge_properties(visual_properties=['EDGE_LABEL', 'EDGE_WIDTH'])
+                              EDGE_LABEL  EDGE_WIDTH
+        YJR022W (pp) YNL050C          pp         2.0
+        YKR026C (pp) YGL122C          pp         2.0
+        ...
+        >>> get_edge_properties([393222, 393223], 'EDGE_LABEL, EDGE_PAINT', network='galFiltered.sif')
+               EDGE_LABEL EDGE_PAINT
+        393222         pd    #808080
+        393223         pp    #808080
+
+    Note:
+        To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
+        'node1 (pd) node\\\\,2' identifies 'node1 (pd) node,2'.
+    """
+    visual_properties = [normalize_prop_name(prop) for prop in normalize_list(visual_properties) or [None]]
+
+    edge_names, prop_values = _get_view_property_values('edge', edge_names, visual_properties, network, base_url)
+    import pandas as df
+    return df.DataFrame(index=edge_names, data=prop_values, columns=visual_properties)
 
 
 @cy_log
@@ -447,21 +518,8 @@ def get_node_position(node_names=None, network=None, base_url=DEFAULT_BASE_URL):
         To identify a node whose name contains a comma, use '\\\\' to escape the comma. For example,
         'node1, node\\\\,2' identifies 'node1' and 'node,2'.
     """
-    x_location = get_node_property(node_names, "NODE_X_LOCATION", network=network, base_url=base_url)
-    x_values = [x_location[node_name] for node_name in x_location]
-    x_names = [node_name for node_name in x_location]
-
-    y_location = get_node_property(node_names, "NODE_Y_LOCATION", network=network, base_url=base_url)
-    y_values = [y_location[node_name] for node_name in y_location]
-    y_names = [node_name for node_name in y_location]
-
-    # Verify that both property calls return locations for the same set of nodes ... necessary because
-    # two calls are not atomic. (This stands virtually no chance of failing, but non-atomic call must be checked.)
-    name_skew = [[x_name, y_name] for x_name, y_name in zip(x_names, y_names) if x_name != y_name]
-    if name_skew != []:
-        raise CyError(f'Inconsistent node sets returned: "{name_skew}"')
-
-    data = df.DataFrame(index=y_names, data={'x': x_values, 'y': y_values})
+    data = get_node_properties(node_names, ['NODE_X_LOCATION', 'NODE_Y_LOCATION'], network=network, base_url=base_url)
+    data.columns = ['x', 'y']
     # TODO: Verify that this is what R returns, too
 
     return data
@@ -717,3 +775,38 @@ def get_network_zoom(network=None, base_url=DEFAULT_BASE_URL):
     """
     res = get_network_property('NETWORK_SCALE_FACTOR', network=network, base_url=base_url)
     return res
+
+
+# ==============================================================================
+# III. Internal functions
+# ------------------------------------------------------------------------------
+
+def _get_view_property_values(table, names, visual_properties, network, base_url):
+    # Fetch each visual property for all nodes or edges in one call, then pick out values for the requested ones.
+    # Returns the node or edge names (or SUIDs, if that's how they were requested) and {property: [value per name]}
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    view_suid = network_views.get_network_views(net_suid, base_url=base_url)[0]
+
+    if names is not None:  # check names before fetching anything
+        names = normalize_list(names)
+        suids = node_name_to_node_suid(names, network=net_suid, base_url=base_url, unique_list=True) if table == 'node' \
+            else edge_name_to_edge_suid(names, network=net_suid, base_url=base_url, unique_list=True)
+
+    values_by_suid = {}
+    for visual_property in visual_properties:
+        res = commands.cyrest_get(f'networks/{net_suid}/views/{view_suid}/{table}s',
+                                  {'visualProperty': visual_property}, base_url=base_url)
+        values_by_suid[visual_property] = {item['SUID']: item['view'][0]['value'] for item in res}
+
+    if names is None:
+        suids = [item['SUID'] for item in res]
+        names = node_suid_to_node_name(suids, network=net_suid, base_url=base_url) if table == 'node' \
+            else edge_suid_to_edge_name(suids, network=net_suid, base_url=base_url)
+
+    try:
+        prop_values = {visual_property: [values_by_suid[visual_property][suid] for suid in suids]
+                       for visual_property in visual_properties}
+    except KeyError as e:
+        # Each property is fetched separately, so make sure the node/edge set didn't change in between
+        raise CyError(f'Inconsistent {table} sets returned: {table} {e} missing')
+    return names, prop_values
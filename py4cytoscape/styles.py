@@ -37,6 +37,7 @@ from . import network_views
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
+from .py4cytoscape_metadata import cached_metadata
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
 # ==============================================================================
@@ -307,7 +308,7 @@ def import_visual_styles(filename="styles.xml", base_url=DEFAULT_BASE_URL):
     See Also:
         :meth:`export_visual_styles`
     """
-    res = commands.commands_post(f'vizmap load file file="{get_abs_sandbox_path(filename)}"', base_url=base_url)
+    res = commands.commands_post(f'vizmap load file file="{get_abs_sandbox_path(filename, base_url=base_url)}"', base_url=base_url)
     return res
 
 @cy_log
@@ -390,8 +391,8 @@ def get_arrow_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_arrow_shapes()
         ['OPEN_CIRCLE', 'SQUARE', 'CIRCLE', 'DELTA_SHORT_2', 'DELTA', 'DIAMOND_SHORT_2', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', base_url=base_url)
-    return res['values']
+    return cached_metadata('arrow_shapes', lambda: commands.cyrest_get(
+        'styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', base_url=base_url)['values'], base_url=base_url)
 
 
 @cy_log
@@ -416,8 +417,8 @@ def get_line_styles(base_url=DEFAULT_BASE_URL):
         >>> get_line_styles()
         ['MARQUEE_DASH_DOT', 'SOLID', 'BACKWARD_SLASH', 'EQUAL_DASH', 'CONTIGUOUS_ARROW', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_LINE_TYPE/values', base_url=base_url)
-    return res['values']
+    return cached_metadata('line_styles', lambda: commands.cyrest_get(
+        'styles/visualproperties/EDGE_LINE_TYPE/values', base_url=base_url)['values'], base_url=base_url)
 
 @cy_log
 def get_node_shapes(base_url=DEFAULT_BASE_URL):
@@ -441,8 +442,8 @@ def get_node_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_node_shapes()
         ['ROUND_RECTANGLE', 'VEE', 'TRIANGLE', 'HEXAGON', 'PARALLELOGRAM', 'ELLIPSE', 'OCTAGON', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/NODE_SHAPE/values', base_url=base_url)
-    return res['values']
+    return cached_metadata('node_shapes', lambda: commands.cyrest_get(
+        'styles/visualproperties/NODE_SHAPE/values', base_url=base_url)['values'], base_url=base_url)
 
 
 @cy_log
@@ -464,9 +465,11 @@ def get_visual_property_names(base_url=DEFAULT_BASE_URL):
         >>> get_visual_property_names()
         ['COMPOUND_NODE_PADDING', 'COMPOUND_NODE_SHAPE', 'DING_RENDERING_ENGINE_ROOT', 'EDGE', ...]
     """
-    res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
-    visual_properties = [prop['visualProperty']     for prop in res['defaults']]
-    return visual_properties
+    def fetch_visual_property_names():
+        res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
+        return [prop['visualProperty'] for prop in res['defaults']]
+
+    return cached_metadata('visual_property_names', fetch_visual_property_names, base_url=base_url)
 
 
 @cy_log
@@ -22,8 +22,11 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # External library imports
-import pandas as pd
-import numpy as np
+import json
+import time
+import collections
+from json.encoder import encode_basestring_ascii
+from concurrent.futures import ThreadPoolExecutor
 
 # Internal module imports
 from . import commands
@@ -31,7 +34,9 @@ from . import networks
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
-from .py4cytoscape_logger import cy_log, narrate
+from .py4cytoscape_logger import cy_log, narrate, detail_logger
+from .py4cytoscape_notebook import check_execution_environment, ExecutionEnvironment
+from .py4cytoscape_client import get_client, NAME_INDEX_CACHE
 from .exceptions import CyError
 from .py4cytoscape_sandbox import get_abs_sandbox_path
 
@@ -76,11 +81,12 @@ def delete_table_column(column, table='node', namespace='default', network=None,
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete(f'networks/{net_suid}/tables/{namespace}{table}/columns/{column}',
                                  base_url=base_url, require_json=False)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
 @cy_log
-def get_table_columns(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL):
+def get_table_columns(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL, bulk=False):
     """Retrieve one or more columns of data from node, edge or network tables.
 
     The 'SUID' column is always retrieved along with specified columns. The 'SUID' values are used as ``index`` in
@@ -96,6 +102,9 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        bulk (bool): True to fetch all requested columns in a single call instead of one call per column. This is
+            faster when calls are expensive (e.g., remote Cytoscape or Jupyter-Bridge) or the table has many columns
+            but not many rows. For large tables on a local Cytoscape, the default (False) transfers less data.
 
     Returns:
         dataframe: requested columns (including SUID), and rows for each node/edge or network.
@@ -126,10 +135,17 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
         4608       0                     1
         4609    2092                     2
         ...
+        >>> get_table_columns(bulk=True)
+              SUID shared name     name  ...   gal4RGsig   gal80Rsig isExcludedFromPaths
+        3072  3072     YDL081C  YDL081C  ...    0.048133  5.9631e-06               False
+        3073  3073     YGL166W  YGL166W  ...   0.0012181    0.032147               False
+        ...
 
     Note:
         For requested columns not present in the table, the column is not returned, but a warning is shown.
     """
+    import pandas as pd  # Imported here so that importing py4cytoscape stays fast
+
     suid = networks.get_network_suid(network, base_url)
 
     # column information (names and types)
@@ -144,47 +160,49 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
     else:
         col_list = columns
 
-    # get suid column first and make a dataframe with SUID as index
-    res_names = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/SUID', base_url=base_url)
-    suid_list = res_names['values']
-    df = pd.DataFrame(index=suid_list)
-
-    # then fill in each requested column
+    # keep requested columns up to the first one that doesn't exist
+    fetch_list = []
     for col in col_list:
         if not col in table_col_list:
             narrate(f'Column "{col}" not found in "{table}" table')
             # TODO: Is this really the behavior we want?
             break
-
-        # fetch all values for the column
-        res_col = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/{col}', base_url=base_url)
-
-        # the R version of this function replaces missing values with the constant NA, which
-        # doesn't exist in Python. Pandas authority discusses this situation, but doesn't
-        # make a clear recommendation, so we'll leave None as None for non-numerics and nan for
-        # numerics.
-        # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
-        table_col_type = table_col_info[col]
-        if table_col_type in ['Double']:
-            def f(x):
-                return np.nan if x is None else float(x)
-        elif table_col_type in ['Long', 'Integer']:
-            def f(x):
-                return np.nan if x is None else int(x)
-        elif table_col_type in ['Boolean']:
-            def f(x):
-                return None if x is None else bool(x)
-        else:
-            def f(x):
-                return x
-        cvv = [f(x) for x in res_col['values']]
-
-        if len(suid_list) != len(cvv):
-            narrate('Column "%s" has only %d elements, but should have %d' % (col, len(cvv), len(suid_list)))
-            break  # TODO: Is this the right response?
-
-        # Assign entire column, assuming values are ordered consistently by Cytoscape
-        df[col] = cvv
+        fetch_list.append(col)
+
+    if bulk:
+        # fetch all rows in a single call, and make a dataframe with SUID as index
+        res_rows = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/rows', base_url=base_url)
+        df = pd.DataFrame(res_rows, columns=list(dict.fromkeys(['SUID'] + fetch_list)))
+        df.index = pd.Index(df['SUID'].to_numpy())
+        df = df[fetch_list]
+    else:
+        # get suid column first and make a dataframe with SUID as index
+        res_names = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/SUID', base_url=base_url)
+        suid_list = res_names['values']
+        df = pd.DataFrame(index=suid_list)
+
+        # then fill in each requested column
+        col_values = {}
+        for col in fetch_list:
+            # fetch all values for the column
+            res_col = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/{col}', base_url=base_url)
+            cvv = res_col['values']
+
+            if len(suid_list) != len(cvv):
+                narrate('Column "%s" has only %d elements, but should have %d' % (col, len(cvv), len(suid_list)))
+                break  # TODO: Is this the right response?
+
+            # Assign entire column, assuming values are ordered consistently by Cytoscape
+            col_values[col] = pd.Series(cvv, index=df.index)
+        df = pd.DataFrame(col_values, index=df.index)
+
+    # the R version of this function replaces missing values with the constant NA, which
+    # doesn't exist in Python. Pandas authority discusses this situation, but doesn't
+    # make a clear recommendation, so we'll leave None as None for non-numerics and nan for
+    # numerics.
+    # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
+    for col in df.columns:
+        df[col] = _coerce_column(df[col], table_col_info[col])
 
     return df
 
@@ -381,7 +399,7 @@ def load_table_data_from_file(file, first_row_as_column_names=False, start_load_
         >>> load_table_data_from_file('data/defaultnode_table.txt', first_row_as_column_names=True, data_key_column_index=2, table_key_column='COMMON')
         {'mappedTables': [460222, 460260]}
     """
-    file = get_abs_sandbox_path(file)
+    file = get_abs_sandbox_path(file, base_url=base_url)
 
     table = table.lower()
     if table == 'node':
@@ -396,11 +414,12 @@ def load_table_data_from_file(file, first_row_as_column_names=False, start_load_
     res = commands.commands_post(
         f'table import file file="{file}" firstRowAsColumnNames="{first_row_as_column_names}" startLoadRow="{start_load_row}" delimiters="{delimiters}" keyColumnIndex="{data_key_column_index}" dataTypeTargetForNetworkCollection="{table}" keyColumnForMapping="{table_key_column}"',
         base_url=base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 @cy_log
 def load_table_data(data, data_key_column='row.names', table='node', table_key_column='name', namespace='default',
-                    network=None, base_url=DEFAULT_BASE_URL):
+                    network=None, progress=None, base_url=DEFAULT_BASE_URL):
     """Loads data into Cytoscape tables keyed by row.
 
     This function loads data into Cytoscape node/edge/network
@@ -412,6 +431,11 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
     stored as Lists by CyREST v3.9+. Existing columns with the same names will
     keep original type but values will be overwritten.
 
+    Large tables are uploaded in chunks of ``TABLE_LOAD_CHUNK_ROWS`` rows, with up to ``TABLE_LOAD_WORKERS`` chunks
+    uploading at a time while the next one is encoded, and no more than about ``TABLE_LOAD_MAX_BYTES`` of encoded
+    chunks held at once (see ``set_table_load_chunking()``). New columns are all created before the first chunk is
+    uploaded, with types that fit all of their values. If a chunk fails to load, the chunks before it stay loaded.
+
     Args:
         data (dataframe): each row is a node and columns contain node attributes
         data_key_column (str): name of data.frame column to use as key; ' default is "row.names"
@@ -420,6 +444,8 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         namespace (str): Namespace of table. Default is "default".
         network (SUID or str or None): Name or SUID of a network. Default is the
             "current" network active in Cytoscape.
+        progress (func): called as ``progress(rows_loaded, row_count)`` after each chunk is loaded; default is
+            no progress reporting
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
@@ -439,6 +465,11 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         >>> data = df.DataFrame(data={'id':['YDL194W','YDR277C','YBR043C'], 'newcol':[1,2,3]})
         >>> load_table_data(data, data_key_column='id', table='node', table_key_column='name', network='galfiltered.sif')
         'Success: Data loaded in defaultnode table'
+        >>> load_table_data(big_data, data_key_column='id', progress=lambda loaded, total: print(f'{loaded} of {total}'))
+        100000 of 250000
+        200000 of 250000
+        250000 of 250000
+        'Success: Data loaded in defaultnode table'
     """
     if type(table_key_column) is not str:
         raise CyError('table_key_column must be the name of a single column.')
@@ -462,6 +493,7 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
     # Note: we rely on isin() to do the proper type comparison for the data values involved
     data_subset = data[data[data_key_column].isin(table_key_column_values[table_key_column])]
     if data_subset.empty:
+        import pandas as pd
         from .py4cytoscape_logger import detail_logger
         detail_logger.debug(f'Pandas: {pd.__version__}')
         detail_logger.debug(f'Python: {sys.version}')
@@ -477,33 +509,26 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         detail_logger.debug(f'data_subset: {data_subset}')
         raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches')
 
-    # look for elements that are lists (instead of scalars) and turn them into comma-separated strings.
-    # Note that CyREST doesn't accept lists or create columns of type list, but comma-separated strings is
-    # the best we can do for the user at this time.
-    for col in data_subset.columns:
-        col_val = [','.join(val) if isinstance(val, list) else val for val in data_subset[col]]
-        data_subset[col] = col_val
-
     # TODO: Find out whether "factors" are an issue in Python, and why factors could be troublesome in R
     # TODO: Verify that this gives the right answer for list of str, int, etc
 
-    data_list = _df_to_attr_dict_list(data_subset)  # convert DataFrame to dicts that are easy to convert to JSON
-
     tbl = namespace + table  # calculate fully qualified table name
 
-    # if there are any columns that aren't in the Cytoscape table and they're going to be Int, add them explicitly now so
-    # they don't default to float
-    def create_col(x):
-        return commands.cyrest_post(f'networks/{net_suid}/tables/{tbl}/columns',
-                                    body={'name': x, 'type': 'Integer'}, require_json=False, base_url=base_url)
-
+    # create all columns that aren't in the Cytoscape table yet in one call, typed by all of their values, before any
+    # chunk is loaded. Otherwise, each chunk's upload would create them, typed by that chunk's values alone (e.g.,
+    # String if they're all missing), and concurrent uploads would race to create the same columns.
     existing_cols = get_table_column_names(table, namespace, net_suid, base_url=base_url)
-    [create_col(x[0]) if x[1] == 'int64' and not x[0] in existing_cols else None     for x in data_subset.dtypes.items()]
-
-    # finally, add the values for whatever columns we have (and create new columns as needed)
-    res = commands.cyrest_put(f'networks/{net_suid}/tables/{tbl}',
-                              body={'key': table_key_column, 'dataKey': data_key_column, 'data': data_list},
-                              require_json=False, base_url=base_url)
+    new_cols = [{'name': col, 'type': _new_column_type(data_subset[col])} for col in data_subset.columns
+                if col not in existing_cols and col != 'SUID']
+    if new_cols:
+        commands.cyrest_post(f'networks/{net_suid}/tables/{tbl}/columns', body=new_cols, require_json=False,
+                             base_url=base_url)
+
+    # finally, add the values for whatever columns we have (and create new columns as needed), encoding the DataFrame
+    # as JSON column by column (instead of as a dict per row), with lists as comma-separated strings
+    _put_table_data(f'networks/{net_suid}/tables/{tbl}', table_key_column, data_key_column, data_subset, progress,
+                    base_url)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
 
     return f'Success: Data loaded in {tbl} table'
     # TODO: This is a difficult result to test for ... are we able to change it?
@@ -609,28 +634,155 @@ def rename_table_column(column, new_name, table='node', namespace='default', net
     res = commands.cyrest_put(f'networks/{net_suid}/tables/{namespace}{table}/columns',
                               body={'oldName': column, 'newName': new_name},
                               base_url=base_url, require_json=False)
+    get_client(base_url).invalidate_caches(NAME_INDEX_CACHE)
     return res
 
 
-# TODO: Check to see if this is needed in RCy3
-def _nan_to_none(original_df, attr_dict_list):
-    # convert missing numbers from 'nan' to None, which will cause the JSON converter to properly emit null
-    # First, determine whether any floating point values are missing
-    if original_df.isnull().any().any():
-        # yes ... find out which rows contain null values
-        data_subset_nans = original_df.isnull()  # map out missing floating point in all cells
-        data_subset_nans_indexes = [True in set(data_subset_nans.loc[i, :]) for i in
-                                    data_subset_nans.index]  # find rows containing missing floating point
-        for has_missing, row_contents in zip(data_subset_nans_indexes, attr_dict_list):
-            # for each row in data_list, if it has missing values, find them and replace them with 'None'
-            # Note that this could not have been done with data_subset because it's a DataFrame, which only outputs 'nan'
-            if has_missing:
-                for key, value in row_contents.items():
-                    if type(value) is float and np.isnan(value): row_contents[key] = None
-    return attr_dict_list
-
-
-def _df_to_attr_dict_list(df):
-    # convert whole data table to dictionary suitable for JSON encoding
-    data_list = df.to_dict(orient='records')
-    return _nan_to_none(df, data_list)
+_JSON_ENCODE_ROWS = 10000  # Rows encoded at a time, which bounds the number of temporary strings
+
+
+def _df_to_json_records(df, prefix=b'', suffix=b''):
+    # Encode a DataFrame as the JSON for a list of row dicts, the same as json.dumps(df.to_dict(orient='records'))
+    # would, except that missing values become null and list values become comma-separated strings. Columns are
+    # encoded whole (from their NumPy buffers where possible) and then interleaved into rows, so no dict or number
+    # object is created per cell. The result is copied only once, even if it's wrapped in a prefix and suffix.
+    parts = [prefix + b'[']
+    for chunk in _iter_json_records(df):
+        if len(parts) > 1: parts.append(b',')
+        parts.append(chunk)
+    parts.append(b']' + suffix)
+    return b''.join(parts)
+
+
+def _iter_json_records(df, chunk_rows=_JSON_ENCODE_ROWS):
+    # Yield the JSON for successive chunks of rows, each a comma-separated list of row dicts
+    keys = [json.dumps(str(col)) for col in df.columns]
+    row_format = '{' + ','.join(key.replace('%', '%%') + ':%s' for key in keys) + '}'
+    for start in range(0, len(df.index), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        col_json = [_column_to_json(chunk.iloc[:, i], df.columns[i]) for i in range(len(keys))]
+        yield ','.join([row_format % row for row in zip(*col_json)]).encode('ascii')
+
+
+def _put_table_data(operation, table_key_column, data_key_column, data, progress, base_url):
+    # Upload table data in chunks, encoding each chunk while earlier ones are uploading. Chunks are independent (each
+    # row is matched by its own key), so they can be loaded in any order. Jupyter-Bridge relays one request at a
+    # time, so don't upload concurrently through it.
+    client = get_client(base_url)
+    row_count = len(data.index)
+    chunk_rows = client.tuning.TABLE_LOAD_CHUNK_ROWS or row_count or 1
+    if check_execution_environment(base_url) == ExecutionEnvironment.REMOTE_JUPYTER_BRIDGE:
+        workers = 1
+    else:
+        workers = max(1, client.tuning.TABLE_LOAD_WORKERS)
+    max_bytes = client.tuning.TABLE_LOAD_MAX_BYTES
+
+    uploads = collections.deque()  # (future, rows, bytes) for each chunk not yet known to be loaded
+    loaded = {'rows': 0, 'bytes': 0}
+
+    def put_chunk(body):
+        return commands.cyrest_put(operation, body=body, require_json=False, base_url=base_url)
+
+    def finish_oldest_upload():
+        future, rows, size = uploads.popleft()
+        future.result()  # Raises the upload's error, if any
+        loaded['rows'] += rows
+        loaded['bytes'] -= size
+        detail_logger.debug(f'Loaded {loaded["rows"]} of {row_count} rows into {operation}')
+        if progress: progress(loaded['rows'], row_count)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='py4cytoscape-table-load') as executor:
+        for start in range(0, max(row_count, 1), chunk_rows):
+            chunk = data.iloc[start:start + chunk_rows]
+            start_time = time.perf_counter()
+            body = _table_data_body(table_key_column, data_key_column, chunk)
+            detail_logger.debug(f'Encoded {len(chunk.index)} rows as {len(body)} bytes in '
+                                f'{time.perf_counter() - start_time:.3f} secs')
+
+            # Wait for a free worker, and for enough earlier chunks to finish that this one fits under max_bytes
+            while uploads and (len(uploads) >= workers or loaded['bytes'] + len(body) > max_bytes):
+                finish_oldest_upload()
+            uploads.append((executor.submit(put_chunk, body), len(chunk.index), len(body)))
+            loaded['bytes'] += len(body)
+            del body
+        while uploads:
+            finish_oldest_upload()
+
+
+def _new_column_type(values):
+    # Choose the Cytoscape type for a new column that fits all of its values ... lists become comma-separated Strings
+    import numpy as np
+    from pandas.api.types import infer_dtype
+    kind = values.dtype.kind if isinstance(values.dtype, np.dtype) else None
+    value_type = infer_dtype(values, skipna=True) if kind is None or kind == 'O' else None
+    if kind == 'b' or value_type == 'boolean':
+        return 'Boolean'
+    elif kind in ['i', 'u'] or value_type == 'integer':
+        present = values.dropna()
+        in_range = present.empty or (-2 ** 31 <= present.min() and present.max() < 2 ** 31)
+        return 'Integer' if in_range else 'Long'
+    elif kind == 'f' or value_type in ['floating', 'mixed-integer-float', 'decimal']:
+        return 'Double'
+    return 'String'
+
+
+def _table_data_body(table_key_column, data_key_column, data):
+    # Build the JSON body for a table data PUT
+    return _df_to_json_records(data, prefix=b'{"key":' + json.dumps(table_key_column).encode('ascii') +
+                                            b',"dataKey":' + json.dumps(data_key_column).encode('ascii') + b',"data":',
+                               suffix=b'}')
+
+
+def _column_to_json(values, col_name):
+    # Return the JSON for each value in a column. Numeric and boolean columns are converted straight from their
+    # NumPy buffers, and string columns are escaped without checking each value's type.
+    import numpy as np
+    from pandas.api.types import infer_dtype
+    kind = values.dtype.kind if isinstance(values.dtype, np.dtype) else 'O'  # i.e., nullable types have no buffer
+    if kind == 'f':
+        numbers = values.to_numpy()
+        if np.isinf(numbers).any():
+            raise CyError(f'Column "{col_name}" contains infinite values, which cannot be loaded')
+        missing = np.isnan(numbers)
+        texts = list(map(float.__repr__, numbers.tolist()))
+    elif kind in ['i', 'u']:
+        return list(map(int.__repr__, values.to_numpy().tolist()))
+    elif kind == 'b':
+        return np.where(values.to_numpy(), 'true', 'false').tolist()
+    else:
+        missing = values.isna().to_numpy()
+        present = values.to_numpy(dtype=object, copy=True)
+        present[missing] = ''  # missing values are replaced by null below
+        present = present.tolist()
+        if infer_dtype(values, skipna=True) == 'string':
+            texts = list(map(encode_basestring_ascii, present))
+        else:
+            texts = [_value_to_json(value) for value in present]
+    for row in np.flatnonzero(missing).tolist():
+        texts[row] = 'null'
+    return texts
+
+
+def _value_to_json(value):
+    # Look for elements that are lists (instead of scalars) and turn them into comma-separated strings.
+    # Note that CyREST doesn't accept lists or create columns of type list, but comma-separated strings is
+    # the best we can do for the user at this time.
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    elif isinstance(value, list):
+        return encode_basestring_ascii(','.join(value))
+    elif hasattr(value, 'item'):  # i.e., a NumPy scalar
+        value = value.item()
+    return json.dumps(value, allow_nan=False)
+
+
+def _coerce_column(values, table_col_type):
+    # Convert a column of Cytoscape values to the Python types matching its Cytoscape type
+    if table_col_type in ['Double']:
+        return values.astype('float64')
+    elif table_col_type in ['Long', 'Integer']:
+        return values.astype('float64' if values.isna().any() else 'int64')
+    elif values.dtype == object and values.isna().any():
+        return values.astype(object).where(values.notna(), None)
+    else:
+        return values
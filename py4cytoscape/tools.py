@@ -21,7 +21,6 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 
 # External library imports
 import sys
-import time
 
 # Internal module imports
 from . import commands
@@ -31,7 +30,8 @@ from . import sandbox
 from .exceptions import CyError
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
-from .py4cytoscape_tuning import CATCHUP_NETWORK_MERGE_SECS
+from .py4cytoscape_client import get_client, NETWORK_SUID_CACHE
+from .py4cytoscape_tuning import wait_until_ready
 
 
 @cy_log
@@ -446,9 +446,14 @@ def merge_networks(sources=None,
         cmd_string += f' networkMergeMap="{",".join(record_list)}"'
 
     res = commands.commands_post(cmd_string, base_url=base_url)
+    get_client(base_url).invalidate_caches(NETWORK_SUID_CACHE)
 
     # Wait for Cytoscape to finish adding __annotations column to Network table
-    time.sleep(CATCHUP_NETWORK_MERGE_SECS)
+    if 'SUID' in res:
+        tuning = get_client(base_url).tuning
+        wait_until_ready(lambda: '__annotations' in [col['name'] for col in commands.cyrest_get(
+            f'networks/{res["SUID"]}/tables/defaultnetwork/columns', base_url=base_url)],
+                         tuning.CATCHUP_NETWORK_MERGE_SECS, tuning=tuning)
 
     return res['SUID'] if 'SUID' in res else res
 
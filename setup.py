@@ -32,7 +32,6 @@ setuptools.setup(
         'colorbrewer',
         'chardet',
         'decorator',
-        'backoff',
         'colour'
     ],
     classifiers=[
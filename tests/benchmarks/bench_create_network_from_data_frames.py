@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark building the CyJS body that create_network_from_data_frames() sends, before and after column-wise
+encoding.
+
+Only the building of the body is measured (no Cytoscape is needed): inferring nodes from the edges, naming the edges
+and encoding the JSON. Each measurement runs in its own process so that its peak RSS can be reported, along with the
+RSS of the process after the edges are made (which the peak includes). The previous implementation needs a lot of
+memory, so by default it's run only up to before_max_edges. Run it from the tests directory:
+
+    python benchmarks/bench_create_network_from_data_frames.py [before_max_edges]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape.networks import _edge_names, _cyjs_network_json
+
+EDGE_COUNTS = [100000, 1000000, 5000000]
+
+
+def _make_edges(edge_count):
+    # Edges among a fifth as many nodes, each with a weight
+    rng = np.random.default_rng(0)
+    names = np.array([f'node {i}' for i in range(max(edge_count // 5, 1))], dtype=object)
+    return pd.DataFrame({'source': names[rng.integers(0, len(names), edge_count)],
+                         'target': names[rng.integers(0, len(names), edge_count)],
+                         'interaction': 'interacts with',
+                         'weight': rng.random(edge_count)})
+
+
+def _build_per_row(edges):
+    # The previous implementation: list every edge end as a node, build a dict per node and edge (naming each edge by
+    # string concatenation), and let requests call json.dumps(). The edge names were built a second time, to find
+    # the edge SUIDs.
+    id_list = []
+    for source, target in zip(edges['source'].values, edges['target'].values):
+        id_list.append(source)
+        id_list.append(target)
+    nodes = pd.DataFrame(data=id_list, columns=['id'])
+    json_nodes = [{'data': {'id': node}} for node in nodes['id']]
+    json_edges = [{'data': {'name': source + ' (' + interaction + ') ' + target, 'source': source,
+                            'target': target, 'interaction': interaction}} for source, target, interaction in
+                  zip(edges['source'], edges['target'], edges['interaction'])]
+    json_network = {'data': [{'name': 'bench'}], 'elements': {'nodes': json_nodes, 'edges': json_edges}}
+    body = json.dumps(json_network).encode('utf-8')
+    edge_names = [source + ' (' + interaction + ') ' + target for source, interaction, target in
+                  zip(edges['source'], edges['interaction'], edges['target'])]
+    return body, len(nodes.index), len(edge_names)
+
+
+def _build_column_wise(edges):
+    # The current implementation, as create_network_from_data_frames() calls it
+    ends = np.column_stack((edges['source'].to_numpy(dtype=object), edges['target'].to_numpy(dtype=object)))
+    nodes = pd.DataFrame({'id': pd.unique(ends.ravel())})
+    edge_names = _edge_names(edges['source'], edges['target'], edges['interaction'])
+    body = _cyjs_network_json('bench', [('id', nodes['id'])],
+                              [('name', edge_names), ('source', edges['source']), ('target', edges['target']),
+                               ('interaction', edges['interaction'])])
+    return body, len(nodes.index), len(edge_names)
+
+
+def _run(method, edge_count):
+    # Build one body in this process, and report its time, size and memory as JSON
+    edges = _make_edges(edge_count)
+    data_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    body, node_count, name_count = {'before': _build_per_row, 'after': _build_column_wise}[method](edges)
+    secs = time.perf_counter() - start
+    print(json.dumps({'secs': secs, 'data_rss_kb': data_rss, 'peak_rss_kb': resource.getrusage(
+        resource.RUSAGE_SELF).ru_maxrss, 'body_bytes': len(body), 'node_count': node_count,
+                      'edges': len(json.loads(body)['elements']['edges']) if edge_count <= 100000 else name_count}))
+
+
+def _measure(label, method, edge_count):
+    # Run one measurement in a fresh process, so that its peak RSS is its own
+    result = subprocess.run([sys.executable, __file__, '--run', method, str(edge_count)], capture_output=True,
+                            text=True)
+    if result.returncode:
+        print(f'  {label:<24} failed: {result.stderr.strip().splitlines()[-1:]}')
+        return None
+    stats = json.loads(result.stdout)
+    print(f'  {label:<24} {stats["secs"]:8.3f} secs   peak RSS {stats["peak_rss_kb"] / 2 ** 10:8.1f} MB '
+          f'(edges {stats["data_rss_kb"] / 2 ** 10:7.1f} MB)   body {stats["body_bytes"] / 2 ** 20:7.1f} MB   '
+          f'{stats["node_count"]} nodes sent')
+    return stats
+
+
+def main(before_max_edges=1000000):
+    for edge_count in EDGE_COUNTS:
+        print(f'{edge_count} edges')
+        _measure('after (column-wise)', 'after', edge_count)
+        if edge_count <= before_max_edges:
+            _measure('before (per-row dicts)', 'before', edge_count)
+        else:
+            print(f'  {"before (per-row dicts)":<24} skipped (more than {before_max_edges} edges)')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        _run(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(*[int(arg) for arg in sys.argv[1:2]])
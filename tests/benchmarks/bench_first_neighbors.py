@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark get_first_neighbors() for many seed nodes, comparing the per-node loop with the bulk fetch.
+
+A FakeCytoscape serves a random network with the requested number of nodes (and 3 times as many edges), and can add
+a fixed delay to each call to stand in for Cytoscape's own per-call overhead or a remote connection. The neighbors of
+every node are fetched. Run it from the tests directory:
+
+    python benchmarks/bench_first_neighbors.py [node_count] [latency_ms]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import py4cytoscape as p4c
+from py4cytoscape import commands
+from py4cytoscape.fake_cytoscape import FakeCytoscape
+
+
+def _get_first_neighbors_per_node(node_names, base_url):
+    # The previous implementation: one name lookup, neighbor fetch and SUID lookup per node, deduping as it goes
+    net_suid = p4c.get_network_suid(base_url=base_url)
+    neighbor_names = []
+    for node_name in node_names:
+        node_suid = p4c.node_name_to_node_suid([node_name], net_suid, base_url=base_url, unique_list=True)[0]
+        first_neighbors_suids = commands.cyrest_get(f'networks/{net_suid}/nodes/{node_suid}/neighbors',
+                                                    base_url=base_url)
+        neighbor_names += p4c.node_suid_to_node_name(first_neighbors_suids, net_suid, base_url=base_url)
+        neighbor_names = list(dict.fromkeys(neighbor_names))
+    return neighbor_names
+
+
+def _time_call(label, func):
+    start = time.perf_counter()
+    res = func()
+    print(f'{label:<28} {time.perf_counter() - start:8.3f} secs')
+    return res
+
+
+def main(node_count=10000, latency_ms=0):
+    rng = random.Random(0)
+    names = [f'node {i}' for i in range(node_count)]
+    edges = [(rng.choice(names), rng.choice(names), 'pp') for i in range(3 * node_count)]
+
+    with FakeCytoscape(latency_secs=latency_ms / 1000) as cy:
+        cy.add_network(names, edges, title='neighbors')
+        print(f'{node_count} seed nodes, {len(edges)} edges in FakeCytoscape at {cy.base_url}, {latency_ms} ms per call')
+        before = _time_call('before (per node)', lambda: _get_first_neighbors_per_node(names, cy.base_url))
+        after = _time_call('after (bulk)', lambda: p4c.get_first_neighbors(names, base_url=cy.base_url))
+        by_node = _time_call('after (as_dict)', lambda: p4c.get_first_neighbors(names, as_dict=True, base_url=cy.base_url))
+        assert before == after and len(by_node) == node_count
+        print('results are identical')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark get_table_columns() on a large table, comparing the per-column fetch with the single-call bulk fetch.
+
+A small HTTP/1.1 server stands in for Cytoscape so the benchmark runs without a live Cytoscape. It serves a node
+table with the requested number of rows and a mix of column types (including missing values), and can add a fixed
+delay to each call to stand in for Cytoscape's own per-call overhead or a remote connection. Run it from the tests
+directory:
+
+    python benchmarks/bench_get_table_columns.py [row_count] [column_count] [latency_ms]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from urllib.parse import unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import py4cytoscape as p4c
+from py4cytoscape import commands
+
+_NETWORK_SUID = 52
+_TYPES = ['Double', 'Integer', 'String', 'Boolean', 'Long']
+
+
+def _make_table(row_count, column_count):
+    # Column name -> (type, values), with every third column missing a value in every tenth row
+    rng = np.random.default_rng(0)
+    suids = list(range(1000, 1000 + row_count))
+    columns = {'SUID': ('Long', suids),
+               'name': ('String', [f'node {suid}' for suid in suids]),
+               'selected': ('Boolean', [False] * row_count)}
+    for i in range(column_count - len(columns)):
+        col_type = _TYPES[i % len(_TYPES)]
+        if col_type == 'Double':
+            values = rng.random(row_count).tolist()
+        elif col_type in ['Integer', 'Long']:
+            values = rng.integers(0, 1000, row_count).tolist()
+        elif col_type == 'Boolean':
+            values = (rng.random(row_count) > 0.5).tolist()
+        else:
+            values = [f'value {x}' for x in rng.integers(0, 1000, row_count)]
+        if i % 3 == 0:
+            values = [None if row % 10 == 0 else value for row, value in enumerate(values)]
+        columns[f'{col_type} {i}'] = (col_type, values)
+    return columns
+
+
+def _make_responses(columns):
+    # Pre-encode every response so that server time doesn't swamp client time
+    table_path = f'/v1/networks/{_NETWORK_SUID}/tables/defaultnode'
+    names = list(columns.keys())
+    row_values = zip(*[values for col_type, values in columns.values()])
+    responses = {'/v1': {'apiVersion': 'v1', 'cytoscapeVersion': '3.10.0'},
+                 '/v1/networks': [_NETWORK_SUID],
+                 f'{table_path}/columns': [{'name': name, 'type': col_type} for name, (col_type, values) in columns.items()],
+                 f'{table_path}/rows': [{name: value for name, value in zip(names, row) if value is not None}
+                                        for row in row_values]}
+    for name, (col_type, values) in columns.items():
+        responses[f'{table_path}/columns/{name}'] = {'name': name, 'values': values}
+    return {path: json.dumps(response).encode('utf-8') for path, response in responses.items()}
+
+
+def _make_handler(responses, latency_secs):
+    class _StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # allow keep-alive
+        disable_nagle_algorithm = True  # headers and body are written separately
+
+        def do_GET(self):
+            self._reply(responses[unquote(self.path).rstrip('/')])
+
+        def do_POST(self):  # i.e., sandbox initialization
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self._reply(b'{"data": {"sandboxPath": "/tmp"}, "errors": []}')
+
+        def _reply(self, body):
+            time.sleep(latency_secs)  # Cytoscape's own per-request overhead, plus network round trip if remote
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return _StandInHandler
+
+
+def _get_table_columns_per_column(table, base_url):
+    # The previous implementation: one call for the SUIDs, then one call per column, converting value by value
+    suid = p4c.get_network_suid(_NETWORK_SUID, base_url=base_url)
+    table_col_info = p4c.get_table_column_types(table, network=_NETWORK_SUID, base_url=base_url)
+    res_names = commands.cyrest_get(f'networks/{suid}/tables/default{table}/columns/SUID', base_url=base_url)
+    df = pd.DataFrame(index=res_names['values'])
+    for col in table_col_info:
+        res_col = commands.cyrest_get(f'networks/{suid}/tables/default{table}/columns/{col}', base_url=base_url)
+        table_col_type = table_col_info[col]
+        if table_col_type in ['Double']:
+            def f(x):
+                return np.nan if x is None else float(x)
+        elif table_col_type in ['Long', 'Integer']:
+            def f(x):
+                return np.nan if x is None else int(x)
+        elif table_col_type in ['Boolean']:
+            def f(x):
+                return None if x is None else bool(x)
+        else:
+            def f(x):
+                return x
+        df[col] = [f(x) for x in res_col['values']]
+    return df
+
+
+def _time_call(label, func):
+    start = time.perf_counter()
+    res = func()
+    print(f'{label:<28} {time.perf_counter() - start:8.3f} secs')
+    return res
+
+
+def main(row_count=100000, column_count=20, latency_ms=0):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(_make_responses(_make_table(row_count, column_count)),
+                                                                   latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}/v1'
+
+    try:
+        print(f'{row_count} rows x {column_count} columns from stand-in server at {base_url}, {latency_ms} ms per call')
+        before = _time_call('before (per-value convert)', lambda: _get_table_columns_per_column('node', base_url))
+        per_column = _time_call('after (bulk=False)',
+                                lambda: p4c.get_table_columns('node', network=_NETWORK_SUID, base_url=base_url))
+        bulk = _time_call('after (bulk=True)',
+                          lambda: p4c.get_table_columns('node', network=_NETWORK_SUID, bulk=True, base_url=base_url))
+        pd.testing.assert_frame_equal(before, per_column)
+        pd.testing.assert_frame_equal(before, bulk)
+        print('results are identical')
+    finally:
+        p4c.reset_http_sessions()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark per-call CyREST latency with and without pooled (keep-alive) connections.
+
+A FakeCytoscape stands in for Cytoscape so the benchmark runs without a live Cytoscape. Run it from the
+tests directory:
+
+    python benchmarks/bench_http_session.py [call_count]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import time
+import statistics
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape.fake_cytoscape import FakeCytoscape
+from py4cytoscape.py4cytoscape_http import pooled_request, reset_http_sessions
+
+
+def _time_calls(requester, url, call_count):
+    latencies = []
+    for i in range(call_count):
+        start = time.perf_counter()
+        r = requester('GET', url)
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label, latencies):
+    latencies_ms = [x * 1000 for x in latencies]
+    print(f'{label:<24} mean {statistics.mean(latencies_ms):7.3f} ms   '
+          f'median {statistics.median(latencies_ms):7.3f} ms   '
+          f'p95 {sorted(latencies_ms)[int(len(latencies_ms) * 0.95)]:7.3f} ms')
+
+
+def main(call_count=1000):
+    with FakeCytoscape() as cy:
+        url = f'{cy.base_url}/version'
+        try:
+            print(f'{call_count} GET calls against stand-in server at {url}')
+            _report('before (requests.request)', _time_calls(requests.request, url, call_count))
+            reset_http_sessions()
+            _report('after (pooled_request)', _time_calls(pooled_request, url, call_count))
+        finally:
+            reset_http_sessions()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
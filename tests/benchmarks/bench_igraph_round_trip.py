@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark the igraph conversions of create_network_from_igraph() and create_igraph_from_network(), before and after
+building them from integer index arrays.
+
+Only the conversions are measured (no Cytoscape is needed): igraph to the node and edge DataFrames sent to Cytoscape,
+and then those DataFrames (as the node and edge tables read back from Cytoscape would be) to igraph. The two graphs are
+checked to be the same. Run it from the tests directory:
+
+    python benchmarks/bench_igraph_round_trip.py [edge_count]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import igraph as ig
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape.networks import _igraph_to_data_frames, _data_frames_to_igraph
+
+
+def _make_graph(edge_count):
+    # A directed multigraph among a fifth as many vertices, with numeric and string attributes
+    rng = np.random.default_rng(0)
+    vertex_count = max(edge_count // 5, 1)
+    g = ig.Graph(n=vertex_count, edges=rng.integers(0, vertex_count, (edge_count, 2)), directed=True)
+    g.vs['name'] = [f'node {i}' for i in range(vertex_count)]
+    g.vs['score'] = rng.integers(0, 1000, vertex_count).tolist()
+    g.es['weight'] = rng.random(edge_count).tolist()
+    g.es['interaction'] = ['pp' if x else 'pd' for x in rng.random(edge_count) > 0.5]
+    return g
+
+
+def _to_data_frames_before(igraph):
+    # The previous implementation: get igraph's edge DataFrame, then look up each edge's source and target names
+    node_df = ig.Graph.get_vertex_dataframe(igraph)
+    node_df['name'] = node_df['name'].astype(str)
+    edge_df = ig.Graph.get_edge_dataframe(igraph)
+    if 'interaction' in edge_df.columns: edge_df['interaction'] = edge_df['interaction'].astype(str)
+    edge_df['source'] = edge_df['source'].apply(lambda x: node_df['name'][x])
+    edge_df['target'] = edge_df['target'].apply(lambda x: node_df['name'][x])
+    return node_df, edge_df
+
+
+def _to_igraph_before(cynodes, cyedges):
+    # The previous implementation: add vertices by name, then add edges by name and attributes as lists of NumPy values
+    g = ig.Graph(directed=True)
+    g.add_vertices(list(cynodes['name']))
+    for col in cynodes.columns:
+        if not col in ['name', 'SUID']: g.vs[col] = list(cynodes[col])
+    g.add_edges([(src, trg) for src, trg in zip(cyedges['source'], cyedges['target'])])
+    for col in cyedges.columns:
+        if not col in ['SUID']: g.es[col] = list(cyedges[col])
+    return g
+
+
+def _as_tables(node_df, edge_df):
+    # Make node and edge tables like the ones get_table_columns() would return for the network
+    cynodes = node_df.copy()
+    cynodes.insert(0, 'SUID', np.arange(len(cynodes.index)) + 100)
+    cyedges = edge_df.reset_index(drop=True)
+    cyedges.insert(0, 'SUID', np.arange(len(cyedges.index)) + 100 + len(cynodes.index))
+    cyedges['name'] = cyedges['source'] + ' (' + cyedges['interaction'] + ') ' + cyedges['target']
+    return cynodes, cyedges
+
+
+def _measure(label, convert, *args):
+    start = time.perf_counter()
+    result = convert(*args)
+    print(f'  {label:<32} {time.perf_counter() - start:8.3f} secs')
+    return result
+
+
+def main(edge_count=1000000):
+    g = _make_graph(edge_count)
+    print(f'{g.vcount()} vertices, {g.ecount()} edges')
+    before = _measure('to DataFrames before (per edge)', _to_data_frames_before, g)
+    after = _measure('to DataFrames after (arrays)', _igraph_to_data_frames, g)
+    for before_df, after_df in zip(before, after):
+        pd.testing.assert_frame_equal(before_df.reset_index(drop=True), after_df.reset_index(drop=True))
+    cynodes, cyedges = _as_tables(*after)
+    before = _measure('to igraph before (by name)', _to_igraph_before, cynodes, cyedges)
+    after = _measure('to igraph after (arrays)', _data_frames_to_igraph, cynodes, cyedges)
+    if before.get_edgelist() != after.get_edgelist() or before.get_edgelist() != g.get_edgelist() or \
+            before.vs['score'] != after.vs['score'] or before.es['weight'] != after.es['weight']:
+        raise Exception('Graphs differ')
+    print('  round trip reproduces the graph')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark import_network_from_local_file(), which streams a large edge file into the sandbox and imports it.
+
+First, the client side of the upload is measured on its own (no Cytoscape is needed): encoding the whole file as
+base64 in memory, as sandbox_send_to() used to, against encoding it a chunk at a time as it's sent. Peak memory is
+measured by tracemalloc, in a second run of each. Then the whole import is timed against FakeCytoscape. Run it from
+the tests directory:
+
+    python benchmarks/bench_import_network_from_local_file.py [edge_count]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape import import_network_from_local_file, sandbox_set, get_edge_count
+from py4cytoscape.fake_cytoscape import FakeCytoscape
+from py4cytoscape.sandbox import _iter_file_content64, _StreamedBody
+
+
+def _write_edges(file, edge_count):
+    # An edge file among a fifth as many nodes, with numeric and string attributes
+    rng = np.random.default_rng(0)
+    node_count = max(edge_count // 5, 1)
+    with open(file, 'w') as f:
+        f.write('source\ttarget\tinteraction\tweight\tevidence\n')
+        for src, trg, weight in zip(rng.integers(0, node_count, edge_count).tolist(),
+                                    rng.integers(0, node_count, edge_count).tolist(),
+                                    rng.random(edge_count).tolist()):
+            f.write(f'node {src}\tnode {trg}\tpp\t{weight}\texperiment {src % 7}\n')
+
+
+def _encode_before(file):
+    # The previous implementation: the whole file as base64 in the command's JSON body
+    with open(file, 'rb') as f:
+        return len(json.dumps({'fileBase64': base64.b64encode(f.read()).decode('utf-8')}))
+
+
+def _encode_after(file):
+    # The current implementation: the body is encoded a chunk at a time as the HTTP connection reads it
+    file_size = os.path.getsize(file)
+    body = _StreamedBody(lambda: _iter_file_content64(file, file_size, hashlib.sha256(), None),
+                         (file_size + 2) // 3 * 4)
+    return sum(len(chunk) for chunk in iter(lambda: body.read(2 ** 16), b''))
+
+
+def _measure(label, encode, file):
+    # Time the encoding on its own, then repeat it under tracemalloc (which slows it down) to find its peak memory
+    start = time.perf_counter()
+    encode(file)
+    secs = time.perf_counter() - start
+    tracemalloc.start()
+    encode(file)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'  {label:<36} {secs:8.3f} secs   peak {peak_bytes / 2 ** 20:9.1f} MB')
+
+
+def main(edge_count=1000000):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = os.path.join(temp_dir, 'edges.tsv')
+        _write_edges(file, edge_count)
+        file_bytes = os.path.getsize(file)
+        print(f'{edge_count} edges in {file_bytes / 2 ** 20:.1f} MB')
+        _measure('upload body before (whole file)', _encode_before, file)
+        _measure('upload body after (streamed)', _encode_after, file)
+
+        with FakeCytoscape() as cy:
+            sandbox_set('benchmark', base_url=cy.base_url)
+            start = time.perf_counter()
+            import_network_from_local_file(file, base_url=cy.base_url)
+            secs = time.perf_counter() - start
+            print(f'  {"import through sandbox":<36} {secs:8.3f} secs   {file_bytes / 2 ** 20 / secs:9.1f} MB/s')
+            if get_edge_count(base_url=cy.base_url) != edge_count:
+                raise Exception('Edge count differs')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark how long ``import py4cytoscape`` takes, and guard against heavy dependencies being loaded by it.
+
+Each import is timed in a fresh interpreter. igraph, networkx, pandas, numpy and colorbrewer should be loaded only
+when a function that uses them is called, so the benchmark fails (exit status 1) if any of them is loaded by the import
+itself, or if the median import time exceeds max_secs (if given). Run it from the tests directory:
+
+    python benchmarks/bench_import_time.py [run_count] [max_secs]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+HEAVY_MODULES = ['igraph', 'networkx', 'pandas', 'numpy', 'colorbrewer']
+
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Runs in a fresh interpreter: optionally import the heavy modules first (i.e., what used to happen), then time
+# importing py4cytoscape, and report which heavy modules ended up loaded
+_TIMED_IMPORT = '''
+import sys, time, json
+start = time.perf_counter()
+for name in sys.argv[1:]: __import__(name)
+import py4cytoscape
+secs = time.perf_counter() - start
+print(json.dumps({'secs': secs, 'loaded': [name for name in %r if name in sys.modules]}))
+''' % HEAVY_MODULES
+
+
+def _time_import(preloads):
+    res = subprocess.run([sys.executable, '-c', _TIMED_IMPORT] + preloads, capture_output=True, text=True,
+                         check=True, env={**os.environ, 'PYTHONPATH': _PACKAGE_DIR})
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def _report(label, results):
+    secs = [result['secs'] * 1000 for result in results]
+    print(f'{label:<24} median {statistics.median(secs):8.1f} ms   min {min(secs):8.1f} ms   max {max(secs):8.1f} ms')
+
+
+def main(run_count=10, max_secs=None):
+    _time_import([])  # Warm the .pyc files and the OS file cache so the first run isn't an outlier
+    print(f'import py4cytoscape, {run_count} runs, each in a fresh interpreter')
+    eager = [_time_import(HEAVY_MODULES) for i in range(run_count)]
+    _report('before (eager imports)', eager)
+    lazy = [_time_import([]) for i in range(run_count)]
+    _report('after (lazy imports)', lazy)
+
+    failures = []
+    loaded = sorted({name for result in lazy for name in result['loaded']})
+    if loaded:
+        failures.append(f'import py4cytoscape loaded {", ".join(loaded)}')
+    median_secs = statistics.median(result['secs'] for result in lazy)
+    if max_secs is not None and median_secs > max_secs:
+        failures.append(f'median import time {median_secs:.3f} secs exceeds {max_secs:.3f} secs')
+    for failure in failures:
+        print(f'REGRESSION: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10, float(sys.argv[2]) if len(sys.argv) > 2 else None))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark encoding a DataFrame as the JSON body of load_table_data(), before and after column-wise encoding.
+
+Only the encoding is measured (no Cytoscape is needed). Peak memory is measured by tracemalloc, which includes NumPy's
+buffers. The previous implementation is slow enough that by default it's run only up to before_max_rows. Run it from
+the tests directory:
+
+    python benchmarks/bench_load_table_data.py [column_count] [before_max_rows]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape.tables import _df_to_json_records
+
+ROW_COUNTS = [10000, 100000, 1000000]
+
+
+def _make_data(row_count, column_count):
+    # A key column, then a mix of float (with missing values), int, bool and string (with missing values and lists)
+    rng = np.random.default_rng(0)
+    data = {'name': [f'node {i}' for i in range(row_count)]}
+    for i in range(column_count - 1):
+        col_type = i % 4
+        if col_type == 0:
+            values = rng.random(row_count)
+            values[::10] = np.nan
+        elif col_type == 1:
+            values = rng.integers(0, 1000, row_count)
+        elif col_type == 2:
+            values = rng.random(row_count) > 0.5
+        else:
+            values = np.array([f'value {x}' for x in rng.integers(0, 1000, row_count)], dtype=object)
+            values[::7] = None
+            values[::11] = [['a', 'b']] * len(values[::11])
+        data[f'col {i}'] = values
+    return pd.DataFrame(data)
+
+
+def _encode_per_row(data):
+    # The previous implementation: join lists cell by cell, build a dict per row, find NaNs row by row, and let
+    # requests call json.dumps()
+    data = data.copy()
+    for col in data.columns:
+        data[col] = [','.join(val) if isinstance(val, list) else val for val in data[col]]
+    data_list = data.to_dict(orient='records')
+    if data.isnull().any().any():
+        data_nans = data.isnull()
+        for has_missing, row_contents in zip([True in set(data_nans.loc[i, :]) for i in data_nans.index], data_list):
+            if has_missing:
+                for key, value in row_contents.items():
+                    if type(value) is float and np.isnan(value): row_contents[key] = None
+    return json.dumps(data_list, allow_nan=False).encode('utf-8')
+
+
+def _measure(label, encode, data):
+    # Time the encoding on its own, then repeat it under tracemalloc (which slows it down) to find its peak memory
+    start = time.perf_counter()
+    encoded = encode(data)
+    secs = time.perf_counter() - start
+    del encoded
+    tracemalloc.start()
+    encoded = encode(data)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'  {label:<24} {secs:8.3f} secs   peak {peak_bytes / 2 ** 20:9.1f} MB   body {len(encoded) / 2 ** 20:8.1f} MB')
+    return encoded
+
+
+def main(column_count=20, before_max_rows=100000):
+    for row_count in ROW_COUNTS:
+        data = _make_data(row_count, column_count)
+        print(f'{row_count} rows x {column_count} columns')
+        after = _measure('after (column-wise)', _df_to_json_records, data)
+        if row_count <= before_max_rows:
+            before = _measure('before (per-row dicts)', _encode_per_row, data)
+            if json.loads(before) != json.loads(after):
+                raise Exception('Encodings differ')
+        else:
+            print(f'  {"before (per-row dicts)":<24} skipped (more than {before_max_rows} rows)')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
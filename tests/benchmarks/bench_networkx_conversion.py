@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+""" Benchmark the NetworkX conversions of create_network_from_networkx() and create_networkx_from_network(), before
+and after converting column-wise.
+
+Only the conversions are measured (no Cytoscape is needed): a NetworkX multigraph to the node and edge DataFrames sent
+to Cytoscape, and then those DataFrames (as the node and edge tables read back from Cytoscape would be) to NetworkX.
+Peak memory is measured by tracemalloc, in a second run of each conversion. Run it from the tests directory:
+
+    python benchmarks/bench_networkx_conversion.py [edge_count]
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from py4cytoscape.networks import _networkx_columns, _data_frames_to_networkx
+
+
+def _make_graph(edge_count):
+    # A multigraph among a fifth as many nodes, with numeric and string attributes
+    rng = np.random.default_rng(0)
+    node_count = max(edge_count // 5, 1)
+    g = nx.MultiDiGraph()
+    g.add_nodes_from((f'node {i}', {'score': int(score)}) for i, score in enumerate(rng.integers(0, 1000, node_count)))
+    g.add_edges_from((f'node {src}', f'node {trg}', {'weight': weight, 'interaction': 'pp'})
+                     for src, trg, weight in zip(rng.integers(0, node_count, edge_count).tolist(),
+                                                 rng.integers(0, node_count, edge_count).tolist(),
+                                                 rng.random(edge_count).tolist()))
+    return g
+
+
+def _to_data_frames_before(netx):
+    # The previous implementation: a merged dict per node and edge, then DataFrame.from_records()
+    node_df = pd.DataFrame.from_records([{**attrs, 'name': name} for name, attrs in netx.nodes(data=True)])
+    edge_df = pd.DataFrame.from_records([{**attrs, 'source': src, 'target': targ}
+                                         for src, targ, attrs in netx.edges(data=True)])
+    return node_df, edge_df
+
+
+def _to_data_frames_after(netx):
+    # The current implementation, as create_network_from_networkx() calls it
+    node_names, node_cols = _networkx_columns(netx.nodes(data=True), netx.number_of_nodes(), 1, None, {'name'})
+    edge_ends, edge_cols = _networkx_columns(netx.edges(data=True), netx.number_of_edges(), 2, None,
+                                             {'source', 'target'})
+    return pd.DataFrame({**node_cols, 'name': node_names[0]}), \
+           pd.DataFrame({**edge_cols, 'source': edge_ends[0], 'target': edge_ends[1]})
+
+
+def _to_networkx_before(cynodes, cyedges):
+    # The previous implementation: all rows as dicts, then a filtered copy of each, then the graph
+    e_bunch = [(row['source'], row['target'], row['SUID'], {k: row[k] for k in row if k not in {'source', 'target'}})
+               for row in cyedges.to_dict(orient='records')]
+    n_bunch = [(row['name'], {k: row[k] for k in row if k not in {'name'}}) for row in cynodes.to_dict(orient='records')]
+    md_graph = nx.MultiDiGraph()
+    md_graph.add_edges_from(e_bunch)
+    md_graph.add_nodes_from(n_bunch)
+    return md_graph
+
+
+def _as_tables(node_df, edge_df):
+    # Make node and edge tables like the ones get_table_columns() would return for the network
+    cynodes = node_df.copy()
+    cynodes.insert(0, 'SUID', np.arange(len(cynodes.index)) + 100)
+    cyedges = edge_df.copy()
+    cyedges.insert(0, 'SUID', np.arange(len(cyedges.index)) + 100 + len(cynodes.index))
+    return cynodes, cyedges
+
+
+def _measure(label, convert, *args):
+    # Time the conversion on its own, then repeat it under tracemalloc (which slows it down) to find its peak memory
+    start = time.perf_counter()
+    result = convert(*args)
+    secs = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = convert(*args)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'  {label:<36} {secs:8.3f} secs   peak {peak_bytes / 2 ** 20:9.1f} MB')
+    return result
+
+
+def main(edge_count=1000000):
+    g = _make_graph(edge_count)
+    print(f'{g.number_of_nodes()} nodes, {g.number_of_edges()} edges')
+    before = _measure('to DataFrames before (dict per row)', _to_data_frames_before, g)
+    after = _measure('to DataFrames after (columns)', _to_data_frames_after, g)
+    for before_df, after_df in zip(before, after):
+        pd.testing.assert_frame_equal(before_df, after_df[before_df.columns])
+    cynodes, cyedges = _as_tables(*after)
+    del before, after
+    before = _measure('to NetworkX before (dict per row)', _to_networkx_before, cynodes, cyedges)
+    after = _measure('to NetworkX after (generators)', _data_frames_to_networkx, cynodes, cyedges)
+    if list(before.edges(keys=True, data=True)) != list(after.edges(keys=True, data=True)) or \
+            list(before.nodes(data=True)) != list(after.nodes(data=True)):
+        raise Exception('Graphs differ')
+    print('  round trip reproduces the graph')
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
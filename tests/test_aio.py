@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in aio.py.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import asyncio
+
+from test_utils import *
+
+
+class AioTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            close_session(False)
+        except:
+            pass
+
+    def tearDown(self):
+        pass
+
+    @print_entry_exit
+    def test_cyrest_calls(self):
+        # Initialization
+        load_test_session()
+        suid = get_network_suid()
+
+        async def fetch(client):
+            return await asyncio.gather(client.cyrest_get('networks'),
+                                        client.cyrest_get(f'networks/{suid}/views'),
+                                        client.cyrest_get('styles'),
+                                        client.cyrest_get('version'))
+
+        async def run_fetch():
+            async with AsyncCyClient(max_concurrency=2) as client:
+                return await fetch(client)
+
+        # Verify that concurrent reads return the same results as blocking reads
+        networks, views, styles, version = asyncio.run(run_fetch())
+        self.assertListEqual(networks, cyrest_get('networks'))
+        self.assertListEqual(views, cyrest_get(f'networks/{suid}/views'))
+        self.assertListEqual(styles, cyrest_get('styles'))
+        self.assertDictEqual(version, cyrest_get('version'))
+
+        # Verify that a POST/PUT/DELETE round trip works
+        async def create_and_delete_view(client):
+            await client.cyrest_delete(f'networks/{suid}/views', require_json=False)
+            res = await client.cyrest_post(f'networks/{suid}/views')
+            return res
+
+        res = asyncio.run(create_and_delete_view(AsyncCyClient()))
+        self.assertIn('networkViewSUID', res)
+        self.assertEqual(len(get_network_views()), 1)
+
+    @print_entry_exit
+    def test_commands_calls(self):
+        async def echo(client):
+            return await asyncio.gather(*[client.commands_post(f'command echo message="{i}"') for i in range(5)])
+
+        res = asyncio.run(echo(AsyncCyClient()))
+        self.assertListEqual(res, [[str(i)] for i in range(5)])
+
+        res = asyncio.run(AsyncCyClient().commands_get('command sleep duration=1'))
+        self.assertListEqual(res, [])
+
+    @print_entry_exit
+    def test_errors(self):
+        # Verify that errors are translated the same way as for blocking calls
+        self.assertRaises(CyError, asyncio.run, AsyncCyClient().cyrest_get('networks/0/tables/defaultnode'))
+        self.assertRaises(CyError, asyncio.run, AsyncCyClient().commands_post('bogus command'))
+        self.assertRaises(requests.exceptions.RequestException, asyncio.run,
+                          AsyncCyClient(base_url='http://totallybogus').cyrest_get('version'))
+
+    @print_entry_exit
+    def test_call(self):
+        # Initialization
+        load_test_session()
+
+        async def read_all(client):
+            return await asyncio.gather(client.call(get_table_columns, 'node', ['name']),
+                                        client.call(get_node_property, visual_property='NODE_SIZE'),
+                                        client.call(get_network_list))
+
+        columns, sizes, network_list = asyncio.run(read_all(AsyncCyClient()))
+        self.assertTrue(columns.equals(get_table_columns('node', ['name'])))
+        self.assertDictEqual(sizes, get_node_property(visual_property='NODE_SIZE'))
+        self.assertListEqual(network_list, get_network_list())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+""" Test FakeCytoscape in fake_cytoscape.py.
+
+Unlike the other test suites, these tests don't need a running Cytoscape.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import time
+import pandas as df
+
+from test_utils import *
+
+
+class FakeCytoscapeTests(unittest.TestCase):
+    def setUp(self):
+        self.cy = FakeCytoscape().start()
+        self.base_url = self.cy.base_url
+        self.net_suid = self.cy.add_network(['A', 'B', 'C'], [('A', 'B', 'pp'), ('B', 'C', 'pd')], title='test',
+                                            node_columns={'score': [1.5, 2.5, 3.5]})
+
+    def tearDown(self):
+        self.cy.stop()
+
+    @print_entry_exit
+    def test_networks(self):
+        # Verify that the network added directly to the model is visible to py4cytoscape
+        self.assertEqual(cytoscape_version_info(base_url=self.base_url)['cytoscapeVersion'], '3.10.0')
+        self.assertListEqual(get_network_list(base_url=self.base_url), ['test'])
+        self.assertEqual(get_network_suid(base_url=self.base_url), self.net_suid)
+        self.assertEqual(get_node_count(base_url=self.base_url), 3)
+        self.assertListEqual(get_all_edges(base_url=self.base_url), ['A (pp) B', 'B (pd) C'])
+        self.assertSetEqual(set(get_first_neighbors('B', base_url=self.base_url)), {'A', 'C'})
+
+        # Verify that a network created through py4cytoscape carries its node and edge attributes
+        nodes = df.DataFrame({'id': ['x', 'y', 'z'], 'val': [1, 2, 3]})
+        edges = df.DataFrame({'source': ['x', 'y'], 'target': ['y', 'z'], 'interaction': ['pp', 'pp'], 'w': [0.5, 0.7]})
+        new_suid = create_network_from_data_frames(nodes, edges, title='from df', base_url=self.base_url)
+        self.assertListEqual(list(get_table_columns(columns='val', network=new_suid, base_url=self.base_url)['val']),
+                             [1, 2, 3])
+        self.assertListEqual(list(get_table_columns('edge', 'w', network=new_suid, base_url=self.base_url)['w']),
+                             [0.5, 0.7])
+
+        # Verify that networks can be renamed, cloned and deleted
+        rename_network('renamed', network=self.net_suid, base_url=self.base_url)
+        clone_network(self.net_suid, base_url=self.base_url)
+        self.assertSetEqual(set(get_network_list(base_url=self.base_url)), {'renamed', 'renamed_1', 'from df'})
+        delete_network('from df', base_url=self.base_url)
+        self.assertSetEqual(set(get_network_list(base_url=self.base_url)), {'renamed', 'renamed_1'})
+        close_session(False, base_url=self.base_url)
+        self.assertListEqual(get_network_list(base_url=self.base_url), [])
+
+    @print_entry_exit
+    def test_tables(self):
+        # Verify that table columns are typed, and can be loaded, renamed and deleted
+        self.assertDictEqual(get_table_column_types(base_url=self.base_url),
+                             {'SUID': 'Long', 'shared name': 'String', 'name': 'String', 'selected': 'Boolean',
+                              'score': 'Double'})
+        load_table_data(df.DataFrame({'name': ['A', 'C'], 'label': ['x', 'y']}), data_key_column='name',
+                        base_url=self.base_url)
+        labels = get_table_columns(columns=['name', 'label'], base_url=self.base_url)
+        self.assertListEqual(list(labels['label'].fillna('')), ['x', '', 'y'])
+        rename_table_column('label', 'tag', base_url=self.base_url)
+        self.assertIn('tag', get_table_column_names(base_url=self.base_url))
+        delete_table_column('tag', base_url=self.base_url)
+        self.assertNotIn('tag', get_table_column_names(base_url=self.base_url))
+        self.assertRaises(CyError, get_table_columns, table='bogustable', base_url=self.base_url)
+
+    @print_entry_exit
+    def test_views(self):
+        # Verify that bypasses override style values, and can be cleared
+        self.assertDictEqual(get_node_property(visual_property='NODE_LABEL', base_url=self.base_url),
+                             {'A': 'A', 'B': 'B', 'C': 'C'})
+        set_node_property_bypass(['A', 'B'], '#FF0000', 'NODE_FILL_COLOR', base_url=self.base_url)
+        self.assertDictEqual(get_node_property(visual_property='NODE_FILL_COLOR', base_url=self.base_url),
+                             {'A': '#FF0000', 'B': '#FF0000', 'C': '#89D0F5'})
+        clear_node_property_bypass('all', 'NODE_FILL_COLOR', base_url=self.base_url)
+        self.assertSetEqual(set(get_node_property(visual_property='NODE_FILL_COLOR', base_url=self.base_url).values()),
+                            {'#89D0F5'})
+
+        # Verify that layouts position the nodes, and that network properties can be set
+        layout_network(base_url=self.base_url)
+        self.assertEqual(len(get_node_position(base_url=self.base_url).drop_duplicates()), 3)
+        set_network_property_bypass(2.0, 'NETWORK_SCALE_FACTOR', base_url=self.base_url)
+        self.assertEqual(get_network_property('NETWORK_SCALE_FACTOR', base_url=self.base_url), 2.0)
+
+    @print_entry_exit
+    def test_styles(self):
+        # Verify that styles can be copied, changed and applied
+        self.assertListEqual(get_visual_style_names(base_url=self.base_url), ['default'])
+        self.assertIn('ELLIPSE', get_node_shapes(base_url=self.base_url))
+        copy_visual_style('default', 'mine', base_url=self.base_url)
+        set_node_color_default('#00FF00', style_name='mine', base_url=self.base_url)
+        set_visual_style('mine', base_url=self.base_url)
+        self.assertEqual(get_current_style(base_url=self.base_url), 'mine')
+        self.assertEqual(get_node_property(['A'], 'NODE_FILL_COLOR', base_url=self.base_url), {'A': '#00FF00'})
+
+    @print_entry_exit
+    def test_selection(self):
+        # Verify that nodes and edges can be selected, inverted and cleared
+        select_nodes(['A'], by_col='name', base_url=self.base_url)
+        self.assertListEqual(get_selected_nodes(base_url=self.base_url), ['A'])
+        select_edges_adjacent_to_selected_nodes(base_url=self.base_url)
+        self.assertListEqual(get_selected_edges(base_url=self.base_url), ['A (pp) B'])
+        invert_node_selection(base_url=self.base_url)
+        self.assertListEqual(get_selected_nodes(base_url=self.base_url), ['B', 'C'])
+        delete_selected_nodes(base_url=self.base_url)
+        self.assertListEqual(get_all_nodes(base_url=self.base_url), ['A'])
+        self.assertIsNone(get_all_edges(base_url=self.base_url))
+
+    @print_entry_exit
+    def test_sandbox(self):
+        # Verify that files can be sent to, inspected in, fetched from and removed from the sandbox
+        self.assertTrue(sandbox_send_to(__file__, 'test.py', base_url=self.base_url)['filePath'].endswith('test.py'))
+        self.assertTrue(sandbox_get_file_info('test.py', base_url=self.base_url)['isFile'])
+        sandbox_get_from('test.py', '_fetched.py', base_url=self.base_url)
+        try:
+            with open(__file__, 'rb') as f1, open('_fetched.py', 'rb') as f2:
+                self.assertEqual(f1.read(), f2.read())
+        finally:
+            os.remove('_fetched.py')
+        sandbox_remove_file('test.py', base_url=self.base_url)
+        self.assertFalse(sandbox_get_file_info('test.py', base_url=self.base_url)['isFile'])
+
+    @print_entry_exit
+    def test_errors_and_calls(self):
+        # Verify that unknown networks, endpoints and commands fail the way they do with Cytoscape
+        self.assertRaises(CyError, get_network_suid, 'bogus', base_url=self.base_url)
+        self.assertRaises(CyError, commands_post, 'apps list available', base_url=self.base_url)
+        self.assertRaises(CyError, cyrest_get, 'bogus/endpoint', base_url=self.base_url)
+        self.assertListEqual(commands_get('command echo message=hi', base_url=self.base_url), ['hi'])
+
+        # Verify that calls are counted by endpoint
+        self.cy.reset_calls()
+        get_table_columns(columns='name', base_url=self.base_url)
+        self.assertEqual(self.cy.calls['GET networks/{suid}/tables/defaultnode/columns/name'], 1)
+        self.assertEqual(self.cy.call_count, sum(self.cy.calls.values()))
+
+        # Verify that latency is added to each call
+        self.cy.latency_secs = 0.05
+        start = time.perf_counter()
+        get_network_count(base_url=self.base_url)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,10 +24,13 @@ import unittest
 import math
 import pandas as df
 from igraph import Graph
+import networkx as nx
 import time
 import re
 import os
 import copy
+import tempfile
+import importlib.util
 
 from test_utils import *
 
@@ -406,6 +409,44 @@ class NetworkTests(unittest.TestCase):
 
         # TODO: test case of node_names being a single (str) node
 
+    @print_entry_exit
+    def test_get_first_neighbors_bulk(self):
+        with FakeCytoscape() as cy:
+            net_suid = cy.add_network(['A', 'B', 'C', 'D', 'E'],
+                                      [('A', 'B', 'pp'), ('A', 'C', 'pp'), ('C', 'D', 'pp'), ('D', 'A', 'pp')])
+            suid_A = node_name_to_node_suid('A', base_url=cy.base_url)[0]
+
+            # Verify that neighbors come back per node, in each of the result shapes
+            self.assertDictEqual(get_first_neighbors(['A', 'E', 'D'], as_dict=True, network=net_suid,
+                                                     base_url=cy.base_url),
+                                 {'A': ['B', 'C', 'D'], 'E': [], 'D': ['C', 'A']})
+            self.assertListEqual(get_first_neighbors(['D', 'A', 'D'], as_nested_list=True, base_url=cy.base_url),
+                                 [['D', ['C', 'A']], ['A', ['B', 'C', 'D']], ['D', ['C', 'A']]])
+            self.assertListEqual(get_first_neighbors(['D', suid_A], base_url=cy.base_url), ['C', 'A', 'B', 'D'])
+
+            # Verify that each distinct node's neighbors are fetched once, and its name is resolved without a fetch
+            cy.reset_calls()
+            get_first_neighbors(['A', 'B', 'A', suid_A, 'C'], base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET networks/{suid}/nodes/{suid}/neighbors'], 3)
+            self.assertEqual(cy.calls['GET networks/{suid}/tables/defaultnode/columns/name'], 0)
+
+            # Verify that an unknown node is still an error
+            self.assertRaises(CyError, get_first_neighbors, ['A', 'bogus'], base_url=cy.base_url)
+
+            # Verify that neighbors of many nodes are found in one fetch of the whole network, with the same results
+            ring = [f'R{i}' for i in range(150)]
+            cy.add_network(ring, [(ring[i], ring[(i + 1) % 150], 'pp') for i in range(150)] + [('R0', 'R0', 'pp')],
+                           title='ring')
+            cy.reset_calls()
+            neighbors = get_first_neighbors(ring, as_dict=True, network='ring', base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET networks/{suid}/nodes/{suid}/neighbors'], 0)
+            self.assertEqual(cy.calls['GET networks/{suid}'], 1)
+            self.assertSetEqual(set(neighbors['R0']), {'R1', 'R149', 'R0'})
+            self.assertSetEqual(set(neighbors['R75']), {'R74', 'R76'})
+            for node in ring[:3]:
+                self.assertSetEqual(set(neighbors[node]),
+                                    set(get_first_neighbors(node, network='ring', base_url=cy.base_url)))
+
     
     @print_entry_exit
     def test_get_node_count(self):
@@ -792,6 +833,61 @@ class NetworkTests(unittest.TestCase):
         # Verify that when no edges or nodes are passed in, an error occurs
         self.assertRaises(CyError, create_network_from_data_frames)
 
+    @print_entry_exit
+    def test_create_network_from_data_frames_inline(self):
+        nodes = df.DataFrame({'id': ['A', 'B', 'C'], 'score': [20, 10, 15], 'weight': [1.5, float('nan'), 2.5],
+                              'tags': [['x', 'y'], None, ['z']], 'ok': [True, False, True],
+                              'group': ['g1', None, 'g2']})
+        edges = df.DataFrame({'source': ['A', 'A', 'B'], 'target': ['B', 'B', 'C'],
+                              'interaction': ['pp', 'pp', 'pd'], 'weight': [1.0, 2.0, 3.0]})
+        with FakeCytoscape() as cy:
+            # Verify that attributes arrive with the network, without loading tables or looking up edge SUIDs
+            suid = create_network_from_data_frames(nodes, edges, title='inline', inline_attributes=True,
+                                                   base_url=cy.base_url)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultnode'], 0)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultedge'], 0)
+            self.assertEqual(cy.calls['GET networks/{suid}/tables/defaultedge/columns/name'], 0)
+            node_table = get_table_columns('node', network=suid, base_url=cy.base_url).set_index('name')
+            self.assertDictEqual(node_table['score'].to_dict(), {'A': 20, 'B': 10, 'C': 15})
+            self.assertEqual(node_table['weight']['C'], 2.5)
+            self.assertTrue(math.isnan(node_table['weight']['B']))
+            self.assertListEqual(node_table['tags'][['A', 'C']].tolist(), ['x,y', 'z'])
+            self.assertTrue(df.isna(node_table['tags']['B']))
+            self.assertDictEqual(node_table['ok'].to_dict(), {'A': True, 'B': False, 'C': True})
+            self.assertEqual(node_table['group']['C'], 'g2')
+
+            # Verify that each of the parallel edges keeps its own attributes
+            edge_table = get_table_columns('edge', network=suid, base_url=cy.base_url)
+            self.assertListEqual(sorted(edge_table['weight']), [1.0, 2.0, 3.0])
+            self.assertNotIn('data.key.column', edge_table.columns)
+
+            # Verify that a column that can't be sent along with the network is loaded afterwards instead
+            nodes['mixed'] = ['a', 1, 'c']
+            cy.reset_calls()
+            suid = create_network_from_data_frames(nodes, edges, title='loaded', inline_attributes=True,
+                                                   base_url=cy.base_url)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultnode'], 1)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultedge'], 1)
+            node_table = get_table_columns('node', network=suid, base_url=cy.base_url).set_index('name')
+            self.assertDictEqual(node_table['score'].to_dict(), {'A': 20, 'B': 10, 'C': 15})
+
+    @print_entry_exit
+    def test_create_network_from_edge_data_frame(self):
+        edges = df.DataFrame({'from': ['A', 'A', 'B', 'C'], 'to': ['B', 'B', 'C', 'A'], 'kind': ['pp', 'pp', 'pd', 'pp'],
+                              'label': ['x "quoted"', 'y', '100%', 'é']})
+        with FakeCytoscape() as cy:
+            # Verify that nodes inferred from edges in renamed columns are listed once each, in order of appearance
+            suid = create_network_from_data_frames(edges=edges, source_id_list='from', target_id_list='to',
+                                                   interaction_type_list='kind', base_url=cy.base_url)
+            node_table = get_table_columns('node', network=suid, base_url=cy.base_url)
+            self.assertListEqual(node_table['name'].tolist(), ['A', 'B', 'C'])
+
+            # Verify that parallel edges are told apart, and that their names and attributes survive JSON encoding
+            edge_table = get_table_columns('edge', network=suid, base_url=cy.base_url).sort_values('SUID')
+            self.assertListEqual(edge_table['name'].tolist(),
+                                 ['A (pp) B', 'A (pp) B', 'B (pd) C', 'C (pp) A'])
+            self.assertListEqual(edge_table['label'].tolist(), ['x "quoted"', 'y', '100%', 'é'])
+
     @print_entry_exit
     def test_import_network_from_tabular_file(self):
 
@@ -1247,6 +1343,152 @@ class NetworkTests(unittest.TestCase):
         cytoscape_edges_dict = {(row.source, row.target): row.e_color for row in cytoscape_edges_df.itertuples()}
         self.assertDictEqual(normalize_edge_names(test_dict), normalize_edge_names(cytoscape_edges_dict))
 
+    @print_entry_exit
+    def test_igraph_round_trip_offline(self):
+        # Build a multigraph whose vertices aren't in name order, with a self loop and a 'source' edge attribute
+        g = Graph(directed=True)
+        g.add_vertices(4)
+        g.vs['name'] = ['D', 'B', 'A', 'C']
+        g.vs['age'] = [40, 30, 20, 10]
+        g.add_edges([(0, 1), (0, 1), (2, 3), (3, 3)])
+        g.es['weight'] = [1.5, 2.5, 3.5, 4.5]
+        g.es['source'] = ['x', 'y', 'z', 'w']
+        with FakeCytoscape() as cy:
+            # Verify that edges reach Cytoscape between the right vertices' nodes, with their attributes
+            suid = create_network_from_igraph(g, 'igraph', base_url=cy.base_url)
+            edge_table = get_table_columns('edge', network=suid, base_url=cy.base_url).sort_values('weight')
+            self.assertListEqual(edge_table['name'].tolist(),
+                                 ['D (interacts with) B', 'D (interacts with) B', 'A (interacts with) C',
+                                  'C (interacts with) C'])
+            self.assertListEqual(edge_table['source.original'].tolist(), ['x', 'y', 'z', 'w'])
+
+            # Verify that the graph comes back with the same edges and attributes, as plain Python values
+            new_g = create_igraph_from_network(suid, base_url=cy.base_url)
+            edges = sorted((new_g.vs[e.source]['name'], new_g.vs[e.target]['name'], e['weight']) for e in new_g.es)
+            self.assertListEqual(edges, [('A', 'C', 3.5), ('C', 'C', 4.5), ('D', 'B', 1.5), ('D', 'B', 2.5)])
+            self.assertDictEqual(dict(zip(new_g.vs['name'], new_g.vs['age'])), {'D': 40, 'B': 30, 'A': 20, 'C': 10})
+            self.assertIs(type(new_g.vs['age'][0]), int)
+
+    @print_entry_exit
+    def test_networkx_round_trip_offline(self):
+        # Build a multigraph whose nodes and edges don't all have the same attributes
+        g = nx.MultiDiGraph()
+        g.add_node('A', score=1, label='first')
+        g.add_node('B', score=2)
+        g.add_node('C', name='ignored')
+        g.add_edge('A', 'B', weight=1.5, kind='x')
+        g.add_edge('A', 'B', weight=2.5)
+        g.add_edge('C', 'A', kind='y', source='ignored')
+        with FakeCytoscape() as cy:
+            # Verify that nodes and edges reach Cytoscape with the attributes they have, and only those asked for
+            suid = create_network_from_networkx(g, 'netx', base_url=cy.base_url)
+            node_table = get_table_columns('node', network=suid, base_url=cy.base_url).set_index('name')
+            self.assertListEqual(node_table['score'].tolist()[:2], [1, 2])
+            self.assertTrue(df.isna(node_table['label']['B']))
+            edge_table = get_table_columns('edge', network=suid, base_url=cy.base_url).sort_values('SUID')
+            self.assertListEqual(edge_table['source'].tolist(), ['A', 'A', 'C'])
+            self.assertListEqual(edge_table['kind'].fillna('').tolist(), ['x', '', 'y'])
+            suid_2 = create_network_from_networkx(g, 'netx weights', edge_attributes=['weight'], node_attributes=[],
+                                                  base_url=cy.base_url)
+            self.assertNotIn('kind', get_table_column_names('edge', network=suid_2, base_url=cy.base_url))
+            self.assertNotIn('score', get_table_column_names('node', network=suid_2, base_url=cy.base_url))
+
+            # Verify that the graph comes back with the same edges and attributes
+            new_g = create_networkx_from_network(suid, base_url=cy.base_url)
+            self.assertListEqual(sorted((u, v, attrs['weight']) for u, v, attrs in new_g.edges(data=True)
+                                        if attrs['weight'] == attrs['weight']), [('A', 'B', 1.5), ('A', 'B', 2.5)])
+            self.assertEqual(new_g.nodes['A']['label'], 'first')
+            self.assertEqual(new_g.nodes['A']['score'], 1)
+
+            # Verify that only the columns asked for are fetched, along with the ones that make up the graph
+            cy.reset_calls()
+            new_g = create_networkx_from_network(suid, node_attributes=['score'], edge_attributes=['weight', 'bogus'],
+                                                 base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET networks/{suid}/tables/defaultedge/columns/kind'], 0)
+            self.assertEqual(cy.calls['GET networks/{suid}/tables/defaultnode/columns/label'], 0)
+            self.assertSetEqual(set(new_g.nodes['A']), {'SUID', 'score'})
+            self.assertSetEqual(set().union(*(attrs for u, v, attrs in new_g.edges(data=True))),
+                                {'SUID', 'name', 'weight'})
+            self.assertEqual(new_g.number_of_edges(), 3)
+
+    @print_entry_exit
+    def test_import_network_from_local_file_offline(self):
+        with tempfile.TemporaryDirectory() as temp_dir, FakeCytoscape() as cy:
+            file = os.path.join(temp_dir, 'interactions.csv')
+            with open(file, 'w') as f:
+                f.write('gene1,gene2,type,score,big,keep,organism1,unused\n'
+                        'A,B,pp,1.5,3000000000,true,yeast,x\n'
+                        'B,C,pd,,1,false,human,y\n'
+                        'C,"A, too",pp,2,2,true,,z\n')
+
+            # Verify that a local file is imported in place, with columns in their roles, and that columns not given a
+            # data type get the widest type their values allow
+            sandbox_set(None, base_url=cy.base_url)
+            set_current_sandbox(None, None, base_url=cy.base_url)  # i.e., Cytoscape shares this file system
+            sent = []
+            res = import_network_from_local_file(file, 'gene1', 'gene2', interaction_column='type',
+                                                 source_attributes=['organism1'], skip_columns=['unused'],
+                                                 data_types={'keep': 'b'}, progress=lambda *args: sent.append(args),
+                                                 base_url=cy.base_url)
+            self.assertEqual(cy.calls['POST commands/filetransfer/toSandbox'], 0)
+            self.assertListEqual(sent, [(os.path.getsize(file), os.path.getsize(file))])
+            self.assertEqual(get_network_suid(base_url=cy.base_url), res['networks'][0])
+            self.assertEqual(get_edge_count(base_url=cy.base_url), 3)
+            self.assertSetEqual(set(get_all_nodes(base_url=cy.base_url)), {'A', 'B', 'C', 'A, too'})
+            columns = get_table_column_types('edge', base_url=cy.base_url)
+            self.assertDictEqual({col: columns[col] for col in ['score', 'big', 'keep']},
+                                 {'score': 'Double', 'big': 'Long', 'keep': 'Boolean'})
+            self.assertNotIn('unused', columns)
+            edges = get_table_columns('edge', base_url=cy.base_url).set_index('name')
+            self.assertEqual(edges['score']['A (pp) B'], 1.5)
+            self.assertTrue(df.isna(edges['score']['B (pd) C']))
+            nodes = get_table_columns('node', base_url=cy.base_url).set_index('name')
+            self.assertEqual(nodes['organism1']['B'], 'human')
+
+            # Verify that a data type can be overridden, and that a bad column name is caught
+            import_network_from_local_file(file, 'gene1', 'gene2', data_types={'big': 's'}, base_url=cy.base_url)
+            self.assertEqual(get_table_column_types('edge', base_url=cy.base_url)['big'], 'String')
+            self.assertEqual(get_table_column_types('edge', base_url=cy.base_url)['keep'], 'String')
+            self.assertRaises(CyError, import_network_from_local_file, file, 'gene1', 'bogus', base_url=cy.base_url)
+
+            # Verify that with a sandbox, the file is streamed into the sandbox and imported from there
+            sandbox_set('mySand', base_url=cy.base_url)
+            sent = []
+            import_network_from_local_file(file, 'gene1', 'gene2', dest_file='edges.csv',
+                                           progress=lambda *args: sent.append(args), base_url=cy.base_url)
+            self.assertEqual(cy.calls['POST commands/filetransfer/toSandbox'], 1)
+            self.assertEqual(sent[-1], (os.path.getsize(file), os.path.getsize(file)))
+            self.assertEqual(get_network_name(base_url=cy.base_url), 'edges.csv')
+            self.assertEqual(get_edge_count(base_url=cy.base_url), 3)
+
+            # Verify that with no data types given, Cytoscape chooses them (which the fake doesn't do, so they're
+            # all String)
+            self.assertEqual(get_table_column_types('edge', base_url=cy.base_url)['score'], 'String')
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is None, 'Reading Parquet files requires pyarrow')
+    @print_entry_exit
+    def test_import_network_from_local_parquet_file_offline(self):
+        import pyarrow
+        import pyarrow.parquet
+        with tempfile.TemporaryDirectory() as temp_dir, FakeCytoscape() as cy:
+            file = os.path.join(temp_dir, 'interactions.parquet')
+            pyarrow.parquet.write_table(pyarrow.table({'gene1': ['A', 'B', 'C'], 'gene2': ['B', 'C', 'A, too'],
+                                                       'score': [1.5, None, 2.0],
+                                                       'rank': pyarrow.array([1, None, 3], pyarrow.int32()),
+                                                       'big': [1, 2, 3], 'keep': [True, None, False]}),
+                                        file, row_group_size=2)
+
+            # Verify that the file is converted batch by batch, sent to the sandbox and typed by its schema
+            import_network_from_local_file(file, 'gene1', 'gene2', base_url=cy.base_url)
+            self.assertEqual(get_network_name(base_url=cy.base_url), 'interactions.parquet.tsv')
+            self.assertSetEqual(set(get_all_nodes(base_url=cy.base_url)), {'A', 'B', 'C', 'A, too'})
+            columns = get_table_column_types('edge', base_url=cy.base_url)
+            self.assertDictEqual({col: columns[col] for col in ['score', 'rank', 'big', 'keep']},
+                                 {'score': 'Double', 'rank': 'Integer', 'big': 'Long', 'keep': 'Boolean'})
+            edges = get_table_columns('edge', base_url=cy.base_url).set_index('name')
+            self.assertEqual(edges['rank']['C (interacts with) A, too'], 3)
+            self.assertTrue(df.isna(edges['keep']['B (interacts with) C']))
+
     def _check_igraph_attributes(self, original_collection, new_collection, orig_name='name'):
         # Verify that all edges or vertices (and their attributes) in the igraph original_collection are present in the
         # igraph new_collection. Note that there can be extra attributes in the new_collection,
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in pool.py.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import socket
+import time
+import requests
+
+from test_utils import *
+
+_DEAD_BASE_URL = 'http://127.0.0.1:9/v1'  # Nothing listens on the discard port
+
+
+class PoolTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            close_session(False)
+        except:
+            pass
+
+    def tearDown(self):
+        pass
+
+    @print_entry_exit
+    def test_pool_jobs(self):
+        # Initialization
+        load_test_session()
+        node_count = get_node_count()
+
+        # Verify that jobs run on the live Cytoscape, results come back in order, and stats are kept
+        with CytoscapePool([DEFAULT_BASE_URL, _DEAD_BASE_URL], jobs_per_instance=2) as pool:
+            self.assertDictEqual(pool.check_health(), {DEFAULT_BASE_URL: True, _DEAD_BASE_URL: False})
+            self.assertListEqual(pool.map(get_node_count, [None] * 6), [node_count] * 6)
+            self.assertEqual(pool.submit(get_network_name).result(), get_network_name())
+
+            stats = pool.stats()
+            self.assertEqual(stats[DEFAULT_BASE_URL]['completed'], 7)
+            self.assertEqual(stats[DEFAULT_BASE_URL]['active'], 0)
+            self.assertEqual(stats[_DEAD_BASE_URL]['completed'], 0)
+            self.assertFalse(stats[_DEAD_BASE_URL]['healthy'])
+            self.assertGreater(stats[DEFAULT_BASE_URL]['jobs_per_sec'], 0)
+
+            # Verify that a job's own error is returned without retrying it
+            self.assertRaises(CyError, pool.submit(get_network_suid, 'bogus network').result)
+            self.assertEqual(pool.stats()[DEFAULT_BASE_URL]['failed'], 1)
+            self.assertEqual(pool.stats()[DEFAULT_BASE_URL]['retried'], 0)
+
+    @print_entry_exit
+    def test_pool_no_instances(self):
+        # Verify that a pool can't be created if no Cytoscape responds, and the connection error is kept as the cause
+        with self.assertRaises(CyError) as context:
+            CytoscapePool([_DEAD_BASE_URL])
+        self.assertIsInstance(context.exception.__cause__, requests.exceptions.ConnectionError)
+
+        # Verify that jobs fail once every instance has gone away, also with the connection error as the cause
+        with FakeCytoscape() as cy:
+            pool = CytoscapePool([cy.base_url])
+        with pool:
+            self.assertDictEqual(pool.check_health(), {cy.base_url: False})
+            with self.assertRaises(CyError) as context:
+                pool.submit(get_network_count).result()
+            self.assertIsInstance(context.exception.__cause__, requests.exceptions.ConnectionError)
+
+    @print_entry_exit
+    def test_pool_unresponsive_instance(self):
+        # Verify that an instance that accepts connections but never answers is left out after the ping timeout,
+        # instead of holding up the pool forever
+        with socket.socket() as black_hole, FakeCytoscape() as cy:
+            black_hole.bind(('127.0.0.1', 0))
+            black_hole.listen()
+            silent_base_url = f'http://127.0.0.1:{black_hole.getsockname()[1]}/v1'
+            start = time.perf_counter()
+            with CytoscapePool([cy.base_url, silent_base_url], ping_timeout_secs=0.5) as pool:
+                self.assertLess(time.perf_counter() - start, 5)
+                self.assertDictEqual(pool.check_health(), {cy.base_url: True, silent_base_url: False})
+                self.assertEqual(pool.submit(get_network_count).result(), 0)
+                self.assertEqual(pool.stats()[cy.base_url]['completed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
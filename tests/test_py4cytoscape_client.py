@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in py4cytoscape_client.py.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import threading
+from test_utils import *
+from py4cytoscape.py4cytoscape_client import NETWORK_SUID_CACHE
+
+_OTHER_BASE_URL = 'http://127.0.0.2:1234/v1'
+
+
+class Py4cytoscapeClientTests(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            close_session(False)
+        except:
+            pass
+
+    def tearDown(self):
+        reset_default_sandbox()
+        reset_default_sandbox(base_url=_OTHER_BASE_URL)
+
+    @print_entry_exit
+    def test_get_client(self):
+        # Verify that there's exactly one client per base_url, and that the default client is for DEFAULT_BASE_URL
+        self.assertIs(get_client(), get_client(DEFAULT_BASE_URL))
+        self.assertIsNot(get_client(), get_client(_OTHER_BASE_URL))
+        self.assertEqual(get_client(_OTHER_BASE_URL).base_url, _OTHER_BASE_URL)
+
+        # Verify that creating a client replaces the client for that base_url
+        old_client = get_client(_OTHER_BASE_URL)
+        new_client = CytoscapeClient(_OTHER_BASE_URL)
+        self.assertIsNot(old_client, new_client)
+        self.assertIs(get_client(_OTHER_BASE_URL), new_client)
+
+    @print_entry_exit
+    def test_client_state_is_separate(self):
+        # Initialization
+        load_test_session()
+        default_sandbox = get_current_sandbox()
+
+        # Verify that sandbox and environment state for one Cytoscape doesn't affect another
+        set_current_sandbox('other_sandbox', '/other/path', base_url=_OTHER_BASE_URL)
+        self.assertTupleEqual(get_current_sandbox(base_url=_OTHER_BASE_URL), ('other_sandbox', '/other/path'))
+        self.assertTupleEqual(get_current_sandbox(), default_sandbox)
+        self.assertEqual(get_client(_OTHER_BASE_URL).execution_environment, 0)  # i.e., UNKNOWN
+        self.assertNotEqual(get_client().execution_environment, 0)
+
+        # Verify that tuning values can be overridden for one Cytoscape only
+        get_client(_OTHER_BASE_URL).tuning.MODEL_PROPAGATION_SECS = 0
+        self.assertEqual(get_client(_OTHER_BASE_URL).tuning.MODEL_PROPAGATION_SECS, 0)
+        self.assertNotEqual(get_client().tuning.MODEL_PROPAGATION_SECS, 0)
+
+        # Verify that a reset forgets the environment and sandbox
+        get_client(_OTHER_BASE_URL).reset()
+        self.assertTupleEqual(get_current_sandbox(base_url=_OTHER_BASE_URL), (None, None))
+        self.assertTrue(get_sandbox_reinitialize(base_url=_OTHER_BASE_URL))
+
+    @print_entry_exit
+    def test_client_functions(self):
+        # Initialization
+        load_test_session()
+        client = get_client()
+
+        # Verify that py4cytoscape functions can be called as client methods
+        self.assertListEqual(client.get_network_list(), get_network_list())
+        self.assertEqual(client.get_node_count(), get_node_count())
+        self.assertRaises(AttributeError, getattr, client, 'bogus_function')
+        self.assertRaises(AttributeError, getattr, client, 'normalize_list')  # no base_url parameter
+
+    @print_entry_exit
+    def test_client_threads(self):
+        # Initialization
+        load_test_session()
+        node_count = get_node_count()
+        results = []
+
+        # Verify that several threads can use the same client concurrently
+        def count_nodes():
+            results.append(get_client().get_node_count())
+
+        threads = [threading.Thread(target=count_nodes) for i in range(8)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertListEqual(results, [node_count] * 8)
+
+    @print_entry_exit
+    def test_network_suid_scope(self):
+        with FakeCytoscape() as cy:
+            cy.add_network(['A', 'B'], [('A', 'B', 'pp')], title='net')
+            client = get_client(cy.base_url)
+            resolution_calls = ['GET networks.names', 'POST commands/network/get attribute', 'GET networks']
+
+            # Verify that a call resolves its network only once, however many helpers need it
+            cy.reset_calls()
+            set_node_color_bypass(['A', 'B'], '#FF0000', network='net', base_url=cy.base_url)
+            self.assertEqual(sum(cy.calls[call] for call in resolution_calls), 2)  # list names, then get SUID
+
+            # Verify that calls in a batch share resolutions, and that they end with the batch
+            cy.reset_calls()
+            with client.batch():
+                for node in ['A', 'B']:
+                    set_node_color_bypass(node, '#00FF00', network='net', base_url=cy.base_url)
+                self.assertEqual(sum(cy.calls[call] for call in resolution_calls), 2)
+            self.assertIsNone(client.scoped_cache(NETWORK_SUID_CACHE))
+
+            # Verify that changing networks within a batch discards stale resolutions
+            with client.batch():
+                net_suid = get_network_suid('net', base_url=cy.base_url)
+                rename_network('renamed', network=net_suid, base_url=cy.base_url)
+                self.assertRaises(CyError, get_network_suid, 'net', base_url=cy.base_url)
+                self.assertEqual(get_network_suid('renamed', base_url=cy.base_url), net_suid)
+                clone_suid = clone_network(net_suid, base_url=cy.base_url)
+                set_current_network(clone_suid, base_url=cy.base_url)
+                self.assertEqual(get_network_suid(base_url=cy.base_url), clone_suid)
+                delete_network(clone_suid, base_url=cy.base_url)
+                self.assertRaises(CyError, get_network_suid, clone_suid, base_url=cy.base_url)
+
+
+if __name__ == '__main__':
+    unittest.main()
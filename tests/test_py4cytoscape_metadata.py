@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in py4cytoscape_metadata.py.
+
+These tests don't need a running Cytoscape ... they use a FakeCytoscape instead.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import json
+import tempfile
+
+from test_utils import *
+
+_METADATA_CALLS = ['GET styles/default/defaults', 'GET styles/visualproperties/NODE_SHAPE/values',
+                   'GET styles/visualproperties/EDGE_LINE_TYPE/values',
+                   'GET styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', 'GET apply/layouts']
+
+
+class Py4cytoscapeMetadataTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.cache_dir.name, 'metadata.json')
+
+    def tearDown(self):
+        set_metadata_cache_file(None)
+        self.cache_dir.cleanup()
+
+    @print_entry_exit
+    def test_metadata_is_fetched_once(self):
+        with FakeCytoscape() as cy:
+            cy.add_network(['A', 'B'], [('A', 'B', 'pp')])
+
+            # Verify that each list is fetched only the first time it's needed, and that callers get their own copy
+            for i in range(3):
+                shapes = get_node_shapes(base_url=cy.base_url)
+                self.assertIn('ELLIPSE', shapes)
+                shapes.clear()
+                get_visual_property_names(base_url=cy.base_url)
+                get_line_styles(base_url=cy.base_url)
+                get_arrow_shapes(base_url=cy.base_url)
+                get_layout_names(base_url=cy.base_url)
+                get_layout_property_names('grid', base_url=cy.base_url)
+            for call in _METADATA_CALLS + ['GET apply/layouts/grid/parameters']:
+                self.assertEqual(cy.calls[call], 1, call)
+
+            # Verify that validating bypass values uses the cached list
+            cy.reset_calls()
+            set_node_shape_bypass(['A'], 'ELLIPSE', base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 0)
+
+            # Verify that resetting the client (e.g., on reconnect) discards the cache
+            get_client(cy.base_url).reset()
+            get_node_shapes(base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 1)
+
+    @print_entry_exit
+    def test_warm_metadata_cache(self):
+        with FakeCytoscape() as cy:
+            # Verify that warming fetches everything up front, and that a refresh fetches it again
+            self.assertListEqual(warm_metadata_cache(base_url=cy.base_url),
+                                 ['visual_property_names', 'node_shapes', 'line_styles', 'arrow_shapes', 'layout_names'])
+            get_node_shapes(base_url=cy.base_url)
+            for call in _METADATA_CALLS:
+                self.assertEqual(cy.calls[call], 1, call)
+            warm_metadata_cache(refresh=True, base_url=cy.base_url)
+            for call in _METADATA_CALLS:
+                self.assertEqual(cy.calls[call], 2, call)
+
+            # Verify that layout properties can be warmed, too
+            names = warm_metadata_cache(layout_properties=True, base_url=cy.base_url)
+            self.assertIn('layout_property_names:grid', names)
+
+    @print_entry_exit
+    def test_metadata_cache_file(self):
+        set_metadata_cache_file(self.cache_file)
+
+        # Verify that metadata fetched from one Cytoscape is saved by version and installed apps
+        with FakeCytoscape() as cy:
+            warm_metadata_cache(base_url=cy.base_url)
+        with open(self.cache_file) as f:
+            saved = json.load(f)
+        self.assertEqual(len(saved), 1)
+        key_3_10, = saved
+        self.assertTrue(key_3_10.startswith('3.10.0 apps:'))
+        self.assertIn('ELLIPSE', saved[key_3_10]['node_shapes'])
+
+        # Verify that another Cytoscape of the same version and apps doesn't need to fetch it
+        with FakeCytoscape() as cy:
+            self.assertIn('ELLIPSE', get_node_shapes(base_url=cy.base_url))
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 0)
+
+            # Verify that a refresh discards the saved metadata
+            warm_metadata_cache(refresh=True, base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 1)
+
+        # Verify that a Cytoscape of the same version but with another app fetches its own (e.g., its layouts)
+        with FakeCytoscape() as cy:
+            cy.installed_apps.append({'appName': 'yFiles Layout Algorithms', 'version': '1.1.3',
+                                      'description': 'null', 'status': 'Installed'})
+            get_layout_names(base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET apply/layouts'], 1)
+
+        # Verify that a Cytoscape of a different version fetches its own
+        with FakeCytoscape(cytoscape_version='3.9.1') as cy:
+            get_node_shapes(base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 1)
+        with open(self.cache_file) as f:
+            keys = set(json.load(f))
+        self.assertEqual(len(keys), 3)
+        self.assertIn(key_3_10, keys)
+        self.assertEqual(len([key for key in keys if key.startswith('3.9.1 apps:')]), 1)
+
+    @print_entry_exit
+    def test_metadata_cache_file_without_apps(self):
+        set_metadata_cache_file(self.cache_file)
+
+        # Verify that metadata is kept in memory only if the installed apps can't be listed
+        with FakeCytoscape() as cy:
+            cy.installed_apps = None  # Makes 'apps list installed' fail
+            self.assertIn('ELLIPSE', get_node_shapes(base_url=cy.base_url))
+            self.assertIn('ELLIPSE', get_node_shapes(base_url=cy.base_url))
+            self.assertEqual(cy.calls['GET styles/visualproperties/NODE_SHAPE/values'], 1)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in py4cytoscape_tuning.py.
+
+These tests don't need a running Cytoscape ... they use a FakeCytoscape instead.
+"""
+
+"""License:
+    Copyright 2020-2022 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import time
+import io
+import copy
+import contextlib
+import pandas as df
+
+from test_utils import *
+from py4cytoscape.py4cytoscape_tuning import wait_until_ready, settled, wait_until_stable
+from py4cytoscape.style_mappings import _is_same_mapping
+
+
+class Py4cytoscapeTuningTests(unittest.TestCase):
+    def setUp(self):
+        reset_readiness_wait_stats()
+        reset_stability_wait_stats()
+
+    @print_entry_exit
+    def test_wait_until_ready(self):
+        # Verify that a check that's already true returns right away after one check
+        start = time.perf_counter()
+        self.assertTrue(wait_until_ready(lambda: True, 2))
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+        # Verify that checks are repeated until true, and that exceptions count as not ready
+        results = iter([False, RuntimeError, False, True])
+        def is_ready():
+            result = next(results)
+            if result is RuntimeError: raise RuntimeError('not yet')
+            return result
+        self.assertTrue(wait_until_ready(is_ready, 2))
+
+        # Verify that a check that's never true times out after about the timeout
+        start = time.perf_counter()
+        self.assertFalse(wait_until_ready(lambda: False, 0.3))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertLess(time.perf_counter() - start, 0.8)
+
+        # Verify that errors shown by failed checks are held back, and that only a timeout shows the last one
+        def raise_error(text):
+            raise CyError(text)
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            results = iter([False, True])
+            self.assertTrue(wait_until_ready(lambda: next(results) or raise_error('not yet'), 2))
+            self.assertEqual(errors.getvalue(), '')
+            self.assertFalse(wait_until_ready(lambda: raise_error('never'), 0.2))
+        self.assertEqual(errors.getvalue().count('never'), 1)
+        self.assertIn('Timed out', errors.getvalue())
+
+        # Verify that a 0 timeout skips the wait and the check
+        self.assertFalse(wait_until_ready(lambda: 1 / 0, 0))
+
+        # Verify that waits are counted
+        stats = get_readiness_wait_stats()
+        self.assertEqual(stats['waits'], 5)
+        self.assertGreaterEqual(stats['checks'], 1 + 4 + 2 + 2 + 2)
+        self.assertEqual(stats['timeouts'], 2)
+        self.assertGreaterEqual(stats['wait_secs'], 0.3)
+        reset_readiness_wait_stats()
+        self.assertDictEqual(get_readiness_wait_stats(), {'waits': 0, 'checks': 0, 'timeouts': 0, 'wait_secs': 0.0})
+
+    @print_entry_exit
+    def test_settled(self):
+        # Verify that a settled check succeeds only once the value stops changing
+        values = iter([1, 2, 3, 3, 4])
+        is_settled = settled(lambda: next(values))
+        self.assertListEqual([is_settled() for i in range(4)], [False, False, False, True])
+
+    @print_entry_exit
+    def test_wait_until_stable(self):
+        # Verify that an operation is retried until it succeeds, starting with short pauses
+        attempts = iter([False, RuntimeError, False, True])
+        def attempt_op():
+            result = next(attempts)
+            if result is RuntimeError: raise RuntimeError('not yet')
+            return result
+        start = time.perf_counter()
+        self.assertTrue(wait_until_stable(attempt_op, 'test op'))
+        self.assertLess(time.perf_counter() - start, 1)
+
+        # Verify that each attempt requires vote_count successes in a row
+        votes = iter([True, False, True, True, True])
+        self.assertTrue(wait_until_stable(lambda: next(votes), 'test votes', vote_count=3))
+
+        # Verify that an operation that never succeeds times out
+        self.assertFalse(wait_until_stable(lambda: False, 'test timeout', timeout_secs=0.3))
+
+        # Verify that settle times are kept per operation, and that the histogram counts successes only
+        stats = get_stability_wait_stats()
+        self.assertSetEqual(set(stats), {'test op', 'test votes', 'test timeout'})
+        self.assertEqual(stats['test op']['count'], 1)
+        self.assertEqual(sum(stats['test op']['histogram'].values()), 1)
+        self.assertEqual(stats['test timeout']['timeouts'], 1)
+        self.assertEqual(sum(stats['test timeout']['histogram'].values()), 0)
+        self.assertIsNone(stats['test timeout']['typical_secs'])
+
+        # Verify that once an operation has a typical settle time, the first retry waits about that long
+        wait_until_stable(settled(iter([1, 2, 2]).__next__), 'test learned')
+        typical_secs = get_stability_wait_stats()['test learned']['typical_secs']
+        attempt_times = []
+        def timed_attempt():
+            attempt_times.append(time.perf_counter())
+            return len(attempt_times) > 1
+        wait_until_stable(timed_attempt, 'test learned')
+        self.assertGreaterEqual(attempt_times[1] - attempt_times[0], typical_secs * 0.8)
+
+        reset_stability_wait_stats()
+        self.assertDictEqual(get_stability_wait_stats(), {})
+
+    @print_entry_exit
+    def test_network_creation_waits(self):
+        # Verify that creating a network records the settle times of the steps that Cytoscape may not be ready for
+        with FakeCytoscape() as cy:
+            create_network_from_data_frames(df.DataFrame({'id': ['A', 'B']}),
+                                            df.DataFrame({'source': ['A'], 'target': ['B']}), base_url=cy.base_url)
+            stats = get_stability_wait_stats()
+            self.assertSetEqual(set(stats), {'verifying network SUID', 'apply vizmap', 'layout network'})
+            self.assertEqual(cy.calls['GET networks/{suid}/tables/defaultnode/columns'], 10)
+
+    @print_entry_exit
+    def test_style_waits(self):
+        # Verify that style changes wait only until Cytoscape shows them, not the whole MODEL_PROPAGATION_SECS
+        with FakeCytoscape() as cy:
+            cy.add_network(['A', 'B'], [('A', 'B', 'pp')])
+            get_client(cy.base_url).tuning.MODEL_PROPAGATION_SECS = 10
+            start = time.perf_counter()
+            set_node_color_default('#00FF00', base_url=cy.base_url)
+            set_node_label_mapping('name', base_url=cy.base_url)
+            self.assertLess(time.perf_counter() - start, 5)
+            self.assertEqual(get_readiness_wait_stats()['waits'], 2)
+            self.assertEqual(get_readiness_wait_stats()['timeouts'], 0)
+
+            # Verify that changing an existing mapping's values waits until Cytoscape shows the new values
+            set_node_shape_mapping('name', ['A', 'B'], ['ELLIPSE', 'DIAMOND'], base_url=cy.base_url)
+            old_mapping = copy.deepcopy(_get_node_shape_mapping(cy))
+            set_node_shape_mapping('name', ['A', 'B'], ['RECTANGLE', 'DIAMOND'], base_url=cy.base_url)
+            new_mapping = _get_node_shape_mapping(cy)
+            self.assertFalse(_is_same_mapping(old_mapping, new_mapping))
+            self.assertTrue(_is_same_mapping({**new_mapping, 'map': [{'key': 'B', 'value': 'diamond'},
+                                                                     {'key': 'A', 'value': 'Rectangle'}]},
+                                             new_mapping))
+            self.assertEqual(get_readiness_wait_stats()['timeouts'], 0)
+
+
+def _get_node_shape_mapping(cy):
+    # Read the node shape mapping back from the fake Cytoscape
+    return commands.cyrest_get('styles/default/mappings/NODE_SHAPE', base_url=cy.base_url)
+
+
+if __name__ == '__main__':
+    unittest.main()
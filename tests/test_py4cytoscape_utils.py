@@ -21,7 +21,14 @@
 """
 
 import unittest
+import os
+import socket
+import subprocess
+import sys
+import requests
 from test_utils import *
+from py4cytoscape.py4cytoscape_client import VERSION_INFO_CACHE
+from py4cytoscape.py4cytoscape_notebook import ExecutionEnvironment
 
 class Py4cytoscapeUtilsTests(unittest.TestCase):
 
@@ -141,6 +148,31 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
 
         self.assertEqual(node_name_to_node_suid(node_names[0], unique_list=False), [suids[0]]) # try just a single node name, list declared non-unique
 
+    @print_entry_exit
+    def test_name_index_cache(self):
+        # Initialization
+        load_test_session()
+        suid = node_name_to_node_suid('YGR009C')[0]
+        edge_suid = edge_name_to_edge_suid('YGR009C (pp) YOR327C')[0]
+
+        # Verify that deleting nodes via py4cytoscape functions updates the name index
+        select_nodes(['YGR009C'], by_col='name')
+        delete_selected_nodes()
+        self.assertRaises(CyError, node_name_to_node_suid, 'YGR009C')
+        self.assertRaises(CyError, node_suid_to_node_name, suid)
+        self.assertRaises(CyError, edge_suid_to_edge_name, edge_suid)
+
+        # Verify that adding nodes via py4cytoscape functions updates the name index
+        new_suid = add_cy_nodes(['YGR009C'])[0]['SUID']
+        self.assertListEqual(node_name_to_node_suid('YGR009C'), [new_suid])
+        self.assertListEqual(node_suid_to_node_name(new_suid), ['YGR009C'])
+
+        # Verify that changes made behind py4cytoscape's back are seen only after invalidate_caches()
+        commands_post('network delete nodeList="name:YGR009C"')
+        self.assertListEqual(node_name_to_node_suid('YGR009C'), [new_suid])
+        invalidate_caches()
+        self.assertRaises(CyError, node_name_to_node_suid, 'YGR009C')
+
 
     @print_entry_exit
     def test_edge_suid_to_edge_name(self):
@@ -288,6 +320,51 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
         self.assertRaises(CyError, verify_supported_versions, cytoscape='4.0')
         self.assertRaises(AttributeError, verify_supported_versions, cytoscape='complete trash')
 
+    @print_entry_exit
+    def test_capabilities(self):
+        with FakeCytoscape(cytoscape_version='3.9.1') as cy:
+            # Verify that features are derived from the Cytoscape version
+            self.assertDictEqual(get_capabilities(base_url=cy.base_url),
+                                 {'supports_filter_apply_flag': True, 'supports_regex_filter': True,
+                                  'supports_v310_export': False})
+            self.assertFalse(has_capability('supports_v310_export', base_url=cy.base_url))
+            self.assertRaises(KeyError, has_capability, 'bogus', base_url=cy.base_url)
+
+            # Verify that the version is fetched only once, no matter how many version checks are made
+            for i in range(5):
+                verify_supported_versions(1, '3.9', base_url=cy.base_url)
+                self.assertIsNotNone(check_supported_versions(1, '3.10', base_url=cy.base_url))
+            self.assertEqual(cy.calls['GET version'], 1)
+            self.assertEqual(cached_version_info(base_url=cy.base_url)['cytoscapeVersion'], '3.9.1')
+
+            # Verify that the version is fetched again after a reconnect
+            get_client(cy.base_url).reset()
+            has_capability('supports_v310_export', base_url=cy.base_url)
+            self.assertEqual(cy.calls['GET version'], 2)
+
+        # Verify that the cached version is discarded when Cytoscape can't be reached (e.g., while it restarts)
+        with socket.socket() as closed_port:
+            closed_port.bind(('127.0.0.1', 0))
+            base_url = f'http://127.0.0.1:{closed_port.getsockname()[1]}/v1'
+        client = get_client(base_url)
+        client.execution_environment = ExecutionEnvironment.REMOTE_DIRECT_URL  # As if it had been reached before
+        client.caches[VERSION_INFO_CACHE] = {'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}
+        self.assertTrue(has_capability('supports_regex_filter', base_url=base_url))
+        self.assertRaises(requests.exceptions.ConnectionError, get_network_count, base_url=base_url)
+        self.assertNotIn(VERSION_INFO_CACHE, client.caches)
+        self.assertEqual(client.execution_environment, ExecutionEnvironment.UNKNOWN)
+
+    @print_entry_exit
+    def test_lazy_imports(self):
+        # Verify that importing py4cytoscape doesn't load the heavy dependencies ... only functions that need them do
+        res = subprocess.run([sys.executable, '-c',
+                              'import sys, py4cytoscape; '
+                              'print(" ".join(m for m in ["igraph", "networkx", "pandas", "numpy", "colorbrewer"] '
+                              'if m in sys.modules))'],
+                             capture_output=True, text=True, check=True,
+                             env={**os.environ, 'PYTHONPATH': os.path.abspath('..')})
+        self.assertEqual(res.stdout.strip(), '')
+
 
     @print_entry_exit
     def test_verify_colors(self):
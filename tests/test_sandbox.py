@@ -23,9 +23,12 @@ import os
 
 import unittest
 import time
+import base64
+import hashlib
 from requests import HTTPError
 
 from test_utils import *
+from py4cytoscape.sandbox import _StreamedBody, _iter_file_content64
 
 _TEST_SANDBOX_NAME = 'test_sandbox'
 _TEST_FILE = 'test file'
@@ -423,6 +426,55 @@ class SandboxTests(unittest.TestCase):
         self._verify_current_sandbox_is_preset()
         check_url_to_sandbox(default_sandbox_path, PREDEFINED_SANDBOX_NAME)
 
+    @print_entry_exit
+    def test_sandbox_large_transfer(self):
+        _LOCAL_FILE_NAME = '_large transfer.bin'
+        _SANDBOX_FILE_NAME = 'my "large" file name=x.bin'  # Would have been garbled by command string parsing
+        content = os.urandom(7 * 2 ** 20 + 1)  # Several transfer chunks, and not a multiple of 3 bytes
+
+        with FakeCytoscape() as cy:
+            try:
+                with open(_LOCAL_FILE_NAME, 'wb') as f: f.write(content)
+
+                # Verify that a file spanning several chunks arrives intact, and that its checksum can be verified
+                sent = []
+                res = sandbox_send_to(_LOCAL_FILE_NAME, _SANDBOX_FILE_NAME, verify=True,
+                                      progress=lambda sent_bytes, file_bytes: sent.append((sent_bytes, file_bytes)),
+                                      base_url=cy.base_url)
+                self.assertSetEqual(set(res.keys()), {'filePath'})
+                with open(res['filePath'], 'rb') as f: self.assertEqual(f.read(), content)
+                self.assertEqual(len(sent), 3)  # One report per chunk read while sending
+                self.assertTupleEqual(sent[-1], (len(content), len(content)))
+
+                # Verify that a streamed body can be rewound and sent again in full (as a retry would), and that
+                # closing it partway closes the file
+                body = _StreamedBody(lambda: _iter_file_content64(_LOCAL_FILE_NAME, len(content), hashlib.sha256(),
+                                                                  None), (len(content) + 2) // 3 * 4)
+                self.assertEqual(len(body.read(1000)), 1000)
+                self.assertEqual(body.tell(), 1000)
+                self.assertEqual(body.seek(0), 0)
+                self.assertEqual(body.read(), base64.b64encode(content))
+                self.assertEqual(body.seek(10), 10)
+                self.assertEqual(body.read(), base64.b64encode(content)[10:])
+                body.seek(0)
+                body.read(10)
+                body.close()
+                os.rename(_LOCAL_FILE_NAME, _LOCAL_FILE_NAME + '.moved')  # Fails on Windows if the file is still open
+                os.rename(_LOCAL_FILE_NAME + '.moved', _LOCAL_FILE_NAME)
+
+                # Verify that it comes back intact, replacing the local file
+                os.remove(_LOCAL_FILE_NAME)
+                res = sandbox_get_from(_SANDBOX_FILE_NAME, _LOCAL_FILE_NAME, base_url=cy.base_url)
+                self.assertSetEqual(set(res.keys()), {'filePath', 'modifiedTime', 'isFile', 'fileByteCount'})
+                self.assertEqual(res['fileByteCount'], len(content))
+                with open(_LOCAL_FILE_NAME, 'rb') as f: self.assertEqual(f.read(), content)
+
+                # Verify that a failed transfer leaves neither a partial nor a temporary file behind
+                self.assertRaises(CyError, sandbox_get_from, 'totally bogus', '_bogus.bin', base_url=cy.base_url)
+                self.assertListEqual([name for name in os.listdir('.') if name.startswith('_bogus.bin')], [])
+            finally:
+                if os.path.exists(_LOCAL_FILE_NAME): os.remove(_LOCAL_FILE_NAME)
+
 
     def _verify_missing_sandbox_file(self, file_name='.'):
         # Verify that a file in a sandbox is not present
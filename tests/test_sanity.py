@@ -24,6 +24,7 @@
 import os
 import unittest
 import math
+import pandas as df
 
 from test_utils import *
 
@@ -61,6 +61,64 @@ class StyleBypassesTests(unittest.TestCase):
 
         self._clear_property_bypass(clear_edge_property_bypass, set_edge_property_bypass, get_edge_property, 'edge', 'EDGE_UNSELECTED_PAINT')
 
+    @print_entry_exit
+    def test_set_node_properties_bypass(self):
+        # Initialization
+        load_test_session()
+        all_names = list(get_table_columns(columns='name')['name'])
+
+        # Verify that several properties are set at once, with scalar and per-node values
+        sizes = list(range(20, 20 + len(all_names)))
+        res = set_node_properties_bypass(all_names, {'NODE_FILL_COLOR': 'red', 'NODE_SIZE': sizes, 'NODE_SHAPE': 'DIAMOND'})
+        self.assertEqual(res, '')
+        props = get_node_properties(all_names, ['NODE_FILL_COLOR', 'NODE_SIZE', 'NODE_SHAPE'])
+        self.assertSetEqual(set(props['NODE_FILL_COLOR']), {'#FF0000'})
+        self.assertListEqual(list(props['NODE_SIZE']), sizes)
+        self.assertSetEqual(set(props['NODE_SHAPE']), {'DIAMOND'})
+
+        # Verify that bypasses set together can be cleared one property at a time
+        clear_node_property_bypass(all_names, 'NODE_FILL_COLOR')
+        self.assertNotIn('#FF0000', set(get_node_property(all_names, 'NODE_FILL_COLOR').values()))
+        self.assertListEqual(list(get_node_properties(all_names, 'NODE_SIZE')['NODE_SIZE']), sizes)
+
+        # Verify that a bad value in any property is caught before anything is set
+        orig_props = get_node_properties(all_names, ['NODE_FILL_COLOR', 'NODE_SHAPE'])
+        self.assertRaises(CyError, set_node_properties_bypass, all_names, {'NODE_FILL_COLOR': 'blue', 'NODE_SHAPE': 'BogusShape'})
+        self.assertRaises(CyError, set_node_properties_bypass, all_names, {'NODE_FILL_COLOR': ['blue', 'red']})
+        self.assertTrue(get_node_properties(all_names, ['NODE_FILL_COLOR', 'NODE_SHAPE']).equals(orig_props))
+
+        # Verify that bad node names, values and network are caught
+        self.assertRaises(CyError, set_node_properties_bypass, ['BogusNode'], {'NODE_FILL_COLOR': 'red'})
+        self.assertRaises(CyError, set_node_properties_bypass, all_names, 'red')
+        self.assertRaises(CyError, set_node_properties_bypass, all_names, {'NODE_FILL_COLOR': 'red'}, network='BogusNetwork')
+
+    @print_entry_exit
+    def test_set_edge_properties_bypass(self):
+        # Initialization
+        load_test_session()
+        all_names = list(get_table_columns(table='edge', columns='name')['name'])
+
+        # Verify that several properties are set at once, with scalar and per-edge values
+        labels = [f'e{i}' for i in range(len(all_names))]
+        res = set_edge_properties_bypass(all_names, {'EDGE_UNSELECTED_PAINT': 'red', 'EDGE_LABEL': labels,
+                                                     'EDGE_TARGET_ARROW_SHAPE': 'ARROW', 'EDGE_SOURCE_ARROW_SHAPE': 'DIAMOND'})
+        self.assertEqual(res, '')
+        props = get_edge_properties(all_names, ['EDGE_UNSELECTED_PAINT', 'EDGE_LABEL', 'EDGE_TARGET_ARROW_SHAPE',
+                                                'EDGE_SOURCE_ARROW_SHAPE'])
+        self.assertSetEqual(set(props['EDGE_UNSELECTED_PAINT']), {'#FF0000'})
+        self.assertListEqual(list(props['EDGE_LABEL']), labels)
+        self.assertSetEqual(set(props['EDGE_TARGET_ARROW_SHAPE']), {'ARROW'})
+        self.assertSetEqual(set(props['EDGE_SOURCE_ARROW_SHAPE']), {'DIAMOND'})
+
+        # Verify that a bad value in any property is caught before anything is set
+        orig_props = get_edge_properties(all_names, ['EDGE_UNSELECTED_PAINT', 'EDGE_LINE_TYPE'])
+        self.assertRaises(CyError, set_edge_properties_bypass, all_names, {'EDGE_UNSELECTED_PAINT': 'blue', 'EDGE_LINE_TYPE': 'BogusStyle'})
+        self.assertTrue(get_edge_properties(all_names, ['EDGE_UNSELECTED_PAINT', 'EDGE_LINE_TYPE']).equals(orig_props))
+
+        # Verify that bad edge names and network are caught
+        self.assertRaises(CyError, set_edge_properties_bypass, ['BogusEdge'], {'EDGE_UNSELECTED_PAINT': 'red'})
+        self.assertRaises(CyError, set_edge_properties_bypass, all_names, {'EDGE_UNSELECTED_PAINT': 'red'}, network='BogusNetwork')
+
     @print_entry_exit
     def test_set_network_property_bypass(self):
         # Initialization
@@ -636,6 +694,22 @@ class StyleBypassesTests(unittest.TestCase):
                              {'data': {}, 'errors': []})
         self.assertDictEqual(getter_func(visual_property=visual_property), orig_colors)
 
+        # Verify that when all nodes have colors, 'all' clears them all
+        res = bypass_func(list(all_names['name']), ['#00FF88'], visual_property)
+        check_bypass(res, '#00FF88')
+        self.assertDictEqual(clear_func('all', visual_property), {'data': {}, 'errors': []})
+        self.assertDictEqual(getter_func(visual_property=visual_property), orig_colors)
+
+        # Verify that small batches clear them all, too
+        try:
+            get_client().tuning.BYPASS_BATCH_SIZE = 7
+            res = bypass_func(list(all_names['name']), ['#0088FF'], visual_property)
+            check_bypass(res, '#0088FF')
+            self.assertDictEqual(clear_func(list(all_names['name']), visual_property), {'data': {}, 'errors': []})
+            self.assertDictEqual(getter_func(visual_property=visual_property), orig_colors)
+        finally:
+            del get_client().tuning.BYPASS_BATCH_SIZE
+
         # Verify that nothing happens when an empty list is passed in
         self.assertDictEqual(clear_func([], visual_property), {'data': {}, 'errors': []})
         self.assertDictEqual(getter_func(visual_property=visual_property), orig_colors)
@@ -644,7 +718,6 @@ class StyleBypassesTests(unittest.TestCase):
         self.assertRaises(TypeError, clear_func, None, visual_property)
 
         # Verify that bad node list is caught
-        self.assertRaises(CyError, clear_func, 'all', visual_property)
         self.assertRaises(CyError, clear_func, ['BogusNode'], visual_property)
 
         # Verify that bad property name is caught
@@ -56,6 +56,52 @@ class StyleValuesTests(unittest.TestCase):
 
         self._check_get_property(get_edge_property, 'edge_names', 'edge', 'EDGE_LABEL', 'interaction', 'YDR277C (pp) YJR022W', 'pp')
 
+    @print_entry_exit
+    def test_get_node_properties(self):
+        # Initialization
+        load_test_session()
+        all_node_names = list(get_table_columns(columns=['name'])['name'])
+
+        # Verify that several properties for all nodes match the values returned one property at a time
+        props = get_node_properties(visual_properties=['NODE_LABEL', 'NODE_X_LOCATION', 'node size'])
+        self.assertListEqual(list(props.columns), ['NODE_LABEL', 'NODE_X_LOCATION', 'NODE_SIZE'])
+        self.assertSetEqual(set(props.index), set(all_node_names))
+        self.assertDictEqual(props['NODE_LABEL'].to_dict(), get_node_property(visual_property='NODE_LABEL'))
+        self.assertDictEqual(props['NODE_SIZE'].to_dict(), get_node_property(visual_property='NODE_SIZE'))
+
+        # Verify that nodes can be identified by name string list or by SUID
+        props = get_node_properties('YER112W, YDR277C', 'NODE_LABEL, NODE_FILL_COLOR')
+        self.assertListEqual(list(props.index), ['YER112W', 'YDR277C'])
+        self.assertEqual(props['NODE_LABEL']['YER112W'], 'LSM4')
+        suid = node_name_to_node_suid('YER112W')[0]
+        self.assertEqual(get_node_properties(suid, ['NODE_LABEL'])['NODE_LABEL'][suid], 'LSM4')
+
+        # Verify that bad property, node name or network is caught
+        self.assertRaises(CyError, get_node_properties, 'YER112W')
+        self.assertRaises(CyError, get_node_properties, 'YER112W', ['NODE_LABEL', 'BogusProperty'])
+        self.assertRaises(CyError, get_node_properties, 'bogusName', ['NODE_LABEL'])
+        self.assertRaises(CyError, get_node_properties, 'YER112W', ['NODE_LABEL'], network='BogusNetwork')
+
+    @print_entry_exit
+    def test_get_edge_properties(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that several properties for all edges match the values returned one property at a time
+        props = get_edge_properties(visual_properties='EDGE_WIDTH, EDGE_PAINT')
+        self.assertListEqual(list(props.columns), ['EDGE_WIDTH', 'EDGE_PAINT'])
+        self.assertEqual(len(props.index), get_edge_count())
+        self.assertDictEqual(props['EDGE_PAINT'].to_dict(), get_edge_property(visual_property='EDGE_PAINT'))
+
+        # Verify that edges can be identified by name
+        props = get_edge_properties(['YDR277C (pp) YJR022W'], ['EDGE_WIDTH'])
+        self.assertListEqual(list(props.index), ['YDR277C (pp) YJR022W'])
+
+        # Verify that bad property, edge name or network is caught
+        self.assertRaises(CyError, get_edge_properties, 'YDR277C (pp) YJR022W', ['BogusProperty'])
+        self.assertRaises(CyError, get_edge_properties, 'bogusName', ['EDGE_WIDTH'])
+        self.assertRaises(CyError, get_edge_properties, 'YDR277C (pp) YJR022W', ['EDGE_WIDTH'], network='BogusNetwork')
+
     @print_entry_exit
     def test_get_network_property(self):
         # Initialization
@@ -106,7 +106,25 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, get_table_columns, table='bogustable', columns='boguscolumn')
         self.assertRaises(CyError, get_table_columns, network='bogus')
 
-    
+    @print_entry_exit
+    def test_get_table_columns_bulk(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that fetching all columns in one call returns exactly what fetching column by column returns
+        for table in ['node', 'edge', 'network']:
+            df.testing.assert_frame_equal(get_table_columns(table=table, bulk=True), get_table_columns(table=table))
+
+        # Verify that column lists and bogus columns are handled the same, too
+        df.testing.assert_frame_equal(get_table_columns(columns=['gal1RGexp', 'Eccentricity', 'Stress'], bulk=True),
+                                      get_table_columns(columns=['gal1RGexp', 'Eccentricity', 'Stress']))
+        df.testing.assert_frame_equal(get_table_columns(columns='Stress, bogus', bulk=True),
+                                      get_table_columns(columns='Stress, bogus'))
+
+        self.assertRaises(CyError, get_table_columns, table='bogustable', columns='boguscolumn', bulk=True)
+        self.assertRaises(CyError, get_table_columns, network='bogus', bulk=True)
+
+
     @print_entry_exit
     def test_get_table_value(self):
         # Initialization
@@ -346,7 +364,91 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, load_table_data, data, namespace='bogus')
         self.assertRaises(CyError, load_table_data, data, network='bogus')
 
-    
+    @print_entry_exit
+    def test_load_table_data_encoding(self):
+        with FakeCytoscape() as cy:
+            cy.add_network(['A', 'B', 'C'], [('A', 'B', 'pp')])
+
+            # Verify that missing values, lists, and each column type survive the trip to Cytoscape
+            data = df.DataFrame({'id': ['A', 'B', 'C'], 'double': [1 / 3, np.nan, -2.5], 'int': [1, 2, 3],
+                                 'bool': [True, False, True], 'str': ['x"y', None, ['p', 'q']],
+                                 'numpy': [np.int64(7), None, np.int64(9)]})
+            load_table_data(data, data_key_column='id', base_url=cy.base_url)
+            loaded = get_table_columns(columns=['name', 'double', 'int', 'bool', 'str', 'numpy'], base_url=cy.base_url)
+            loaded = loaded.set_index('name').astype(object).where(loaded.set_index('name').notna(), None)
+            self.assertDictEqual(loaded.to_dict(orient='index'),
+                                 {'A': {'double': 1 / 3, 'int': 1, 'bool': True, 'str': 'x"y', 'numpy': 7},
+                                  'B': {'double': None, 'int': 2, 'bool': False, 'str': None, 'numpy': None},
+                                  'C': {'double': -2.5, 'int': 3, 'bool': True, 'str': 'p,q', 'numpy': 9}})
+
+            # Verify that values JSON can't represent are rejected
+            self.assertRaises(CyError, load_table_data, df.DataFrame({'id': ['A'], 'double': [np.inf]}),
+                              data_key_column='id', base_url=cy.base_url)
+
+    @print_entry_exit
+    def test_load_table_data_chunks(self):
+        with FakeCytoscape() as cy:
+            names = [f'N{i}' for i in range(25)]
+            cy.add_network(names, [])
+            client = get_client(cy.base_url)
+            client.tuning.TABLE_LOAD_CHUNK_ROWS = 10
+            client.tuning.TABLE_LOAD_WORKERS = 3
+
+            # Verify that rows are loaded in chunks, that progress is reported per chunk, and that new Integer columns
+            # are created together in a single call
+            progress = []
+            data = df.DataFrame({'id': names, 'rank': range(25), 'count': range(100, 125), 'score': [0.5] * 25})
+            load_table_data(data, data_key_column='id', progress=lambda loaded, total: progress.append((loaded, total)),
+                            base_url=cy.base_url)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultnode'], 3)
+            self.assertEqual(cy.calls['POST networks/{suid}/tables/defaultnode/columns'], 1)
+            self.assertListEqual(progress, [(10, 25), (20, 25), (25, 25)])
+            loaded = get_table_columns(columns=['name', 'rank', 'count', 'score'], base_url=cy.base_url)
+            self.assertListEqual(list(loaded.set_index('name').loc[names, 'count']), list(range(100, 125)))
+            self.assertEqual(get_table_column_types(base_url=cy.base_url)['rank'], 'Integer')
+
+            # Verify that a byte ceiling too small for two chunks still loads everything, one chunk at a time
+            cy.reset_calls()
+            client.tuning.TABLE_LOAD_MAX_BYTES = 1
+            data['score'] = 1.5
+            load_table_data(data, data_key_column='id', base_url=cy.base_url)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultnode'], 3)
+            self.assertEqual(cy.calls['POST networks/{suid}/tables/defaultnode/columns'], 0)
+            self.assertSetEqual(set(get_table_columns(columns=['score'], base_url=cy.base_url)['score']), {1.5})
+
+            # Verify that a chunk size of 0 loads all rows at once
+            cy.reset_calls()
+            client.tuning.TABLE_LOAD_CHUNK_ROWS = 0
+            load_table_data(data, data_key_column='id', base_url=cy.base_url)
+            self.assertEqual(cy.calls['PUT networks/{suid}/tables/defaultnode'], 1)
+
+            # Verify that new columns are all created before loading, typed by all of their values even if the first
+            # chunk has none of them
+            cy.reset_calls()
+            client.tuning.TABLE_LOAD_CHUNK_ROWS = 10
+            client.tuning.TABLE_LOAD_MAX_BYTES = 2 ** 20
+            data = df.DataFrame({'id': names, 'late_float': [np.nan] * 10 + [2.5] * 15,
+                                 'late_str': [None] * 10 + ['x'] * 15, 'late_bool': [None] * 20 + [True] * 5,
+                                 'big': [2 ** 40] * 25, 'none': [None] * 25})
+            load_table_data(data, data_key_column='id', base_url=cy.base_url)
+            self.assertEqual(cy.calls['POST networks/{suid}/tables/defaultnode/columns'], 1)
+            types = get_table_column_types(base_url=cy.base_url)
+            self.assertDictEqual({col: types[col] for col in ['late_float', 'late_str', 'late_bool', 'big', 'none']},
+                                 {'late_float': 'Double', 'late_str': 'String', 'late_bool': 'Boolean',
+                                  'big': 'Long', 'none': 'String'})
+            loaded = get_table_columns(columns=['name', 'late_float'], base_url=cy.base_url).set_index('name')
+            self.assertEqual(loaded['late_float']['N24'], 2.5)
+
+            # Verify that the data key column is created up front too, and then loaded along with the rest
+            cy.reset_calls()
+            data = df.DataFrame({'key': names, 'value': range(25)})
+            load_table_data(data, data_key_column='key', base_url=cy.base_url)
+            self.assertEqual(cy.calls['POST networks/{suid}/tables/defaultnode/columns'], 1)
+            self.assertEqual(get_table_column_types(base_url=cy.base_url)['key'], 'String')
+            loaded = get_table_columns(columns=['name', 'key'], base_url=cy.base_url)
+            self.assertListEqual(list(loaded['key']), list(loaded['name']))
+
+
     @print_entry_exit
     def test_map_table_column(self):
         # Initialization
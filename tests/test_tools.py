@@ -23,6 +23,7 @@ import os
 
 import unittest
 import time
+import pandas as df
 from requests import HTTPError
 
 from test_utils import *